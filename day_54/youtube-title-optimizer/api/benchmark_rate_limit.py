@@ -0,0 +1,115 @@
+"""
+Load test for the rate limit middleware
+
+Sends requests through a minimal FastAPI app in-process (no network, a trivial
+endpoint) so the difference between runs is the middleware's own cost:
+
+    none        no middleware
+    passthrough an @app.middleware that only calls call_next (the wrapper's own cost)
+    memory      enforce_rate_limit with InMemoryRateLimiter
+    legacy      the previous middleware: blocking GET, then INCR/EXPIRE pipeline (needs --redis-url)
+    redis       enforce_rate_limit with RedisRateLimiter (needs --redis-url)
+
+It also fires a burst of concurrent requests from one client at a limit of
+--limit and reports how many got through, which shows whether the check races.
+
+Usage (from the project root):
+    python -m api.benchmark_rate_limit [--requests 5000] [--concurrency 50] [--redis-url redis://localhost:6379/15]
+"""
+
+import argparse
+import asyncio
+import time
+from typing import Optional
+
+import httpx
+from fastapi import FastAPI, Request, status
+from fastapi.responses import JSONResponse
+
+from api.services.rate_limit import InMemoryRateLimiter, RedisRateLimiter, enforce_rate_limit
+
+def build_app(variant: str, limit: int, redis_url: Optional[str]) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/ping")
+    async def ping():
+        return {"ok": True}
+
+    if variant == "memory":
+        limiter = InMemoryRateLimiter(limit=limit, window=60)
+    elif variant == "redis":
+        limiter = RedisRateLimiter(redis_url, limit=limit, window=60, key_prefix="bench_rate_limit:")
+    elif variant == "legacy":
+        import redis
+        client = redis.Redis.from_url(redis_url)
+
+    if variant == "passthrough":
+        @app.middleware("http")
+        async def rate_limit_middleware(request: Request, call_next):
+            return await call_next(request)
+    elif variant in ("memory", "redis"):
+        @app.middleware("http")
+        async def rate_limit_middleware(request: Request, call_next):
+            return await enforce_rate_limit(limiter, request.headers["x-client"], request, call_next)
+    elif variant == "legacy":
+        @app.middleware("http")
+        async def rate_limit_middleware(request: Request, call_next):
+            rate_limit_key = f"bench_rate_limit:{request.headers['x-client']}"
+            current_count = client.get(rate_limit_key)
+            if current_count and int(current_count) >= limit:
+                return JSONResponse(status_code=status.HTTP_429_TOO_MANY_REQUESTS, content={"detail": "Rate limit exceeded."})
+            pipe = client.pipeline()
+            pipe.incr(rate_limit_key)
+            pipe.expire(rate_limit_key, 60)
+            pipe.execute()
+            return await call_next(request)
+
+    return app
+
+async def run(variant: str, requests: int, concurrency: int, limit: int, redis_url: Optional[str]) -> dict:
+    app = build_app(variant, limit, redis_url)
+    run_id = f"{variant}-{time.time_ns()}"
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        # Throughput: every request from its own client so none are rejected
+        counter = iter(range(requests))
+
+        async def worker():
+            for i in counter:
+                await client.get("/ping", headers={"x-client": f"{run_id}-{i}"})
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - start
+
+        # Correctness: a concurrent burst from one client should get exactly `limit` through
+        burst = await asyncio.gather(*(
+            client.get("/ping", headers={"x-client": f"{run_id}-burst"}) for _ in range(limit * 3)
+        ))
+        allowed = sum(1 for response in burst if response.status_code == 200)
+
+    return {"us_per_request": elapsed / requests * 1e6, "requests_per_second": requests / elapsed, "allowed": allowed}
+
+async def main():
+    parser = argparse.ArgumentParser(description="Benchmark the rate limit middleware.")
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--limit", type=int, default=60, help="Requests per minute per client")
+    parser.add_argument("--redis-url", help="Redis server for the legacy and redis variants")
+    args = parser.parse_args()
+
+    variants = ["none", "passthrough", "memory"] + (["legacy", "redis"] if args.redis_url else [])
+    print(f"{args.requests:,} requests, concurrency {args.concurrency}, burst of {args.limit * 3} at limit {args.limit}\n")
+    print(f"{'variant':<11} {'µs/request':>11} {'overhead':>9} {'req/s':>9} {'burst allowed':>14}")
+
+    baseline = None
+    for variant in variants:
+        result = await run(variant, args.requests, args.concurrency, args.limit, args.redis_url)
+        if baseline is None:
+            baseline = result["us_per_request"]
+        allowed = f"{result['allowed']}/{args.limit}" if variant not in ("none", "passthrough") else "-"
+        print(f"{variant:<11} {result['us_per_request']:11.1f} {result['us_per_request'] - baseline:+9.1f} "
+              f"{result['requests_per_second']:9,.0f} {allowed:>14}")
+
+if __name__ == "__main__":
+    asyncio.run(main())
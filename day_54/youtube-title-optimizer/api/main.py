@@ -20,6 +20,8 @@ from api.models.optimization import (
 )
 from api.routers import optimization, analytics, users, youtube
 from api.services.cache import RedisCache
+from api.services.response_cache import get_response_cache
+from api.services.rate_limit import create_rate_limiter, enforce_rate_limit
 from api.services.database import Database
 from core.ai.gemini_service import GeminiService
 from core.ai.openai_service import OpenAIService
@@ -67,6 +69,13 @@ try:
         database = None
         logger.warning("Database URL not provided. Running without database.")
     
+    # Rate limiting: 60 requests per minute per IP by default, shared through Redis when available
+    rate_limiter = create_rate_limiter(
+        redis_url,
+        limit=int(os.getenv("RATE_LIMIT_PER_MINUTE", "60")),
+        window=60
+    )
+    
     # Initialize AI services
     model_factory = ModelFactory(
         gemini_api_key=os.getenv("GEMINI_API_KEY"),
@@ -88,26 +97,8 @@ async def rate_limit_middleware(request: Request, call_next):
     if request.url.path in ["/docs", "/redoc", "/openapi.json"]:
         return await call_next(request)
     
-    # Check if Redis is available for rate limiting
-    if cache:
-        # Rate limit: 60 requests per minute per IP
-        rate_limit_key = f"rate_limit:{client_ip}"
-        current_count = cache.redis.get(rate_limit_key)
-        
-        if current_count and int(current_count) >= 60:
-            return JSONResponse(
-                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-                content={"detail": "Rate limit exceeded. Please try again later."}
-            )
-        
-        # Increment counter and set expiry
-        pipe = cache.redis.pipeline()
-        pipe.incr(rate_limit_key)
-        pipe.expire(rate_limit_key, 60)  # 60 seconds
-        pipe.execute()
-    
-    # Continue processing the request
-    return await call_next(request)
+    # Check and record the request in one atomic step, then continue or answer 429
+    return await enforce_rate_limit(rate_limiter, client_ip, request, call_next)
 
 # Include routers
 app.include_router(optimization.router, prefix="/api/v1", tags=["optimization"])
@@ -127,7 +118,8 @@ async def health_check():
             "cache": "available" if cache else "unavailable",
             "database": "available" if database else "unavailable",
             "ai_models": model_factory.available_models()
-        }
+        },
+        "response_cache": get_response_cache().stats()
     }
 
 # Fallback error handler
@@ -1,6 +1,7 @@
-from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks, Query
+from fastapi import APIRouter, HTTPException, Depends, Query
+from fastapi.responses import StreamingResponse
 from typing import List, Dict, Any, Optional
-import asyncio
+import json
 import logging
 from datetime import datetime
 
@@ -11,6 +12,8 @@ from api.models.optimization import (
     BatchOptimizationRequest,
     BatchOptimizationResponse
 )
+from api.services.batch_jobs import BatchJobEngine, get_batch_engine
+from api.services.response_cache import ResponseCache, get_response_cache, optimization_cache_key
 from core.ai.model_factory import ModelFactory, get_model_factory
 
 # Configure logging
@@ -22,36 +25,45 @@ router = APIRouter()
 @router.post("/optimize", response_model=TitleOptimizationResponse)
 async def optimize_title(
     request: TitleOptimizationRequest,
-    model_factory: ModelFactory = Depends(get_model_factory)
+    model_factory: ModelFactory = Depends(get_model_factory),
+    response_cache: ResponseCache = Depends(get_response_cache)
 ):
     """
     Optimize a YouTube title using AI
     
     This endpoint takes a YouTube title and related information and returns
-    an optimized version with alternatives and analysis.
+    an optimized version with alternatives and analysis. Identical requests
+    are answered from the response cache.
     """
     try:
         # Get the appropriate AI service based on the model name
         model_name = request.model.lower().split()[0] if request.model else "gemini"
         ai_service = model_factory.get_service(model_name)
         
-        # Call the AI service to optimize the title
-        result = await ai_service.optimize_title(
-            original_title=request.original_title,
-            description=request.description,
-            category=request.category,
-            target_emotion=request.target_emotion,
-            content_type=request.content_type,
-            model_name=model_name,
-            optimization_strength=request.optimization_strength,
-            advanced_analysis=request.advanced_analysis
+        inputs = {
+            "original_title": request.original_title,
+            "description": request.description,
+            "category": request.category,
+            "target_emotion": request.target_emotion,
+            "content_type": request.content_type,
+            "model_name": model_name,
+            "optimization_strength": request.optimization_strength,
+            "advanced_analysis": request.advanced_analysis
+        }
+        
+        # Call the AI service to optimize the title (unless an identical request was answered recently)
+        cached_result, cached = await response_cache.get_or_compute(
+            optimization_cache_key(**inputs),
+            lambda: ai_service.optimize_title(**inputs)
         )
         
-        # Add metadata to the response
+        # Add metadata to a copy; the cached result is shared
+        result = dict(cached_result)
         result["metadata"] = {
             "timestamp": datetime.now().isoformat(),
             "model_used": model_name,
-            "request_id": str(request.request_id)
+            "request_id": str(request.request_id),
+            "cached": cached
         }
         
         return result
@@ -66,68 +78,58 @@ async def optimize_title(
 @router.post("/batch-optimize", response_model=BatchOptimizationResponse)
 async def batch_optimize_titles(
     request: BatchOptimizationRequest,
-    background_tasks: BackgroundTasks,
-    model_factory: ModelFactory = Depends(get_model_factory)
+    model_factory: ModelFactory = Depends(get_model_factory),
+    batch_engine: BatchJobEngine = Depends(get_batch_engine)
 ):
     """
     Optimize multiple YouTube titles in batch
     
-    This endpoint takes a list of YouTube titles and returns optimized versions.
-    For large batches, processing happens in the background.
+    Titles are optimized concurrently (bounded per provider). Small batches are
+    returned directly; larger ones run as a background job whose progress and
+    partial results are available from /batch-status/{batch_id}.
     """
     try:
         # Get the appropriate AI service
         model_name = request.model.lower().split()[0] if request.model else "gemini"
         ai_service = model_factory.get_service(model_name)
         
-        # For small batches (≤5), process synchronously
+        batch = dict(
+            batch_id=str(request.batch_id),
+            titles=request.titles,
+            model_name=model_name,
+            params={
+                "description": request.description or "Batch optimization",
+                "category": request.category,
+                "target_emotion": request.target_emotion,
+                "content_type": request.content_type,
+                "optimization_strength": request.optimization_strength,
+                "advanced_analysis": False  # Simplified for batch processing
+            },
+            ai_service=ai_service
+        )
+        
+        # Small batches (≤5) are answered directly and not kept as jobs
         if len(request.titles) <= 5:
-            optimized_titles = []
-            
-            for title in request.titles:
-                result = await ai_service.optimize_title(
-                    original_title=title,
-                    description=request.description or "Batch optimization",
-                    category=request.category,
-                    target_emotion=request.target_emotion,
-                    content_type=request.content_type,
-                    model_name=model_name,
-                    optimization_strength=request.optimization_strength,
-                    advanced_analysis=False  # Simplified for batch processing
-                )
-                
-                optimized_titles.append({
-                    "original": title,
-                    "optimized": result["improved_title"],
-                    "seo_score": result.get("seo_score", 75)
-                })
+            job = await batch_engine.run(**batch)
+            if job.errors and not job.results:
+                raise RuntimeError(next(iter(job.errors.values())))
             
             return {
-                "optimized_titles": optimized_titles,
-                "status": "completed",
-                "batch_id": str(request.batch_id)
+                "optimized_titles": [job.results[i] for i in sorted(job.results)],
+                "status": job.status,
+                "batch_id": job.batch_id
             }
         
-        # For larger batches, process in background
-        else:
-            # Create a job and return the ID
-            batch_id = str(request.batch_id)
-            
-            # Add background task
-            background_tasks.add_task(
-                process_batch_optimization,
-                batch_id,
-                request,
-                ai_service
-            )
-            
-            return {
-                "optimized_titles": [],
-                "status": "processing",
-                "batch_id": batch_id,
-                "message": f"Processing {len(request.titles)} titles in the background. Check status with /batch-status/{batch_id}"
-            }
-            
+        job = batch_engine.submit(**batch)
+        return {
+            "optimized_titles": [],
+            "status": job.status,
+            "batch_id": job.batch_id,
+            "message": f"Processing {len(request.titles)} titles in the background. Check status with /batch-status/{job.batch_id}"
+        }
+        
+    except ValueError as e:
+        raise HTTPException(status_code=409 if "already exists" in str(e) else 400, detail=str(e))
     except Exception as e:
         logger.error(f"Error in batch optimization: {str(e)}")
         raise HTTPException(
@@ -136,49 +138,53 @@ async def batch_optimize_titles(
         )
 
 @router.get("/batch-status/{batch_id}")
-async def get_batch_status(batch_id: str):
-    """Get the status of a batch optimization job"""
-    # In a real implementation, this would check a database or cache
-    # For now, return a mock response
-    return {
-        "batch_id": batch_id,
-        "status": "completed",
-        "progress": 100,
-        "total_titles": 10,
-        "processed_titles": 10,
-        "completed_at": datetime.now().isoformat()
-    }
+async def get_batch_status(
+    batch_id: str,
+    since: int = Query(0, ge=0, description="The 'next' value from the previous poll; only newer results are returned"),
+    stream: bool = Query(False, description="Stream results as newline-delimited JSON until the job finishes"),
+    batch_engine: BatchJobEngine = Depends(get_batch_engine)
+):
+    """Get the status of a batch optimization job with its results so far"""
+    job = batch_engine.get_job(batch_id)
+    if not job:
+        raise HTTPException(status_code=404, detail=f"Batch {batch_id} not found")
+    
+    if stream:
+        async def lines():
+            async for event in batch_engine.stream(batch_id):
+                yield json.dumps(event) + "\n"
+        
+        return StreamingResponse(lines(), media_type="application/x-ndjson")
+    
+    return job.status_dict(since=since)
 
-async def process_batch_optimization(
+@router.post("/batch-resume/{batch_id}")
+async def resume_batch(
     batch_id: str,
-    request: BatchOptimizationRequest,
-    ai_service: Any
+    model_factory: ModelFactory = Depends(get_model_factory),
+    batch_engine: BatchJobEngine = Depends(get_batch_engine)
 ):
-    """Process batch optimization in the background"""
+    """Resume a failed, cancelled or interrupted batch; titles already optimized are not redone"""
+    job = batch_engine.get_job(batch_id)
+    if not job:
+        raise HTTPException(status_code=404, detail=f"Batch {batch_id} not found")
+    
     try:
-        # In a real implementation, this would update a database with progress
-        logger.info(f"Processing batch {batch_id} with {len(request.titles)} titles")
-        
-        # Process each title
-        for title in request.titles:
-            # Add delay to avoid rate limits
-            await asyncio.sleep(1)
-            
-            # Optimize title
-            await ai_service.optimize_title(
-                original_title=title,
-                description=request.description or "Batch optimization",
-                category=request.category,
-                target_emotion=request.target_emotion,
-                content_type=request.content_type
-            )
-            
-            # Update progress in database
-            logger.info(f"Processed title: {title}")
-        
-        # Mark batch as complete
-        logger.info(f"Batch {batch_id} processing completed")
-        
-    except Exception as e:
-        logger.error(f"Error processing batch {batch_id}: {str(e)}")
-        # Update batch status to failed
+        job = batch_engine.resume(batch_id, model_factory.get_service(job.model_name))
+    except ValueError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    
+    return job.status_dict(since=len(job.completion_order))
+
+@router.delete("/batch/{batch_id}")
+async def cancel_batch(
+    batch_id: str,
+    batch_engine: BatchJobEngine = Depends(get_batch_engine)
+):
+    """Cancel a running batch; results so far are kept and it can be resumed later"""
+    try:
+        job = await batch_engine.cancel(batch_id)
+    except KeyError:
+        raise HTTPException(status_code=404, detail=f"Batch {batch_id} not found")
+    
+    return job.status_dict(since=len(job.completion_order))
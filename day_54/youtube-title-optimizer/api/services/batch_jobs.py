@@ -0,0 +1,413 @@
+import os
+import json
+import asyncio
+import logging
+from dataclasses import dataclass, field, asdict
+from datetime import datetime, timedelta
+from typing import Dict, List, Any, Optional, Set, AsyncIterator
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Job states
+PENDING = "pending"
+PROCESSING = "processing"
+COMPLETED = "completed"
+FAILED = "failed"
+CANCELLED = "cancelled"
+INTERRUPTED = "interrupted"  # Was processing when the server stopped
+
+RESUMABLE_STATES = (FAILED, CANCELLED, INTERRUPTED)
+
+@dataclass
+class BatchJob:
+    """A batch optimization job with its per-title results"""
+    batch_id: str
+    model_name: str
+    titles: List[str]
+    params: Dict[str, Any]
+    status: str = PENDING
+    results: Dict[int, Dict[str, Any]] = field(default_factory=dict)  # title index -> result
+    errors: Dict[int, str] = field(default_factory=dict)  # title index -> last error
+    completion_order: List[int] = field(default_factory=list)  # indexes in the order they finished
+    created_at: str = field(default_factory=lambda: datetime.now().isoformat())
+    started_at: Optional[str] = None
+    completed_at: Optional[str] = None
+
+    @property
+    def pending_indexes(self) -> List[int]:
+        """Titles that still need a result (including ones that failed last time)"""
+        return [i for i in range(len(self.titles)) if i not in self.results]
+
+    @property
+    def progress(self) -> int:
+        return int(len(self.results) * 100 / len(self.titles)) if self.titles else 100
+
+    @property
+    def finished(self) -> bool:
+        return self.status not in (PENDING, PROCESSING)
+
+    def status_dict(self, since: int = 0) -> Dict[str, Any]:
+        """
+        Status with the results finished since an earlier poll
+
+        Args:
+            since: The "next" value from the previous status response (0 for all results)
+        """
+        return {
+            "batch_id": self.batch_id,
+            "status": self.status,
+            "progress": self.progress,
+            "total_titles": len(self.titles),
+            "processed_titles": len(self.results),
+            "failed_titles": len(self.errors),
+            "results": [self.results[i] for i in self.completion_order[since:]],
+            "errors": [{"index": i, "original": self.titles[i], "error": error} for i, error in self.errors.items()],
+            "next": len(self.completion_order),
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "completed_at": self.completed_at
+        }
+
+    def to_json(self) -> str:
+        return json.dumps(asdict(self))
+
+    @classmethod
+    def from_json(cls, data: str) -> "BatchJob":
+        values = json.loads(data)
+        # JSON object keys are strings
+        values["results"] = {int(i): result for i, result in values["results"].items()}
+        values["errors"] = {int(i): error for i, error in values["errors"].items()}
+        return cls(**values)
+
+    @property
+    def finished_at(self) -> datetime:
+        """When the job stopped (interrupted jobs loaded from disk have no completed_at)"""
+        return datetime.fromisoformat(self.completed_at or self.started_at or self.created_at)
+
+class JobStore:
+    """In-memory job store; finished jobs are kept for a retention period, up to a cap"""
+
+    def __init__(self, retention: float = 86400, max_finished: int = 1000):
+        """
+        Initialize the store
+
+        Args:
+            retention: Seconds a finished job stays available for status and resume
+            max_finished: Most finished jobs kept; the oldest go first
+        """
+        self.jobs: Dict[str, BatchJob] = {}
+        self.retention = retention
+        self.max_finished = max_finished
+
+    def add(self, job: BatchJob) -> None:
+        self.jobs[job.batch_id] = job
+
+    def get(self, batch_id: str) -> Optional[BatchJob]:
+        return self.jobs.get(batch_id)
+
+    def save(self, job: BatchJob) -> None:
+        """Persist a job's current state (nothing to do in memory)"""
+
+    def remove(self, batch_id: str) -> None:
+        self.jobs.pop(batch_id, None)
+
+    def prune(self) -> int:
+        """Remove finished jobs past the retention period or beyond max_finished; returns how many"""
+        finished = sorted((job for job in self.jobs.values() if job.finished), key=lambda job: job.finished_at)
+        cutoff = datetime.now() - timedelta(seconds=self.retention)
+        over_cap = max(len(finished) - self.max_finished, 0)
+        expired = [job for n, job in enumerate(finished) if n < over_cap or job.finished_at < cutoff]
+        for job in expired:
+            self.remove(job.batch_id)
+        return len(expired)
+
+class FileJobStore(JobStore):
+    """Job store that also keeps each job as a JSON file so jobs survive a restart"""
+
+    def __init__(self, directory: str, retention: float = 86400, max_finished: int = 1000):
+        super().__init__(retention, max_finished)
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+        for filename in os.listdir(directory):
+            if not filename.endswith(".json"):
+                continue
+            try:
+                with open(os.path.join(directory, filename)) as f:
+                    job = BatchJob.from_json(f.read())
+            except (OSError, ValueError, TypeError) as e:
+                logger.error(f"Skipping unreadable batch job file {filename}: {str(e)}")
+                continue
+            if not job.finished:
+                # Its worker died with the previous process; resume it with /batch-resume
+                job.status = INTERRUPTED
+            self.jobs[job.batch_id] = job
+
+        self.prune()
+        if self.jobs:
+            logger.info(f"Loaded {len(self.jobs)} batch jobs from {directory}")
+
+    def add(self, job: BatchJob) -> None:
+        super().add(job)
+        self.save(job)
+
+    def save(self, job: BatchJob) -> None:
+        path = os.path.join(self.directory, f"{job.batch_id}.json")
+        # Write then rename so a crash never leaves a half-written job
+        with open(path + ".tmp", "w") as f:
+            f.write(job.to_json())
+        os.replace(path + ".tmp", path)
+
+    def remove(self, batch_id: str) -> None:
+        super().remove(batch_id)
+        try:
+            os.remove(os.path.join(self.directory, f"{batch_id}.json"))
+        except FileNotFoundError:
+            pass
+
+class BatchJobEngine:
+    """
+    Runs batch optimization jobs in the background
+
+    Each job is worked by a pool of workers, and every provider (AI service class)
+    has one semaphore shared by all jobs, so concurrent batches together never
+    have more than `concurrency_per_provider` requests in flight to one provider.
+    """
+
+    def __init__(
+        self,
+        store: Optional[JobStore] = None,
+        concurrency_per_provider: int = 8,
+        save_interval: float = 1.0
+    ):
+        """
+        Initialize the engine
+
+        Args:
+            store: Where jobs are kept (in memory by default)
+            concurrency_per_provider: Maximum in-flight requests per provider
+            save_interval: Minimum seconds between saves of a job's progress
+        """
+        self.store = store or JobStore()
+        self.concurrency_per_provider = concurrency_per_provider
+        self.save_interval = save_interval
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self._updates: Dict[str, asyncio.Condition] = {}
+        self._last_saved: Dict[str, float] = {}
+
+    def _semaphore(self, ai_service: Any) -> asyncio.Semaphore:
+        provider = type(ai_service).__name__
+        if provider not in self._semaphores:
+            self._semaphores[provider] = asyncio.Semaphore(self.concurrency_per_provider)
+        return self._semaphores[provider]
+
+    def _condition(self, batch_id: str) -> asyncio.Condition:
+        if batch_id not in self._updates:
+            self._updates[batch_id] = asyncio.Condition()
+        return self._updates[batch_id]
+
+    def get_job(self, batch_id: str) -> Optional[BatchJob]:
+        return self.store.get(batch_id)
+
+    def submit(self, batch_id: str, titles: List[str], model_name: str, params: Dict[str, Any], ai_service: Any) -> BatchJob:
+        """Create a job and start processing it in the background"""
+        if self.store.get(batch_id):
+            raise ValueError(f"Batch {batch_id} already exists")
+
+        job = BatchJob(batch_id=batch_id, model_name=model_name, titles=list(titles), params=params)
+        self.store.add(job)
+        self._start(job, ai_service)
+        return job
+
+    async def run(self, batch_id: str, titles: List[str], model_name: str, params: Dict[str, Any], ai_service: Any) -> BatchJob:
+        """
+        Process a small batch within the caller's request and return the finished job
+
+        The job is never stored, so it has no status, stream or resume, and
+        writes nothing to the job directory.
+        """
+        if self.store.get(batch_id):
+            raise ValueError(f"Batch {batch_id} already exists")
+
+        job = BatchJob(batch_id=batch_id, model_name=model_name, titles=list(titles), params=params,
+                       status=PROCESSING, started_at=datetime.now().isoformat())
+        await self._process(job, ai_service, background=False)
+        return job
+
+    def resume(self, batch_id: str, ai_service: Any) -> BatchJob:
+        """Restart a failed, cancelled or interrupted job; titles that already have results are kept"""
+        job = self.store.get(batch_id)
+        if not job:
+            raise KeyError(batch_id)
+        if job.status not in RESUMABLE_STATES:
+            raise ValueError(f"Batch {batch_id} is {job.status} and cannot be resumed")
+
+        self._start(job, ai_service)
+        return job
+
+    async def cancel(self, batch_id: str) -> BatchJob:
+        """Stop a running job, keeping its partial results"""
+        job = self.store.get(batch_id)
+        if not job:
+            raise KeyError(batch_id)
+
+        task = self._tasks.get(batch_id)
+        if task and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        return job
+
+    async def wait(self, batch_id: str) -> BatchJob:
+        """Wait until a job has finished"""
+        task = self._tasks.get(batch_id)
+        if task:
+            await asyncio.shield(task)
+        return self.store.get(batch_id)
+
+    async def stream(self, batch_id: str) -> AsyncIterator[Dict[str, Any]]:
+        """Yield each result as it finishes (earlier ones first), then a final status"""
+        job = self.store.get(batch_id)
+        if not job:
+            raise KeyError(batch_id)
+
+        sent = 0
+        while True:
+            for i in job.completion_order[sent:]:
+                yield {"type": "result", **job.results[i]}
+            sent = len(job.completion_order)
+            if job.finished:
+                break
+            # Looked up each time: it is dropped when the job finishes and recreated on resume
+            condition = self._condition(batch_id)
+            async with condition:
+                await condition.wait_for(lambda: job.finished or len(job.completion_order) > sent)
+
+        final = job.status_dict(since=sent)
+        del final["results"]
+        yield {"type": "status", **final}
+
+    def _start(self, job: BatchJob, ai_service: Any) -> None:
+        job.status = PROCESSING
+        job.started_at = datetime.now().isoformat()
+        job.completed_at = None
+        job.errors.clear()
+        self.store.save(job)
+        self._tasks[job.batch_id] = asyncio.create_task(self._run(job, ai_service))
+
+    async def _run(self, job: BatchJob, ai_service: Any) -> None:
+        try:
+            await self._process(job, ai_service)
+        except asyncio.CancelledError:
+            pass
+        finally:
+            self.store.save(job)
+            self._last_saved.pop(job.batch_id, None)
+            self._tasks.pop(job.batch_id, None)
+            await self._notify(job.batch_id)
+            # Streams still waiting hold their own reference and see the job finished
+            self._updates.pop(job.batch_id, None)
+            self.store.prune()
+
+    async def _process(self, job: BatchJob, ai_service: Any, background: bool = True) -> None:
+        """Work through the job's pending titles and set its final status"""
+        pending = job.pending_indexes
+        logger.info(f"Processing batch {job.batch_id}: {len(pending)} of {len(job.titles)} titles to go")
+
+        queue: asyncio.Queue = asyncio.Queue()
+        for i in pending:
+            queue.put_nowait(i)
+
+        semaphore = self._semaphore(ai_service)
+        workers = [
+            asyncio.create_task(self._worker(job, ai_service, queue, semaphore, background))
+            for _ in range(min(self.concurrency_per_provider, len(pending)))
+        ]
+
+        try:
+            await asyncio.gather(*workers)
+            job.status = FAILED if job.errors else COMPLETED
+            logger.info(f"Batch {job.batch_id} {job.status}: {len(job.results)} done, {len(job.errors)} failed")
+        except asyncio.CancelledError:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            job.status = CANCELLED
+            logger.info(f"Batch {job.batch_id} cancelled after {len(job.results)} titles")
+            raise
+        except Exception as e:
+            job.status = FAILED
+            logger.error(f"Error processing batch {job.batch_id}: {str(e)}")
+        finally:
+            job.completed_at = datetime.now().isoformat()
+
+    async def _worker(
+        self,
+        job: BatchJob,
+        ai_service: Any,
+        queue: asyncio.Queue,
+        semaphore: asyncio.Semaphore,
+        background: bool = True
+    ) -> None:
+        while not queue.empty():
+            i = queue.get_nowait()
+            title = job.titles[i]
+
+            try:
+                async with semaphore:
+                    result = await ai_service.optimize_title(
+                        original_title=title,
+                        model_name=job.model_name,
+                        **job.params
+                    )
+            except Exception as e:
+                # One bad title should not sink the batch; it is retried on resume
+                logger.error(f"Error optimizing title {title!r} in batch {job.batch_id}: {str(e)}")
+                job.errors[i] = str(e)
+                continue
+
+            job.results[i] = {
+                "index": i,
+                "original": title,
+                "optimized": result["improved_title"],
+                "seo_score": result.get("seo_score", 75),
+                "alternates": result.get("alternates", [])
+            }
+            job.errors.pop(i, None)
+            job.completion_order.append(i)
+            if background:
+                self._save_progress(job)
+                await self._notify(job.batch_id)
+
+    def _save_progress(self, job: BatchJob) -> None:
+        """Save a running job at most once per save_interval"""
+        now = asyncio.get_running_loop().time()
+        if now - self._last_saved.get(job.batch_id, 0) >= self.save_interval:
+            self.store.save(job)
+            self._last_saved[job.batch_id] = now
+
+    async def _notify(self, batch_id: str) -> None:
+        condition = self._updates.get(batch_id)
+        if condition:
+            async with condition:
+                condition.notify_all()
+
+# Shared engine for the API
+_batch_engine: Optional[BatchJobEngine] = None
+
+def get_batch_engine() -> BatchJobEngine:
+    """Dependency to get the shared batch job engine"""
+    global _batch_engine
+    if _batch_engine is None:
+        job_dir = os.getenv("BATCH_JOB_DIR")
+        retention = float(os.getenv("BATCH_JOB_RETENTION", "86400"))
+        max_finished = int(os.getenv("BATCH_MAX_FINISHED_JOBS", "1000"))
+        _batch_engine = BatchJobEngine(
+            store=FileJobStore(job_dir, retention, max_finished) if job_dir else JobStore(retention, max_finished),
+            concurrency_per_provider=int(os.getenv("BATCH_CONCURRENCY_PER_PROVIDER", "8"))
+        )
+    return _batch_engine
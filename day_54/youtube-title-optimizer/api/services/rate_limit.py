@@ -0,0 +1,167 @@
+import math
+import time
+import uuid
+import logging
+from collections import deque
+from dataclasses import dataclass
+from typing import Dict, Deque, Optional, Callable, Awaitable
+from fastapi import Request, Response, status
+from fastapi.responses import JSONResponse
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+@dataclass
+class RateLimitResult:
+    allowed: bool
+    limit: int
+    remaining: int
+    retry_after: float  # Seconds until a request would be allowed (0 when allowed)
+
+# Sliding-window check-and-record in one round trip. Runs atomically on the
+# server, so concurrent requests cannot both see the last free slot. Uses the
+# server clock so workers with skewed clocks agree on the window.
+SLIDING_WINDOW_SCRIPT = """
+local key = KEYS[1]
+local window = tonumber(ARGV[1])
+local limit = tonumber(ARGV[2])
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+
+redis.call('ZREMRANGEBYSCORE', key, '-inf', now - window)
+local count = redis.call('ZCARD', key)
+if count < limit then
+    redis.call('ZADD', key, now, now .. '-' .. ARGV[3])
+    redis.call('PEXPIRE', key, window)
+    return {1, limit - count - 1, 0}
+end
+local oldest = redis.call('ZRANGE', key, 0, 0, 'WITHSCORES')
+return {0, 0, tonumber(oldest[2]) + window - now}
+"""
+
+class InMemoryRateLimiter:
+    """Sliding-window limiter for a single process"""
+
+    def __init__(self, limit: int = 60, window: float = 60.0):
+        """
+        Initialize the limiter
+
+        Args:
+            limit: Requests allowed per client within the window
+            window: Window length in seconds
+        """
+        self.limit = limit
+        self.window = window
+        self._requests: Dict[str, Deque[float]] = {}
+        self._next_sweep = time.monotonic() + window
+
+    async def hit(self, key: str) -> RateLimitResult:
+        """Record a request for key if it is within the limit"""
+        now = time.monotonic()
+        if now >= self._next_sweep:
+            self._sweep(now)
+
+        requests = self._requests.setdefault(key, deque())
+        while requests and requests[0] <= now - self.window:
+            requests.popleft()
+
+        if len(requests) < self.limit:
+            requests.append(now)
+            return RateLimitResult(True, self.limit, self.limit - len(requests), 0.0)
+        return RateLimitResult(False, self.limit, 0, requests[0] + self.window - now)
+
+    def _sweep(self, now: float) -> None:
+        """Forget clients with no requests in the window so the table does not grow forever"""
+        for key in [key for key, requests in self._requests.items() if not requests or requests[-1] <= now - self.window]:
+            del self._requests[key]
+        self._next_sweep = now + self.window
+
+class RedisRateLimiter:
+    """
+    Sliding-window limiter shared by all workers through Redis
+
+    Each request is one EVALSHA of SLIDING_WINDOW_SCRIPT on a sorted set per
+    client. If Redis cannot be reached the request is checked against an
+    in-process fallback limiter instead of failing or going unlimited, and
+    Redis is not tried again for `retry_interval` seconds, so an outage costs
+    each request nothing rather than a connect timeout.
+    """
+
+    # Every request waits on Redis, so give up on it quickly
+    SOCKET_TIMEOUT = 0.25
+
+    def __init__(
+        self,
+        redis_url: str,
+        limit: int = 60,
+        window: float = 60.0,
+        key_prefix: str = "rate_limit:",
+        retry_interval: float = 5.0
+    ):
+        import redis.asyncio as aioredis
+
+        self.limit = limit
+        self.window = window
+        self.key_prefix = key_prefix
+        self.retry_interval = retry_interval
+        self.redis = aioredis.from_url(
+            redis_url,
+            socket_connect_timeout=self.SOCKET_TIMEOUT,
+            socket_timeout=self.SOCKET_TIMEOUT
+        )
+        self._script = self.redis.register_script(SLIDING_WINDOW_SCRIPT)
+        self.fallback = InMemoryRateLimiter(limit, window)
+        self._redis_down = False
+        self._retry_at = 0.0  # monotonic time before which Redis is skipped
+
+    async def hit(self, key: str) -> RateLimitResult:
+        if self._redis_down and time.monotonic() < self._retry_at:
+            return await self.fallback.hit(key)
+
+        try:
+            allowed, remaining, retry_after_ms = await self._script(
+                keys=[self.key_prefix + key],
+                args=[int(self.window * 1000), self.limit, uuid.uuid4().hex]
+            )
+        except Exception as e:
+            if not self._redis_down:
+                logger.warning(f"Redis rate limiting unavailable, using in-process limits: {str(e)}")
+                self._redis_down = True
+            self._retry_at = time.monotonic() + self.retry_interval
+            return await self.fallback.hit(key)
+
+        if self._redis_down:
+            logger.info("Redis rate limiting restored")
+            self._redis_down = False
+        return RateLimitResult(bool(allowed), self.limit, int(remaining), int(retry_after_ms) / 1000)
+
+def create_rate_limiter(redis_url: Optional[str], limit: int = 60, window: float = 60.0):
+    """Redis-backed limiter when a Redis URL is configured, otherwise in-process"""
+    if redis_url:
+        return RedisRateLimiter(redis_url, limit, window)
+    return InMemoryRateLimiter(limit, window)
+
+async def enforce_rate_limit(
+    limiter,
+    key: str,
+    request: Request,
+    call_next: Callable[[Request], Awaitable[Response]]
+) -> Response:
+    """Run the request if the client is within its limit, otherwise answer 429"""
+    result = await limiter.hit(key)
+    headers = {
+        "X-RateLimit-Limit": str(result.limit),
+        "X-RateLimit-Remaining": str(result.remaining)
+    }
+    
+    if not result.allowed:
+        headers["Retry-After"] = str(max(1, math.ceil(result.retry_after)))
+        return JSONResponse(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            content={"detail": "Rate limit exceeded. Please try again later."},
+            headers=headers
+        )
+    
+    response = await call_next(request)
+    response.headers.update(headers)
+    return response
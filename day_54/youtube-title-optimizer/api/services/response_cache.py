@@ -0,0 +1,205 @@
+import os
+import json
+import time
+import hashlib
+import asyncio
+import logging
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Callable, Awaitable, Tuple
+
+from core.ai.prompt_templates import TITLE_OPTIMIZATION_PROMPT
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Part of every key, so editing the prompt template invalidates old responses
+PROMPT_VERSION = hashlib.sha256(TITLE_OPTIMIZATION_PROMPT.encode()).hexdigest()[:12]
+
+def _normalize_text(value: Optional[str]) -> str:
+    """Collapse whitespace (it does not change the answer) but keep case"""
+    return " ".join((value or "").split())
+
+def _normalize_label(value: Optional[str]) -> str:
+    """Labels such as category or emotion are matched case-insensitively"""
+    return _normalize_text(value).casefold()
+
+def optimization_cache_key(
+    original_title: str,
+    description: str,
+    category: str,
+    target_emotion: str,
+    content_type: str,
+    optimization_strength: int,
+    model_name: str,
+    advanced_analysis: bool = True
+) -> str:
+    """Content-addressed key for a title optimization request"""
+    inputs = {
+        "prompt": PROMPT_VERSION,
+        "title": _normalize_text(original_title),
+        "description": _normalize_text(description),
+        "category": _normalize_label(category),
+        "emotion": _normalize_label(target_emotion),
+        "content_type": _normalize_label(content_type),
+        "strength": int(optimization_strength),
+        "model": _normalize_label(model_name),
+        "advanced": bool(advanced_analysis)
+    }
+    digest = hashlib.sha256(json.dumps(inputs, sort_keys=True).encode()).hexdigest()
+    return f"title_opt:{digest}"
+
+class ResponseCache:
+    """
+    Two-tier cache for AI responses
+
+    An in-process LRU answers repeated requests without leaving the process; an
+    optional Redis tier shares responses between workers and restarts. Concurrent
+    requests for the same key are single-flighted: only the first one calls the
+    model and the others await its result.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttl: int = 3600,
+        redis_url: Optional[str] = None
+    ):
+        """
+        Initialize the cache
+
+        Args:
+            max_entries: Size of the in-process LRU
+            ttl: Seconds a response stays valid in both tiers
+            redis_url: Redis server for the shared tier (None for in-process only)
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()  # key -> (expires at, value)
+        self._in_flight: Dict[str, asyncio.Future] = {}
+        self.redis = None
+        if redis_url:
+            import redis.asyncio as aioredis
+            self.redis = aioredis.from_url(redis_url)
+
+        self.memory_hits = 0
+        self.redis_hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.redis_errors = 0
+
+    async def get_or_compute(self, key: str, compute: Callable[[], Awaitable[Dict[str, Any]]]) -> Tuple[Dict[str, Any], bool]:
+        """
+        Return the cached value for key, computing and storing it on a miss
+
+        Returns:
+            (value, cached) where cached is False only for the request that computed it
+        """
+        value = self._get_local(key)
+        if value is not None:
+            self.memory_hits += 1
+            return value, True
+
+        # Someone is already computing this key: wait for their answer
+        task = self._in_flight.get(key)
+        if task is not None:
+            value, _ = await asyncio.shield(task)
+            self.coalesced += 1
+            return value, True
+
+        # The lookup runs in its own task so that cancelling the request that
+        # started it (a client disconnect) does not fail everyone waiting on it
+        task = asyncio.create_task(self._fill(key, compute))
+        task.add_done_callback(self._fill_done)
+        self._in_flight[key] = task
+        return await asyncio.shield(task)
+
+    async def _fill(self, key: str, compute: Callable[[], Awaitable[Dict[str, Any]]]) -> Tuple[Dict[str, Any], bool]:
+        """Read the shared tier or call the model, then store the value in both tiers"""
+        try:
+            value = await self._get_redis(key)
+            if value is not None:
+                self.redis_hits += 1
+                cached = True
+            else:
+                self.misses += 1
+                value = await compute()
+                cached = False
+                await self._set_redis(key, value)
+            self._set_local(key, value)
+            return value, cached
+        finally:
+            # Errors are not cached; everyone waiting gets the same failure
+            del self._in_flight[key]
+
+    @staticmethod
+    def _fill_done(task: asyncio.Task) -> None:
+        # Mark a failure retrieved even when every waiter has gone away
+        if not task.cancelled():
+            task.exception()
+
+    def _get_local(self, key: str) -> Optional[Dict[str, Any]]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry[1]
+
+    def _set_local(self, key: str, value: Dict[str, Any]) -> None:
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def _get_redis(self, key: str) -> Optional[Dict[str, Any]]:
+        if not self.redis:
+            return None
+        try:
+            data = await self.redis.get(key)
+            return json.loads(data) if data else None
+        except Exception as e:
+            # The shared tier is an optimization; fall back to calling the model
+            self.redis_errors += 1
+            logger.warning(f"Response cache read failed: {str(e)}")
+            return None
+
+    async def _set_redis(self, key: str, value: Dict[str, Any]) -> None:
+        if not self.redis:
+            return
+        try:
+            await self.redis.set(key, json.dumps(value), ex=self.ttl)
+        except Exception as e:
+            self.redis_errors += 1
+            logger.warning(f"Response cache write failed: {str(e)}")
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit-rate metrics for /health"""
+        hits = self.memory_hits + self.redis_hits + self.coalesced
+        requests = hits + self.misses
+        return {
+            "requests": requests,
+            "hit_rate": round(hits / requests, 4) if requests else 0.0,
+            "memory_hits": self.memory_hits,
+            "redis_hits": self.redis_hits,
+            "coalesced": self.coalesced,
+            "misses": self.misses,
+            "redis_errors": self.redis_errors,
+            "entries": len(self._entries),
+            "tiers": ["memory", "redis"] if self.redis else ["memory"]
+        }
+
+# Shared cache for the API
+_response_cache: Optional[ResponseCache] = None
+
+def get_response_cache() -> ResponseCache:
+    """Dependency to get the shared response cache"""
+    global _response_cache
+    if _response_cache is None:
+        _response_cache = ResponseCache(
+            max_entries=int(os.getenv("RESPONSE_CACHE_SIZE", "1024")),
+            ttl=int(os.getenv("RESPONSE_CACHE_TTL", "3600")),
+            redis_url=os.getenv("REDIS_URL")
+        )
+    return _response_cache
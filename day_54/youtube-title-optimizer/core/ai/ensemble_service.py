@@ -0,0 +1,175 @@
+import time
+import asyncio
+import logging
+from collections import deque
+from typing import Dict, List, Any, Optional, Deque
+
+# Local imports
+from core.analytics.metrics import calculate_seo_score
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+class LatencyTracker:
+    """Recent request latencies of one provider"""
+
+    def __init__(self, window: int = 200):
+        self._samples: Deque[float] = deque(maxlen=window)
+
+    def record(self, seconds: float) -> None:
+        self._samples.append(seconds)
+
+    def percentile(self, q: float) -> Optional[float]:
+        """Latency at quantile q (0-1), or None before enough samples"""
+        if len(self._samples) < 10:
+            return None
+        ordered = sorted(self._samples)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+# Shared across service instances (the factory is rebuilt per request), keyed by provider
+_latencies: Dict[str, LatencyTracker] = {}
+
+def _tracker(provider: str) -> LatencyTracker:
+    if provider not in _latencies:
+        _latencies[provider] = LatencyTracker()
+    return _latencies[provider]
+
+class EnsembleService:
+    """
+    Runs a title optimization on several providers and keeps the best result
+
+    Modes:
+        parallel: ask every provider at once; after the first answer, wait at
+            most `collect_window` seconds for the rest, then cancel stragglers
+            and return the best-scoring result
+        hedged: ask the fastest provider first and only start the next one if
+            it fails or runs past its `hedge_percentile` latency; the first
+            answer wins and the others are cancelled
+    """
+
+    def __init__(
+        self,
+        services: Dict[str, Any],
+        mode: str = "parallel",
+        hedge_percentile: float = 0.95,
+        default_hedge_delay: float = 3.0,
+        collect_window: float = 1.0
+    ):
+        """
+        Initialize the ensemble
+
+        Args:
+            services: Provider name -> AI service
+            mode: "parallel" or "hedged"
+            hedge_percentile: Latency quantile after which a hedged request starts the next provider
+            default_hedge_delay: Hedge delay in seconds until a provider has latency history
+            collect_window: Seconds to wait for other providers after the first parallel answer
+        """
+        if not services:
+            raise ValueError("At least one AI service is required for ensemble")
+        if mode not in ("parallel", "hedged"):
+            raise ValueError(f"Unknown ensemble mode: {mode}")
+
+        self.services = services
+        self.mode = mode
+        self.hedge_percentile = hedge_percentile
+        self.default_hedge_delay = default_hedge_delay
+        self.collect_window = collect_window
+
+    def _providers_by_speed(self) -> List[str]:
+        """Providers ordered by median latency, unknown ones last in configured order"""
+        def median(provider: str) -> float:
+            value = _tracker(provider).percentile(0.5)
+            return value if value is not None else float("inf")
+        return sorted(self.services, key=median)
+
+    def _hedge_delay(self, provider: str) -> float:
+        value = _tracker(provider).percentile(self.hedge_percentile)
+        return value if value is not None else self.default_hedge_delay
+
+    async def _call(self, provider: str, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        started = time.perf_counter()
+        result = await self.services[provider].optimize_title(**kwargs)
+        _tracker(provider).record(time.perf_counter() - started)
+        return result
+
+    async def optimize_title(
+        self,
+        original_title: str,
+        description: str,
+        category: str = "General",
+        model_name: Optional[str] = None,
+        **kwargs: Any
+    ) -> Dict[str, Any]:
+        """
+        Optimize a YouTube title with every configured provider
+
+        Takes the same arguments as the provider services; model_name is ignored
+        since each provider uses its own default model.
+
+        Returns:
+            The best result, with an "ensemble" entry naming the provider and the candidate scores
+        """
+        kwargs = dict(kwargs, original_title=original_title, description=description, category=category)
+        tasks: Dict[asyncio.Task, str] = {}
+        results: Dict[str, Dict[str, Any]] = {}
+        errors: Dict[str, str] = {}
+
+        def start(provider: str) -> None:
+            tasks[asyncio.create_task(self._call(provider, kwargs))] = provider
+
+        def collect(done) -> None:
+            for task in done:
+                provider = tasks.pop(task)
+                if task.exception():
+                    errors[provider] = str(task.exception())
+                    logger.warning(f"Ensemble provider {provider} failed: {errors[provider]}")
+                else:
+                    results[provider] = task.result()
+
+        waiting = self._providers_by_speed()
+        try:
+            if self.mode == "parallel":
+                for provider in waiting:
+                    start(provider)
+                while tasks and not results:
+                    done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                    collect(done)
+                if tasks:
+                    done, _ = await asyncio.wait(tasks, timeout=self.collect_window)
+                    collect(done)
+            else:
+                while waiting or tasks:
+                    if waiting and not tasks:
+                        start(waiting.pop(0))  # Nothing in flight (start, or everything failed)
+                    timeout = self._hedge_delay(tasks[next(reversed(tasks))]) if waiting else None
+                    done, _ = await asyncio.wait(tasks, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+                    collect(done)
+                    if results:
+                        break
+                    if not done and waiting:
+                        logger.info(f"Ensemble hedging: starting {waiting[0]} after {timeout:.2f}s")
+                        start(waiting.pop(0))
+        finally:
+            # Losers and stragglers are not worth waiting for
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        if not results:
+            raise RuntimeError(f"All ensemble providers failed: {errors}")
+
+        scores = {
+            provider: calculate_seo_score(result["improved_title"], original_title, category)
+            for provider, result in results.items()
+        }
+        best = max(scores, key=scores.get)
+        result = dict(results[best])
+        result["seo_score"] = scores[best]
+        result["ensemble"] = {
+            "mode": self.mode,
+            "provider": best,
+            "scores": scores,
+            "failed": errors
+        }
+        return result
@@ -1,5 +1,4 @@
 import os
-import time
 import json
 import logging
 from typing import Dict, List, Any, Optional, Tuple
@@ -9,6 +8,7 @@ from google.api_core.exceptions import ResourceExhausted, ServiceUnavailable
 
 # Local imports
 from core.ai.prompt_templates import TITLE_OPTIMIZATION_PROMPT
+from core.ai.rate_limiter import AsyncTokenBucket, get_rate_limiter
 from core.analytics.metrics import calculate_seo_score
 
 # Configure logging
@@ -21,8 +21,20 @@ logger = logging.getLogger(__name__)
 class GeminiService:
     """Service for interacting with Google's Gemini AI models"""
     
-    def __init__(self, api_key: Optional[str] = None):
-        """Initialize the Gemini service with API key"""
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        requests_per_minute: Optional[float] = None,
+        burst: Optional[int] = None
+    ):
+        """
+        Initialize the Gemini service with API key
+
+        Args:
+            api_key: Gemini API key
+            requests_per_minute: Allowed request rate per model (GEMINI_REQUESTS_PER_MINUTE, default 60)
+            burst: Requests allowed at once before the rate applies (GEMINI_REQUEST_BURST, default 5)
+        """
         self.api_key = api_key or os.getenv("GEMINI_API_KEY")
         if not self.api_key:
             raise ValueError("Gemini API key is required")
@@ -36,21 +48,21 @@ class GeminiService:
             "gemini-flash": "gemini-1.5-flash"
         }
         
-        # Cache for rate limiting
-        self._last_request_time = 0
-        self._min_request_interval = 1.0  # seconds
-    
-    def _rate_limit(self) -> None:
-        """Implement rate limiting to avoid API quota issues"""
-        current_time = time.time()
-        time_since_last_request = current_time - self._last_request_time
+        # Rate limiting to avoid API quota issues
+        self.requests_per_minute = requests_per_minute or float(os.getenv("GEMINI_REQUESTS_PER_MINUTE", "60"))
+        self.burst = burst or int(os.getenv("GEMINI_REQUEST_BURST", "5"))
         
-        if time_since_last_request < self._min_request_interval:
-            sleep_time = self._min_request_interval - time_since_last_request
-            logger.debug(f"Rate limiting: sleeping for {sleep_time:.2f} seconds")
-            time.sleep(sleep_time)
-        
-        self._last_request_time = time.time()
+        # Model clients, created on first use
+        self._clients: Dict[str, genai.GenerativeModel] = {}
+    
+    def _rate_limiter(self, model_id: str) -> AsyncTokenBucket:
+        """Bucket for a model, shared with every other GeminiService in the process"""
+        return get_rate_limiter("gemini", model_id, self.requests_per_minute / 60, self.burst)
+    
+    def _client(self, model_id: str) -> genai.GenerativeModel:
+        if model_id not in self._clients:
+            self._clients[model_id] = genai.GenerativeModel(model_id)
+        return self._clients[model_id]
     
     @retry(
         stop=stop_after_attempt(3),
@@ -85,12 +97,12 @@ class GeminiService:
         Returns:
             Dictionary containing optimization results
         """
-        # Apply rate limiting
-        self._rate_limit()
-        
         # Select the appropriate model
         model_id = self.models.get(model_name, "gemini-1.5-pro")
-        model = genai.GenerativeModel(model_id)
+        model = self._client(model_id)
+        
+        # Wait for our turn without blocking the event loop
+        await self._rate_limiter(model_id).acquire()
         
         # Format the prompt with user inputs
         prompt = TITLE_OPTIMIZATION_PROMPT.format(
@@ -104,8 +116,8 @@ class GeminiService:
         )
         
         try:
-            # Generate content with Gemini
-            response = model.generate_content(
+            # Generate content with Gemini (native async call)
+            response = await model.generate_content_async(
                 prompt,
                 generation_config={
                     "temperature": 0.7,
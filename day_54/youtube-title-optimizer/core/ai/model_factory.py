@@ -6,6 +6,7 @@ import logging
 from core.ai.gemini_service import GeminiService
 from core.ai.openai_service import OpenAIService
 from core.ai.anthropic_service import AnthropicService
+from core.ai.ensemble_service import EnsembleService
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -17,12 +18,14 @@ class ModelFactory:
         self,
         gemini_api_key: Optional[str] = None,
         openai_api_key: Optional[str] = None,
-        anthropic_api_key: Optional[str] = None
+        anthropic_api_key: Optional[str] = None,
+        ensemble_mode: Optional[str] = None
     ):
-        """Initialize the model factory with API keys"""
+        """Initialize the model factory with API keys and the ensemble mode (parallel or hedged)"""
         self.gemini_api_key = gemini_api_key or os.getenv("GEMINI_API_KEY")
         self.openai_api_key = openai_api_key or os.getenv("OPENAI_API_KEY")
         self.anthropic_api_key = anthropic_api_key or os.getenv("ANTHROPIC_API_KEY")
+        self.ensemble_mode = ensemble_mode or os.getenv("ENSEMBLE_MODE", "parallel")
         
         # Initialize services lazily
         self._services = {}
@@ -69,24 +72,24 @@ class ModelFactory:
             return service
             
         elif model_name == "ensemble":
-            # Ensemble requires all services to be available
-            services = []
+            # Ensemble uses every service that has an API key
+            services = {}
             
             if self.gemini_api_key:
-                services.append(self.get_service("gemini"))
+                services["gemini"] = self.get_service("gemini")
             
             if self.openai_api_key:
-                services.append(self.get_service("openai"))
+                services["openai"] = self.get_service("openai")
             
             if self.anthropic_api_key:
-                services.append(self.get_service("anthropic"))
+                services["anthropic"] = self.get_service("anthropic")
             
             if not services:
                 raise ValueError("At least one AI service is required for ensemble")
             
-            # In a real implementation, this would be an EnsembleService class
-            # For now, just return the first available service
-            return services[0]
+            service = EnsembleService(services, mode=self.ensemble_mode)
+            self._services[model_name] = service
+            return service
         
         else:
             # Default to Gemini if available
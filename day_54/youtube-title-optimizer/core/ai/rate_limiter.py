@@ -0,0 +1,72 @@
+import asyncio
+import time
+import logging
+from typing import Dict, Optional, Tuple
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+class AsyncTokenBucket:
+    """
+    Token bucket rate limiter for coroutines
+
+    Tokens refill at `rate` per second up to `capacity`. Callers wait in FIFO
+    order: a waiting caller holds the lock while it sleeps, so later callers
+    queue behind it instead of racing for the next token. Waiting never blocks
+    the event loop.
+    """
+
+    def __init__(self, rate: float, capacity: float = 1.0):
+        """
+        Initialize the bucket
+
+        Args:
+            rate: Tokens added per second (requests per second)
+            capacity: Maximum burst size
+        """
+        if rate <= 0 or capacity < 1:
+            raise ValueError("Rate must be positive and capacity at least 1")
+
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated_at = time.monotonic()
+        self._lock: Optional[asyncio.Lock] = None
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+    async def acquire(self, tokens: float = 1.0) -> float:
+        """Take tokens, waiting for them if needed; returns the seconds waited"""
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
+        waited = 0.0
+        async with self._lock:
+            self._refill()
+            if self._tokens < tokens:
+                waited = (tokens - self._tokens) / self.rate
+                logger.debug(f"Rate limiting: waiting {waited:.2f} seconds")
+                await asyncio.sleep(waited)
+                self._refill()
+            self._tokens -= tokens
+        return waited
+
+    async def __aenter__(self):
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+# Buckets shared by every service instance in the process, keyed by (provider, model)
+_buckets: Dict[Tuple[str, str], AsyncTokenBucket] = {}
+
+def get_rate_limiter(provider: str, model: str, rate: float, capacity: float = 1.0) -> AsyncTokenBucket:
+    """Get the shared bucket for a provider/model, creating it on first use"""
+    key = (provider, model)
+    if key not in _buckets:
+        _buckets[key] = AsyncTokenBucket(rate, capacity)
+    return _buckets[key]
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Benchmark of the organizer's console and log output overhead.
+
+Creates a flat directory of small files and runs a dry-run organize over it
+several times, with stdout/stderr attached to a pseudo-terminal (drained by a
+background thread, like a real terminal would be) so the progress bar is drawn:
+
+  * unthrottled  - progress redrawn for every file, DEBUG file log
+  * throttled    - progress_refresh_per_second = 10, DEBUG file log
+  * quiet log    - throttled, INFO file log (per-file debug lines never formatted)
+  * no tty       - stdout redirected to /dev/null, so no progress bar at all
+
+Usage:
+    python benchmark_console_output.py [--files 200000] [--runs 1]
+"""
+
+import argparse
+import json
+import os
+import pty
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from enhanced_file_organizer import EnhancedFileOrganizer
+
+
+class _Terminal:
+    """Points fds 1 and 2 at a pty (or /dev/null) for the duration of a run."""
+
+    def __init__(self, use_pty: bool):
+        self.use_pty = use_pty
+        self.bytes_written = 0
+
+    def __enter__(self):
+        sys.stdout.flush()
+        sys.stderr.flush()
+        self._saved = (os.dup(1), os.dup(2))
+        if self.use_pty:
+            self._master, target = pty.openpty()
+            self._reader = threading.Thread(target=self._drain, daemon=True)
+            self._reader.start()
+        else:
+            self._master, target = None, os.open(os.devnull, os.O_WRONLY)
+        os.dup2(target, 1)
+        os.dup2(target, 2)
+        os.close(target)
+        return self
+
+    def _drain(self):
+        while True:
+            try:
+                data = os.read(self._master, 65536)
+            except OSError:
+                return
+            if not data:
+                return
+            self.bytes_written += len(data)
+
+    def __exit__(self, *exc):
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os.dup2(self._saved[0], 1)
+        os.dup2(self._saved[1], 2)
+        for fd in self._saved:
+            os.close(fd)
+        if self._master is not None:
+            time.sleep(0.05) # Let the reader catch up before closing the pty
+            os.close(self._master)
+            self._reader.join(timeout=1)
+
+
+def make_files(root: Path, count: int) -> None:
+    extensions = ['.jpg', '.pdf', '.mp3', '.txt', '.py', '.zip', '.docx', '.mp4']
+    for i in range(count):
+        (root / f"file_{i}{extensions[i % len(extensions)]}").touch()
+
+
+def run_case(work: Path, target: Path, settings: dict, use_pty: bool) -> tuple:
+    case_dir = Path(tempfile.mkdtemp(dir=work))
+    config = {
+        "log_directory": str(case_dir / "logs"),
+        "backup_structure": False,
+        "journal_enabled": False,
+        "export_reports": False,
+        "hash_cache_enabled": False,
+        "operations_log_format": "none",
+    }
+    config.update(settings)
+    config_path = case_dir / "config.json"
+    config_path.write_text(json.dumps(config))
+
+    with _Terminal(use_pty) as terminal:
+        # Created inside the redirect so the organizer sees the pty as its stdout
+        organizer = EnhancedFileOrganizer(str(config_path))
+        start = time.perf_counter()
+        organizer.organize_directory(str(target), dry_run=True)
+        elapsed = time.perf_counter() - start
+    for handler in organizer.logger.handlers[:]:
+        handler.close()
+        organizer.logger.removeHandler(handler)
+    log_bytes = sum(p.stat().st_size for p in (case_dir / "logs").glob("*.log"))
+    return elapsed, terminal.bytes_written, log_bytes
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark console/log output overhead of a dry run.")
+    parser.add_argument('--files', type=int, default=200_000, help='Number of files to create')
+    parser.add_argument('--runs', type=int, default=1, help='Runs per case (best time is reported)')
+    args = parser.parse_args()
+
+    cases = [
+        ("unthrottled", {"progress_refresh_per_second": 0, "file_log_level": "DEBUG"}, True),
+        ("throttled", {"progress_refresh_per_second": 10, "file_log_level": "DEBUG"}, True),
+        ("quiet log", {"progress_refresh_per_second": 10, "file_log_level": "INFO"}, True),
+        ("no tty", {"progress_refresh_per_second": 10, "file_log_level": "INFO"}, False),
+    ]
+
+    work = Path(tempfile.mkdtemp(prefix="organizer_console_bench_"))
+    try:
+        target = work / "target"
+        target.mkdir()
+        print(f"Creating {args.files:,} files in {target} ...")
+        make_files(target, args.files)
+
+        print(f"\n{'case':<12} {'time':>9} {'files/s':>10} {'tty output':>12} {'log file':>12}")
+        for label, settings, use_pty in cases:
+            best = None
+            for _ in range(args.runs):
+                result = run_case(work, target, settings, use_pty)
+                if best is None or result[0] < best[0]:
+                    best = result
+            elapsed, tty_bytes, log_bytes = best
+            print(f"{label:<12} {elapsed:8.2f}s {args.files / elapsed:10,.0f} "
+                  f"{tty_bytes / 1e6:10.2f}MB {log_bytes / 1e6:10.2f}MB")
+    finally:
+        shutil.rmtree(work, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
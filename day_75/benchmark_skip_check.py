@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for the exclude-pattern part of the organizer's skip check.
+
+Compares the legacy approach (compile one regex per pattern for every file)
+against the precompiled ExcludeMatcher, verifies both return the same pattern
+for every name, and prints the per-file cost of each.
+
+Usage:
+    python benchmark_skip_check.py [--files 200000] [--patterns 50] [--config file_organizer_config.json]
+"""
+
+import argparse
+import json
+import random
+import re
+import time
+from typing import List, Optional
+
+from enhanced_file_organizer import ExcludeMatcher
+
+
+def legacy_match(name: str, patterns: List[str]) -> Optional[str]:
+    """The pre-ExcludeMatcher check: one re.compile per pattern per file."""
+    name_lower = name.lower()
+    for pattern in patterns:
+        try:
+            escaped = re.escape(pattern)
+            regex_pattern = escaped.replace(r'\*', '.*').replace(r'\?', '.')
+            regex = re.compile(f'^{regex_pattern}$', re.IGNORECASE)
+            if regex.match(name_lower):
+                return pattern
+        except re.error:
+            continue
+    return None
+
+
+def build_patterns(base: List[str], count: int) -> List[str]:
+    """Pad the configured patterns with a realistic mix up to `count` entries."""
+    patterns = list(base)
+    i = 0
+    while len(patterns) < count:
+        kind = i % 4
+        if kind == 0:
+            patterns.append(f"*.ext{i}")          # suffix
+        elif kind == 1:
+            patterns.append(f"cache_{i}_*")       # prefix
+        elif kind == 2:
+            patterns.append(f"ignored_file_{i}.dat")  # exact name
+        else:
+            patterns.append(f"tmp{i}_*.b?k")      # needs the regex
+        i += 1
+    return patterns
+
+
+def build_names(count: int, seed: int = 42) -> List[str]:
+    """Generate a mix of ordinary and excluded file names."""
+    rng = random.Random(seed)
+    extensions = ['.jpg', '.pdf', '.mp3', '.txt', '.py', '.zip', '.docx', '.tmp', '.log', '.ext8']
+    names = []
+    for i in range(count):
+        roll = rng.random()
+        if roll < 0.02:
+            names.append(f".hidden_{i}")
+        elif roll < 0.03:
+            names.append("Thumbs.db")
+        elif roll < 0.04:
+            names.append(f"tmp3_{i}.bak")
+        else:
+            names.append(f"File_{i}{rng.choice(extensions)}")
+    return names
+
+
+def time_it(label: str, func, names: List[str]) -> List[Optional[str]]:
+    start = time.perf_counter()
+    results = [func(name) for name in names]
+    elapsed = time.perf_counter() - start
+    print(f"{label:<22} {elapsed:8.3f} s total  {elapsed / len(names) * 1e6:8.2f} µs/file")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the exclude-pattern skip check.")
+    parser.add_argument('--files', type=int, default=200_000, help='Number of file names to check')
+    parser.add_argument('--patterns', type=int, default=50, help='Number of exclude patterns')
+    parser.add_argument('--config', default='file_organizer_config.json', help='Config to take base patterns from')
+    args = parser.parse_args()
+
+    try:
+        with open(args.config, 'r', encoding='utf-8') as f:
+            base = json.load(f).get("exclude_patterns", [])
+    except (OSError, json.JSONDecodeError):
+        base = ["*.tmp", "*.log", ".*", "desktop.ini", "thumbs.db"]
+
+    patterns = build_patterns(base, args.patterns)
+    names = build_names(args.files)
+    print(f"{len(names):,} file names, {len(patterns)} exclude patterns\n")
+
+    legacy = time_it("legacy (per-file)", lambda n: legacy_match(n, patterns), names)
+
+    start = time.perf_counter()
+    matcher = ExcludeMatcher(patterns)
+    print(f"{'compile matcher':<22} {time.perf_counter() - start:8.6f} s (once)")
+    compiled = time_it("ExcludeMatcher", matcher.match, names)
+
+    mismatches = [(n, a, b) for n, a, b in zip(names, legacy, compiled) if a != b]
+    if mismatches:
+        print(f"\n{len(mismatches)} mismatches, e.g. {mismatches[:5]}")
+        raise SystemExit(1)
+    excluded = sum(1 for r in compiled if r is not None)
+    print(f"\nResults identical ({excluded:,} names excluded).")
+
+
+if __name__ == "__main__":
+    main()
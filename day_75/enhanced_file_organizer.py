@@ -10,21 +10,30 @@ Phase UI-1: Basic UI with threading.
 
 import os
 import shutil
+import stat
+import errno
+import select
+import struct
 import json
 import argparse
 import hashlib
 import logging
 import csv
 import re
+import sqlite3
+from collections import deque
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Set, Any
+from typing import Dict, List, Optional, Tuple, Set, Any, Callable, Iterable, Iterator, Union
 from dataclasses import dataclass, field, asdict
 from enum import Enum
 import sys
 import traceback
 import threading
+import multiprocessing
 import queue # Import the queue module for thread communication
+import time
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, Future, as_completed, wait, FIRST_COMPLETED
 
 # --- Try to import CustomTkinter ---
 try:
@@ -97,6 +106,785 @@ class DuplicateResolutionResult:
     error_info: Optional[str] = None
 
 
+# --- Hashing Helpers ---
+
+def _hash_file_contents(file_path: Path, chunk_size: int, quick_check: bool) -> Tuple[str, int]:
+    """
+    Hash a file with MD5 and return (hex digest, bytes read).
+
+    With quick_check, files larger than two chunks only have their first and
+    last chunk hashed. Raises OSError if the file cannot be read.
+    """
+    file_size = os.stat(file_path).st_size
+    file_hash = hashlib.md5()
+    bytes_read = 0
+
+    with open(file_path, 'rb') as f:
+        # Always read first chunk
+        chunk1 = f.read(chunk_size)
+        file_hash.update(chunk1)
+        bytes_read += len(chunk1)
+
+        # For quick check on large files, hash last chunk too
+        if quick_check and file_size > chunk_size * 2:
+            # Seek to near end of file (minus one chunk)
+            f.seek(-chunk_size, 2)
+            chunk2 = f.read(chunk_size)
+            file_hash.update(chunk2)
+            bytes_read += len(chunk2)
+        else:
+            # If not quick check, read remaining chunks
+            while chunk := f.read(chunk_size): # Use walrus operator for cleaner loop
+                file_hash.update(chunk)
+                bytes_read += len(chunk)
+
+    return file_hash.hexdigest(), bytes_read
+
+
+def _hash_worker(path_str: str, chunk_size: int, quick_check: bool) -> Tuple[str, Optional[str], int, float, str, Optional[str]]:
+    """
+    Worker entry point for the hashing pool (module level so process pools can pickle it).
+
+    Returns:
+        (path, digest or None, bytes read, seconds spent, worker name, error message or None)
+    """
+    if multiprocessing.parent_process() is not None:
+        worker_name = f"process-{os.getpid()}"
+    else:
+        worker_name = threading.current_thread().name
+
+    started = time.perf_counter()
+    try:
+        digest, bytes_read = _hash_file_contents(Path(path_str), chunk_size, quick_check)
+        return path_str, digest, bytes_read, time.perf_counter() - started, worker_name, None
+    except (IOError, OSError) as e:
+        return path_str, None, 0, time.perf_counter() - started, worker_name, str(e)
+
+
+# --- Move Helpers ---
+
+_COPY_CHUNK_SIZE = 8 * 1024 * 1024 # Bytes per copy_file_range/sendfile call
+# errnos meaning "this copy syscall can't handle these files", as opposed to real I/O errors
+_COPY_FALLBACK_ERRNOS = {errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.ENOTSUP, errno.EBADF, errno.EPERM}
+
+
+def _copy_file_contents(src: str, dst: str) -> int:
+    """
+    Copy file data in-kernel where possible and return the number of bytes copied.
+
+    Tries os.copy_file_range (may reflink/offload on capable filesystems), then
+    os.sendfile, then falls back to a plain buffered copy.
+    """
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        in_fd, out_fd = fsrc.fileno(), fdst.fileno()
+        copied = 0
+
+        if hasattr(os, 'copy_file_range'):
+            try:
+                while n := os.copy_file_range(in_fd, out_fd, _COPY_CHUNK_SIZE):
+                    copied += n
+                return copied
+            except OSError as e:
+                if copied or e.errno not in _COPY_FALLBACK_ERRNOS:
+                    raise
+
+        if hasattr(os, 'sendfile') and sys.platform.startswith('linux'): # Only Linux sends file-to-file
+            try:
+                while n := os.sendfile(out_fd, in_fd, copied, _COPY_CHUNK_SIZE):
+                    copied += n
+                return copied
+            except OSError as e:
+                if copied or e.errno not in _COPY_FALLBACK_ERRNOS:
+                    raise
+
+        shutil.copyfileobj(fsrc, fdst, 1024 * 1024)
+        return fdst.tell()
+
+
+def _cross_device_move(src: str, dst: str, overwrite: bool) -> int:
+    """
+    Move a file to another filesystem: copy to a hidden temp file beside dst,
+    publish it with a rename, then delete the source. dst never holds a partial
+    copy, and on failure the source is left untouched. Returns bytes copied.
+    """
+    dst_dir, dst_name = os.path.split(dst)
+    temp_path = os.path.join(dst_dir, f".{dst_name}.{os.getpid()}.{threading.get_ident()}.partial")
+    try:
+        copied = _copy_file_contents(src, temp_path)
+        shutil.copystat(src, temp_path)
+        if overwrite:
+            os.replace(temp_path, dst)
+        else:
+            os.rename(temp_path, dst)
+    except BaseException:
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+        raise
+    os.unlink(src)
+    return copied
+
+
+# --- Duplicate Index ---
+
+class DuplicateIndex:
+    """
+    Whole-tree content index for duplicate detection, resolved in tiers.
+
+    Files are grouped by size first; only files sharing a size get a quick
+    (head/tail) hash, and only files sharing size and quick hash get a full
+    content hash. Files no larger than `full_hash_threshold` are read whole by
+    the quick hash already, so their quick digest doubles as the full digest.
+    """
+
+    def __init__(self, hash_many: Callable[[List[Path], bool], Dict[Path, Optional[str]]], full_hash_threshold: int = 0):
+        self._hash_many = hash_many # Batch hasher: (paths, quick_check) -> {path: digest}
+        self._full_hash_threshold = full_hash_threshold
+        self._by_size: Dict[int, Set[Path]] = {}
+        self._sizes: Dict[Path, int] = {}
+        self._quick: Dict[Path, Optional[str]] = {}
+        self._full: Dict[Path, Optional[str]] = {}
+        self.quick_hashes = 0
+        self.full_hashes = 0
+
+    def __len__(self) -> int:
+        return len(self._sizes)
+
+    def __contains__(self, path: Path) -> bool:
+        return path in self._sizes
+
+    def add(self, path: Path, size: int) -> None:
+        """Add a file to the index (no hashing happens here)."""
+        self.discard(path)
+        self._sizes[path] = size
+        self._by_size.setdefault(size, set()).add(path)
+
+    def discard(self, path: Path) -> None:
+        """Remove a file and any digests known for it."""
+        size = self._sizes.pop(path, None)
+        if size is not None:
+            group = self._by_size[size]
+            group.discard(path)
+            if not group:
+                del self._by_size[size]
+        self._quick.pop(path, None)
+        self._full.pop(path, None)
+
+    def relocate(self, old_path: Path, new_path: Path) -> None:
+        """Track a file that was moved, keeping its digests (content did not change)."""
+        if old_path not in self._sizes:
+            return
+        size = self._sizes[old_path]
+        quick, full = self._quick.get(old_path), self._full.get(old_path)
+        self.discard(old_path)
+        self.add(new_path, size)
+        if quick is not None:
+            self._quick[new_path] = quick
+        if full is not None:
+            self._full[new_path] = full
+
+    def collision_groups(self) -> int:
+        """Number of size groups with more than one file."""
+        return sum(1 for group in self._by_size.values() if len(group) > 1)
+
+    def resolve(self, paths: Optional[List[Path]] = None) -> None:
+        """
+        Compute the digests needed to decide identity within size groups.
+
+        Args:
+            paths: Only resolve the size groups these files belong to (all groups if None).
+        """
+        if paths is None:
+            sizes = [size for size, group in self._by_size.items() if len(group) > 1]
+        else:
+            sizes = {self._sizes[p] for p in paths if p in self._sizes and len(self._by_size[self._sizes[p]]) > 1}
+
+        # Tier 2: quick hashes for every member of a colliding size group
+        need_quick = [p for size in sizes for p in self._by_size[size] if p not in self._quick]
+        if need_quick:
+            self._quick.update(self._hash_many(need_quick, True))
+            self.quick_hashes += len(need_quick)
+
+        # Tier 3: full hashes only where size and quick hash both collide
+        need_full: List[Path] = []
+        for size in sizes:
+            buckets: Dict[str, List[Path]] = {}
+            for p in self._by_size[size]:
+                if self._quick.get(p) is not None:
+                    buckets.setdefault(self._quick[p], []).append(p)
+            for members in buckets.values():
+                if len(members) < 2:
+                    continue
+                for p in members:
+                    if p in self._full:
+                        continue
+                    if size <= self._full_hash_threshold:
+                        self._full[p] = self._quick[p] # Quick hash already covered the whole file
+                    else:
+                        need_full.append(p)
+        if need_full:
+            self._full.update(self._hash_many(need_full, False))
+            self.full_hashes += len(need_full)
+
+    def are_identical(self, path_a: Path, path_b: Path) -> Optional[bool]:
+        """True/False if the index can tell whether two files have the same content, None if unknown."""
+        if path_a not in self._sizes or path_b not in self._sizes:
+            return None
+        if self._sizes[path_a] != self._sizes[path_b]:
+            return False
+
+        self.resolve([path_a, path_b])
+        quick_a, quick_b = self._quick.get(path_a), self._quick.get(path_b)
+        if quick_a is None or quick_b is None:
+            return None
+        if quick_a != quick_b:
+            return False
+        full_a, full_b = self._full.get(path_a), self._full.get(path_b)
+        if full_a is None or full_b is None:
+            return None
+        return full_a == full_b
+
+
+# --- Exclude Pattern Matcher ---
+
+class ExcludeMatcher:
+    """
+    Case-insensitive glob matcher for `exclude_patterns`, compiled once per config.
+
+    Only `*` and `?` are wildcards (everything else matches literally), as in the
+    original per-file regex check. Patterns are split into tiers so that the
+    common cases never touch the regex engine:
+      - exact names (no wildcard):        'desktop.ini'  -> dict lookup
+      - pure suffixes ('*' + literal):    '*.tmp'        -> dict lookup per suffix length
+      - pure prefixes (literal + '*'):    '.*'           -> dict lookup per prefix length
+      - everything else:                  'temp*.bak'    -> one combined, anchored regex
+    When several patterns match, the one listed first in the config is reported.
+    """
+
+    def __init__(self, patterns: Iterable[str], logger: Optional[logging.Logger] = None):
+        self.patterns: List[str] = []
+        self._exact: Dict[str, int] = {}
+        self._suffixes: Dict[int, Dict[str, int]] = {} # suffix length -> {suffix: pattern index}
+        self._prefixes: Dict[int, Dict[str, int]] = {} # prefix length -> {prefix: pattern index}
+        self._match_all: Optional[int] = None # Index of a '*'-only pattern, if any
+        regex_parts = []
+
+        for pattern in patterns:
+            if not isinstance(pattern, str) or not pattern:
+                if logger:
+                    logger.warning("Ignoring invalid pattern %r in config exclude_patterns.", pattern)
+                continue
+            index = len(self.patterns)
+            self.patterns.append(pattern)
+            lowered = pattern.lower()
+            body = lowered.strip('*')
+
+            if '*' not in lowered and '?' not in lowered:
+                self._exact.setdefault(lowered, index)
+            elif not body:
+                if self._match_all is None:
+                    self._match_all = index
+            elif '*' not in body and '?' not in body and lowered.startswith('*') and not lowered.endswith('*'):
+                self._suffixes.setdefault(len(body), {}).setdefault(body, index)
+            elif '*' not in body and '?' not in body and lowered.endswith('*') and not lowered.startswith('*'):
+                self._prefixes.setdefault(len(body), {}).setdefault(body, index)
+            else:
+                # Escape special regex characters, then convert glob patterns (*, ?)
+                regex_pattern = re.escape(lowered).replace(r'\*', '.*').replace(r'\?', '.')
+                regex_parts.append(f'(?P<p{index}>{regex_pattern})')
+
+        # Alternatives are tried in config order, so lastgroup is the first matching pattern
+        self._regex = re.compile('|'.join(regex_parts), re.DOTALL) if regex_parts else None
+        # Ascending, so lookups can stop once a length exceeds the name
+        self._suffix_lengths = sorted(self._suffixes)
+        self._prefix_lengths = sorted(self._prefixes)
+
+    def match(self, name: str) -> Optional[str]:
+        """Return the first (in config order) pattern matching `name`, or None."""
+        name_lower = name.lower()
+        best = self._exact.get(name_lower)
+        if self._match_all is not None and (best is None or self._match_all < best):
+            best = self._match_all
+
+        name_len = len(name_lower)
+        for length in self._suffix_lengths:
+            if length > name_len:
+                break
+            index = self._suffixes[length].get(name_lower[-length:])
+            if index is not None and (best is None or index < best):
+                best = index
+        for length in self._prefix_lengths:
+            if length > name_len:
+                break
+            index = self._prefixes[length].get(name_lower[:length])
+            if index is not None and (best is None or index < best):
+                best = index
+
+        if self._regex is not None:
+            m = self._regex.fullmatch(name_lower)
+            if m is not None:
+                index = int(m.lastgroup[1:])
+                if best is None or index < best:
+                    best = index
+
+        return None if best is None else self.patterns[best]
+
+
+# --- Persistent Hash Cache ---
+
+class HashCache:
+    """
+    On-disk cache of file digests that survives between runs.
+
+    Entries are keyed by (device, inode) and only trusted while the file's size
+    and mtime still match, so a renamed/moved file on the same filesystem keeps
+    its cached digest while any modified file is rehashed. Writes are buffered
+    and flushed in batches; entries not seen for `max_age_days` are evicted
+    when the cache is closed.
+    """
+
+    FLUSH_EVERY = 1000 # Buffered rows before an intermediate flush
+
+    def __init__(self, db_path: Path, max_age_days: int, logger: logging.Logger):
+        self.db_path = db_path
+        self.max_age_days = max_age_days
+        self.logger = logger
+        self.hits = 0
+        self.misses = 0
+        # (dev, ino) -> [size, mtime_ns, quick, full] for rows read or written this run
+        self._rows: Dict[Tuple[int, int], List[Any]] = {}
+        self._dirty: Set[Tuple[int, int]] = set()
+        self._seen: Set[Tuple[int, int]] = set()
+
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(db_path))
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS file_hashes (
+                dev INTEGER NOT NULL,
+                ino INTEGER NOT NULL,
+                size INTEGER NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                quick TEXT,
+                full TEXT,
+                last_seen REAL NOT NULL,
+                PRIMARY KEY (dev, ino)
+            )
+        """)
+        self._conn.commit()
+
+    def _row(self, st: os.stat_result) -> Optional[List[Any]]:
+        """Cached row for a file, or None if unknown or stale (size/mtime changed)."""
+        key = (st.st_dev, st.st_ino)
+        row = self._rows.get(key)
+        if row is None:
+            db_row = self._conn.execute(
+                "SELECT size, mtime_ns, quick, full FROM file_hashes WHERE dev = ? AND ino = ?", key
+            ).fetchone()
+            if db_row is None:
+                return None
+            row = self._rows[key] = list(db_row)
+        if row[0] != st.st_size or row[1] != st.st_mtime_ns:
+            return None
+        return row
+
+    def lookup(self, st: os.stat_result, quick_check: bool) -> Optional[str]:
+        """Return the cached digest for a file's current state, or None."""
+        row = self._row(st)
+        digest = None if row is None else row[2 if quick_check else 3]
+        if digest is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._seen.add((st.st_dev, st.st_ino))
+        return digest
+
+    def store(self, st: os.stat_result, quick_check: bool, digest: str) -> None:
+        """Remember a digest computed for a file in the state described by `st`."""
+        key = (st.st_dev, st.st_ino)
+        row = self._row(st)
+        if row is None:
+            row = self._rows[key] = [st.st_size, st.st_mtime_ns, None, None]
+        row[2 if quick_check else 3] = digest
+        self._dirty.add(key)
+        if len(self._dirty) >= self.FLUSH_EVERY:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write buffered digests and last-seen times in one transaction."""
+        now = time.time()
+        dirty_rows = [(*key, *self._rows[key], now) for key in self._dirty]
+        seen_only = [(now, *key) for key in self._seen - self._dirty]
+        with self._conn:
+            if dirty_rows:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO file_hashes (dev, ino, size, mtime_ns, quick, full, last_seen) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)", dirty_rows
+                )
+            if seen_only:
+                self._conn.executemany("UPDATE file_hashes SET last_seen = ? WHERE dev = ? AND ino = ?", seen_only)
+        self._dirty.clear()
+        self._seen.clear()
+
+    def close(self) -> None:
+        """Flush, evict entries not seen for max_age_days, and close the database."""
+        try:
+            self.flush()
+            cutoff = time.time() - self.max_age_days * 86400
+            with self._conn:
+                evicted = self._conn.execute("DELETE FROM file_hashes WHERE last_seen < ?", (cutoff,)).rowcount
+            if evicted:
+                self.logger.debug("Evicted %s stale entries from hash cache '%s'.", evicted, self.db_path)
+        finally:
+            self._conn.close()
+
+    def discard(self) -> None:
+        """Close the database without writing buffered entries (after an error)."""
+        self._dirty.clear()
+        self._seen.clear()
+        try:
+            self._conn.close()
+        except sqlite3.Error:
+            pass
+
+
+# --- Move Journal ---
+
+@dataclass
+class JournalRun:
+    """One organize run as reconstructed from the move journal."""
+    run_id: str
+    target: str
+    started: str
+    ended: bool = False
+    undone: bool = False
+    # seq -> {"src", "dst", "size", "overwrite", "status"}; status is 'done', 'failed' or 'pending'
+    moves: Dict[int, Dict[str, Any]] = field(default_factory=dict)
+
+    def completed_moves(self) -> List[Dict[str, Any]]:
+        """Moves that took effect, in the order they were made."""
+        return [self.moves[seq] for seq in sorted(self.moves) if self.moves[seq]["status"] == "done"]
+
+
+class MoveJournal:
+    """
+    Append-only, JSON-lines log of the moves made by organize runs in one directory.
+
+    Each move is written as an intent record *before* the file is moved and
+    followed by a 'done'/'failed' record afterwards:
+
+        {"op": "start",  "run": id, "time": ..., "target": ...}
+        {"op": "resume", "run": id, "time": ...}
+        {"op": "move",   "run": id, "seq": n, "src": ..., "dst": ..., "size": ..., "overwrite": false}
+        {"op": "done",   "run": id, "seq": n}          (or "failed")
+        {"op": "end",    "run": id, "time": ...}
+        {"op": "undone", "run": id, "time": ...}       (appended by reverse_organization)
+
+    Intent records are flushed to the OS before the move, so a killed process
+    never loses one; fsync is batched every `fsync_every` moves (and at the end
+    of the run) to bound what a power failure can drop. A run without an 'end'
+    record was interrupted and is resumed by the next run on the same directory.
+    An intent without an outcome is settled by looking at the filesystem.
+    """
+
+    FILE_NAME = ".file_organizer_journal.jsonl"
+
+    def __init__(self, path: Path, fsync_every: int = 100):
+        self.path = Path(path)
+        self.fsync_every = max(1, fsync_every)
+        self.run_id: Optional[str] = None
+        self._seq = 0
+        self._unsynced = 0
+        self._file = None
+
+    # --- Reading ---
+
+    @staticmethod
+    def read_runs(path: Path) -> List[JournalRun]:
+        """Parse a journal into runs (oldest first); a torn last line from a crash is ignored."""
+        runs: Dict[str, JournalRun] = {}
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                        op, run_id = record["op"], record["run"]
+                    except (ValueError, KeyError, TypeError):
+                        continue
+                    run = runs.get(run_id)
+                    if op == "start":
+                        runs[run_id] = JournalRun(run_id, record.get("target", ""), record.get("time", ""))
+                    elif run is None:
+                        continue
+                    elif op == "move":
+                        run.moves[record["seq"]] = {"src": record["src"], "dst": record["dst"], "size": record.get("size", 0),
+                                                    "overwrite": record.get("overwrite", False), "status": "pending"}
+                    elif op in ("done", "failed") and record.get("seq") in run.moves:
+                        run.moves[record["seq"]]["status"] = op
+                    elif op == "end":
+                        run.ended = True
+                    elif op == "undone":
+                        run.undone = True
+        except FileNotFoundError:
+            return []
+
+        for run in runs.values():
+            for move in run.moves.values():
+                if move["status"] == "pending":
+                    move["status"] = MoveJournal._settle(move)
+                    move["settled"] = True
+        return list(runs.values())
+
+    @staticmethod
+    def _settle(move: Dict[str, Any]) -> str:
+        """Decide whether a move interrupted between intent and outcome took effect."""
+        if os.path.lexists(move["dst"]) and not os.path.lexists(move["src"]):
+            return "done"
+        return "failed"
+
+    # --- Writing ---
+
+    def begin(self, target_path: Path) -> Tuple[str, Optional[JournalRun]]:
+        """
+        Start journaling a run, resuming the last one if it never finished.
+
+        Returns:
+            (run id, the interrupted run being resumed or None)
+        """
+        runs = self.read_runs(self.path)
+        interrupted = runs[-1] if runs and not runs[-1].ended and not runs[-1].undone else None
+
+        self._file = open(self.path, 'a', encoding='utf-8')
+        if interrupted is not None:
+            self.run_id = interrupted.run_id
+            self._seq = max(interrupted.moves, default=0)
+            # Persist how the moves cut off by the crash were settled
+            for seq, move in interrupted.moves.items():
+                if move.get("settled"):
+                    self._write({"op": move["status"], "run": self.run_id, "seq": seq})
+            self._write({"op": "resume", "run": self.run_id, "time": datetime.now().isoformat()})
+        else:
+            self.run_id = datetime.now().strftime('%Y%m%d_%H%M%S_%f')
+            self._seq = 0
+            self._write({"op": "start", "run": self.run_id, "time": datetime.now().isoformat(), "target": str(target_path)})
+        self.sync()
+        return self.run_id, interrupted
+
+    def record_move(self, src: Path, dst: Path, size: int, overwrite: bool) -> int:
+        """Log the intent to move src to dst; must be called before the move. Returns its sequence number."""
+        self._seq += 1
+        self._write({"op": "move", "run": self.run_id, "seq": self._seq, "src": str(src), "dst": str(dst),
+                     "size": size, "overwrite": overwrite})
+        self._file.flush() # Reach the OS before the file is touched
+        self._unsynced += 1
+        if self._unsynced >= self.fsync_every:
+            self.sync()
+        return self._seq
+
+    def record_outcome(self, seq: int, succeeded: bool) -> None:
+        """Log whether a recorded move took effect (flushed along with the next intent)."""
+        self._write({"op": "done" if succeeded else "failed", "run": self.run_id, "seq": seq})
+
+    def close(self, completed: bool) -> None:
+        """Close the journal, marking the run finished unless it was interrupted."""
+        if self._file is None:
+            return
+        try:
+            if completed:
+                self._write({"op": "end", "run": self.run_id, "time": datetime.now().isoformat()})
+            self.sync()
+        finally:
+            self._file.close()
+            self._file = None
+
+    @staticmethod
+    def mark_undone(path: Path, run_id: str) -> None:
+        """Record that a run has been reversed so it is neither undone nor resumed again."""
+        with open(path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps({"op": "undone", "run": run_id, "time": datetime.now().isoformat()}) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _write(self, record: Dict[str, Any]) -> None:
+        self._file.write(json.dumps(record) + "\n")
+
+    def sync(self) -> None:
+        """Flush and fsync everything written so far."""
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._unsynced = 0
+
+
+# --- Directory Watchers ---
+
+class PollingWatcher:
+    """
+    Portable watcher: rescans the tree every `interval` seconds and reports
+    files that are new or whose size/mtime changed since the last scan.
+
+    `descend(name, depth)` decides whether the folder `name`, found at `depth`
+    below the root, is watched too.
+    """
+
+    def __init__(self, root: Path, descend: Callable[[str, int], bool], interval: float = 5.0):
+        self.root = root
+        self.descend = descend
+        self.interval = interval
+        self._snapshot = self._scan()
+        self._next_scan = time.monotonic() + interval
+
+    def _scan(self) -> Dict[str, Tuple[int, int]]:
+        files: Dict[str, Tuple[int, int]] = {}
+        stack = [(str(self.root), 0)]
+        while stack:
+            current, depth = stack.pop()
+            try:
+                with os.scandir(current) as entries:
+                    for entry in entries:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                if self.descend(entry.name, depth):
+                                    stack.append((entry.path, depth + 1))
+                            elif entry.is_file():
+                                st = entry.stat()
+                                files[entry.path] = (st.st_size, st.st_mtime_ns)
+                        except OSError:
+                            continue
+            except OSError:
+                continue
+        return files
+
+    def poll(self, timeout: float) -> List[Path]:
+        """Wait up to `timeout` seconds and return the files that appeared or changed."""
+        delay = self._next_scan - time.monotonic()
+        if delay > timeout:
+            time.sleep(timeout)
+            return []
+        time.sleep(max(0.0, delay))
+        self._next_scan = time.monotonic() + self.interval
+
+        previous, self._snapshot = self._snapshot, self._scan()
+        return [Path(path) for path, signature in self._snapshot.items() if previous.get(path) != signature]
+
+    def close(self) -> None:
+        pass
+
+
+class InotifyWatcher:
+    """
+    Event-driven watcher backed by Linux inotify (via ctypes, no extra dependency).
+
+    Reports files as they are created, finish writing or are moved in; new
+    folders are watched as they appear (subject to `descend`). On event queue
+    overflow the watched folders are rescanned. Raises OSError where inotify
+    is unavailable, so callers can fall back to PollingWatcher.
+    """
+
+    IN_CLOSE_WRITE = 0x008
+    IN_MOVED_TO = 0x080
+    IN_CREATE = 0x100
+    IN_DELETE_SELF = 0x400
+    IN_Q_OVERFLOW = 0x4000
+    IN_IGNORED = 0x8000
+    IN_ONLYDIR = 0x01000000
+    IN_ISDIR = 0x40000000
+    WATCH_MASK = IN_CREATE | IN_CLOSE_WRITE | IN_MOVED_TO | IN_DELETE_SELF | IN_ONLYDIR
+    _EVENT_HEADER = struct.Struct('iIII') # wd, mask, cookie, name length
+
+    def __init__(self, root: Path, descend: Callable[[str, int], bool]):
+        if not sys.platform.startswith('linux'):
+            raise OSError(errno.ENOSYS, "inotify is only available on Linux")
+        import ctypes
+        import ctypes.util
+        try:
+            self._libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+            self._libc.inotify_init1 # Missing on very old libcs
+        except (OSError, AttributeError) as e:
+            raise OSError(errno.ENOSYS, f"inotify unavailable: {e}")
+
+        self.root = root
+        self.descend = descend
+        self._fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err))
+        self._watches: Dict[int, Tuple[str, int]] = {} # wd -> (folder, depth below root)
+        self._add_tree(str(root), 0)
+
+    def _add_watch(self, folder: str, depth: int) -> bool:
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(folder), self.WATCH_MASK)
+        if wd < 0:
+            return False
+        self._watches[wd] = (folder, depth)
+        return True
+
+    def _add_tree(self, folder: str, depth: int) -> List[Path]:
+        """Watch a folder and its eligible subfolders; return the files already inside them."""
+        found: List[Path] = []
+        stack = [(folder, depth)]
+        while stack:
+            current, current_depth = stack.pop()
+            if not self._add_watch(current, current_depth):
+                continue
+            try:
+                with os.scandir(current) as entries:
+                    for entry in entries:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                if self.descend(entry.name, current_depth):
+                                    stack.append((entry.path, current_depth + 1))
+                            elif entry.is_file():
+                                found.append(Path(entry.path))
+                        except OSError:
+                            continue
+            except OSError:
+                continue
+        return found
+
+    def poll(self, timeout: float) -> List[Path]:
+        """Wait up to `timeout` seconds for events and return the files they concern."""
+        readable, _, _ = select.select([self._fd], [], [], timeout)
+        if not readable:
+            return []
+        try:
+            data = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return []
+
+        changed: List[Path] = []
+        offset = 0
+        while offset + self._EVENT_HEADER.size <= len(data):
+            wd, mask, _, name_len = self._EVENT_HEADER.unpack_from(data, offset)
+            offset += self._EVENT_HEADER.size
+            name = os.fsdecode(data[offset:offset + name_len].rstrip(b'\0'))
+            offset += name_len
+
+            if mask & self.IN_Q_OVERFLOW:
+                # Events were dropped: rescan everything we watch
+                for folder, depth in list(self._watches.values()):
+                    changed.extend(self._add_tree(folder, depth))
+                continue
+            if mask & (self.IN_IGNORED | self.IN_DELETE_SELF):
+                self._watches.pop(wd, None)
+                continue
+            if wd not in self._watches or not name:
+                continue
+
+            folder, depth = self._watches[wd]
+            path = os.path.join(folder, name)
+            if mask & self.IN_ISDIR:
+                if mask & (self.IN_CREATE | self.IN_MOVED_TO) and self.descend(name, depth):
+                    changed.extend(self._add_tree(path, depth + 1))
+            else:
+                changed.append(Path(path))
+        return changed
+
+    def close(self) -> None:
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
 # --- Custom Exception (Existing) ---
 
 class FileOrganizerError(Exception):
@@ -105,20 +893,114 @@ class FileOrganizerError(Exception):
 
 # --- Reporter Class (Existing) ---
 
+class OperationSink:
+    """
+    Append-only per-file result log (JSON lines or CSV) written as results arrive,
+    so the full operation history never has to be held in memory.
+    """
+
+    CSV_FIELDS = ['timestamp', 'operation', 'source', 'destination', 'category', 'size', 'reason', 'error_info']
+
+    def __init__(self, path: Path, fmt: str):
+        self.path = path
+        self.fmt = fmt
+        self.count = 0
+        self._file = None
+        self._writer = None
+
+    def write(self, entry: Dict[str, Any]) -> None:
+        if self._file is None:
+            # (Re)open in append mode so a sink closed by finalize() can keep going (watch mode)
+            new_file = not self.path.exists()
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(self.path, 'a', newline='', encoding='utf-8')
+            if self.fmt == 'csv':
+                self._writer = csv.DictWriter(self._file, fieldnames=self.CSV_FIELDS, extrasaction='ignore')
+                if new_file:
+                    self._writer.writeheader()
+        if self.fmt == 'csv':
+            self._writer.writerow(entry)
+        else:
+            self._file.write(json.dumps(entry) + "\n")
+        self.count += 1
+
+    def flush(self) -> None:
+        if self._file is not None:
+            self._file.flush()
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            self._writer = None
+
+
 class FileOrganizerReporter:
-    """Handles logging, reporting, and statistics for the file organizer run."""
+    """
+    Handles logging, reporting, and statistics for the file organizer run.
+
+    Totals and per-category counters are updated as each result arrives, and
+    per-file results are streamed to an OperationSink instead of being kept in
+    memory, so reporting costs the same for ten files or ten million. Only the
+    last RECENT_OPERATIONS results are retained for the report's recent list.
+    """
+
+    RECENT_OPERATIONS = 50
+    MOVED_ACTIONS = ("moved", "renamed", "overwritten")
+    SKIPPED_ACTIONS = ("skipped", "dry_run", "processed_dry_run", "skipped_by_strategy")
+    EVENT_ACTIONS = ("backup_created", "folder_created") # Not counted as processed files
 
     def __init__(self, config: Dict[str, Any], logger: logging.Logger):
         self.config = config
         self.logger = logger
-        self.operation_log: List[Dict[str, Any]] = []
+        self.recent_operations: deque = deque(maxlen=self.RECENT_OPERATIONS)
+        self.totals = {'total_files_processed': 0, 'total_size_processed': 0, 'files_moved': 0,
+                       'files_skipped': 0, 'errors': 0, 'total_size_moved': 0}
+        self.category_stats: Dict[str, Dict[str, int]] = {}
+        self.hash_worker_stats: Dict[str, Dict[str, float]] = {} # worker name -> files/bytes/seconds
         self.start_time = datetime.now()
         self.end_time: Optional[datetime] = None
+        self.sink = self._create_sink()
+
+    def _create_sink(self) -> Optional[OperationSink]:
+        """Per-file results go to <log_directory>/file_organizer_operations_<time>.jsonl/.csv (or nowhere)."""
+        fmt = self.config.get("operations_log_format", "jsonl")
+        if fmt not in ("jsonl", "csv"):
+            return None
+        log_dir = Path(self.config.get("log_directory", "logs")).expanduser().resolve()
+        return OperationSink(log_dir / f'file_organizer_operations_{self.start_time.strftime("%Y%m%d_%H%M%S")}.{fmt}', fmt)
+
+    def _aggregate(self, entry: Dict[str, Any]) -> None:
+        """Fold one result into the running totals and category counters."""
+        action = entry['operation']
+        size = entry['size']
+        category = entry.get('category') or 'Unknown'
+        stats = self.category_stats.get(category)
+        if stats is None:
+            stats = self.category_stats[category] = {'count': 0, 'size': 0, 'moved': 0, 'skipped': 0, 'errors': 0}
+
+        if action not in self.EVENT_ACTIONS:
+            self.totals['total_files_processed'] += 1
+            self.totals['total_size_processed'] += size
+            stats['count'] += 1
+            stats['size'] += size
+
+        if action in self.MOVED_ACTIONS:
+            self.totals['files_moved'] += 1
+            stats['moved'] += 1
+            if action == "moved":
+                self.totals['total_size_moved'] += size
+        elif action in self.SKIPPED_ACTIONS:
+            self.totals['files_skipped'] += 1
+            stats['skipped'] += 1
+        elif action.startswith("error"):
+            self.totals['errors'] += 1
+            stats['errors'] += 1
 
     def add_operation_result(self, result: DuplicateResolutionResult) -> None:
         """Logs a file processing result or system event to the operation log."""
         if not isinstance(result, DuplicateResolutionResult):
-            self.logger.error(f"Attempted to log invalid result object: {result}")
+            self.logger.error("Attempted to log invalid result object: %s", result)
             return
 
         entry = asdict(result)
@@ -129,9 +1011,24 @@ class FileOrganizerReporter:
 
         entry['operation'] = result.action_taken # Standard key for reports
 
-        self.operation_log.append(entry)
+        self._aggregate(entry)
+        self.recent_operations.append(entry)
+        if self.sink is not None:
+            try:
+                self.sink.write(entry)
+            except OSError as e:
+                self.logger.warning("Could not write operations log '%s': %s. Per-file results will not be saved.", self.sink.path, e)
+                self.sink = None
+
+        # Log to the main logger. The organizer already logs each outcome where it happens,
+        # so apart from errors this is a DEBUG line, and it is only built if it will be emitted.
+        if result.action_taken.startswith("error"):
+             level = logging.ERROR
+        else:
+             level = logging.DEBUG
+        if not self.logger.isEnabledFor(level):
+             return
 
-        # Log to the main logger for console/file output
         log_message = f"{result.action_taken.upper()}: '{result.source.name if result.source else 'N/A'}'"
         if result.destination:
              dest_path = Path(result.destination)
@@ -141,52 +1038,33 @@ class FileOrganizerReporter:
         if result.error_info:
              log_message += f" (ERROR: {result.error_info.splitlines()[0]})"
 
-        if result.action_taken.startswith("error"):
-             self.logger.error(log_message)
-        elif result.action_taken in ["skipped", "skipped_by_strategy", "dry_run", "processed_dry_run"]:
-             self.logger.info(log_message)
-        elif result.action_taken in ["moved", "renamed", "overwritten", "backup_created", "folder_created"]:
-             self.logger.info(log_message)
+        if result.action_taken in self.MOVED_ACTIONS + self.SKIPPED_ACTIONS + self.EVENT_ACTIONS or level == logging.ERROR:
+             self.logger.log(level, log_message)
         else:
-             self.logger.debug(f"Logged unknown action: {log_message}")
+             self.logger.debug("Logged unknown action: %s", log_message)
+
+
+    def record_hash_work(self, worker: str, bytes_read: int, seconds: float) -> None:
+        """Accumulates hashing throughput for a single worker of the hashing pool."""
+        stats = self.hash_worker_stats.setdefault(worker, {'files': 0, 'bytes': 0, 'seconds': 0.0})
+        stats['files'] += 1
+        stats['bytes'] += bytes_read
+        stats['seconds'] += seconds
 
+    def flush(self) -> None:
+        """Push buffered per-file results to the operations log."""
+        if self.sink is not None:
+            self.sink.flush()
 
     def finalize(self) -> None:
-        """Mark the end of operations."""
+        """Mark the end of operations and close the operations log."""
         self.end_time = datetime.now()
+        if self.sink is not None:
+            self.sink.close()
 
     def get_summary_stats(self) -> Dict[str, Any]:
-        """Generate summary statistics by processing the operation log."""
-        total_files_processed = sum(1 for op in self.operation_log if op['operation'] not in ["backup_created", "folder_created"])
-        total_moved = sum(1 for op in self.operation_log if op['operation'] in ["moved", "renamed", "overwritten"])
-        total_skipped = sum(1 for op in self.operation_log if op['operation'] in ["skipped", "dry_run", "processed_dry_run", "skipped_by_strategy"])
-        total_errors = sum(1 for op in self.operation_log if op['operation'].startswith("error"))
-        total_size_processed_overall = sum(op.get('size', 0) for op in self.operation_log if op['operation'] not in ["backup_created", "folder_created"])
-        total_size_moved = sum(op.get('size', 0) for op in self.operation_log if op['operation'] == "moved")
-
-        recalculated_category_stats: Dict[str, Dict[str, int]] = {}
-        all_categories = set() # Collect all categories encountered
-
-        for op in self.operation_log:
-            category = op.get('category', 'Unknown')
-            action = op.get('operation', 'unknown')
-            size = op.get('size', 0)
-
-            all_categories.add(category) # Add this category
-
-            if category not in recalculated_category_stats:
-                 recalculated_category_stats[category] = {'count': 0, 'size': 0, 'moved': 0, 'skipped': 0, 'errors': 0}
-
-            if action not in ["backup_created", "folder_created"]:
-                recalculated_category_stats[category]['count'] += 1
-                recalculated_category_stats[category]['size'] += size
-
-            if action in ["moved", "renamed", "overwritten"]:
-                recalculated_category_stats[category]['moved'] += 1
-            elif action in ["skipped", "dry_run", "processed_dry_run", "skipped_by_strategy"]:
-                recalculated_category_stats[category]['skipped'] += 1
-            elif action.startswith("error"):
-                recalculated_category_stats[category]['errors'] += 1
+        """Generate summary statistics from the running counters."""
+        recalculated_category_stats = {category: dict(stats) for category, stats in self.category_stats.items()}
 
         # Ensure categories from config that might not have had files are included (with zero counts)
         config_categories = set(self.config.get("extension_mapping", {}).values()) | set(self.config.get("custom_patterns", {}).values())
@@ -208,17 +1086,24 @@ class FileOrganizerReporter:
 
         duration = (self.end_time - self.start_time).total_seconds() if self.end_time and self.start_time else 0
 
+        # Per-worker hashing throughput (MB/s over the time each worker spent hashing)
+        hash_workers: Dict[str, Dict[str, Any]] = {}
+        for worker, stats in sorted(self.hash_worker_stats.items()):
+            hash_workers[worker] = {
+                'files': stats['files'],
+                'bytes': stats['bytes'],
+                'seconds': stats['seconds'],
+                'mb_per_second': (stats['bytes'] / (1024*1024)) / stats['seconds'] if stats['seconds'] > 0 else 0.0
+            }
+
         return {
-            'total_files_processed': total_files_processed,
-            'total_size_processed': total_size_processed_overall,
-            'files_moved': total_moved,
-            'files_skipped': total_skipped,
-            'errors': total_errors,
-            'total_size_moved': total_size_moved,
+            **self.totals,
             'start_time': self.start_time.isoformat(),
             'end_time': self.end_time.isoformat() if self.end_time else None,
             'duration_seconds': duration,
-            'categories': recalculated_category_stats
+            'categories': recalculated_category_stats,
+            'hash_workers': hash_workers,
+            'operations_file': str(self.sink.path) if self.sink is not None and self.sink.count else None
         }
 
     def export_report(self, format: str = 'text', output_path: Optional[Path] = None) -> Optional[Path]:
@@ -261,6 +1146,8 @@ class FileOrganizerReporter:
                     writer.writerow(['Total Size Processed (MB)', f"{summary['total_size_processed'] / (1024*1024):.2f}"])
                     writer.writerow(['Total Size Moved (MB)', f"{summary['total_size_moved'] / (1024*1024):.2f}"])
                     writer.writerow(['Duration (seconds)', f"{summary['duration_seconds']:.2f}"])
+                    if summary['operations_file']:
+                        writer.writerow(['All Operations', summary['operations_file']])
                     writer.writerow([])
 
                     writer.writerow(['Category', 'Count', 'Size (MB)', 'Moved', 'Skipped', 'Errors'])
@@ -277,7 +1164,7 @@ class FileOrganizerReporter:
                     writer.writerow([])
 
                     writer.writerow(['Timestamp', 'Operation', 'Source', 'Destination', 'Category', 'Size (Bytes)', 'Reason', 'Error Info'])
-                    for op in self.operation_log[-50:]:
+                    for op in self.recent_operations:
                          writer.writerow([
                              op.get('timestamp', ''), op.get('operation', ''), op.get('source', ''),
                              op.get('destination', ''), op.get('category', ''), op.get('size', 0),
@@ -313,9 +1200,19 @@ class FileOrganizerReporter:
                             f.write(f"{category:<25} {stats['count']:>8} {stats['size']/(1024*1024):>12.2f} "
                                    f"{stats['moved']:>8} {stats['skipped']:>8} {stats['errors']:>8}\n")
 
-                    f.write("\nRECENT OPERATIONS (last 50)\n")
+                    if summary['hash_workers']:
+                        f.write("\nHASH WORKERS\n")
+                        f.write("-" * 60 + "\n")
+                        f.write(f"{'Worker':<25} {'Files':>8} {'Size (MB)':>12} {'MB/s':>12}\n")
+                        for worker, stats in summary['hash_workers'].items():
+                            f.write(f"{worker:<25} {stats['files']:>8} {stats['bytes']/(1024*1024):>12.2f} "
+                                   f"{stats['mb_per_second']:>12.2f}\n")
+
+                    f.write(f"\nRECENT OPERATIONS (last {self.RECENT_OPERATIONS})\n")
                     f.write("-" * 60 + "\n")
-                    for op in self.operation_log[-50:]:
+                    if summary['operations_file']:
+                        f.write(f"All operations: {summary['operations_file']}\n")
+                    for op in self.recent_operations:
                         op_str = f"{op.get('timestamp', 'N/A').split('.')[0]} {op.get('operation', 'N/A').upper()}: {Path(op.get('source', 'N/A')).name}"
                         if op.get('destination'):
                             dest_path = Path(op['destination'])
@@ -326,11 +1223,11 @@ class FileOrganizerReporter:
                             op_str += f" (ERROR: {op['error_info'].splitlines()[0]})"
                         f.write(op_str + "\n")
 
-            self.logger.info(f"Report exported to: {report_file_path}")
+            self.logger.info("Report exported to: %s", report_file_path)
             return report_file_path
 
         except Exception as e:
-            self.logger.error(f"Error exporting report: {e}", exc_info=True)
+            self.logger.error("Error exporting report: %s", e, exc_info=True)
             return None
 
 
@@ -367,8 +1264,34 @@ class EnhancedFileOrganizer:
             # Detailed counts are managed by the reporter
             self.stats = OrganizationStats()
 
+            # Digests produced by the parallel hashing stage, keyed by (path, quick_check)
+            self._hash_results: Dict[Tuple[Path, bool], Optional[str]] = {}
+            # Size-first content index over the target tree, built per run
+            self._duplicate_index: Optional[DuplicateIndex] = None
+            # Persistent digest cache shared across runs, opened on first use
+            self._hash_cache: Optional[HashCache] = None
+            # Move journal for the run in progress (None for dry runs or when disabled)
+            self._journal: Optional[MoveJournal] = None
+
+            # Identity used for permission checks from stat data, and files never to organize
+            self._euid = os.geteuid() if hasattr(os, 'geteuid') else None
+            self._groups = set(os.getgroups()) | {os.getegid()} if hasattr(os, 'getgroups') else set()
+            self._protected_files = self._protected_file_names()
+            # Exclude patterns compiled once instead of per file
+            self._exclude_matcher = ExcludeMatcher(self.config.get("exclude_patterns", []), self.logger)
+            # Progress line state: cached tty check and redraw throttling (see _show_progress)
+            self._stdout_is_tty = sys.stdout.isatty()
+            self._progress_started: Optional[float] = None
+            self._progress_next_draw = 0.0
+            # Destination folders already created/checked during the current run -> their device id
+            self._ready_dest_folders: Dict[Path, int] = {}
+            # Pool for cross-device copies and the moves it has in flight:
+            # destination -> (future, source, result details, journal seq)
+            self._copy_pool: Optional[ThreadPoolExecutor] = None
+            self._pending_moves: Dict[Path, Tuple[Future, Path, Dict[str, Any], Optional[int]]] = {}
+
         except Exception as e:
-            self.logger.critical(f"Initialization failed: {e}", exc_info=True)
+            self.logger.critical("Initialization failed: %s", e, exc_info=True)
             raise FileOrganizerError(f"Initialization failed: {e}") from e
 
 
@@ -388,8 +1311,8 @@ class EnhancedFileOrganizer:
                 pass  # Ignore errors closing
             logger.removeHandler(handler)
 
-        # Set log level
-        logger.setLevel(logging.DEBUG) # Master level captures everything
+        # Capture everything while handlers are set up; narrowed by _update_logger_level below
+        logger.setLevel(logging.DEBUG)
 
         # Console handler - use INFO level by default, will be overridden by main
         console_handler = logging.StreamHandler()
@@ -411,20 +1334,30 @@ class EnhancedFileOrganizer:
             log_file = log_dir / f'file_organizer_debug_{datetime.now().strftime("%Y%m%d_%H%M%S")}.log'
 
             file_handler = logging.FileHandler(log_file, mode='w')
-            file_handler.setLevel(logging.DEBUG) # Log everything to the file
+            file_handler.setLevel(self.config.get("file_log_level", "DEBUG")) # Everything (DEBUG) by default
             file_formatter = logging.Formatter(
                  '%(asctime)s - %(name)s - %(levelname)-8s - %(message)s'
              )
             file_handler.setFormatter(file_formatter)
             logger.addHandler(file_handler)
-            logger.info(f"Logging DEBUG messages to file: {log_file}")
+            logger.info("Logging %s messages to file: %s", logging.getLevelName(file_handler.level), log_file)
 
         except Exception as e:
-             logger.warning(f"Could not set up file logging in '{log_dir}': {e}")
+             logger.warning("Could not set up file logging in '%s': %s", log_dir, e)
 
+        self._update_logger_level(logger)
         # Return the configured logger instance
         return logger
 
+    @staticmethod
+    def _update_logger_level(logger: logging.Logger) -> None:
+        """
+        Lower the logger's level only as far as its most verbose handler, so messages
+        no handler would emit are dropped before their arguments are ever formatted.
+        """
+        levels = [handler.level for handler in logger.handlers if not isinstance(handler, logging.NullHandler)]
+        logger.setLevel(min(levels) if levels else logging.DEBUG)
+
 
     def _load_config(self) -> Dict[str, Any]:
         """Load configuration from file or create default."""
@@ -493,15 +1426,34 @@ class EnhancedFileOrganizer:
             "exclude_patterns": [
                 "*.tmp", "*.log", ".*", "desktop.ini", "thumbs.db",
                 "__pycache__", ".git", ".vscode", ".idea",
+                "*.part", "*.crdownload", "*.partial", # Downloads/copies still in progress
                 "file_organizer_config.json" # Exclude config file itself by default
             ],
             "date_based_organization": False, # If True, adds Year/Month or Year subfolders
             "date_format": "%Y-%m",         # "%Y" for Year only, "%Y-%m" for Year/Month
             "max_file_size_mb": 1000,       # Skip files larger than this (1GB default)
+            "max_depth": 0,                 # Folder levels below the target to organize (0 = top level only, -1 = unlimited)
+            "scan_batch_size": 1000,        # Files taken from the streaming scanner per processing batch
             "log_directory": "logs",        # Directory to store log files and reports
             "backup_structure": True,       # Backup directory structure before organizing
             "duplicate_resolution": "rename", # Options: 'skip', 'rename', 'overwrite', 'ask'
             "hash_chunk_size": 65536,       # 64KB chunks for hashing large files
+            "hash_workers": 4,              # Concurrent hashing workers for duplicate detection (1 = serial)
+            "hash_executor": "thread",      # 'thread' (MD5 releases the GIL) or 'process'
+            "hash_cache_enabled": True,     # Reuse digests of unchanged files across runs
+            "hash_cache_file": "file_organizer_hash_cache.sqlite", # Relative paths are next to the config file
+            "hash_cache_max_age_days": 30,  # Evict cache entries for files not seen for this long
+            "journal_enabled": True,        # Log every move to a journal in the target folder (resume + undo)
+            "journal_file": MoveJournal.FILE_NAME,
+            "journal_fsync_every": 100,     # fsync the journal after this many moves
+            "copy_workers": 4,              # Concurrent copies for moves to another filesystem (1 = one at a time)
+            "watch_backend": "auto",        # Watch mode event source: 'auto', 'inotify' (Linux) or 'poll'
+            "watch_poll_interval": 5,       # Seconds between rescans when polling
+            "watch_settle_seconds": 2,      # A file must stay unchanged this long before it is moved
+            "watch_batch_seconds": 5,       # Move settled files at least this often (or once a batch is full)
+            "file_log_level": "DEBUG",      # Level of the log file in log_directory ('INFO' skips per-file debug lines)
+            "progress_refresh_per_second": 10, # Max progress bar redraws per second (0 = every file)
+            "operations_log_format": "jsonl", # Per-file results streamed to the log directory: 'jsonl', 'csv' or 'none'
             "export_reports": True,         # Automatically export reports after run
             "report_formats": ["text", "csv"] # List of formats to export ('text', 'csv', 'json')
         }
@@ -517,11 +1469,11 @@ class EnhancedFileOrganizer:
             try:
                 with open(config_file_path, 'r') as f:
                     loaded_config = json.load(f)
-                logger.info(f"Loaded configuration from '{config_file_path}'.") # Use logger now
+                logger.info("Loaded configuration from '%s'.", config_file_path) # Use logger now
             except json.JSONDecodeError as e:
-                logger.error(f"Error decoding JSON from '{config_file_path}'. Using default mapping.")
+                logger.error("Error decoding JSON from '%s'. Using default mapping.", config_file_path)
             except Exception as e:
-                logger.error(f"An unexpected error occurred loading config '{config_file_path}': {e}. Using default mapping.")
+                logger.error("An unexpected error occurred loading config '%s': %s. Using default mapping.", config_file_path, e)
 
 
         # Merge loaded config with defaults
@@ -539,7 +1491,7 @@ class EnhancedFileOrganizer:
         valid_strategies = [s.value for s in DuplicateStrategy]
         current_strategy = config.get("duplicate_resolution")
         if current_strategy not in valid_strategies:
-            logger.warning(f"Invalid duplicate_resolution strategy '{current_strategy}'. Defaulting to 'rename'.")
+            logger.warning("Invalid duplicate_resolution strategy '%s'. Defaulting to 'rename'.", current_strategy)
             config["duplicate_resolution"] = "rename"
 
         # Ensure extensions in mapping are lowercase keys
@@ -550,6 +1502,49 @@ class EnhancedFileOrganizer:
         if "custom_patterns" in config:
              config["custom_patterns"] = {k.lower(): v for k, v in config["custom_patterns"].items()}
 
+        # Validate hashing pool settings
+        if config.get("hash_executor") not in ("thread", "process"):
+            logger.warning("Invalid hash_executor '%s'. Defaulting to 'thread'.", config.get('hash_executor'))
+            config["hash_executor"] = "thread"
+        try:
+            config["hash_workers"] = max(1, int(config.get("hash_workers", 4)))
+        except (TypeError, ValueError):
+            logger.warning("Invalid hash_workers '%s'. Defaulting to 4.", config.get('hash_workers'))
+            config["hash_workers"] = 4
+
+        # Validate scan, journal and copy settings
+        for key, default, minimum in (("max_depth", 0, -1), ("scan_batch_size", 1000, 1), ("journal_fsync_every", 100, 1),
+                                       ("copy_workers", 4, 1)):
+            try:
+                config[key] = max(minimum, int(config.get(key, default)))
+            except (TypeError, ValueError):
+                logger.warning("Invalid %s '%s'. Defaulting to %s.", key, config.get(key), default)
+                config[key] = default
+
+        # Validate watch mode settings
+        if config.get("watch_backend") not in ("auto", "inotify", "poll"):
+            logger.warning("Invalid watch_backend '%s'. Defaulting to 'auto'.", config.get('watch_backend'))
+            config["watch_backend"] = "auto"
+        for key, default in (("watch_poll_interval", 5), ("watch_settle_seconds", 2), ("watch_batch_seconds", 5)):
+            try:
+                config[key] = max(0.1, float(config.get(key, default)))
+            except (TypeError, ValueError):
+                logger.warning("Invalid %s '%s'. Defaulting to %s.", key, config.get(key), default)
+                config[key] = default
+
+        if config.get("file_log_level") not in ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"):
+            logger.warning("Invalid file_log_level '%s'. Defaulting to 'DEBUG'.", config.get("file_log_level"))
+            config["file_log_level"] = "DEBUG"
+        try:
+            config["progress_refresh_per_second"] = max(0.0, float(config.get("progress_refresh_per_second", 10)))
+        except (TypeError, ValueError):
+            logger.warning("Invalid progress_refresh_per_second '%s'. Defaulting to 10.", config.get("progress_refresh_per_second"))
+            config["progress_refresh_per_second"] = 10
+
+        if config.get("operations_log_format") not in ("jsonl", "csv", "none"):
+            logger.warning("Invalid operations_log_format '%s'. Defaulting to 'jsonl'.", config.get('operations_log_format'))
+            config["operations_log_format"] = "jsonl"
+
         # Validate report formats
         valid_report_formats = ['text', 'csv', 'json']
         if "report_formats" in config:
@@ -574,9 +1569,9 @@ class EnhancedFileOrganizer:
             config_file_path.parent.mkdir(parents=True, exist_ok=True) # Ensure config directory exists
             with open(config_file_path, 'w') as f:
                 json.dump(config, f, indent=2)
-            self.logger.debug(f"Saved configuration to '{config_file_path}'.")
+            self.logger.debug("Saved configuration to '%s'.", config_file_path)
         except Exception as e:
-            self.logger.error(f"Could not save config file '{self.config_path}': {e}")
+            self.logger.error("Could not save config file '%s': %s", self.config_path, e)
 
     # --- Helper Methods ---
 
@@ -589,24 +1584,51 @@ class EnhancedFileOrganizer:
 
     def _clear_progress_line(self):
          """Clears the current console line for the progress bar."""
-         if sys.stdout.isatty(): # Check if connected to a terminal
+         if self._stdout_is_tty: # Check if connected to a terminal
              # Move cursor to the beginning of the line and clear line from cursor
              sys.stdout.write('\r' + ' ' * 100 + '\r') # Clear more space just in case
              sys.stdout.flush()
 
-    def _show_progress(self, current: int, total: int, description: str = "Processing"):
-        """Show progress bar on the console."""
-        if not sys.stdout.isatty(): # Only show progress on a terminal
+    def _show_progress(self, current: int, total: Optional[int], description: str = "Processing"):
+        """
+        Show progress bar on the console (just a running count if the total is not known).
+
+        Redraws are limited to `progress_refresh_per_second` (0 = redraw on every call),
+        except that the final update of a known total is always drawn. The line
+        includes the processing rate and, when the total is known, an ETA.
+        """
+        now = time.monotonic()
+        if current <= 1 or self._progress_started is None:
+            self._progress_started = now # New progress sequence
+            self._progress_next_draw = 0.0
+        if now < self._progress_next_draw and current != total:
+            return
+        if not self._stdout_is_tty: # Only show progress on a terminal
+            return
+        refresh = self.config.get("progress_refresh_per_second", 10)
+        self._progress_next_draw = now + (1.0 / refresh if refresh > 0 else 0.0)
+
+        elapsed = now - self._progress_started
+        rate = current / elapsed if elapsed > 0 else 0.0
+
+        if total is None:
+            # Streaming scan: the number of files is not known up front
+            self._clear_progress_line()
+            print(f"{description}: {current} files ({rate:,.0f} files/s)", end="", flush=True)
             return
 
         percent = (current / total) * 100 if total > 0 else 0
         bar_length = 30
-        filled = int(bar_length * current // total)
+        filled = int(bar_length * current // total) if total > 0 else bar_length
         bar = "█" * filled + "░" * (bar_length - filled)
+        eta = ""
+        if rate > 0 and current < total:
+            minutes, seconds = divmod(int((total - current) / rate), 60)
+            eta = f" ETA {minutes}:{seconds:02d}"
 
         # Clear the line before printing the progress bar
         self._clear_progress_line()
-        print(f"{description}: [{bar}] {percent:.1f}% ({current}/{total})", end="", flush=True)
+        print(f"{description}: [{bar}] {percent:.1f}% ({current}/{total}) {rate:,.0f} files/s{eta}", end="", flush=True)
 
         if current == total:
             print()  # New line when complete
@@ -623,68 +1645,99 @@ class EnhancedFileOrganizer:
                 self.logger.error(f"Insufficient disk space in '{directory.anchor}' partition. Required: {required_size:,} bytes, Available: {free:,} bytes.")
                 return False
         except OSError as e:
-            self.logger.error(f"Could not check disk space for '{directory}': {e}")
+            self.logger.error("Could not check disk space for '%s': %s", directory, e)
             return False
 
-    def _should_skip_file(self, file_path: Path) -> Tuple[bool, str]:
-        """Check if file should be skipped based on various criteria."""
-        # Check if file is the script or config file itself using absolute paths
-        try:
-            abs_file_path = file_path.resolve()
-            abs_script_path = Path(__file__).resolve()
-            abs_config_path = Path(self.config_path).resolve()
+    def _matches_exclude_pattern(self, name: str) -> Optional[str]:
+        """Return the first exclude pattern matching a file or directory name, or None."""
+        return self._exclude_matcher.match(name)
+
+    def _protected_file_names(self) -> Dict[str, Tuple[Path, str]]:
+        """Map the (lowercase) names of the script, config and hash cache to their resolved paths."""
+        protected = {}
+        for path, reason in ((Path(__file__), "is the script file"),
+                             (Path(self.config_path).expanduser(), "is the configuration file"),
+                             (self._hash_cache_path(), "is the hash cache file")):
+            try:
+                protected[path.name.lower()] = (path.resolve(), reason)
+            except (OSError, RuntimeError):
+                continue
+        return protected
+
+    def _check_access(self, st: os.stat_result) -> Optional[str]:
+        """
+        Check read/write permission from a stat result instead of two os.access() calls.
 
-            if abs_file_path == abs_script_path:
-                return True, "is the script file"
-            # Use is_relative_to check in case config file is in parent dir of target
-            if abs_config_path == abs_file_path:
-                 return True, "is the configuration file"
+        Returns a skip reason, or None if the file can be read and moved.
+        """
+        if os.name == 'nt':
+            # Windows only exposes the read-only attribute through st_mode
+            readable, writable = True, bool(st.st_mode & stat.S_IWRITE)
+        elif self._euid == 0:
+            readable = writable = True
+        elif st.st_uid == self._euid:
+            readable, writable = bool(st.st_mode & stat.S_IRUSR), bool(st.st_mode & stat.S_IWUSR)
+        elif st.st_gid in self._groups:
+            readable, writable = bool(st.st_mode & stat.S_IRGRP), bool(st.st_mode & stat.S_IWGRP)
+        else:
+            readable, writable = bool(st.st_mode & stat.S_IROTH), bool(st.st_mode & stat.S_IWOTH)
 
-        except (OSError, RuntimeError) as e: # Catch OSError and symlink loop RuntimeErrors
-             # If resolving path fails, skip as it might be a broken symlink or inaccessible
-             self.logger.debug(f"Could not resolve path {file_path}: {e}")
-             return True, "could not resolve path"
+        if not readable: # Need read permission to hash/copy
+            return "read permission denied"
+        if not writable: # Need write permission to move/delete original
+            return "write permission denied (might be in use)"
+        return None
 
+    def _should_skip_file(self, file_path: Path, st: Optional[os.stat_result] = None) -> Tuple[bool, str]:
+        """
+        Check if file should be skipped based on various criteria.
 
-        # Check exclude patterns (using case-insensitive regex match on the filename)
-        # Use glob pattern matching logic with regex conversion
-        file_name_lower = file_path.name.lower()
-        for pattern in self.config.get("exclude_patterns", []):
+        Args:
+            file_path: File to check
+            st: Stat result for the file if the caller already has one (e.g. from os.scandir),
+                so the check needs no further system calls
+        """
+        # Check if file is the script, config or hash cache file itself.
+        # Only files sharing one of those names are resolved, instead of resolving every file.
+        protected = self._protected_files.get(file_path.name.lower())
+        if protected is not None:
             try:
-                # Escape special regex characters, then convert glob patterns (*, ?)
-                escaped = re.escape(pattern)
-                regex_pattern = escaped.replace(r'\*', '.*').replace(r'\?', '.')
-                # Anchor the regex to match the whole filename
-                regex = re.compile(f'^{regex_pattern}$', re.IGNORECASE)
-                # Check if the filename matches the pattern
-                if regex.match(file_name_lower):
-                    self.logger.debug(f"'{file_path.name}' matches exclude pattern '{pattern}'.")
-                    return True, f"matches exclude pattern: {pattern}"
-            except re.error as e:
-                self.logger.warning(f"Invalid regex pattern '{pattern}' in config exclude_patterns: {e}")
-                continue # Continue to next pattern
+                if file_path.resolve() == protected[0]:
+                    return True, protected[1]
+            except (OSError, RuntimeError) as e: # Catch OSError and symlink loop RuntimeErrors
+                 # If resolving path fails, skip as it might be a broken symlink or inaccessible
+                 self.logger.debug("Could not resolve path %s: %s", file_path, e)
+                 return True, "could not resolve path"
+
+
+        # Check exclude patterns (using case-insensitive regex match on the filename)
+        matched_pattern = self._matches_exclude_pattern(file_path.name)
+        if matched_pattern is not None:
+            self.logger.debug("'%s' matches exclude pattern '%s'.", file_path.name, matched_pattern)
+            return True, f"matches exclude pattern: {matched_pattern}"
 
 
         # Check file size limit
         try:
-            max_size = self.config.get("max_file_size_mb", 1000) * 1024 * 1024
-            if file_path.stat().st_size > max_size:
-                self.logger.debug(f"'{file_path.name}' is too large ({file_path.stat().st_size} bytes).")
-                return True, f"file too large (>{max_size/1024/1024:.1f}MB)"
+            if st is None:
+                st = file_path.stat()
         except OSError:
             # If stat fails, treat as potentially inaccessible or problematic
-            self.logger.debug(f"Could not access metadata for '{file_path.name}'.")
+            self.logger.debug("Could not access metadata for '%s'.", file_path.name)
             return True, "could not access file metadata (might be in use or permission issue)"
 
-        # Check if file is in use (common heuristic, may not work everywhere)
+        max_size = self.config.get("max_file_size_mb", 1000) * 1024 * 1024
+        if st.st_size > max_size:
+            self.logger.debug("'%s' is too large (%s bytes).", file_path.name, st.st_size)
+            return True, f"file too large (>{max_size/1024/1024:.1f}MB)"
+
+        # Check permissions (common heuristic, may not work everywhere)
         # rely on OS errors during the move for definitive locked files
         # This check is primarily for permissions or obvious locks before attempting move
-        if not os.access(file_path, os.R_OK): # Need read permission to hash/copy
-             self.logger.debug(f"Read permission denied for '{file_path.name}'.")
-             return True, "read permission denied"
-        if not os.access(file_path, os.W_OK): # Need write permission to move/delete original
-             self.logger.debug(f"Write permission denied for '{file_path.name}'.")
-             return True, "write permission denied (might be in use)"
+        access_problem = self._check_access(st)
+        if access_problem:
+             self.logger.debug("Skipping '%s': %s.", file_path.name, access_problem)
+             return True, access_problem
 
 
         return False, "" # Not skipped
@@ -700,44 +1753,245 @@ class EnhancedFileOrganizer:
         Returns:
             Optional[str]: Hex digest of the file hash, or None on error
         """
+        if (file_path, quick_check) in self._hash_results:
+            # Already computed by the parallel hashing stage
+            return self._hash_results[(file_path, quick_check)]
+
         if not file_path.is_file():
             # Already logged warnings for non-existent files before hashing
             return None
 
         try:
-            file_size = file_path.stat().st_size
-            chunk_size = self.config.get("hash_chunk_size", 65536)  # 64KB chunks
-            file_hash = hashlib.md5()
+            digest, st = self._lookup_cached_hash(file_path, quick_check)
+            if digest is not None:
+                self.logger.debug("Using cached hash for %s (quick check: %s).", file_path.name, quick_check)
+                return digest
 
-            with open(file_path, 'rb') as f:
-                # Always read first chunk
-                chunk1 = f.read(chunk_size)
-                file_hash.update(chunk1)
-
-                # For quick check on large files, hash last chunk too
-                if quick_check and file_size > chunk_size * 2:
-                    # Seek to near end of file (minus one chunk)
-                    f.seek(-chunk_size, 2)
-                    chunk2 = f.read(chunk_size)
-                    file_hash.update(chunk2)
-                    self.logger.debug(f"Hashed first and last {chunk_size} bytes for {file_path.name} (quick check).")
-                else:
-                     # If not quick check, read remaining chunks
-                    while chunk := f.read(chunk_size): # Use walrus operator for cleaner loop
-                         file_hash.update(chunk)
-                    self.logger.debug(f"Hashed entire file {file_path.name}.")
-
-            return file_hash.hexdigest()
+            chunk_size = self.config.get("hash_chunk_size", 65536)  # 64KB chunks
+            digest, _ = _hash_file_contents(file_path, chunk_size, quick_check)
+            if st is not None:
+                self._store_cached_hash(file_path, st, quick_check, digest)
+            if quick_check:
+                self.logger.debug("Hashed first and last %s bytes for %s (quick check).", chunk_size, file_path.name)
+            else:
+                self.logger.debug("Hashed entire file %s.", file_path.name)
+            return digest
 
         except (IOError, OSError, PermissionError) as e:
-            self.logger.warning(f"Error hashing file {file_path}: {e}")
+            self.logger.warning("Error hashing file %s: %s", file_path, e)
             return None
         except Exception as e:
-            self.logger.error(f"Unexpected error during hashing {file_path}: {e}", exc_info=True)
+            self.logger.error("Unexpected error during hashing %s: %s", file_path, e, exc_info=True)
             return None
 
+    def _hash_cache_path(self) -> Path:
+        """Location of the persistent hash cache (relative paths live next to the config file)."""
+        cache_file = Path(self.config.get("hash_cache_file", "file_organizer_hash_cache.sqlite")).expanduser()
+        if not cache_file.is_absolute():
+            cache_file = Path(self.config_path).expanduser().resolve().parent / cache_file
+        return cache_file
+
+    def _get_hash_cache(self) -> Optional[HashCache]:
+        """Open the persistent hash cache on first use (None if disabled or unavailable)."""
+        if self._hash_cache is None and self.config.get("hash_cache_enabled", True):
+            cache_file = self._hash_cache_path()
+            try:
+                self._hash_cache = HashCache(cache_file, self.config.get("hash_cache_max_age_days", 30), self.logger)
+                self.logger.debug("Using hash cache: %s", cache_file)
+            except (sqlite3.Error, OSError) as e: # OSError: cache directory could not be created
+                self.logger.warning("Could not open hash cache '%s': %s. Continuing without it.", cache_file, e)
+                self.config["hash_cache_enabled"] = False # Don't retry for every file
+        return self._hash_cache
+
+    def _close_hash_cache(self) -> None:
+        """Flush and close the persistent hash cache at the end of a run."""
+        if self._hash_cache is None:
+            return
+        try:
+            self.logger.info("Hash cache: %s hits, %s misses.", self._hash_cache.hits, self._hash_cache.misses)
+            self._hash_cache.close()
+        except sqlite3.Error as e:
+            self.logger.warning("Could not save hash cache '%s': %s", self._hash_cache.db_path, e)
+        self._hash_cache = None
+
+    def _open_journal(self, target_path: Path) -> None:
+        """Start (or resume) the move journal for a real run in target_path."""
+        if not self.config.get("journal_enabled", True):
+            return
+        journal_path = target_path / self.config.get("journal_file", MoveJournal.FILE_NAME)
+        # Never organize the journal itself
+        self._protected_files[journal_path.name.lower()] = (journal_path, "is the move journal")
+        try:
+            journal = MoveJournal(journal_path, self.config.get("journal_fsync_every", 100))
+            run_id, resumed = journal.begin(target_path)
+        except OSError as e:
+            self.logger.warning("Could not open move journal '%s': %s. Continuing without it.", journal_path, e)
+            return
+        self._journal = journal
+        if resumed is not None:
+            done = len(resumed.completed_moves())
+            self.logger.info("Resuming interrupted run %s (%s files already moved).", run_id, done)
+            self._print_colored(f"↻ Resuming interrupted run {run_id} ({done} files already moved).", Fore.YELLOW)
+        else:
+            self.logger.info("Journaling moves of run %s to '%s'.", run_id, journal_path)
+
+    def _close_journal(self, completed: bool) -> None:
+        """Close the move journal; an incomplete run is resumed next time."""
+        if self._journal is None:
+            return
+        try:
+            self._journal.close(completed)
+        except OSError as e:
+            self.logger.warning("Could not finalize move journal '%s': %s", self._journal.path, e)
+        self._journal = None
 
-    def _get_destination_folder(self, file_path: Path) -> str:
+    def _lookup_cached_hash(self, file_path: Path, quick_check: bool) -> Tuple[Optional[str], Optional[os.stat_result]]:
+        """
+        Look a file up in the persistent hash cache.
+
+        Returns:
+            (cached digest or None, stat result to store a fresh digest under, or None if the cache is off)
+        """
+        cache = self._get_hash_cache()
+        if cache is None:
+            return None, None
+        st = os.stat(file_path)
+        try:
+            return cache.lookup(st, quick_check), st
+        except sqlite3.Error as e:
+            self.logger.warning("Hash cache lookup failed for %s: %s", file_path.name, e)
+            return None, None
+
+    def _store_cached_hash(self, file_path: Path, st: os.stat_result, quick_check: bool, digest: str) -> None:
+        """Remember a fresh digest in the persistent hash cache (which flushes every FLUSH_EVERY entries)."""
+        if self._hash_cache is None:
+            return
+        try:
+            self._hash_cache.store(st, quick_check, digest)
+        except sqlite3.Error as e:
+            self.logger.warning("Hash cache write failed for %s: %s. Continuing without it.", file_path.name, e)
+            self._disable_hash_cache()
+
+    def _flush_hash_cache(self) -> None:
+        """Write buffered digests to the persistent hash cache."""
+        if self._hash_cache is None:
+            return
+        try:
+            self._hash_cache.flush()
+        except sqlite3.Error as e:
+            self.logger.warning("Could not save hash cache '%s': %s. Continuing without it.", self._hash_cache.db_path, e)
+            self._disable_hash_cache()
+
+    def _disable_hash_cache(self) -> None:
+        """Stop using the persistent hash cache for the rest of the run after a database error."""
+        self._hash_cache.discard()
+        self._hash_cache = None
+        self.config["hash_cache_enabled"] = False # Don't reopen it for the next file
+
+    def _hash_files_parallel(self, file_paths: List[Path], quick_check: bool = False) -> Dict[Path, Optional[str]]:
+        """
+        Hash many files concurrently on a worker pool.
+
+        Results are stored in the hash results used by `_get_file_hash` (so
+        `_handle_duplicate` picks them up without rehashing) and each worker's
+        throughput is recorded with the reporter.
+
+        Args:
+            file_paths: Files to hash (duplicates and already-hashed files are ignored)
+            quick_check: If True, hash only first/last chunks for large files
+
+        Returns:
+            Dict[Path, Optional[str]]: Digest per file, None where hashing failed
+        """
+        pending = list(dict.fromkeys(p for p in file_paths if (p, quick_check) not in self._hash_results))
+        if not pending:
+            return {p: self._hash_results.get((p, quick_check)) for p in file_paths}
+
+        # Digests cached by earlier runs skip hashing entirely
+        file_stats: Dict[Path, os.stat_result] = {}
+        still_pending = []
+        for p in pending:
+            try:
+                digest, st = self._lookup_cached_hash(p, quick_check)
+            except OSError:
+                digest, st = None, None # Let the worker report the error
+            if digest is not None:
+                self._hash_results[(p, quick_check)] = digest
+                continue
+            if st is not None:
+                file_stats[p] = st
+            still_pending.append(p)
+        pending = still_pending
+        if not pending:
+            return {p: self._hash_results.get((p, quick_check)) for p in file_paths}
+
+        chunk_size = self.config.get("hash_chunk_size", 65536)
+        workers = min(self.config.get("hash_workers", 4), len(pending))
+        executor_cls = ProcessPoolExecutor if self.config.get("hash_executor") == "process" else ThreadPoolExecutor
+        executor_kwargs = {} if executor_cls is ProcessPoolExecutor else {'thread_name_prefix': 'hash-worker'}
+
+        self.logger.debug("Hashing %s files with %s %s workers (quick check: %s).", len(pending), workers, self.config.get('hash_executor'), quick_check)
+
+        def store(result: Tuple[str, Optional[str], int, float, str, Optional[str]]) -> None:
+            path_str, digest, bytes_read, seconds, worker_name, error = result
+            if error:
+                self.logger.warning("Error hashing file %s: %s", path_str, error)
+            path = Path(path_str)
+            self._hash_results[(path, quick_check)] = digest
+            self.reporter.record_hash_work(worker_name, bytes_read, seconds)
+            if digest is not None and path in file_stats:
+                self._store_cached_hash(path, file_stats[path], quick_check, digest)
+
+        if workers <= 1:
+            for p in pending:
+                store(_hash_worker(str(p), chunk_size, quick_check))
+        else:
+            with executor_cls(max_workers=workers, **executor_kwargs) as executor:
+                futures = [executor.submit(_hash_worker, str(p), chunk_size, quick_check) for p in pending]
+                for future in as_completed(futures):
+                    store(future.result())
+
+        return {p: self._hash_results.get((p, quick_check)) for p in file_paths}
+
+    def _build_duplicate_index(self, target_path: Path) -> None:
+        """
+        Index the files already organized under the target tree by size.
+
+        Nothing is hashed here: files being processed are added batch by batch
+        (see _index_batch) and only size groups they collide with get hashed.
+        """
+        self._duplicate_index = None
+        if DuplicateStrategy(self.config.get("duplicate_resolution", "rename")) == DuplicateStrategy.SKIP:
+            return # SKIP never needs to know whether files are identical
+
+        chunk_size = self.config.get("hash_chunk_size", 65536)
+        index = DuplicateIndex(self._hash_files_parallel, full_hash_threshold=chunk_size * 2)
+
+        # Existing destinations can only live in the organizer's category folders
+        for category_root in sorted(self._category_roots()):
+            category_dir = target_path / category_root
+            if category_dir.is_dir():
+                for path, st in self._walk_files(category_dir):
+                    index.add(path, st.st_size)
+
+        self._duplicate_index = index
+        self.logger.debug("Duplicate index: %s organized files indexed by size.", len(index))
+
+    def _index_batch(self, batch: List[Tuple[Path, os.stat_result]]) -> None:
+        """
+        Add a batch of files about to be processed to the duplicate index and
+        resolve the size groups they fall into (quick hash, then full hash for
+        quick-hash collisions) on the hashing pool; the rest of the tree is never read.
+        """
+        index = self._duplicate_index
+        if index is None:
+            return
+        for file_path, st in batch:
+            index.add(file_path, st.st_size)
+        index.resolve([file_path for file_path, _ in batch])
+
+
+    def _get_destination_folder(self, file_path: Path, st: Optional[os.stat_result] = None) -> str:
         """
         Determine destination folder for a file based on config rules.
 
@@ -745,6 +1999,7 @@ class EnhancedFileOrganizer:
 
         Args:
             file_path: Path to the file
+            st: Stat result for the file if already known (avoids another stat for date folders)
 
         Returns:
             str: Name of the destination folder (relative path components, e.g. "Images/2024-06")
@@ -771,7 +2026,7 @@ class EnhancedFileOrganizer:
         if folder_name is None:
             folder_name = self.config["extension_mapping"].get("unknown", "Others")
             if extension or "no_extension" not in self.config["extension_mapping"]:
-                 self.logger.debug(f"Using default 'Others' for '{file_path.name}' (extension '{extension}' unknown).")
+                 self.logger.debug("Using default 'Others' for '%s' (extension '%s' unknown).", file_path.name, extension)
 
 
         # 4. Add date-based organization if enabled
@@ -779,15 +2034,15 @@ class EnhancedFileOrganizer:
             date_format = self.config.get("date_format", "%Y-%m")
             try:
                 # Use modification time
-                file_date = datetime.fromtimestamp(file_path.stat().st_mtime)
+                file_date = datetime.fromtimestamp((st or file_path.stat()).st_mtime)
                 date_subfolder = file_date.strftime(date_format)
                 # Append date subfolder to the determined folder name
                 folder_name = Path(folder_name) / date_subfolder
             except OSError:
-                self.logger.warning(f"Could not get modification date for {file_path.name}, skipping date-based organization for this file.")
+                self.logger.warning("Could not get modification date for %s, skipping date-based organization for this file.", file_path.name)
                 pass  # Use default folder name if date access fails
             except ValueError:
-                 self.logger.error(f"Invalid date format '{date_format}' in config. Skipping date-based organization for this file.")
+                 self.logger.error("Invalid date format '%s' in config. Skipping date-based organization for this file.", date_format)
                  pass # Use default folder name if format is invalid
 
 
@@ -825,7 +2080,7 @@ class EnhancedFileOrganizer:
 
         if not dest_file_path.exists():
              # This method should only be called if dest_file_path exists, but add check
-             self.logger.warning(f"_handle_duplicate called but destination '{dest_file_path}' does not exist.")
+             self.logger.warning("_handle_duplicate called but destination '%s' does not exist.", dest_file_path)
              result_details.update({'reason': "duplicate handling called on non-existent destination"})
              return DuplicateResolutionResult(**result_details)
 
@@ -836,36 +2091,44 @@ class EnhancedFileOrganizer:
 
 
         try:
-            self.logger.debug(f"Handling duplicate: Source='{source_name}', Dest='{dest_name}', Strategy='{strategy.value}'")
-
-            # Perform quick hash check
-            source_hash_quick = self._get_file_hash(source_file, quick_check=True)
-            dest_hash_quick = self._get_file_hash(dest_file_path, quick_check=True)
-
-            files_identical = False
-            # Proceed to full hash only if quick hashes match AND both were calculable
-            if source_hash_quick is not None and dest_hash_quick is not None and source_hash_quick == dest_hash_quick:
-                self.logger.debug(f"Quick hashes match for '{source_name}' vs '{dest_name}'. Performing full hash check.")
-                source_hash_full = self._get_file_hash(source_file, quick_check=False)
-                dest_hash_full = self._get_file_hash(dest_file_path, quick_check=False)
-
-                # Files are identical only if full hashes match AND both were calculable
-                if source_hash_full is not None and dest_hash_full is not None and source_hash_full == dest_hash_full:
-                     files_identical = True
-                     self.logger.debug(f"Full hash confirmed '{source_name}' and '{dest_name}' are identical.")
-                elif source_hash_full is None or dest_hash_full is None:
-                     self.logger.warning(f"Could not complete full hash check for '{source_name}' or '{dest_name}'. Cannot confirm if identical.")
-                     files_identical = False # Treat as non-identical if cannot verify identity
-                else:
-                     self.logger.debug(f"Full hash confirmed '{source_name}' and '{dest_name}' are different.")
-                     files_identical = False # Full hashes differ
+            self.logger.debug("Handling duplicate: Source='%s', Dest='%s', Strategy='%s'", source_name, dest_name, strategy.value)
 
-            elif source_hash_quick is None or dest_hash_quick is None:
-                 self.logger.warning(f"Could not calculate quick hash for '{source_name}' or '{dest_name}'. Cannot confirm if identical.")
-                 files_identical = False # Cannot confirm identity, treat as non-identical for safety (will rename or ask, not skip identical)
+            # Use the size-first duplicate index when it covers both files
+            index = self._duplicate_index
+            indexed_identity = index.are_identical(source_file, dest_file_path) if index is not None else None
+
+            if indexed_identity is not None:
+                files_identical = indexed_identity
+                self.logger.debug("Duplicate index says '%s' and '%s' are %s.", source_name, dest_name, 'identical' if files_identical else 'different')
             else:
-                 self.logger.debug(f"Quick hashes differ for '{source_name}' vs '{dest_name}'. Files are different.")
-                 files_identical = False # Quick hashes differ
+                # Perform quick hash check
+                source_hash_quick = self._get_file_hash(source_file, quick_check=True)
+                dest_hash_quick = self._get_file_hash(dest_file_path, quick_check=True)
+
+                files_identical = False
+                # Proceed to full hash only if quick hashes match AND both were calculable
+                if source_hash_quick is not None and dest_hash_quick is not None and source_hash_quick == dest_hash_quick:
+                    self.logger.debug("Quick hashes match for '%s' vs '%s'. Performing full hash check.", source_name, dest_name)
+                    source_hash_full = self._get_file_hash(source_file, quick_check=False)
+                    dest_hash_full = self._get_file_hash(dest_file_path, quick_check=False)
+
+                    # Files are identical only if full hashes match AND both were calculable
+                    if source_hash_full is not None and dest_hash_full is not None and source_hash_full == dest_hash_full:
+                         files_identical = True
+                         self.logger.debug("Full hash confirmed '%s' and '%s' are identical.", source_name, dest_name)
+                    elif source_hash_full is None or dest_hash_full is None:
+                         self.logger.warning("Could not complete full hash check for '%s' or '%s'. Cannot confirm if identical.", source_name, dest_name)
+                         files_identical = False # Treat as non-identical if cannot verify identity
+                    else:
+                         self.logger.debug("Full hash confirmed '%s' and '%s' are different.", source_name, dest_name)
+                         files_identical = False # Full hashes differ
+
+                elif source_hash_quick is None or dest_hash_quick is None:
+                     self.logger.warning("Could not calculate quick hash for '%s' or '%s'. Cannot confirm if identical.", source_name, dest_name)
+                     files_identical = False # Cannot confirm identity, treat as non-identical for safety (will rename or ask, not skip identical)
+                else:
+                     self.logger.debug("Quick hashes differ for '%s' vs '%s'. Files are different.", source_name, dest_name)
+                     files_identical = False # Quick hashes differ
 
 
             # --- Apply resolution strategy ---
@@ -873,7 +2136,7 @@ class EnhancedFileOrganizer:
             if strategy == DuplicateStrategy.SKIP:
                 action_taken = "skipped_by_strategy"
                 reason = f"destination exists (strategy: {strategy.value})"
-                self.logger.debug(f"'{source_name}' {action_taken}: {reason}")
+                self.logger.debug("'%s' %s: %s", source_name, action_taken, reason)
                 result_details.update({'action_taken': action_taken, 'reason': reason})
                 return DuplicateResolutionResult(**result_details)
 
@@ -881,7 +2144,7 @@ class EnhancedFileOrganizer:
                 if files_identical:
                     action_taken = "skipped_by_strategy"
                     reason = f"identical file exists (strategy: {strategy.value})"
-                    self.logger.debug(f"'{source_name}' {action_taken}: {reason}")
+                    self.logger.debug("'%s' %s: %s", source_name, action_taken, reason)
                     result_details.update({'action_taken': action_taken, 'reason': reason})
                     return DuplicateResolutionResult(**result_details)
                 else:
@@ -889,7 +2152,7 @@ class EnhancedFileOrganizer:
                     new_dest_path = self._generate_unique_filename(dest_file_path)
                     action_taken = "resolved_rename"
                     reason = f"files differ, renamed to '{new_dest_path.name}' (strategy: {strategy.value})"
-                    self.logger.debug(f"'{source_name}' {action_taken}: {reason}")
+                    self.logger.debug("'%s' %s: %s", source_name, action_taken, reason)
                     result_details.update({'action_taken': action_taken, 'destination': new_dest_path, 'reason': reason})
                     return DuplicateResolutionResult(**result_details)
 
@@ -898,7 +2161,7 @@ class EnhancedFileOrganizer:
                  # Note: Overwriting an identical file is effectively a skip, but strategy says overwrite
                  action_taken = "resolved_overwrite"
                  reason = f"destination exists, will overwrite (strategy: {strategy.value}, identical: {files_identical})"
-                 self.logger.debug(f"'{source_name}' {action_taken}: {reason}")
+                 self.logger.debug("'%s' %s: %s", source_name, action_taken, reason)
                  result_details.update({'action_taken': action_taken, 'reason': reason})
                  return DuplicateResolutionResult(**result_details)
 
@@ -935,7 +2198,7 @@ class EnhancedFileOrganizer:
                      choice = input("Choose an option: ").strip().lower()
 
                      if choice in ['s', 'skip']:
-                         self.logger.info(f"User chose to skip '{source_name}'.")
+                         self.logger.info("User chose to skip '%s'.", source_name)
                          action_taken = "skipped_by_strategy"
                          reason = "user chose to skip"
                          result_details.update({'action_taken': action_taken, 'reason': reason})
@@ -943,7 +2206,7 @@ class EnhancedFileOrganizer:
 
                      elif choice in ['r', 'rename']:
                          new_path = self._generate_unique_filename(dest_file_path)
-                         self.logger.info(f"User chose to rename '{source_name}' to '{new_path.name}'.")
+                         self.logger.info("User chose to rename '%s' to '%s'.", source_name, new_path.name)
                          self._print_colored(f"  → Renaming to: {new_path.name}", Fore.CYAN)
                          action_taken = "resolved_rename"
                          reason = f"user chose to rename to '{new_path.name}'"
@@ -951,7 +2214,7 @@ class EnhancedFileOrganizer:
                          return DuplicateResolutionResult(**result_details)
 
                      elif choice in ['k', 'keep'] and files_identical:
-                          self.logger.info(f"User chose to keep existing identical file for '{source_name}'.")
+                          self.logger.info("User chose to keep existing identical file for '%s'.", source_name)
                           self._print_colored("  → Keeping existing identical file.", Fore.CYAN)
                           action_taken = "skipped_by_strategy"
                           reason = "user chose to keep existing identical file"
@@ -961,18 +2224,18 @@ class EnhancedFileOrganizer:
                      elif choice in ['o', 'overwrite'] and not files_identical:
                          confirm = input("Are you sure you want to overwrite? (y/n): ").strip().lower()
                          if confirm == 'y':
-                              self.logger.info(f"User chose to overwrite '{dest_file_path.name}' with '{source_name}'.")
+                              self.logger.info("User chose to overwrite '%s' with '%s'.", dest_file_path.name, source_name)
                               self._print_colored("  → Overwriting existing file.", Fore.RED)
                               action_taken = "resolved_overwrite"
                               reason = "user chose to overwrite"
                               result_details.update({'action_taken': action_taken, 'reason': reason})
                               return DuplicateResolutionResult(**result_details)
                          else:
-                             self.logger.info(f"User cancelled overwrite for '{source_name}'.")
+                             self.logger.info("User cancelled overwrite for '%s'.", source_name)
                              # Re-show menu for a different choice
                              continue
                      elif choice in ['d', 'diff'] and not files_identical:
-                          self.logger.info(f"User requested diff for '{source_name}' vs '{dest_file_path.name}'.")
+                          self.logger.info("User requested diff for '%s' vs '%s'.", source_name, dest_file_path.name)
                           self._show_file_differences(source_file, dest_file_path)
                           # Re-show menu after showing diff
                           continue
@@ -1109,12 +2372,12 @@ class EnhancedFileOrganizer:
         new_dest_file = dest_file # Start with original path
 
         # Loop until a non-existent filename is found
-        while new_dest_file.exists():
+        while new_dest_file.exists() or new_dest_file in self._pending_moves: # Also skip names of copies in flight
             new_name = f"{base_name}_{counter}{name_parts[1]}"
             new_dest_file = dest_dir / new_name
             counter += 1
             if counter > 10000: # Safety break for extremely rare cases or bugs
-                self.logger.error(f"Could not find unique name for {dest_file.name} after 10000 attempts.")
+                self.logger.error("Could not find unique name for %s after 10000 attempts.", dest_file.name)
                 raise FileOrganizerError(f"Could not find unique name for {dest_file.name}")
 
         return new_dest_file
@@ -1131,7 +2394,7 @@ class EnhancedFileOrganizer:
         backup_dir = target_path.parent / backup_dir_name
 
         try:
-            self.logger.info(f"Creating structure backup in: {backup_dir}")
+            self.logger.info("Creating structure backup in: %s", backup_dir)
             # Only backup the directory structure, not the files
             structure_info = {
                 "timestamp": datetime.now().isoformat(),
@@ -1151,7 +2414,7 @@ class EnhancedFileOrganizer:
                          backup_subdir_name = backup_dir.relative_to(current_dir).parts[0]
                          if backup_subdir_name in dirs:
                               dirs.remove(backup_subdir_name)
-                              self.logger.debug(f"Pruning backup directory '{backup_subdir_name}' from walk.")
+                              self.logger.debug("Pruning backup directory '%s' from walk.", backup_subdir_name)
                      except ValueError:
                          # backup_dir is not relative to current_dir in the expected way, continue walk
                          pass # Should not happen with is_relative_to check above, but safety
@@ -1160,14 +2423,15 @@ class EnhancedFileOrganizer:
                  for name in files:
                     file_path = current_dir / name
                     try:
-                         # Store relative path, size, and modified time
+                         # Store relative path, size, and modified time (one stat per file)
+                        file_stat = file_path.stat()
                         structure_info["files"].append({
                             "path": str(file_path.relative_to(target_path)),
-                            "size": file_path.stat().st_size,
-                            "modified": file_path.stat().st_mtime # Unix timestamp
+                            "size": file_stat.st_size,
+                            "modified": file_stat.st_mtime # Unix timestamp
                         })
                     except Exception as e:
-                        self.logger.warning(f"Could not get info for backup structure for {file_path}: {e}")
+                        self.logger.warning("Could not get info for backup structure for %s: %s", file_path, e)
 
 
             backup_dir.mkdir(parents=True, exist_ok=True) # Ensure backup dir exists before writing
@@ -1175,7 +2439,7 @@ class EnhancedFileOrganizer:
             with open(info_file_path, "w") as f:
                 json.dump(structure_info, f, indent=2)
 
-            self.logger.info(f"Structure backup created: {info_file_path}")
+            self.logger.info("Structure backup created: %s", info_file_path)
             # Log backup creation via reporter
             # Need to decide if backup creation is logged per file or as a system event
             # Logging as a system event seems more appropriate
@@ -1186,7 +2450,7 @@ class EnhancedFileOrganizer:
             ))
 
         except Exception as e:
-            self.logger.warning(f"Could not create structure backup: {e}")
+            self.logger.warning("Could not create structure backup: %s", e)
             self.reporter.add_operation_result(DuplicateResolutionResult(
                 action_taken="error", source=target_path, destination=None, category="System",
                 size=0, reason=f"Failed to create structure backup: {e}",
@@ -1196,7 +2460,8 @@ class EnhancedFileOrganizer:
 
     # --- Core Processing Logic ---
 
-    def _process_single_file(self, file_path: Path, target_path: Path, dry_run: bool = False) -> DuplicateResolutionResult:
+    def _process_single_file(self, file_path: Path, target_path: Path, dry_run: bool = False,
+                             st: Optional[os.stat_result] = None) -> Optional[DuplicateResolutionResult]:
         """
         Processes a single file: checks eligibility, determines destination,
         handles duplicates, and performs the move (or simulates).
@@ -1205,12 +2470,15 @@ class EnhancedFileOrganizer:
             file_path: The full Path object of the file to process (expected to be resolved).
             target_path: The root directory being organized (expected to be resolved).
             dry_run: If True, simulates the move without action.
+            st: Stat result from the scanner, reused instead of stat-ing the file again.
 
         Returns:
             DuplicateResolutionResult: Describes the outcome (moved, skipped, renamed, error).
+            None if the file is being copied to another filesystem on the copy pool;
+            its result is recorded by _collect_moves once the copy finishes.
         """
         # Log entry point for processing this file
-        self.logger.debug(f"\n{'='*80}\nProcessing file: {file_path}\nTarget path: {target_path}\nDry run: {dry_run}\n{'='*80}")
+        self.logger.debug("\n%s\nProcessing file: %s\nTarget path: %s\nDry run: %s\n%s", '='*80, file_path, target_path, dry_run, '='*80)
 
         # Initialize base result details
         # These will be updated as processing proceeds
@@ -1227,25 +2495,27 @@ class EnhancedFileOrganizer:
              # --- Initial Checks & Metadata ---
              # Ensure file still exists and get size/category early
              try:
-                 if not file_path.exists():
-                     result_details.update({'action_taken': "skipped", 'reason': "source file disappeared"})
-                     self.logger.warning(f"Skipping '{file_path.name}': {result_details['reason']}")
-                     return DuplicateResolutionResult(**result_details) # Return early
+                 if st is None:
+                     if not file_path.exists():
+                         result_details.update({'action_taken': "skipped", 'reason': "source file disappeared"})
+                         self.logger.warning("Skipping '%s': %s", file_path.name, result_details['reason'])
+                         return DuplicateResolutionResult(**result_details) # Return early
+                     st = file_path.stat()
 
-                 result_details['size'] = file_path.stat().st_size
-                 result_details['category'] = self._get_destination_folder(file_path) # Determine category early
-                 self.logger.debug(f"Determined category: {result_details['category']}, size: {result_details['size']} bytes.")
+                 result_details['size'] = st.st_size
+                 result_details['category'] = self._get_destination_folder(file_path, st) # Determine category early
+                 self.logger.debug("Determined category: %s, size: %s bytes.", result_details['category'], result_details['size'])
 
              except (OSError, RuntimeError) as e:
                  result_details.update({'action_taken': "error", 'reason': f"cannot access file metadata: {e}", 'error_info': traceback.format_exc()})
-                 self.logger.error(f"Error processing '{file_path.name}': {result_details['reason']}", exc_info=True)
+                 self.logger.error("Error processing '%s': %s", file_path.name, result_details['reason'], exc_info=True)
                  return DuplicateResolutionResult(**result_details) # Return early
 
              # Check if file should be skipped based on config rules (type, size, patterns, etc.)
-             should_skip, skip_reason = self._should_skip_file(file_path)
+             should_skip, skip_reason = self._should_skip_file(file_path, st)
              if should_skip:
                   result_details.update({'action_taken': "skipped", 'reason': skip_reason})
-                  self.logger.info(f"Skipping '{file_path.name}': {result_details['reason']}")
+                  self.logger.info("Skipping '%s': %s", file_path.name, result_details['reason'])
                   return DuplicateResolutionResult(**result_details) # Return early
 
              # --- Determine Destination ---
@@ -1253,19 +2523,19 @@ class EnhancedFileOrganizer:
                  dest_folder = target_path / result_details['category'] # Use the determined category
                  intended_dest_file_path = dest_folder / file_path.name
                  result_details['destination'] = intended_dest_file_path # Set initial destination in result details
-                 self.logger.debug(f"Intended destination folder: {dest_folder}")
-                 self.logger.debug(f"Intended destination path: {intended_dest_file_path}")
+                 self.logger.debug("Intended destination folder: %s", dest_folder)
+                 self.logger.debug("Intended destination path: %s", intended_dest_file_path)
 
-                 # Skip if the file is already exactly where it should go (resolved paths)
-                 # Check if the parent of the source is the intended destination folder AND the name is the same
-                 if file_path.parent.resolve() == dest_folder.resolve() and file_path.name == intended_dest_file_path.name:
+                 # Skip if the file is already exactly where it should go
+                 # Both paths derive from the resolved target, so no resolve() (and its syscalls) is needed
+                 if file_path.parent == dest_folder and file_path.name == intended_dest_file_path.name:
                      result_details.update({'action_taken': "skipped", 'reason': "already in correct location"})
-                     self.logger.info(f"Skipping '{file_path.name}': {result_details['reason']}")
+                     self.logger.info("Skipping '%s': %s", file_path.name, result_details['reason'])
                      return DuplicateResolutionResult(**result_details) # Return early
 
              except Exception as e:
                   result_details.update({'action_taken': "error", 'reason': f"error determining destination: {e}", 'error_info': traceback.format_exc()})
-                  self.logger.error(f"Error processing '{file_path.name}': {result_details['reason']}", exc_info=True)
+                  self.logger.error("Error processing '%s': %s", file_path.name, result_details['reason'], exc_info=True)
                   return DuplicateResolutionResult(**result_details) # Return early
 
 
@@ -1288,37 +2558,43 @@ class EnhancedFileOrganizer:
                      'destination': final_path_for_report, # Report the simulated destination
                      'reason': reason_suffix
                  })
-                 self.logger.info(f"[DRY RUN] {action_description}: '{file_path.name}' -> '{result_details['destination']}'")
+                 self.logger.debug("[DRY RUN] %s: '%s' -> '%s'", action_description, file_path.name, result_details['destination'])
                  return DuplicateResolutionResult(**result_details) # Return dry run result
 
 
              # --- Perform Actual Operations (if not dry run) ---
 
-             # Create destination folder if needed
-             try:
-                 # exists_ok=True is crucial for retries and multiple files going to same folder
-                 if not dest_folder.exists():
-                      dest_folder.mkdir(parents=True, exist_ok=True)
-                      self.stats.folders_created += 1 # This count is for UI display, reporter has detailed logs
-                      self.logger.info(f"Created directory: {dest_folder}")
-                      # Reporter logs folder creation separately if needed, not tied to file processing result
-
-                 # Verify destination folder is writable
-                 if not os.access(dest_folder, os.W_OK):
-                      result_details.update({'action_taken': "error", 'reason': f"no write permission for destination directory: {dest_folder}", 'error_info': traceback.format_exc()})
-                      self.logger.error(f"Error processing '{file_path.name}': {result_details['reason']}")
-                      return DuplicateResolutionResult(**result_details) # Return early
-
-
-             except (OSError, PermissionError) as e:
-                 result_details.update({'action_taken': "error", 'reason': f"failed to create or check destination directory: {e}", 'error_info': traceback.format_exc()})
-                 self.logger.error(f"Error processing '{file_path.name}': {result_details['reason']}", exc_info=True)
-                 return DuplicateResolutionResult(**result_details) # Return early
+             # Create destination folder if needed (checked once per folder per run)
+             if dest_folder not in self._ready_dest_folders:
+                 try:
+                     # exists_ok=True is crucial for retries and multiple files going to same folder
+                     if not dest_folder.exists():
+                          dest_folder.mkdir(parents=True, exist_ok=True)
+                          self.stats.folders_created += 1 # This count is for UI display, reporter has detailed logs
+                          self.logger.info("Created directory: %s", dest_folder)
+                          # Reporter logs folder creation separately if needed, not tied to file processing result
+
+                     # Verify destination folder is writable
+                     if not os.access(dest_folder, os.W_OK):
+                          result_details.update({'action_taken': "error", 'reason': f"no write permission for destination directory: {dest_folder}", 'error_info': traceback.format_exc()})
+                          self.logger.error("Error processing '%s': %s", file_path.name, result_details['reason'])
+                          return DuplicateResolutionResult(**result_details) # Return early
+                     # Don't re-check it for every file; its device decides rename vs. copy
+                     self._ready_dest_folders[dest_folder] = dest_folder.stat().st_dev
+
+                 except (OSError, PermissionError) as e:
+                     result_details.update({'action_taken': "error", 'reason': f"failed to create or check destination directory: {e}", 'error_info': traceback.format_exc()})
+                     self.logger.error("Error processing '%s': %s", file_path.name, result_details['reason'], exc_info=True)
+                     return DuplicateResolutionResult(**result_details) # Return early
+
 
+             # A cross-device copy to the same path may still be in flight; let it land first
+             if intended_dest_file_path in self._pending_moves:
+                 self._finish_pending_move(intended_dest_file_path)
 
              # --- Handle Duplicates if Destination Exists ---
              if intended_dest_file_path.exists():
-                 self.logger.debug(f"Destination '{intended_dest_file_path}' exists. Handling duplicate...")
+                 self.logger.debug("Destination '%s' exists. Handling duplicate...", intended_dest_file_path)
                  duplicate_resolution_result = self._handle_duplicate(file_path, intended_dest_file_path)
 
                  # Update result details based on duplicate resolution outcome
@@ -1332,20 +2608,21 @@ class EnhancedFileOrganizer:
 
                  # If duplicate handling resulted in skipping this file or error
                  if duplicate_resolution_result.action_taken in ["skipped_by_strategy", "error_duplicate_handling"]:
-                     self.logger.warning(f"Skipping '{file_path.name}' based on duplicate handling: {duplicate_resolution_result.reason}")
+                     self.logger.warning("Skipping '%s' based on duplicate handling: %s", file_path.name, duplicate_resolution_result.reason)
                      return DuplicateResolutionResult(**result_details)  # Return the result object directly
 
                  # If duplicate handling resolved to rename or overwrite, update destination and proceed
                  # action_taken is now "resolved_rename" or "resolved_overwrite"
                  result_details['destination'] = final_destination_path
-                 self.logger.debug(f"Duplicate resolved for '{file_path.name}': {duplicate_resolution_result.action_taken}. Final destination: {final_destination_path}")
+                 self.logger.debug("Duplicate resolved for '%s': %s. Final destination: %s",
+                                   file_path.name, duplicate_resolution_result.action_taken, final_destination_path)
 
              else:
                  # No duplicate conflict, standard move action
                  action_description = "will_move" # Indicate the intended action before attempting move
                  final_destination_path = intended_dest_file_path
                  result_details['destination'] = final_destination_path
-                 self.logger.debug(f"No duplicate for '{file_path.name}'. Will move to '{final_destination_path}'.")
+                 self.logger.debug("No duplicate for '%s'. Will move to '%s'.", file_path.name, final_destination_path)
 
 
              # --- Perform the Move Operation ---
@@ -1359,7 +2636,7 @@ class EnhancedFileOrganizer:
                          'reason': "source file disappeared unexpectedly before move",
                          'error_info': "FileNotFoundError: source file disappeared"
                      })
-                     self.logger.error(f"Error processing '{file_path.name}': {result_details['reason']}")
+                     self.logger.error("Error processing '%s': %s", file_path.name, result_details['reason'])
                      return DuplicateResolutionResult(**result_details)
              except OSError as e:
                  result_details.update({
@@ -1367,236 +2644,428 @@ class EnhancedFileOrganizer:
                      'reason': f"source file inaccessible before move: {e}",
                      'error_info': traceback.format_exc()
                  })
-                 self.logger.error(f"Error processing '{file_path.name}': {result_details['reason']}", exc_info=True)
+                 self.logger.error("Error processing '%s': %s", file_path.name, result_details['reason'], exc_info=True)
                  return DuplicateResolutionResult(**result_details)
 
 
-             try:
-                 # shutil.move handles cross-device moves internally by copying then deleting
-                 shutil.move(str(file_path), str(final_destination_path))
-
-                 # Success! Log the final action (moved/renamed/overwritten)
-                 # Determine the final action status for the reporter based on the outcome before move
-                 action_taken = result_details.get('action_taken', 'moved')
-                 if action_taken == "resolved_rename":
-                      final_action_status = "renamed"
-                      report_reason = f"Successfully renamed to '{final_destination_path.name}'"
-                 elif action_taken == "resolved_overwrite":
-                      final_action_status = "overwritten"
-                      report_reason = f"Successfully overwrote '{final_destination_path.name}'"
-                 else: # Case "will_move" or default
-                      final_action_status = "moved"
-                      report_reason = f"Successfully moved to '{final_destination_path.name}'"
-
-                 # Update result details with final successful status
-                 result_details.update({
-                     'action_taken': final_action_status,
-                     'destination': final_destination_path, # Ensure final destination is correct in result
-                     'reason': report_reason,
-                     'error_info': None # Clear error info on success
-                 })
-                 self.logger.info(f"SUCCESS ({final_action_status}): '{file_path.name}' -> '{final_destination_path}'")
-                 return DuplicateResolutionResult(**result_details) # Return success result
+             overwrite = result_details.get('action_taken') == "resolved_overwrite"
+             # Journal the intent before touching the file so an interrupted run can be resumed/undone
+             journal_seq = None
+             if self._journal is not None:
+                 journal_seq = self._journal.record_move(file_path, final_destination_path, result_details['size'], overwrite)
 
+             same_device = st.st_dev == self._ready_dest_folders[dest_folder]
+             if not same_device and self._copy_pool is not None:
+                 # Cross-device: copy on the pool and finish the move on this thread later (see _collect_moves)
+                 self._wait_for_copy_slot()
+                 future = self._copy_pool.submit(_cross_device_move, str(file_path), str(final_destination_path), overwrite)
+                 self._pending_moves[final_destination_path] = (future, file_path, result_details, journal_seq)
+                 return None
 
+             try:
+                 self._move_file(file_path, final_destination_path, same_device, overwrite)
              except (OSError, shutil.Error, PermissionError) as e:
-                 error_msg = f"Failed to move '{file_path.name}': {e}"
-                 self.logger.error(error_msg, exc_info=True)
-                 result_details.update({
-                     'action_taken': "error",
-                     'destination': final_destination_path if 'final_destination_path' in locals() else intended_dest_file_path, # Use determined path or intended
-                     'reason': error_msg,
-                     'error_info': traceback.format_exc()
-                 })
-
-                 # Clean up potential partial copy if move failed and left one
-                 # Check if the destination file exists AND the source still exists (means move failed, not copy+delete succeeded)
-                 # Use the path from result_details which is final_destination_path or intended
-                 current_dest_path_attempt = Path(result_details.get('destination') or '')
-                 if current_dest_path_attempt.exists() and file_path.exists():
-                      try:
-                           self.logger.warning(f"Attempting cleanup of potential partial copy at '{current_dest_path_attempt}'...")
-                           current_dest_path_attempt.unlink()
-                           self.logger.warning(f"Cleaned up partial copy at '{current_dest_path_attempt}'.")
-                      except Exception as cleanup_error:
-                           self.logger.error(f"Failed to clean up partial copy at '{current_dest_path_attempt}': {cleanup_error}")
-
-                 return DuplicateResolutionResult(**result_details) # Return error result
+                 return self._move_failed(file_path, result_details, journal_seq, e)
+             return self._move_succeeded(file_path, final_destination_path, result_details, journal_seq)
 
         except Exception as e:
             # Catch any other unexpected errors during the entire _process_single_file logic
             reason = f"unexpected error during processing: {e}"
             result_details.update({'action_taken': "error", 'reason': reason, 'error_info': traceback.format_exc()})
-            self.logger.critical(f"Critical error processing '{file_path.name}': {result_details['reason']}", exc_info=True)
+            self.logger.critical("Critical error processing '%s': %s", file_path.name, result_details['reason'], exc_info=True)
             return DuplicateResolutionResult(**result_details) # Return error result
 
+    def _move_file(self, source: Path, destination: Path, same_device: bool, overwrite: bool) -> None:
+        """Move a file on this thread: one atomic rename on the same filesystem, copy + delete otherwise."""
+        if same_device:
+            try:
+                # os.replace also replaces an existing destination (overwrite strategy)
+                (os.replace if overwrite else os.rename)(source, destination)
+                return
+            except OSError as e:
+                if e.errno != errno.EXDEV: # Same device id but still cross-mount (e.g. bind mounts)
+                    raise
+        _cross_device_move(str(source), str(destination), overwrite)
+
+    def _move_succeeded(self, file_path: Path, final_destination_path: Path, result_details: Dict[str, Any],
+                        journal_seq: Optional[int]) -> DuplicateResolutionResult:
+        """Record a completed move and build its result."""
+        if journal_seq is not None:
+            self._journal.record_outcome(journal_seq, True)
+        if self._duplicate_index is not None:
+            self._duplicate_index.relocate(file_path, final_destination_path)
+
+        # Success! Log the final action (moved/renamed/overwritten)
+        # Determine the final action status for the reporter based on the outcome before move
+        action_taken = result_details.get('action_taken', 'moved')
+        if action_taken == "resolved_rename":
+             final_action_status = "renamed"
+             report_reason = f"Successfully renamed to '{final_destination_path.name}'"
+        elif action_taken == "resolved_overwrite":
+             final_action_status = "overwritten"
+             report_reason = f"Successfully overwrote '{final_destination_path.name}'"
+        else: # Case "will_move" or default
+             final_action_status = "moved"
+             report_reason = f"Successfully moved to '{final_destination_path.name}'"
+
+        # Update result details with final successful status
+        result_details.update({
+            'action_taken': final_action_status,
+            'destination': final_destination_path, # Ensure final destination is correct in result
+            'reason': report_reason,
+            'error_info': None # Clear error info on success
+        })
+        self.logger.debug("SUCCESS (%s): '%s' -> '%s'", final_action_status, file_path.name, final_destination_path)
+        return DuplicateResolutionResult(**result_details) # Return success result
+
+    def _move_failed(self, file_path: Path, result_details: Dict[str, Any], journal_seq: Optional[int],
+                     error: BaseException) -> DuplicateResolutionResult:
+        """Record a failed move and build its result. The move helpers never leave a partial copy behind."""
+        if journal_seq is not None:
+            self._journal.record_outcome(journal_seq, False)
+        error_msg = f"Failed to move '{file_path.name}': {error}"
+        self.logger.error(error_msg, exc_info=error)
+        result_details.update({
+            'action_taken': "error",
+            'reason': error_msg,
+            'error_info': ''.join(traceback.format_exception(type(error), error, error.__traceback__))
+        })
+        return DuplicateResolutionResult(**result_details) # Return error result
+
+    # --- Cross-Device Copy Pool ---
+
+    def _open_copy_pool(self) -> None:
+        """Start the worker pool that runs cross-device copies concurrently (copy_workers > 1)."""
+        workers = self.config.get("copy_workers", 4)
+        if workers > 1:
+            self._copy_pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="copy")
+
+    def _wait_for_copy_slot(self) -> None:
+        """Bound the copies in flight (two per worker) so a huge library isn't queued all at once."""
+        while len(self._pending_moves) >= 2 * self.config.get("copy_workers", 4):
+            wait([future for future, *_ in self._pending_moves.values()], return_when=FIRST_COMPLETED)
+            self._collect_moves()
+
+    def _finish_pending_move(self, destination: Path) -> None:
+        """Wait for the in-flight copy to `destination` and record its outcome."""
+        future, file_path, result_details, journal_seq = self._pending_moves.pop(destination)
+        try:
+            future.result()
+        except (OSError, shutil.Error) as e:
+            result = self._move_failed(file_path, result_details, journal_seq, e)
+        else:
+            result = self._move_succeeded(file_path, destination, result_details, journal_seq)
+        self._record_result(result)
+
+    def _collect_moves(self, wait_all: bool = False) -> None:
+        """Record the cross-device moves that have finished (or, with wait_all, every one in flight)."""
+        finished = [dest for dest, (future, *_) in self._pending_moves.items() if wait_all or future.done()]
+        for destination in finished:
+            self._finish_pending_move(destination)
 
-    def _process_files_list(self, files_to_process: List[Path], target_path: Path, dry_run: bool) -> None:
+    def _close_copy_pool(self) -> None:
+        """Wait for outstanding copies and shut the pool down."""
+        self._collect_moves(wait_all=True)
+        if self._copy_pool is not None:
+            self._copy_pool.shutdown()
+            self._copy_pool = None
+
+
+    def _process_files_list(self, files_to_process: Iterable[Union[Path, Tuple[Path, os.stat_result]]],
+                            target_path: Path, dry_run: bool) -> None:
         """
-        Iterates through a list of files and processes each one.
+        Iterates through files and processes each one.
         Calls _process_single_file and logs results via reporter.
         Updates overall stats (processed, moved, skipped, errors) for the final summary.
         This method orchestrates the file processing loop.
+
+        `files_to_process` may be a list of paths (interactive mode) or the
+        (path, stat) stream from _iter_directory_files; streams are consumed in
+        batches of `scan_batch_size` so the full file list is never held in memory.
         """
+        total_files = len(files_to_process) if isinstance(files_to_process, list) else None
+        self.logger.info("Attempting to process %s files in directory: %s (Dry Run: %s)",
+                         total_files if total_files is not None else 'all eligible', target_path, dry_run)
+
+        self._begin_processing(target_path, dry_run)
+
+        batch_size = max(1, self.config.get("scan_batch_size", 1000))
+        processed_count = 0
+        cancelled = False
+        for batch in self._iter_stat_batches(files_to_process, batch_size):
+            if not self._process_batch(batch, target_path, dry_run, processed_count, total_files):
+                cancelled = True
+                break # Stop processing
+            processed_count += len(batch)
+
+        self._end_processing(cancelled)
+
+        # Finalize the reporter run (already called if cancelled, but call again for success path)
+        self.reporter.finalize()
+
+        # Print final console summary based on reporter data and export reports
+        self._print_results()
+
+        # This method does not return stats object anymore, as stats are managed by reporter
+
+    def _begin_processing(self, target_path: Path, dry_run: bool) -> None:
+        """Set up per-run state (duplicate index, journal, copy pool) for one-shot runs and watch mode."""
         # Start the overall timer for the run (reporter also starts its time in __init__)
         self.stats.start_time = datetime.now()
-        self.stats.files_processed = len(files_to_process) # Total files entering this process list
+        self.stats.files_processed = 0 # Counted as files arrive from the scanner
 
-        total_files = len(files_to_process)
-        self.logger.info(f"Attempting to process {total_files} files in directory: {target_path} (Dry Run: {dry_run})")
+        # Index already-organized files by size; batches are hashed against it as they arrive
+        self._build_duplicate_index(target_path)
 
-        # Add disk space check before starting the loop
-        # Estimate required space *only* for files not already skipped by initial checks
-        # The list `files_to_process` already excludes initial skips from _scan_directory_for_files
-        estimated_size_to_move = 0
-        files_eligible_for_disk_check = [] # List of files that passed initial skip checks
-        for f in files_to_process:
-            try:
-                if f.is_file(): # Double check it's a file
-                    estimated_size_to_move += f.stat().st_size
-                    files_eligible_for_disk_check.append(f)
-            except Exception as e:
-                self.logger.warning(f"Error checking file size for disk space estimate for '{f.name}': {e}")
-                # Continue estimating with other files
-                # Log errors during initial size check are logged in _scan_directory_for_files
+        if not dry_run:
+            self._open_journal(target_path)
+            self._open_copy_pool()
 
-        # Add a buffer (10% or minimum 50MB)
-        required_space = estimated_size_to_move + max(estimated_size_to_move // 10, 50 * 1024 * 1024)
+    def _process_batch(self, batch: List[Tuple[Path, os.stat_result]], target_path: Path, dry_run: bool,
+                       processed_before: int = 0, total_files: Optional[int] = None) -> bool:
+        """
+        Process one batch of (path, stat) pairs.
 
+        Returns:
+            bool: False if the run was cancelled because the batch won't fit on disk.
+        """
+        self.stats.files_processed += len(batch)
 
+        # Disk space check per batch (10% or minimum 50MB buffer on top of the batch size)
+        estimated_size_to_move = sum(st.st_size for _, st in batch)
+        required_space = estimated_size_to_move + max(estimated_size_to_move // 10, 50 * 1024 * 1024)
         if not self._check_disk_space(target_path, required_space):
+            self._clear_progress_line()
             self._print_colored("❌ Operation cancelled due to insufficient disk space.", Fore.RED)
             # Log cancellation via reporter
             self.reporter.add_operation_result(DuplicateResolutionResult(
                 action_taken='error', source=target_path, destination=None, category='System',
                 size=0, reason="Operation cancelled due to insufficient disk space"
             ))
-            # Set overall stats end time and finalize reporter on cancellation
-            self.stats.end_time = datetime.now()
-            self.reporter.finalize() # Finalize reporter on cancellation
-            self._print_results() # Print results summarizing the cancellation
-            return # Stop processing
+            return False
 
-        # Now process only the files that passed initial skip checks and disk space check
-        files_to_process_actual = files_eligible_for_disk_check
+        # Hash this batch's size collisions concurrently; _handle_duplicate uses the index
+        self._index_batch(batch)
 
-        processed_count = 0
-        for file_path in files_to_process_actual:
+        processed_count = processed_before
+        for file_path, st in batch:
             processed_count += 1
-            # Note: self.stats.files_processed is total files *scanned*, not *processed*.
-            # It's updated before the loop. This is okay, it indicates the scope.
-
             self._show_progress(processed_count, total_files) # Show progress for files actually being processed
 
-            # Process the single file - this method returns the result object
-            result = self._process_single_file(file_path, target_path, dry_run)
-
-            # The result is already logged by the reporter inside _process_single_file's finally block.
-            # However, we still need to update the *overall* stats object in self.stats
-            # which is used to determine the total counts displayed at the very end.
-            # These stats are simple counters updated in _process_files_list.
-            # The detailed per-category stats are managed by the reporter's internal log.
-
-            # Update overall EnhancedFileOrganizer.stats based on the result for the final summary printout
-            # Detailed counts are in the reporter's summary (get_summary_stats will recalculate from log)
-            if result.action_taken in ["moved", "renamed", "overwritten"]:
-                 self.stats.files_moved += 1
-                 self.stats.total_size_moved += result.size # Use size from result object
-            elif result.action_taken in ["skipped", "dry_run", "processed_dry_run", "skipped_by_strategy"]:
-                 self.stats.files_skipped += 1
-            elif result.action_taken.startswith("error"):
-                 self.stats.errors += 1
-            # Folder created is tracked in stats.folders_created within _process_single_file
-
-
+            # Process the single file - this method returns the result object,
+            # or None while a cross-device copy is still running on the copy pool
+            result = self._process_single_file(file_path, target_path, dry_run, st)
+            if result is not None:
+                self._record_result(result)
+            self._collect_moves() # Record copies that finished meanwhile
+        return True
+
+    def _end_processing(self, cancelled: bool = False) -> None:
+        """Wait for outstanding moves and release the per-run state set up by _begin_processing."""
+        self._close_copy_pool() # Wait for the last cross-device copies
         self._clear_progress_line() # Ensure final line is clear after progress bar
         self.stats.end_time = datetime.now()
+        if self._duplicate_index is not None and not cancelled:
+            index = self._duplicate_index
+            self.logger.info("Duplicate index: %s files, %s size groups with collisions, %s quick hashes, %s full hashes.",
+                             len(index), index.collision_groups(), index.quick_hashes, index.full_hashes)
+        self._hash_results.clear() # Digests may be stale once files have moved
+        self._duplicate_index = None
+        self._ready_dest_folders.clear()
+        self._close_hash_cache()
+        self._close_journal(completed=not cancelled)
+
+    def _record_result(self, result: DuplicateResolutionResult) -> None:
+        """Report a file's outcome and count it in the overall stats."""
+        # The reporter keeps the per-category counters and streams the result to the operations log
+        self.reporter.add_operation_result(result)
+
+        # We still need to update the *overall* stats object in self.stats
+        # which is used to determine the total counts displayed at the very end.
+
+        # Update overall EnhancedFileOrganizer.stats based on the result for the final summary printout
+        # Detailed counts are in the reporter's summary (kept as running counters)
+        if result.action_taken in ["moved", "renamed", "overwritten"]:
+             self.stats.files_moved += 1
+             self.stats.total_size_moved += result.size # Use size from result object
+        elif result.action_taken in ["skipped", "dry_run", "processed_dry_run", "skipped_by_strategy"]:
+             self.stats.files_skipped += 1
+        elif result.action_taken.startswith("error"):
+             self.stats.errors += 1
+        # Folder created is tracked in stats.folders_created within _process_single_file
+
+    def _iter_stat_batches(self, files: Iterable[Union[Path, Tuple[Path, os.stat_result]]],
+                           batch_size: int) -> Iterator[List[Tuple[Path, os.stat_result]]]:
+        """Group files into lists of (path, stat), stat-ing plain paths that arrive without one."""
+        batch: List[Tuple[Path, os.stat_result]] = []
+        for item in files:
+            if isinstance(item, tuple):
+                batch.append(item)
+            else:
+                try:
+                    if item.is_file(): # Double check it's a file
+                        batch.append((item, item.stat()))
+                except OSError as e:
+                    self.logger.warning("Error checking file size for disk space estimate for '%s': %s", item.name, e)
+                    # Continue with other files
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
 
-        # Finalize the reporter run (already called if cancelled, but call again for success path)
-        self.reporter.finalize()
-
-        # Print final console summary based on reporter data and export reports
-        self._print_results()
 
-        # This method does not return stats object anymore, as stats are managed by reporter
+    # --- Scan and Organize Methods ---
 
+    def _max_depth(self) -> Optional[int]:
+        """Configured scan depth (None = unlimited)."""
+        max_depth = self.config.get("max_depth", 0)
+        return None if max_depth is None or max_depth < 0 else max_depth
+
+    def _validate_target_directory(self, directory: Path) -> Path:
+        """Resolve the directory to organize and make sure it can be listed."""
+        # Convert to absolute path and ensure it exists and is a directory
+        abs_dir = Path(directory).expanduser().resolve()
+        if not abs_dir.exists():
+             raise FileOrganizerError(f"Directory not found: '{directory}'")
+        if not abs_dir.is_dir():
+             raise FileOrganizerError(f"Path is not a directory: '{directory}'")
+        if not os.access(abs_dir, os.R_OK): # Need Read permission to list contents
+             raise FileOrganizerError(f"Read permission denied for directory: '{directory}'")
+        if not os.access(abs_dir, os.W_OK): # Need Write permission for potential moves/deletes
+             self.logger.warning("Write permission denied for directory: '%s'. File moves may fail.", directory)
+        return abs_dir
+
+    def _category_roots(self) -> Set[str]:
+        """Top-level folder names the organizer files things into (e.g. 'Images')."""
+        categories = set(self.config.get("extension_mapping", {}).values()) | set(self.config.get("custom_patterns", {}).values())
+        return {Path(category).parts[0] for category in categories if category}
+
+    def _walk_files(self, root: Path) -> Iterator[Tuple[Path, os.stat_result]]:
+        """
+        Yield (path, stat) for every regular file below root using os.scandir.
 
-    # --- Scan and Organize Methods ---
+        Excluded folders (.git, __pycache__, ...) are not descended into and
+        symlinked folders are not followed. Unreadable entries are ignored.
+        """
+        stack = [root]
+        while stack:
+            current = stack.pop()
+            try:
+                with os.scandir(current) as entries:
+                    for entry in entries:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                if self._matches_exclude_pattern(entry.name) is None:
+                                    stack.append(Path(entry.path))
+                            elif entry.is_file():
+                                yield Path(entry.path), entry.stat()
+                        except OSError:
+                            continue
+            except OSError as e:
+                self.logger.debug("Could not list '%s': %s", current, e)
 
-    def _scan_directory_for_files(self, directory: Path) -> List[Path]:
-        """Scan directory and return a list of files at the top level that are eligible for processing."""
-        files_list = [] # List of Path objects that passed initial skip checks
-        unprocessed_items_count = 0 # Count items skipped or errored during scan
+    def _iter_directory_files(self, abs_dir: Path, max_depth: Optional[int] = 0) -> Iterator[Tuple[Path, os.stat_result]]:
+        """
+        Stream the files under a directory that are eligible for processing.
 
-        try:
-            # Convert to absolute path and ensure it exists and is a directory
-            abs_dir = Path(directory).expanduser().resolve()
-            if not abs_dir.exists():
-                 raise FileOrganizerError(f"Directory not found: '{directory}'")
-            if not abs_dir.is_dir():
-                 raise FileOrganizerError(f"Path is not a directory: '{directory}'")
-            if not os.access(abs_dir, os.R_OK): # Need Read permission to list contents
-                 raise FileOrganizerError(f"Read permission denied for directory: '{directory}'")
-            if not os.access(abs_dir, os.W_OK): # Need Write permission for potential moves/deletes
-                 self.logger.warning(f"Write permission denied for directory: '{directory}'. File moves may fail.")
+        Built on os.scandir so the DirEntry type/stat data is reused: each file
+        costs a single stat call, which is handed on to the skip checks and
+        processing. Files are yielded as they are found rather than collected
+        into a list first.
 
+        Args:
+            abs_dir: Resolved directory to scan (see _validate_target_directory)
+            max_depth: How many folder levels below abs_dir to descend into
+                       (0 = top-level files only, None = unlimited). The organizer's
+                       own category folders at the top level are never descended into.
 
-            self.logger.info(f"Scanning directory for files: {abs_dir}")
+        Yields:
+            Tuple[Path, os.stat_result]: Eligible file and its stat result
+        """
+        self.logger.info("Scanning directory for files: %s (max depth: %s)", abs_dir, 'unlimited' if max_depth is None else max_depth)
+        category_roots = self._category_roots()
+        eligible_count = 0
+        unprocessed_items_count = 0 # Count items skipped or errored during scan
 
+        stack: List[Tuple[Path, int]] = [(abs_dir, 0)]
+        while stack:
+            current_dir, depth = stack.pop()
             try:
-                # Iterate only through top-level items
-                for item in abs_dir.iterdir():
-                    item_path = item # Use the Path object directly
+                entries = os.scandir(current_dir)
+            except OSError as e:
+                if current_dir == abs_dir:
+                    # Handle errors accessing the directory itself (e.g., permission denied to list)
+                    raise FileOrganizerError(f"Error listing contents of '{abs_dir}': {e}")
+                self.logger.warning("Skipping inaccessible folder during scan: %s (%s)", current_dir, e)
+                unprocessed_items_count += 1
+                self.reporter.add_operation_result(DuplicateResolutionResult(
+                    action_taken='error', source=current_dir, destination=None, category='System',
+                    size=0, reason=f"inaccessible_during_scan: {e}",
+                    error_info=traceback.format_exc()
+                ))
+                continue
+
+            with entries:
+                for entry in entries:
+                    item_path = Path(entry.path)
                     try:
-                        # We only process files at the top level of the target directory
-                        if item_path.is_file():
-                             # Perform ALL initial skip checks *before* adding to the list
+                        if entry.is_dir(follow_symlinks=False):
+                            if depth == 0 and entry.name in category_roots:
+                                reason = "is an organizer destination folder"
+                            elif max_depth is not None and depth >= max_depth:
+                                reason = "is a directory (top-level files only)" if max_depth == 0 else f"is a directory (max depth {max_depth} reached)"
+                            else:
+                                matched_pattern = self._matches_exclude_pattern(entry.name)
+                                if matched_pattern is None:
+                                    stack.append((item_path, depth + 1))
+                                    continue
+                                reason = f"matches exclude pattern: {matched_pattern}"
+
+                            # Log directories found but not descended into
+                            self.logger.debug("Skipping directory during scan: %s (%s)", item_path.name, reason)
+                            unprocessed_items_count += 1
+                            self.reporter.add_operation_result(DuplicateResolutionResult(
+                               action_taken='skipped', source=item_path, destination=None, category='System',
+                               size=0, reason=reason
+                            ))
+
+                        elif entry.is_file():
+                             # One stat per file (free on Windows, cached by DirEntry)
+                             st = entry.stat()
+                             # Perform ALL initial skip checks *before* yielding the file
                              # This prevents processing files that are explicitly excluded by config
-                             should_skip, skip_reason = self._should_skip_file(item_path)
+                             should_skip, skip_reason = self._should_skip_file(item_path, st)
                              if should_skip:
-                                 self.logger.debug(f"Skipping file during scan: {item_path.name} ({skip_reason})")
+                                 self.logger.debug("Skipping file during scan: %s (%s)", item_path.name, skip_reason)
                                  unprocessed_items_count += 1
                                  # Log skips happening during the initial scan via reporter
                                  try:
-                                      item_size = item_path.stat().st_size if item_path.exists() else 0
-                                      item_cat = self._get_destination_folder(item_path) # Try to get category for logging
+                                      item_cat = self._get_destination_folder(item_path, st) # Try to get category for logging
                                  except Exception:
-                                      item_size = 0
                                       item_cat = "Unknown"
 
                                  self.reporter.add_operation_result(DuplicateResolutionResult(
                                      action_taken='skipped', source=item_path, destination=None, category=item_cat,
-                                     size=item_size, reason=f"skipped_during_scan: {skip_reason}"
+                                     size=st.st_size, reason=f"skipped_during_scan: {skip_reason}"
                                  ))
                                  continue # Skip this file
 
-                             # Add eligible file to the list
-                             files_list.append(item_path)
-
-                        elif item_path.is_dir():
-                             # Log directories found but skipped (as we only process top-level files)
-                             self.logger.debug(f"Skipping directory during scan: {item_path.name}")
-                             unprocessed_items_count += 1
-                             # Log directory skip via reporter
-                             self.reporter.add_operation_result(DuplicateResolutionResult(
-                                action_taken='skipped', source=item_path, destination=None, category='System',
-                                size=0, reason="is a directory (top-level files only)"
-                             ))
+                             eligible_count += 1
+                             yield item_path, st
 
                         else:
-                             # Log other item types (symlinks, devices, etc.)
-                             self.logger.debug(f"Skipping non-file/non-directory item during scan: {item_path.name} ({item_path.stat().st_mode})")
+                             # Log other item types (symlinks to folders, broken symlinks, devices, etc.)
+                             self.logger.debug("Skipping non-file/non-directory item during scan: %s", item_path.name)
                              unprocessed_items_count += 1
-                             # Log other type skip via reporter
                              self.reporter.add_operation_result(DuplicateResolutionResult(
                                 action_taken='skipped', source=item_path, destination=None, category='System',
                                 size=0, reason="is not a file or directory"
                              ))
 
-
                     except OSError as e:
                          # Handle potential permission or other OS errors while iterating items
-                         self.logger.warning(f"Skipping inaccessible item during scan: {item_path.name} ({e})")
+                         self.logger.warning("Skipping inaccessible item during scan: %s (%s)", item_path.name, e)
                          unprocessed_items_count += 1
                          # Log scan errors via reporter
                          self.reporter.add_operation_result(DuplicateResolutionResult(
@@ -1606,30 +3075,20 @@ class EnhancedFileOrganizer:
                          ))
                          continue # Skip item with error
 
-                    except Exception as e:
-                        self.logger.warning(f"Unexpected error scanning item {item_path.name}: {e}", exc_info=True)
-                        unprocessed_items_count += 1
-                        self.reporter.add_operation_result(DuplicateResolutionResult(
-                            action_taken='error', source=item_path, destination=None, category='System',
-                             size=0, reason=f"unexpected_scan_error: {e}",
-                             error_info=traceback.format_exc()
-                        ))
-                        continue # Continue scanning other items
+        self.logger.info("Finished scanning. Found %s eligible files. %s items were skipped or errored during scan.", eligible_count, unprocessed_items_count)
 
-            except OSError as e:
-                # Handle errors accessing the directory itself (e.g., permission denied to list)
-                raise FileOrganizerError(f"Error listing contents of '{abs_dir}': {e}")
-
-
-            self.logger.info(f"Finished scanning. Found {len(files_list)} eligible files at top level. {unprocessed_items_count} items were skipped or errored during scan.")
-            return files_list
+    def _scan_directory_for_files(self, directory: Path, max_depth: Optional[int] = 0) -> List[Path]:
+        """Scan directory and return the list of files that are eligible for processing."""
+        try:
+            abs_dir = self._validate_target_directory(directory)
+            return [file_path for file_path, _ in self._iter_directory_files(abs_dir, max_depth)]
 
         except FileOrganizerError:
              # Re-raise our custom error
              raise
         except Exception as e:
              # Catch any other unexpected error during scan setup
-             self.logger.critical(f"An unexpected error occurred during scan setup for '{directory}': {e}", exc_info=True)
+             self.logger.critical("An unexpected error occurred during scan setup for '%s': %s", directory, e, exc_info=True)
              raise FileOrganizerError(f"An unexpected error occurred during scan setup: {e}") from e
 
 
@@ -1648,13 +3107,13 @@ class EnhancedFileOrganizer:
         target_path = Path(target_directory).expanduser().resolve()
 
         try:
+             target_path = self._validate_target_directory(target_path)
+
              # Create backup *before* scanning, as scan might take time on large dirs
              self._create_backup(target_path)
 
-             # Scan for files to process (validation happens inside)
-             files_to_process = self._scan_directory_for_files(target_path)
-
-             # Process the list of files
+             # Stream eligible files from the scanner straight into processing
+             files_to_process = self._iter_directory_files(target_path, self._max_depth())
              self._process_files_list(files_to_process, target_path, dry_run)
 
         except FileOrganizerError:
@@ -1673,7 +3132,9 @@ class EnhancedFileOrganizer:
 
         except Exception as e:
             # Catch any other unexpected error during automatic mode setup (before file processing loop)
-            self.logger.critical(f"An unexpected error occurred during automatic organization setup: {e}", exc_info=True)
+            self.logger.critical("An unexpected error occurred during automatic organization setup: %s", e, exc_info=True)
+            self._close_copy_pool() # Let in-flight copies land so their outcomes are journaled
+            self._close_journal(completed=False) # Leave the run open so the next one resumes it
             # Log the critical error via reporter
             self.reporter.add_operation_result(DuplicateResolutionResult(
                 action_taken='error', source=target_path, destination=None, category='System',
@@ -1688,6 +3149,125 @@ class EnhancedFileOrganizer:
             raise FileOrganizerError(f"An unexpected error occurred during automatic organization setup: {e}") from e
 
 
+    def _create_watcher(self, target_path: Path) -> Union[InotifyWatcher, PollingWatcher]:
+        """Pick the watch mode event source: inotify where available, periodic rescans otherwise."""
+        backend = self.config.get("watch_backend", "auto")
+        interval = self.config.get("watch_poll_interval", 5)
+        max_depth = self._max_depth()
+        category_roots = self._category_roots()
+
+        def descend(name: str, depth: int) -> bool:
+            # Same folder rules as the scanner: never the category folders, respect max_depth and excludes
+            if depth == 0 and name in category_roots:
+                return False
+            if max_depth is not None and depth >= max_depth:
+                return False
+            return self._matches_exclude_pattern(name) is None
+
+        if backend in ("auto", "inotify"):
+            try:
+                return InotifyWatcher(target_path, descend)
+            except OSError as e:
+                if backend == "inotify":
+                    raise FileOrganizerError(f"inotify is not available: {e}")
+                self.logger.info("inotify not available (%s), polling every %ss instead.", e, interval)
+        return PollingWatcher(target_path, descend, interval)
+
+    def watch_directory(self, target_directory: str, dry_run: bool = False) -> None:
+        """
+        Keep organizing a directory as files land in it, until interrupted (Ctrl+C).
+
+        Files already there are organized first. New files are picked up from
+        inotify events (or periodic rescans where inotify is unavailable) and
+        held back until their size and mtime have not changed for
+        `watch_settle_seconds`, so partially written files are left alone.
+        Settled files are moved in batches: once `scan_batch_size` are ready, or
+        every `watch_batch_seconds`. The duplicate index, hash cache, journal and
+        copy pool stay open for the whole session instead of being rebuilt.
+
+        Args:
+            target_directory: Directory to watch and organize.
+            dry_run: If True, only report what would be moved.
+        """
+        target_path = self._validate_target_directory(Path(target_directory))
+        settle_seconds = self.config.get("watch_settle_seconds", 2)
+        batch_seconds = self.config.get("watch_batch_seconds", 5)
+        batch_size = max(1, self.config.get("scan_batch_size", 1000))
+
+        # Start watching before the initial pass so nothing landing during it is missed
+        watcher = self._create_watcher(target_path)
+        self._begin_processing(target_path, dry_run)
+        self.logger.info("Watching '%s' with %s (Dry Run: %s)", target_path, type(watcher).__name__, dry_run)
+        self._print_colored(f"👀 Watching '{target_path}' for new files. Press Ctrl+C to stop.", Fore.CYAN)
+
+        # Files seen but not settled yet: path -> ((size, mtime_ns), monotonic time of last change)
+        pending: Dict[Path, Tuple[Optional[Tuple[int, int]], float]] = {}
+        ready: List[Tuple[Path, os.stat_result]] = []
+        ready_since = 0.0
+        cancelled = False
+        try:
+            for batch in self._iter_stat_batches(self._iter_directory_files(target_path, self._max_depth()), batch_size):
+                if not self._process_batch(batch, target_path, dry_run):
+                    cancelled = True
+                    return
+                self._finish_watch_batch(batch)
+
+            while True:
+                for path in watcher.poll(min(settle_seconds, 1.0)):
+                    if path not in pending and self._matches_exclude_pattern(path.name) is None:
+                        pending[path] = (None, time.monotonic())
+
+                # Debounce: a file is ready once it has stopped changing
+                now = time.monotonic()
+                for path, (signature, changed_at) in list(pending.items()):
+                    try:
+                        st = path.stat()
+                    except OSError:
+                        del pending[path] # Gone again (temp file, moved away)
+                        continue
+                    if not stat.S_ISREG(st.st_mode):
+                        del pending[path]
+                    elif (st.st_size, st.st_mtime_ns) != signature:
+                        pending[path] = ((st.st_size, st.st_mtime_ns), now)
+                    elif now - changed_at >= settle_seconds:
+                        del pending[path]
+                        if not ready:
+                            ready_since = now
+                        ready.append((path, st))
+
+                if ready and (len(ready) >= batch_size or now - ready_since >= batch_seconds):
+                    if not self._process_batch(ready, target_path, dry_run):
+                        cancelled = True
+                        return
+                    self._finish_watch_batch(ready)
+                    ready = []
+
+        except KeyboardInterrupt:
+            self._clear_progress_line()
+            print("\nStopping watch mode...")
+        finally:
+            watcher.close()
+            self._end_processing(cancelled) # A cancelled batch leaves its journal open for the next run
+            self.reporter.finalize()
+            self._print_results()
+
+    def _finish_watch_batch(self, batch: List[Tuple[Path, os.stat_result]]) -> None:
+        """Make a watch-mode batch durable and keep the long-lived duplicate index bounded."""
+        self._collect_moves(wait_all=True)
+        self._clear_progress_line()
+        if self._journal is not None:
+            self._journal.sync()
+        self._flush_hash_cache()
+        self.reporter.flush()
+        self._hash_results.clear() # Digests are keyed by path, which may now hold a different file
+        if self._duplicate_index is not None:
+            # Only organized files belong in the index; forget sources that were left in place
+            for file_path, _ in batch:
+                if file_path.exists():
+                    self._duplicate_index.discard(file_path)
+        self.logger.info("Watch batch done: %s files. Session totals: %s moved, %s skipped, %s errors.",
+                         len(batch), self.stats.files_moved, self.stats.files_skipped, self.stats.errors)
+
     def interactive_mode(self, target_directory: str) -> None:
         """
         Interactive mode for organizing files with preview and confirmation.
@@ -1707,7 +3287,7 @@ class EnhancedFileOrganizer:
             print("\nScanning directory for files...")
 
             # Scan for all eligible files first (validation happens inside _scan_directory_for_files)
-            all_eligible_files = self._scan_directory_for_files(target_path)
+            all_eligible_files = self._scan_directory_for_files(target_path, self._max_depth())
 
             # Files skipped/errored during scan are already logged by the reporter inside _scan_directory_for_files
 
@@ -1744,7 +3324,7 @@ class EnhancedFileOrganizer:
                     #     size=file_path.stat().st_size, reason=f"Categorized as {category}"
                     # ))
                  except Exception as e:
-                     self.logger.error(f"Error categorizing file {file_path.name}: {e}")
+                     self.logger.error("Error categorizing file %s: %s", file_path.name, e)
                      # Log categorization error via reporter
                      self.reporter.add_operation_result(DuplicateResolutionResult(
                          action_taken='error', source=file_path, destination=None, category='Unknown',
@@ -1848,7 +3428,7 @@ class EnhancedFileOrganizer:
                      intended_dest_path = dest_folder / file_path.name
                      preview_list.append((file_path, intended_dest_path, category_name))
                  except Exception as e:
-                     self.logger.error(f"Error calculating preview path for {file_path.name}: {e}", exc_info=True)
+                     self.logger.error("Error calculating preview path for %s: %s", file_path.name, e, exc_info=True)
                      # Files with errors during category lookup were already skipped from all_eligible_files
                      # If an error happens *now*, log it but don't add to preview_list
 
@@ -1892,7 +3472,7 @@ class EnhancedFileOrganizer:
                 return self.stats
 
             # Perform organization for the selected files
-            self.logger.info(f"User confirmed organization of {len(files_to_process_in_interactive)} files.")
+            self.logger.info("User confirmed organization of %s files.", len(files_to_process_in_interactive))
             # Interactive mode inherently doesn't dry-run the final move stage
             return self._process_files_list(files_to_process_in_interactive, target_path, dry_run=False)
 
@@ -1907,7 +3487,9 @@ class EnhancedFileOrganizer:
             return self.stats
         except Exception as e:
             # Catch any other unexpected error during interactive mode setup/flow
-            self.logger.critical(f"An unexpected error occurred during interactive organization: {e}", exc_info=True)
+            self.logger.critical("An unexpected error occurred during interactive organization: %s", e, exc_info=True)
+            self._close_copy_pool() # Let in-flight copies land so their outcomes are journaled
+            self._close_journal(completed=False) # Leave the run open so the next one resumes it
             # Log the critical error via reporter
             self.reporter.add_operation_result(DuplicateResolutionResult(
                 action_taken='error', source=target_path, destination=None, category='System',
@@ -1979,6 +3561,8 @@ class EnhancedFileOrganizer:
 
         duration = summary['duration_seconds']
         self._print_colored(f"⏱️  Time taken:         {duration:.2f} seconds", Fore.MAGENTA)
+        if summary['operations_file']:
+            self._print_colored(f"🗒️  Per-file results:   {summary['operations_file']}", Fore.MAGENTA)
 
         # Export reports if configured
         if self.config.get('export_reports', True):
@@ -1998,7 +3582,7 @@ class EnhancedFileOrganizer:
                     print(", ".join([f"{fmt} ({path})" for fmt, path in exported]))
 
             except Exception as e:
-                self.logger.error(f"Error exporting reports: {e}", exc_info=True)
+                self.logger.error("Error exporting reports: %s", e, exc_info=True)
                 self._print_colored(f"\n⚠️  Failed to export some reports: {e}", Fore.YELLOW)
 
         print("="*60)
@@ -2017,7 +3601,7 @@ def main():
     # Parse command line arguments
     parser = argparse.ArgumentParser(
         description="Enhanced File Organizer - Organize files by type with safety features."
-                    "\nOrganizes files at the top level of the specified directory.",
+                    "\nOrganizes files at the top level of the specified directory (see --max-depth for subfolders).",
         formatter_class=argparse.RawTextHelpFormatter
     )
     parser.add_argument("directory", nargs="?", help="Directory to organize (optional). Defaults to current directory.")
@@ -2025,6 +3609,8 @@ def main():
     parser.add_argument("--config", default="file_organizer_config.json", help="Path to the JSON configuration file. Defaults to 'file_organizer_config.json'.")
     parser.add_argument("--verbose", "-v", action="store_true", help="Enable verbose logging (show DEBUG messages).")
     parser.add_argument("--auto", action="store_true", help="Run in automatic mode without prompts. By default, runs in interactive mode.")
+    parser.add_argument("--watch", action="store_true", help="Keep running and organize new files as they arrive (Ctrl+C to stop). Combine with --dry-run to only report.")
+    parser.add_argument("--max-depth", type=int, default=None, help="Also organize files in subfolders up to this many levels deep (0 = top level only, -1 = unlimited). Overrides 'max_depth' in the config.")
 
     args = parser.parse_args()
 
@@ -2045,12 +3631,16 @@ def main():
          if isinstance(handler, logging.StreamHandler):
              handler.setLevel(logging.DEBUG if args.verbose else logging.INFO)
              break # Assuming there's only one console handler
+    organizer._update_logger_level(organizer.logger)
 
 
+    if args.max_depth is not None:
+        organizer.config["max_depth"] = max(-1, args.max_depth)
+
     target_dir = args.directory
     if not target_dir:
         # If no directory provided, ask the user unless in auto mode
-        if args.auto:
+        if args.auto or args.watch:
             target_dir = "." # Default to current directory in auto mode
             organizer.logger.info("No directory specified, defaulting to current directory in auto mode.")
         else:
@@ -2066,14 +3656,17 @@ def main():
     try:
          target_path_resolved = str(Path(target_dir).expanduser().resolve())
     except Exception as e:
-         organizer.logger.error(f"Invalid target directory path '{target_dir}': {e}", exc_info=args.verbose)
+         organizer.logger.error("Invalid target directory path '%s': %s", target_dir, e, exc_info=args.verbose)
          print(f"❌ Error: Invalid target directory path '{target_dir}'.")
          return 1
 
 
     try:
         # --- Main Organization Logic ---
-        if args.auto:
+        if args.watch:
+            organizer.watch_directory(target_path_resolved, dry_run=args.dry_run)
+
+        elif args.auto:
             if args.dry_run and organizer.config.get("duplicate_resolution") == "ask":
                 # Warn if ask strategy is set but running dry-run auto
                 organizer.logger.warning("Duplicate resolution is set to 'ask' in config, but running in automatic mode. 'ask' will be ignored. Consider changing strategy to 'skip', 'rename', or 'overwrite' for auto mode.")
@@ -2105,6 +3698,9 @@ def main():
         if organizer and hasattr(organizer, '_clear_progress_line'):
             organizer._clear_progress_line()  # Clear progress bar if active
         print("\nOperation cancelled by user.")
+        if organizer and hasattr(organizer, '_close_journal'):
+            organizer._close_journal(completed=False)  # Run is resumed on the next invocation
+            print("Moves so far are journaled; run again to resume, or use reverse_organization.py to undo.")
         if organizer and organizer.logger:
              organizer.logger.warning("Operation cancelled by user.")
              # Reporter might not be finalized or reflect cancellation accurately
@@ -2116,7 +3712,7 @@ def main():
         # Catch any other unexpected errors during the main execution flow
         # This should be rare with robust handling in processing methods
         if organizer and organizer.logger:
-             organizer.logger.critical(f"An unexpected critical error occurred during execution: {e}", exc_info=args.verbose)
+             organizer.logger.critical("An unexpected critical error occurred during execution: %s", e, exc_info=args.verbose)
              # Log the critical error via reporter if possible
              if hasattr(organizer, 'reporter'):
                  organizer.reporter.add_operation_result(DuplicateResolutionResult(
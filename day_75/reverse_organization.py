@@ -1,9 +1,86 @@
 import os
 import shutil
+import argparse
 
-def reverse_organization(target_directory):
+from enhanced_file_organizer import MoveJournal
+
+def reverse_from_journal(target_directory, journal_file=MoveJournal.FILE_NAME):
+    """
+    Undoes organize runs using the move journal the organizer writes in the target directory.
+
+    Every journaled move is reversed newest first, so the cost is proportional to the
+    number of moves rather than the size of the tree. Returns False if there is no journal.
+    """
+    journal_path = os.path.join(target_directory, journal_file)
+    if not os.path.exists(journal_path):
+        return False
+    runs = [run for run in MoveJournal.read_runs(journal_path) if not run.undone]
+    if not runs:
+        print("Nothing to reverse: every journaled run has already been undone.")
+        return True
+
+    moved_count = 0
+    skipped_count = 0
+    error_count = 0
+    touched_folders = set()
+
+    for run in reversed(runs):
+        moves = run.completed_moves()
+        status = "" if run.ended else " (interrupted)"
+        print(f"Reversing run {run.run_id}{status}: {len(moves)} moves")
+
+        for move in reversed(moves):
+            src, dst = move["src"], move["dst"]
+            name = os.path.basename(src)
+
+            if not os.path.exists(dst):
+                print(f"  Skipping (no longer at {dst}): {name}")
+                skipped_count += 1
+                continue
+            if os.path.exists(src):
+                print(f"  Skipping (already exists): {name}")
+                skipped_count += 1
+                continue
+
+            try:
+                os.makedirs(os.path.dirname(src), exist_ok=True)
+                shutil.move(dst, src)
+                touched_folders.add(os.path.dirname(dst))
+                if move["overwrite"]:
+                    print(f"  Moved back: {name} (the file it overwrote cannot be restored)")
+                else:
+                    print(f"  Moved back: {name}")
+                moved_count += 1
+            except Exception as e:
+                print(f"  Error moving {name}: {e}")
+                error_count += 1
+
+        MoveJournal.mark_undone(journal_path, run.run_id)
+
+    # Remove folders the organizer filled that are now empty (deepest first, never the target itself)
+    target = os.path.abspath(target_directory)
+    for folder in sorted(touched_folders, key=lambda p: p.count(os.sep), reverse=True):
+        folder = os.path.abspath(folder)
+        while folder != target and folder.startswith(target + os.sep):
+            try:
+                os.rmdir(folder)
+                print(f"Removed empty folder: {os.path.relpath(folder, target)}")
+            except OSError:
+                break # Not empty (or not removable), so neither are its parents
+            folder = os.path.dirname(folder)
+
+    print("\nReversal complete!")
+    print(f"Files moved back: {moved_count}")
+    print(f"Files skipped (already existed or missing): {skipped_count}")
+    print(f"Errors encountered: {error_count}")
+    return True
+
+def reverse_organization(target_directory, use_journal=True):
     """
     Moves all files from subdirectories back to the parent directory.
+
+    If the organizer left a move journal, files are returned to exactly where they
+    came from; otherwise the common category folders are rescanned.
     """
     if not os.path.isdir(target_directory):
         print(f"Error: '{target_directory}' is not a valid directory.")
@@ -11,6 +88,11 @@ def reverse_organization(target_directory):
 
     print(f"Starting to reverse organization in: {target_directory}")
     
+    if use_journal and reverse_from_journal(target_directory):
+        return
+    if use_journal:
+        print("No move journal found, rescanning category folders instead.")
+
     # List of common folder names created by the organizer
     common_folders = [
         'Documents', 'Images', 'Audio', 'Videos', 'Archives',
@@ -62,6 +144,12 @@ def reverse_organization(target_directory):
     print(f"Errors encountered: {error_count}")
 
 if __name__ == "__main__":
-    target_dir = input("Enter the path to the directory you want to reverse organization for: ")
+    parser = argparse.ArgumentParser(description="Undo the file organizer's changes in a directory.")
+    parser.add_argument("directory", nargs="?", help="Directory to reverse (prompted for if omitted)")
+    parser.add_argument("--rescan", action="store_true",
+                        help="Ignore the move journal and move files out of the category folders")
+    args = parser.parse_args()
+
+    target_dir = args.directory or input("Enter the path to the directory you want to reverse organization for: ")
     target_dir = os.path.expanduser(target_dir)
-    reverse_organization(target_dir)
+    reverse_organization(target_dir, use_journal=not args.rescan)
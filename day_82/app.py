@@ -14,6 +14,9 @@ import os
 from models import Base, Room, Timer, Message, ConnectedDevice
 from timer_engine import TimerEngine, TimerConfig, TimerType
 from websocket_manager import ConnectionManager, WebSocketHandler
+from room_backend import create_backend
+from room_router import RoomRouter, RoomUnavailableError
+from persistence import WriteBehindStore
 
 # Pydantic models for request/response
 class TimerCreate(BaseModel):
@@ -49,7 +52,17 @@ app.add_middleware(
 # Initialize components
 timer_engine = TimerEngine()
 connection_manager = ConnectionManager()
-websocket_handler = WebSocketHandler(connection_manager, timer_engine)
+
+# Room state and broadcasts go through a backend: memory:// (default) for a single
+# process, or redis://host:port/db to share rooms between several uvicorn workers
+backend_url = os.environ.get("SYNCSTAGE_BACKEND", "memory://")
+
+# Rooms, timers and devices are saved write-behind to this database ("none" disables it)
+database_url = os.environ.get("SYNCSTAGE_DATABASE", "sqlite:///syncstage.db")
+store = WriteBehindStore(database_url) if database_url != "none" else None
+
+room_router = RoomRouter(create_backend(backend_url), timer_engine, connection_manager, store=store)
+websocket_handler = WebSocketHandler(connection_manager, timer_engine, room_router)
 
 # Mount static files
 app.mount("/static", StaticFiles(directory="static"), name="static")
@@ -57,17 +70,24 @@ app.mount("/static", StaticFiles(directory="static"), name="static")
 # Templates
 templates = Jinja2Templates(directory="templates")
 
-# In-memory storage for rooms (in production, use database)
-rooms = {}
+async def get_room_or_404(room_id: str) -> dict:
+    room = await room_router.get_room(room_id)
+    if room is None:
+        raise HTTPException(status_code=404, detail="Room not found")
+    return room
 
 @app.on_event("startup")
 async def startup_event():
-    """Start the timer engine on startup"""
+    """Start the timer engine and connect to the room backend on startup"""
     await timer_engine.start_engine()
+    await room_router.start()
+    if store is not None and backend_url.startswith("memory:"):
+        await store.clear_devices()  # Single process: every device from the last run is gone
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """Stop the timer engine on shutdown"""
+    await room_router.stop()
     await timer_engine.stop_engine()
 
 @app.get("/", response_class=HTMLResponse)
@@ -88,7 +108,7 @@ async def create_room(title: str = Form(...), password: Optional[str] = Form(Non
         "timers": []
     }
     
-    rooms[room_id] = room
+    await room_router.create_room(room)
     
     return {
         "room_id": room_id,
@@ -101,10 +121,7 @@ async def create_room(title: str = Form(...), password: Optional[str] = Form(Non
 @app.get("/controller/{room_id}", response_class=HTMLResponse)
 async def controller_page(request: Request, room_id: str):
     """Controller interface for managing timers"""
-    if room_id not in rooms:
-        raise HTTPException(status_code=404, detail="Room not found")
-    
-    room = rooms[room_id]
+    room = await get_room_or_404(room_id)
     return templates.TemplateResponse("controller.html", {
         "request": request,
         "room": room
@@ -113,10 +130,7 @@ async def controller_page(request: Request, room_id: str):
 @app.get("/viewer/{room_id}", response_class=HTMLResponse)
 async def viewer_page(request: Request, room_id: str):
     """Viewer interface for displaying timers"""
-    if room_id not in rooms:
-        raise HTTPException(status_code=404, detail="Room not found")
-    
-    room = rooms[room_id]
+    room = await get_room_or_404(room_id)
     return templates.TemplateResponse("viewer.html", {
         "request": request,
         "room": room
@@ -125,10 +139,7 @@ async def viewer_page(request: Request, room_id: str):
 @app.get("/agenda/{room_id}", response_class=HTMLResponse)
 async def agenda_page(request: Request, room_id: str):
     """Agenda page for event participants"""
-    if room_id not in rooms:
-        raise HTTPException(status_code=404, detail="Room not found")
-    
-    room = rooms[room_id]
+    room = await get_room_or_404(room_id)
     return templates.TemplateResponse("agenda.html", {
         "request": request,
         "room": room
@@ -139,95 +150,86 @@ async def websocket_endpoint(
     websocket: WebSocket, 
     room_id: str, 
     device_type: str = "viewer",
-    device_name: Optional[str] = None
+    device_name: Optional[str] = None,
+    sync: str = "push"
 ):
-    """WebSocket endpoint for real-time communication"""
-    if room_id not in rooms:
+    """
+    WebSocket endpoint for real-time communication.
+
+    sync=push (default) streams a timer_update whenever a running timer's display
+    changes; sync=clock sends only state transitions plus time_sync replies, and the
+    client renders running timers from its estimate of the server clock.
+    """
+    if await room_router.get_room(room_id) is None:
         await websocket.close(code=4004, reason="Room not found")
         return
+    if sync not in ("push", "clock"):
+        await websocket.close(code=4000, reason="Invalid sync mode")
+        return
     
-    await websocket_handler.handle_websocket(websocket, room_id, device_type, device_name or "Unknown Device")
+    try:
+        timers = await room_router.room_timers(room_id)
+    except RoomUnavailableError:
+        timers = []  # The viewer still gets the next update
+    await websocket_handler.handle_websocket(websocket, room_id, device_type, device_name or "Unknown Device",
+                                             sync, timers)
 
 @app.post("/api/rooms/{room_id}/timers")
 async def create_timer(room_id: str, timer_data: TimerCreate):
     """Create a new timer in a room"""
-    if room_id not in rooms:
-        raise HTTPException(status_code=404, detail="Room not found")
+    await get_room_or_404(room_id)
+    try:
+        TimerType(timer_data.timer_type)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid timer type")
     
-    timer_id = str(uuid.uuid4())
+    # The room's owning worker adds it to its engine and stores it with the room
+    try:
+        timer_info = await room_router.add_timer(room_id, {
+            "title": timer_data.title,
+            "duration": timer_data.duration,
+            "timer_type": timer_data.timer_type,
+            "wrap_up_yellow": timer_data.wrap_up_yellow,
+            "wrap_up_red": timer_data.wrap_up_red
+        })
+    except RoomUnavailableError as e:
+        raise HTTPException(status_code=503, detail=str(e))
     
-    # Create timer config
-    config = TimerConfig(
-        id=timer_id,
-        title=timer_data.title,
-        duration=timer_data.duration,
-        timer_type=TimerType(timer_data.timer_type),
-        wrap_up_yellow=timer_data.wrap_up_yellow,
-        wrap_up_red=timer_data.wrap_up_red
-    )
-    
-    # Add timer to engine
-    timer = timer_engine.add_timer(config)
-    
-    # Add to room
-    timer_info = {
-        "id": timer_id,
-        "title": timer_data.title,
-        "duration": timer_data.duration,
-        "timer_type": timer_data.timer_type,
-        "wrap_up_yellow": timer_data.wrap_up_yellow,
-        "wrap_up_red": timer_data.wrap_up_red,
-        "position": len(rooms[room_id]["timers"])
-    }
-    
-    rooms[room_id]["timers"].append(timer_info)
-    
-    return {"timer_id": timer_id, "timer": timer_info}
+    return {"timer_id": timer_info["id"], "timer": timer_info}
 
 @app.get("/api/rooms/{room_id}/timers")
 async def get_timers(room_id: str):
     """Get all timers in a room"""
-    if room_id not in rooms:
-        raise HTTPException(status_code=404, detail="Room not found")
+    room = await get_room_or_404(room_id)
     
-    return {"timers": rooms[room_id]["timers"]}
+    return {"timers": room["timers"]}
 
 @app.post("/api/rooms/{room_id}/timers/{timer_id}/control")
 async def control_timer(room_id: str, timer_id: str, control_data: TimerControl):
     """Control a timer (start, stop, pause, reset, add_time)"""
-    if room_id not in rooms:
-        raise HTTPException(status_code=404, detail="Room not found")
+    await get_room_or_404(room_id)
     
-    timer = timer_engine.get_timer(timer_id)
-    if not timer:
-        raise HTTPException(status_code=404, detail="Timer not found")
-    
-    # Execute action
-    if control_data.action == "start":
-        timer.start()
-    elif control_data.action == "stop":
-        timer.stop()
-    elif control_data.action == "pause":
-        timer.pause()
-    elif control_data.action == "reset":
-        timer.reset()
-    elif control_data.action == "add_time":
-        seconds = control_data.data.get("seconds", 0) if control_data.data else 0
-        timer.add_time(seconds)
-    else:
+    if control_data.action not in ("start", "stop", "pause", "reset", "add_time"):
         raise HTTPException(status_code=400, detail="Invalid action")
     
+    # Execute action on the worker running the room's timers
+    try:
+        timer = await room_router.control_timer(room_id, timer_id, control_data.action, control_data.data or {})
+    except KeyError:
+        raise HTTPException(status_code=404, detail="Timer not found")
+    except RoomUnavailableError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    
     # Broadcast to all devices in room
     await connection_manager.broadcast_timer_control(room_id, control_data.action, timer_id, control_data.data or {})
-    await connection_manager.broadcast_timer_update(room_id, timer.to_dict())
+    await connection_manager.broadcast_timer_update(room_id, timer)
     
-    return {"success": True, "timer": timer.to_dict()}
+    return {"success": True, "timer": timer}
 
 @app.post("/api/rooms/{room_id}/messages")
 async def create_message(room_id: str, message_data: MessageCreate):
     """Create a display message"""
-    if room_id not in rooms:
-        raise HTTPException(status_code=404, detail="Room not found")
+    await get_room_or_404(room_id)
     
     message_info = {
         "id": str(uuid.uuid4()),
@@ -246,11 +248,10 @@ async def create_message(room_id: str, message_data: MessageCreate):
 
 @app.get("/api/rooms/{room_id}/devices")
 async def get_devices(room_id: str):
-    """Get all connected devices in a room"""
-    if room_id not in rooms:
-        raise HTTPException(status_code=404, detail="Room not found")
+    """Get all connected devices in a room (on every worker)"""
+    await get_room_or_404(room_id)
     
-    devices = connection_manager.get_room_devices(room_id)
+    devices = await room_router.get_devices(room_id)
     return {"devices": devices}
 
 if __name__ == "__main__":
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Benchmark: throughput of saving SyncStage room state to the database.
+
+Each simulated room has a few timers ticking for some seconds and a few devices
+sending messages. The same changes are written two ways to a fresh SQLite file:
+
+  * per-change   - session.merge() and commit() for every timer tick and device
+                   message (what a straightforward ORM integration does)
+  * write-behind - WriteBehindStore recording the changes and flushing once per
+                   simulated second with bulk INSERT/UPDATE statements
+
+and the report shows rooms/second and rows actually written.
+
+Usage:
+    python benchmark_persistence.py [--rooms 200] [--timers 3] [--devices 5] [--seconds 10]
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+from datetime import datetime
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from models import Base, Room, Timer, ConnectedDevice
+from persistence import WriteBehindStore
+
+
+def make_rooms(rooms: int, timers: int, devices: int):
+    now = datetime.now().isoformat()
+    return [
+        {
+            "id": f"room-{r}",
+            "title": f"Room {r}",
+            "password": None,
+            "created_at": now,
+            "timers": [
+                {"id": f"room-{r}-timer-{t}", "title": f"Timer {t}", "duration": 600,
+                 "timer_type": "countdown", "wrap_up_yellow": 60, "wrap_up_red": 30, "position": t}
+                for t in range(timers)
+            ],
+            "devices": [
+                {"id": f"room-{r}-device-{d}", "name": f"Device {d}", "type": "viewer", "last_seen": now}
+                for d in range(devices)
+            ]
+        }
+        for r in range(rooms)
+    ]
+
+
+def runtime_at(second: int) -> dict:
+    """Timer.get_state() of a countdown that has run for the given number of seconds"""
+    return {"state": "running", "current_time": float(600 - second), "start_time": time.time() - second,
+            "pause_time": None, "total_paused_time": 0.0, "duration": 600, "initial_duration": 600}
+
+
+def per_change(url: str, rooms: list, seconds: int) -> int:
+    engine = create_engine(url)
+    Base.metadata.create_all(engine)
+    commits = 0
+    with Session(engine) as session:
+        def save(obj):
+            nonlocal commits
+            session.merge(obj)
+            session.commit()
+            commits += 1
+
+        for room in rooms:
+            save(Room(id=room["id"], title=room["title"], created_at=datetime.now(), settings={}))
+            for device in room["devices"]:
+                save(ConnectedDevice(id=device["id"], room_id=room["id"], device_name=device["name"],
+                                     device_type=device["type"], last_seen=datetime.now(), session_id=device["id"]))
+        for second in range(seconds):
+            for room in rooms:
+                for info in room["timers"]:
+                    runtime = runtime_at(second)
+                    save(Timer(id=info["id"], room_id=room["id"], title=info["title"], duration=info["duration"],
+                               timer_type=info["timer_type"], wrap_up_yellow=info["wrap_up_yellow"],
+                               wrap_up_red=info["wrap_up_red"], position=info["position"],
+                               settings={"runtime": runtime}, is_active=True, is_running=True,
+                               current_time=int(runtime["current_time"])))
+                for device in room["devices"]:
+                    save(ConnectedDevice(id=device["id"], room_id=room["id"], device_name=device["name"],
+                                         device_type=device["type"], last_seen=datetime.now(),
+                                         session_id=device["id"]))
+    engine.dispose()
+    return commits
+
+
+async def write_behind(url: str, rooms: list, seconds: int) -> int:
+    store = WriteBehindStore(url, flush_interval=3600)  # Flushed explicitly once per simulated second
+    await store.start()
+    for room in rooms:
+        store.save_room(room)
+        for device in room["devices"]:
+            store.save_device(room["id"], device)
+    for second in range(seconds):
+        for room in rooms:
+            for info in room["timers"]:
+                store.save_timer(room["id"], info, runtime_at(second))
+            for device in room["devices"]:
+                store.touch_device(device["id"])
+        await store.flush()
+    await store.close()
+    return store.rows_written
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark per-change commits against write-behind batching.")
+    parser.add_argument("--rooms", type=int, default=200, help="Number of rooms")
+    parser.add_argument("--timers", type=int, default=3, help="Running timers per room")
+    parser.add_argument("--devices", type=int, default=5, help="Connected devices per room")
+    parser.add_argument("--seconds", type=int, default=10, help="Simulated seconds of ticking")
+    args = parser.parse_args()
+
+    rooms = make_rooms(args.rooms, args.timers, args.devices)
+    print(f"{args.rooms:,} rooms x {args.timers} timers, {args.devices} devices, {args.seconds} s simulated\n")
+    print(f"{'mode':<14} {'time':>9} {'rooms/s':>10} {'writes':>10}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for label in ("per-change", "write-behind"):
+            url = f"sqlite:///{os.path.join(tmp, label + '.db')}"
+            start = time.perf_counter()
+            if label == "per-change":
+                writes = per_change(url, rooms, args.seconds)
+            else:
+                writes = asyncio.run(write_behind(url, rooms, args.seconds))
+            elapsed = time.perf_counter() - start
+            # A room is "done" once all of its simulated seconds are saved
+            print(f"{label:<14} {elapsed:8.2f}s {args.rooms / elapsed:10,.1f} {writes:10,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Benchmark: CPU cost of the TimerEngine with many concurrent room timers.
+
+Runs the same set of timers (one per room, each with a no-op async callback
+standing in for the room broadcast) under the old 10 Hz polling loop and the
+deadline scheduler, and reports process CPU time and callback counts.
+
+Scenarios:
+  * running - every timer counting down (display changes once a second)
+  * idle    - every timer paused (nothing on screen changes)
+
+Usage:
+    python benchmark_timer_engine.py [--timers 10000] [--seconds 10]
+"""
+
+import argparse
+import asyncio
+import time
+
+from timer_engine import TimerEngine, TimerConfig, TimerType, TimerState
+
+
+class PollingTimerEngine(TimerEngine):
+    """The previous engine loop: update and notify every running timer every 100 ms."""
+
+    async def _run_engine(self):
+        while self._running:
+            current_time = time.time()
+
+            for timer in self.timers.values():
+                if timer.state == TimerState.RUNNING:
+                    timer._update(current_time)
+
+                    if timer.id in self.callbacks:
+                        for callback in self.callbacks[timer.id]:
+                            try:
+                                await callback(timer)
+                            except Exception as e:
+                                print(f"Error in timer callback: {e}")
+
+            await asyncio.sleep(0.1)
+
+
+async def run_scenario(engine_class, timers: int, seconds: float, paused: bool) -> dict:
+    engine = engine_class()
+    calls = 0
+
+    async def on_update(timer):
+        nonlocal calls
+        calls += 1
+
+    for i in range(timers):
+        timer = engine.add_timer(TimerConfig(
+            id=f"timer-{i}",
+            title=f"Room {i}",
+            duration=3600,
+            timer_type=TimerType.COUNTDOWN,
+        ))
+        engine.add_callback(timer.id, on_update)
+        timer.start()
+        if paused:
+            timer.pause()
+
+    await engine.start_engine()
+    await asyncio.sleep(1.5)  # Let the first deadlines (and stale ones from pausing) pass
+    calls = 0
+    cpu_start, wall_start = time.process_time(), time.perf_counter()
+    await asyncio.sleep(seconds)
+    cpu, wall = time.process_time() - cpu_start, time.perf_counter() - wall_start
+    await engine.stop_engine()
+    return {"cpu_percent": cpu / wall * 100, "callbacks_per_second": calls / wall}
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Benchmark TimerEngine CPU use with many timers.")
+    parser.add_argument("--timers", type=int, default=10_000, help="Number of concurrent room timers")
+    parser.add_argument("--seconds", type=float, default=10, help="Measurement window per run")
+    args = parser.parse_args()
+
+    print(f"{args.timers:,} timers, {args.seconds:g} s per run\n")
+    print(f"{'scenario':<10} {'engine':<10} {'CPU':>8} {'callbacks/s':>13}")
+    for scenario, paused in (("running", False), ("idle", True)):
+        for label, engine_class in (("polling", PollingTimerEngine), ("deadline", TimerEngine)):
+            result = await run_scenario(engine_class, args.timers, args.seconds, paused)
+            print(f"{scenario:<10} {label:<10} {result['cpu_percent']:7.1f}% {result['callbacks_per_second']:13,.0f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
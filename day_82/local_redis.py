@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Minimal Redis-compatible server for running several SyncStage workers locally
+without installing Redis.
+
+Implements just the commands RedisBackend uses (strings with NX/PX, hashes,
+pub/sub), keeps everything in memory and is meant for development only.
+
+Usage:
+    python local_redis.py [--host 127.0.0.1] [--port 6379]
+"""
+
+import argparse
+import asyncio
+import time
+from typing import Dict, List, Optional, Set, Tuple
+
+def _bulk(value: Optional[bytes]) -> bytes:
+    if value is None:
+        return b"$-1\r\n"
+    return b"$%d\r\n%s\r\n" % (len(value), value)
+
+def _array(items: List[bytes]) -> bytes:
+    return b"*%d\r\n" % len(items) + b"".join(_bulk(item) for item in items)
+
+class LocalRedis:
+    def __init__(self):
+        self.strings: Dict[bytes, Tuple[bytes, Optional[float]]] = {}  # key -> (value, expires at)
+        self.hashes: Dict[bytes, Dict[bytes, bytes]] = {}
+        self.channels: Dict[bytes, Set[asyncio.StreamWriter]] = {}
+
+    def _get(self, key: bytes) -> Optional[bytes]:
+        entry = self.strings.get(key)
+        if entry is None:
+            return None
+        if entry[1] is not None and entry[1] <= time.monotonic():
+            del self.strings[key]
+            return None
+        return entry[0]
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                command = await self._read_command(reader)
+                if command is None:
+                    break
+                reply = self.execute(command, writer)
+                if reply is not None:
+                    writer.write(reply)
+                    await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            for subscribers in self.channels.values():
+                subscribers.discard(writer)
+            writer.close()
+
+    async def _read_command(self, reader: asyncio.StreamReader) -> Optional[List[bytes]]:
+        line = await reader.readline()
+        if not line:
+            return None
+        if not line.startswith(b"*"):
+            return line.strip().split()  # Inline command (e.g. typed into telnet)
+        args = []
+        for _ in range(int(line[1:-2])):
+            length = int((await reader.readline())[1:-2])
+            args.append((await reader.readexactly(length + 2))[:-2])
+        return args
+
+    def execute(self, command: List[bytes], writer: asyncio.StreamWriter) -> Optional[bytes]:
+        name, args = command[0].upper(), command[1:]
+        if name == b"PING":
+            return b"+PONG\r\n"
+        if name == b"SELECT":
+            return b"+OK\r\n"  # A single keyspace is enough here
+        if name == b"GET":
+            return _bulk(self._get(args[0]))
+        if name == b"SET":
+            return self._set(args)
+        if name == b"DEL":
+            removed = sum(1 for key in args if self.strings.pop(key, None) or self.hashes.pop(key, None))
+            return b":%d\r\n" % removed
+        if name in (b"PEXPIRE", b"EXPIRE"):
+            value = self._get(args[0])
+            if value is None:
+                return b":0\r\n"
+            seconds = int(args[1]) / (1000 if name == b"PEXPIRE" else 1)
+            self.strings[args[0]] = (value, time.monotonic() + seconds)
+            return b":1\r\n"
+        if name == b"HSET":
+            fields = self.hashes.setdefault(args[0], {})
+            added = 0
+            for field, value in zip(args[1::2], args[2::2]):
+                added += field not in fields
+                fields[field] = value
+            return b":%d\r\n" % added
+        if name == b"HDEL":
+            fields = self.hashes.get(args[0], {})
+            removed = sum(1 for field in args[1:] if fields.pop(field, None) is not None)
+            if not fields:
+                self.hashes.pop(args[0], None)
+            return b":%d\r\n" % removed
+        if name == b"HGETALL":
+            items = []
+            for field, value in self.hashes.get(args[0], {}).items():
+                items += [field, value]
+            return _array(items)
+        if name == b"PUBLISH":
+            message = _array([b"message", args[0], args[1]])
+            subscribers = self.channels.get(args[0], set())
+            for subscriber in subscribers:
+                subscriber.write(message)
+            return b":%d\r\n" % len(subscribers)
+        if name in (b"SUBSCRIBE", b"UNSUBSCRIBE"):
+            replies = []
+            for channel in args:
+                if name == b"SUBSCRIBE":
+                    self.channels.setdefault(channel, set()).add(writer)
+                else:
+                    self.channels.get(channel, set()).discard(writer)
+                count = sum(1 for subscribers in self.channels.values() if writer in subscribers)
+                replies.append(b"*3\r\n" + _bulk(name.lower()) + _bulk(channel) + b":%d\r\n" % count)
+            return b"".join(replies)
+        if name == b"QUIT":
+            writer.write(b"+OK\r\n")
+            writer.close()
+            return None
+        return b"-ERR unknown command '%s'\r\n" % name
+
+    def _set(self, args: List[bytes]) -> bytes:
+        key, value, options = args[0], args[1], [a.upper() for a in args[2:]]
+        expires = None
+        if b"PX" in options:
+            expires = time.monotonic() + int(args[2 + options.index(b"PX") + 1]) / 1000
+        elif b"EX" in options:
+            expires = time.monotonic() + int(args[2 + options.index(b"EX") + 1])
+        if b"NX" in options and self._get(key) is not None:
+            return b"$-1\r\n"
+        self.strings[key] = (value, expires)
+        return b"+OK\r\n"
+
+async def serve(host: str, port: int):
+    store = LocalRedis()
+    server = await asyncio.start_server(store.handle, host, port)
+    print(f"Local Redis stand-in listening on {host}:{port}")
+    async with server:
+        await server.serve_forever()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Minimal in-memory Redis stand-in for SyncStage development.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=6379)
+    args = parser.parse_args()
+    try:
+        asyncio.run(serve(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,235 @@
+"""
+Write-behind persistence of rooms, timers and connected devices through the
+SQLAlchemy models in models.py.
+
+Changes are only recorded in memory (the latest state per row wins) and written
+in one transaction every flush interval, with bulk INSERT/UPDATE statements per
+table, so a timer ticking every second or a device sending a message costs a
+dictionary update rather than a commit. On startup load_rooms() returns the saved
+rooms with each timer's runtime state, so running timers carry on.
+"""
+
+import asyncio
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Dict, List, Optional, Set
+import logging
+
+from sqlalchemy import bindparam, create_engine, delete, insert, select
+from sqlalchemy.orm import Session
+
+from models import Base, Room, Timer, ConnectedDevice
+
+logger = logging.getLogger(__name__)
+
+# Rows per IN (...) lookup, well under SQLite's bound-parameter limit
+LOOKUP_CHUNK = 500
+
+class WriteBehindStore:
+    def __init__(self, database_url: str, flush_interval: float = 1.0):
+        self.database_url = database_url
+        self.flush_interval = flush_interval
+        self.engine = None
+        # Pending rows by primary key; replaced wholesale at each flush
+        self._rooms: Dict[str, dict] = {}
+        self._timers: Dict[str, dict] = {}
+        self._devices: Dict[str, dict] = {}
+        self._device_seen: Dict[str, datetime] = {}
+        self._removed_devices: Set[str] = set()
+        # All database work happens on one thread, off the event loop
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="syncstage-db")
+        self._task: Optional[asyncio.Task] = None
+        self.flushes = 0
+        self.rows_written = 0
+
+    async def start(self):
+        """Create the tables if needed and start the periodic flush"""
+        self.engine = create_engine(self.database_url)
+        await self._run(Base.metadata.create_all, self.engine)
+        self._task = asyncio.create_task(self._flush_periodically())
+
+    async def close(self):
+        """Stop the periodic flush and write whatever is still pending"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+        self._executor.shutdown(wait=True)
+        if self.engine is not None:
+            self.engine.dispose()
+
+    async def _run(self, func, *args):
+        return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+
+    # --- Recording changes (cheap; nothing is written yet) ---
+
+    def save_room(self, room: dict):
+        password = room.get("password")
+        self._rooms[room["id"]] = {
+            "id": room["id"],
+            "title": room["title"],
+            "password_hash": hashlib.sha256(password.encode()).hexdigest() if password else room.get("password_hash"),
+            "created_at": datetime.fromisoformat(room["created_at"]),
+            "settings": room.get("settings") or {}
+        }
+
+    def save_timer(self, room_id: str, timer_info: dict, runtime: dict):
+        """Record a timer's definition with its runtime state (Timer.get_state())"""
+        start_time = runtime.get("start_time")
+        self._timers[timer_info["id"]] = {
+            "id": timer_info["id"],
+            "room_id": room_id,
+            "title": timer_info["title"],
+            "duration": timer_info["duration"],
+            "timer_type": timer_info["timer_type"],
+            "wrap_up_yellow": timer_info["wrap_up_yellow"],
+            "wrap_up_red": timer_info["wrap_up_red"],
+            "position": timer_info.get("position", 0),
+            # The model has no columns for pause bookkeeping, so the full state rides in settings
+            "settings": {"runtime": runtime},
+            "is_active": runtime["state"] in ("running", "paused"),
+            "is_running": runtime["state"] == "running",
+            "current_time": int(runtime["current_time"]),
+            "started_at": datetime.fromtimestamp(start_time) if start_time else None
+        }
+
+    def save_device(self, room_id: str, device: dict):
+        self._removed_devices.discard(device["id"])
+        self._devices[device["id"]] = {
+            "id": device["id"],
+            "room_id": room_id,
+            "device_name": device["name"],
+            "device_type": device["type"],
+            "last_seen": datetime.fromisoformat(device["last_seen"]),
+            "session_id": device["id"],
+            "ip_address": device.get("ip_address")
+        }
+
+    def touch_device(self, device_id: str, when: Optional[datetime] = None):
+        self._device_seen[device_id] = when or datetime.now()
+
+    def remove_device(self, device_id: str):
+        self._devices.pop(device_id, None)
+        self._device_seen.pop(device_id, None)
+        self._removed_devices.add(device_id)
+
+    @property
+    def pending(self) -> int:
+        return (len(self._rooms) + len(self._timers) + len(self._devices)
+                + len(self._device_seen) + len(self._removed_devices))
+
+    # --- Writing ---
+
+    async def _flush_periodically(self):
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error(f"Error flushing SyncStage state to the database: {e}")
+
+    async def flush(self):
+        """Write all pending changes in one transaction"""
+        if not self.pending:
+            return
+        batch = (self._rooms, self._timers, self._devices, self._device_seen, self._removed_devices)
+        self._rooms, self._timers, self._devices = {}, {}, {}
+        self._device_seen, self._removed_devices = {}, set()
+        try:
+            await self._run(self._write, *batch)
+        except Exception:
+            self._requeue(*batch)
+            raise
+
+    def _requeue(self, rooms, timers, devices, device_seen, removed_devices):
+        """Put a failed batch back without overwriting anything newer"""
+        self._rooms = {**rooms, **self._rooms}
+        self._timers = {**timers, **self._timers}
+        self._devices = {**devices, **self._devices}
+        self._device_seen = {**device_seen, **self._device_seen}
+        self._removed_devices |= removed_devices - set(self._devices)
+
+    def _write(self, rooms, timers, devices, device_seen, removed_devices):
+        with Session(self.engine) as session, session.begin():
+            written = self._upsert(session, Room, rooms)
+            written += self._upsert(session, Timer, timers)
+            written += self._upsert(session, ConnectedDevice, devices)
+
+            seen = [{"b_id": device_id, "b_seen": when} for device_id, when in device_seen.items()
+                    if device_id not in devices and device_id not in removed_devices]
+            if seen:
+                table = ConnectedDevice.__table__
+                session.execute(table.update().where(table.c.id == bindparam("b_id"))
+                                .values(last_seen=bindparam("b_seen")), seen)
+                written += len(seen)
+            if removed_devices:
+                session.execute(delete(ConnectedDevice).where(ConnectedDevice.id.in_(removed_devices)))
+                written += len(removed_devices)
+        self.flushes += 1
+        self.rows_written += written
+
+    @staticmethod
+    def _upsert(session: Session, model, rows: Dict[str, dict]) -> int:
+        """INSERT the new rows and UPDATE the existing ones, each as one executemany"""
+        if not rows:
+            return 0
+        ids = list(rows)
+        existing = set()
+        for i in range(0, len(ids), LOOKUP_CHUNK):
+            existing.update(session.scalars(select(model.id).where(model.id.in_(ids[i:i + LOOKUP_CHUNK]))))
+
+        new_rows = [row for row_id, row in rows.items() if row_id not in existing]
+        if new_rows:
+            session.execute(insert(model), new_rows)
+        changed = [dict(row, b_id=row_id) for row_id, row in rows.items() if row_id in existing]
+        if changed:
+            table = model.__table__
+            columns = {name: bindparam(name) for name in changed[0] if name not in ("id", "b_id")}
+            session.execute(table.update().where(table.c.id == bindparam("b_id")).values(columns), changed)
+        return len(rows)
+
+    # --- Restoring ---
+
+    async def load_rooms(self) -> List[dict]:
+        """Saved rooms in the shape app.py uses, with each timer's runtime state"""
+        return await self._run(self._load_rooms)
+
+    def _load_rooms(self) -> List[dict]:
+        with Session(self.engine) as session:
+            rooms = {
+                room.id: {
+                    "id": room.id,
+                    "title": room.title,
+                    "password_hash": room.password_hash,
+                    "created_at": room.created_at.isoformat() if room.created_at else datetime.now().isoformat(),
+                    "timers": []
+                }
+                for room in session.scalars(select(Room))
+            }
+            for timer in session.scalars(select(Timer).order_by(Timer.position)):
+                if timer.room_id not in rooms:
+                    continue
+                rooms[timer.room_id]["timers"].append({
+                    "id": timer.id,
+                    "title": timer.title,
+                    "duration": timer.duration,
+                    "timer_type": timer.timer_type,
+                    "wrap_up_yellow": timer.wrap_up_yellow,
+                    "wrap_up_red": timer.wrap_up_red,
+                    "position": timer.position,
+                    "runtime": (timer.settings or {}).get("runtime")
+                })
+            return list(rooms.values())
+
+    async def clear_devices(self):
+        """Drop device rows left by a previous run (nobody is connected after a restart)"""
+        await self._run(self._clear_devices)
+
+    def _clear_devices(self):
+        with Session(self.engine) as session, session.begin():
+            session.execute(delete(ConnectedDevice))
@@ -0,0 +1,376 @@
+"""
+Shared room state and pub/sub for running SyncStage on several worker processes.
+
+InProcessBackend keeps everything in this process (a single worker, the default).
+RedisBackend speaks the Redis protocol, so workers can share rooms through a Redis
+server or the bundled local_redis.py stand-in.
+"""
+
+import asyncio
+import json
+import time
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Called with (channel, message) for every message on a subscribed channel
+MessageHandler = Callable[[str, dict], Awaitable[None]]
+
+KEY_PREFIX = "syncstage:"
+
+class RoomBackend:
+    """Interface shared by the backends"""
+
+    async def start(self, on_message: MessageHandler):
+        """Connect and start delivering subscribed messages to on_message"""
+        raise NotImplementedError
+
+    async def close(self):
+        raise NotImplementedError
+
+    async def get_room(self, room_id: str) -> Optional[dict]:
+        raise NotImplementedError
+
+    async def put_room(self, room: dict):
+        raise NotImplementedError
+
+    async def claim_room(self, room_id: str, worker_id: str, ttl: float) -> str:
+        """Become the room's owner for ttl seconds unless another worker holds it; returns the owner"""
+        raise NotImplementedError
+
+    async def renew_room(self, room_id: str, worker_id: str, ttl: float) -> bool:
+        """Extend our ownership lease; False if the room is no longer ours"""
+        raise NotImplementedError
+
+    async def mark_alive(self, worker_id: str, ttl: float):
+        """Record that the worker is running, for the next ttl seconds"""
+        raise NotImplementedError
+
+    async def is_alive(self, worker_id: str) -> bool:
+        raise NotImplementedError
+
+    async def set_device(self, room_id: str, device: dict):
+        raise NotImplementedError
+
+    async def remove_device(self, room_id: str, device_id: str):
+        raise NotImplementedError
+
+    async def get_devices(self, room_id: str) -> List[dict]:
+        raise NotImplementedError
+
+    async def publish(self, channel: str, message: dict):
+        raise NotImplementedError
+
+    async def subscribe(self, channel: str):
+        raise NotImplementedError
+
+    async def unsubscribe(self, channel: str):
+        raise NotImplementedError
+
+class InProcessBackend(RoomBackend):
+    """Everything in local dictionaries; published messages go straight to the handler"""
+
+    def __init__(self):
+        self.rooms: Dict[str, dict] = {}
+        self.devices: Dict[str, Dict[str, dict]] = {}
+        self.owners: Dict[str, Tuple[str, float]] = {}  # room_id -> (worker_id, lease expiry)
+        self.workers: Dict[str, float] = {}  # worker_id -> when it stops counting as alive
+        self.channels = set()
+        self._on_message: Optional[MessageHandler] = None
+
+    async def start(self, on_message: MessageHandler):
+        self._on_message = on_message
+
+    async def close(self):
+        self._on_message = None
+
+    async def get_room(self, room_id: str) -> Optional[dict]:
+        return self.rooms.get(room_id)
+
+    async def put_room(self, room: dict):
+        self.rooms[room["id"]] = room
+
+    async def claim_room(self, room_id: str, worker_id: str, ttl: float) -> str:
+        owner = self.owners.get(room_id)
+        if owner is None or owner[1] < time.monotonic() or owner[0] == worker_id:
+            self.owners[room_id] = (worker_id, time.monotonic() + ttl)
+            return worker_id
+        return owner[0]
+
+    async def renew_room(self, room_id: str, worker_id: str, ttl: float) -> bool:
+        return await self.claim_room(room_id, worker_id, ttl) == worker_id
+
+    async def mark_alive(self, worker_id: str, ttl: float):
+        self.workers[worker_id] = time.monotonic() + ttl
+
+    async def is_alive(self, worker_id: str) -> bool:
+        return self.workers.get(worker_id, 0) >= time.monotonic()
+
+    async def set_device(self, room_id: str, device: dict):
+        self.devices.setdefault(room_id, {})[device["id"]] = device
+
+    async def remove_device(self, room_id: str, device_id: str):
+        room_devices = self.devices.get(room_id, {})
+        room_devices.pop(device_id, None)
+        if not room_devices:
+            self.devices.pop(room_id, None)
+
+    async def get_devices(self, room_id: str) -> List[dict]:
+        return list(self.devices.get(room_id, {}).values())
+
+    async def publish(self, channel: str, message: dict):
+        if channel in self.channels and self._on_message is not None:
+            await self._on_message(channel, message)
+
+    async def subscribe(self, channel: str):
+        self.channels.add(channel)
+
+    async def unsubscribe(self, channel: str):
+        self.channels.discard(channel)
+
+class RedisError(Exception):
+    """Error reply from the Redis server"""
+
+def _encode_command(*args) -> bytes:
+    """Encode a command as a RESP array of bulk strings"""
+    parts = [b"*%d\r\n" % len(args)]
+    for arg in args:
+        data = arg if isinstance(arg, bytes) else str(arg).encode()
+        parts.append(b"$%d\r\n%s\r\n" % (len(data), data))
+    return b"".join(parts)
+
+async def _read_reply(reader: asyncio.StreamReader):
+    """Read one RESP reply (bulk strings are returned as bytes)"""
+    line = await reader.readline()
+    if not line:
+        raise ConnectionError("Redis connection closed")
+    kind, body = line[:1], line[1:-2]
+    if kind == b"+":
+        return body.decode()
+    if kind == b"-":
+        raise RedisError(body.decode())
+    if kind == b":":
+        return int(body)
+    if kind == b"$":
+        length = int(body)
+        if length < 0:
+            return None
+        data = await reader.readexactly(length + 2)
+        return data[:-2]
+    if kind == b"*":
+        length = int(body)
+        if length < 0:
+            return None
+        return [await _read_reply(reader) for _ in range(length)]
+    raise RedisError(f"Unexpected reply: {line!r}")
+
+class RedisBackend(RoomBackend):
+    """
+    Room state in Redis keys/hashes and messages over Redis pub/sub.
+
+    Uses two connections: one for commands (one request in flight at a time) and
+    one in subscribe mode whose replies are read by a background task. A command
+    that finds its connection dropped reopens it and is retried once. If the
+    subscriber connection drops, the task reconnects with backoff and subscribes
+    to the current channels again; messages published meanwhile are missed.
+    """
+
+    RECONNECT_DELAY = 0.5  # Seconds before the first reconnect attempt, doubled per failure
+    MAX_RECONNECT_DELAY = 10.0
+
+    def __init__(self, host: str = "localhost", port: int = 6379, db: int = 0):
+        self.host = host
+        self.port = port
+        self.db = db
+        self._commands: Optional[Tuple[asyncio.StreamReader, asyncio.StreamWriter]] = None
+        self._command_lock: Optional[asyncio.Lock] = None
+        self._subscriber: Optional[Tuple[asyncio.StreamReader, asyncio.StreamWriter]] = None
+        self._listener: Optional[asyncio.Task] = None
+        self._on_message: Optional[MessageHandler] = None
+        self._channels = set()  # Subscribed channels, to restore after a reconnect
+
+    @classmethod
+    def from_url(cls, url: str) -> "RedisBackend":
+        parsed = urlparse(url)
+        db = int(parsed.path.lstrip("/") or 0)
+        return cls(parsed.hostname or "localhost", parsed.port or 6379, db)
+
+    async def start(self, on_message: MessageHandler):
+        self._on_message = on_message
+        self._command_lock = asyncio.Lock()
+        self._commands = await self._open_commands()
+        # Pub/sub channels are not per-database, so the subscriber needs no SELECT
+        self._subscriber = await asyncio.open_connection(self.host, self.port)
+        self._listener = asyncio.create_task(self._listen())
+        self._listener.add_done_callback(self._listener_done)
+
+    async def close(self):
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+        for connection in (self._commands, self._subscriber):
+            if connection is not None:
+                connection[1].close()
+        self._commands = self._subscriber = self._listener = None
+
+    async def _open_commands(self) -> Tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        reader, writer = await asyncio.open_connection(self.host, self.port)
+        if self.db:
+            try:
+                writer.write(_encode_command("SELECT", self.db))
+                await writer.drain()
+                await _read_reply(reader)
+            except BaseException:
+                writer.close()
+                raise
+        return reader, writer
+
+    def _drop_commands(self):
+        if self._commands is not None:
+            self._commands[1].close()
+            self._commands = None
+
+    async def execute(self, *args):
+        """Send one command and return its reply, reopening a dropped connection and retrying once"""
+        async with self._command_lock:
+            for attempt in range(2):
+                try:
+                    if self._commands is None:
+                        self._commands = await self._open_commands()
+                    reader, writer = self._commands
+                    writer.write(_encode_command(*args))
+                    await writer.drain()
+                    return await _read_reply(reader)
+                except (OSError, asyncio.IncompleteReadError) as e:
+                    self._drop_commands()
+                    if attempt:
+                        raise
+                    logger.warning(f"Redis command connection lost: {e!r}; reconnecting")
+                except asyncio.CancelledError:
+                    # The reply may still arrive; the next command must not take it for its own
+                    self._drop_commands()
+                    raise
+
+    async def _listen(self):
+        """Read the subscriber connection and hand messages to the handler, reconnecting if it drops"""
+        while True:
+            try:
+                await self._read_messages(self._subscriber[0])
+            except (ConnectionError, OSError, asyncio.IncompleteReadError) as e:
+                logger.warning(f"Redis subscriber connection lost: {e}; reconnecting")
+            self._subscriber[1].close()
+            await self._reconnect_subscriber()
+
+    async def _read_messages(self, reader: asyncio.StreamReader):
+        while True:
+            reply = await _read_reply(reader)
+            if not isinstance(reply, list) or len(reply) != 3 or reply[0] != b"message":
+                continue  # subscribe/unsubscribe acknowledgements
+            try:
+                channel = reply[1].decode()[len(KEY_PREFIX):]
+                await self._on_message(channel, json.loads(reply[2]))
+            except Exception as e:
+                logger.error(f"Error handling pub/sub message: {e}")
+
+    async def _reconnect_subscriber(self):
+        """Open a new subscriber connection and subscribe to the current channels again"""
+        delay = self.RECONNECT_DELAY
+        while True:
+            await asyncio.sleep(delay)
+            try:
+                reader, writer = await asyncio.open_connection(self.host, self.port)
+                for channel in self._channels:
+                    writer.write(_encode_command("SUBSCRIBE", KEY_PREFIX + channel))
+                await writer.drain()
+            except OSError as e:
+                delay = min(delay * 2, self.MAX_RECONNECT_DELAY)
+                logger.warning(f"Redis subscriber reconnect failed: {e}; retrying in {delay:.1f}s")
+                continue
+            self._subscriber = (reader, writer)
+            logger.info(f"Redis subscriber reconnected ({len(self._channels)} channels)")
+            return
+
+    @staticmethod
+    def _listener_done(task: asyncio.Task):
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"Redis subscriber stopped; cross-worker messages will not arrive: {task.exception()!r}")
+
+    async def get_room(self, room_id: str) -> Optional[dict]:
+        data = await self.execute("GET", f"{KEY_PREFIX}room:{room_id}")
+        return json.loads(data) if data is not None else None
+
+    async def put_room(self, room: dict):
+        await self.execute("SET", f"{KEY_PREFIX}room:{room['id']}", json.dumps(room))
+
+    async def claim_room(self, room_id: str, worker_id: str, ttl: float) -> str:
+        key = f"{KEY_PREFIX}owner:{room_id}"
+        ttl_ms = int(ttl * 1000)
+        for _ in range(3):  # The owner may expire between SET NX and GET
+            if await self.execute("SET", key, worker_id, "NX", "PX", ttl_ms) == "OK":
+                return worker_id
+            owner = await self.execute("GET", key)
+            if owner is not None:
+                owner = owner.decode()
+                if owner == worker_id:
+                    await self.execute("PEXPIRE", key, ttl_ms)
+                return owner
+        raise RedisError(f"Could not determine the owner of room {room_id}")
+
+    async def renew_room(self, room_id: str, worker_id: str, ttl: float) -> bool:
+        # Not atomic (a server-side script would be), but a lease is only lost if we
+        # missed renewing it for a whole ttl, and then the new owner has restored it anyway
+        key = f"{KEY_PREFIX}owner:{room_id}"
+        owner = await self.execute("GET", key)
+        if owner is not None and owner.decode() != worker_id:
+            return False
+        return await self.claim_room(room_id, worker_id, ttl) == worker_id
+
+    async def mark_alive(self, worker_id: str, ttl: float):
+        await self.execute("SET", f"{KEY_PREFIX}alive:{worker_id}", "1", "PX", int(ttl * 1000))
+
+    async def is_alive(self, worker_id: str) -> bool:
+        return await self.execute("GET", f"{KEY_PREFIX}alive:{worker_id}") is not None
+
+    async def set_device(self, room_id: str, device: dict):
+        await self.execute("HSET", f"{KEY_PREFIX}devices:{room_id}", device["id"], json.dumps(device))
+
+    async def remove_device(self, room_id: str, device_id: str):
+        await self.execute("HDEL", f"{KEY_PREFIX}devices:{room_id}", device_id)
+
+    async def get_devices(self, room_id: str) -> List[dict]:
+        reply = await self.execute("HGETALL", f"{KEY_PREFIX}devices:{room_id}") or []
+        return [json.loads(value) for value in reply[1::2]]
+
+    async def publish(self, channel: str, message: dict):
+        await self.execute("PUBLISH", KEY_PREFIX + channel, json.dumps(message))
+
+    async def subscribe(self, channel: str):
+        self._channels.add(channel)
+        await self._send_subscriber("SUBSCRIBE", channel)
+
+    async def unsubscribe(self, channel: str):
+        self._channels.discard(channel)
+        await self._send_subscriber("UNSUBSCRIBE", channel)
+
+    async def _send_subscriber(self, command: str, channel: str):
+        writer = self._subscriber[1]
+        try:
+            writer.write(_encode_command(command, KEY_PREFIX + channel))
+            await writer.drain()
+        except (ConnectionError, OSError) as e:
+            # The listener is reconnecting and applies the current channel set when it does
+            logger.warning(f"Redis {command} {channel} deferred until reconnect: {e}")
+
+def create_backend(url: str) -> RoomBackend:
+    """Backend for a URL: memory:// (single process) or redis://host:port/db"""
+    scheme = urlparse(url).scheme
+    if scheme == "memory":
+        return InProcessBackend()
+    if scheme == "redis":
+        return RedisBackend.from_url(url)
+    raise ValueError(f"Unsupported room backend: {url}")
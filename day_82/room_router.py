@@ -0,0 +1,354 @@
+"""
+Routes room operations when SyncStage runs as several worker processes.
+
+Each room is owned by one worker, which holds an expiring lease on it in the
+backend and runs the room's timers in its TimerEngine. Timer operations made on
+any other worker are forwarded to the owner over pub/sub, and every broadcast is
+published on the room's channel so whichever workers hold that room's viewers
+deliver it. If an owner dies, the next worker to touch the room, or that holds
+viewers of it, takes over the lease and restores its timers from the state saved
+with the room. Devices a dead worker left in the backend are removed by the owner.
+
+With a WriteBehindStore, rooms, timer state and devices are also saved to the
+database, and rooms with running or paused timers are restored on startup.
+"""
+
+import asyncio
+import uuid
+from typing import Dict, List, Optional, Set
+import logging
+
+from persistence import WriteBehindStore
+from room_backend import RoomBackend
+from timer_engine import Timer, TimerEngine, TimerConfig, TimerType, TimerState
+from websocket_manager import ConnectionManager
+
+logger = logging.getLogger(__name__)
+
+class RoomUnavailableError(Exception):
+    """The worker owning a room did not answer a forwarded call"""
+
+class RoomRouter:
+    LEASE_SECONDS = 30
+    CALL_TIMEOUT = 5
+
+    def __init__(self, backend: RoomBackend, timer_engine: TimerEngine, connection_manager: ConnectionManager,
+                 worker_id: Optional[str] = None, store: Optional[WriteBehindStore] = None):
+        self.backend = backend
+        self.store = store
+        self.timer_engine = timer_engine
+        self.connection_manager = connection_manager
+        self.worker_id = worker_id or str(uuid.uuid4())
+        self.owned_rooms: Set[str] = set()
+        self._room_timers: Dict[str, Set[str]] = {}  # owned room -> ids of its timers in the engine
+        self._timer_info: Dict[str, dict] = {}  # timer id -> its entry in the room record
+        self._room_locks: Dict[str, asyncio.Lock] = {}  # owned room -> held while its record is rewritten
+        self._pending_calls: Dict[str, asyncio.Future] = {}
+        self._lease_task: Optional[asyncio.Task] = None
+        self._handlers: Set[asyncio.Task] = set()
+
+    async def start(self):
+        """Connect to the backend and start serving forwarded calls"""
+        await self.backend.start(self._on_message)
+        await self.backend.subscribe(self._worker_channel(self.worker_id))
+        self.connection_manager.hub = self
+        await self.backend.mark_alive(self.worker_id, self.LEASE_SECONDS)
+        self._lease_task = asyncio.create_task(self._renew_leases())
+        if self.store is not None:
+            await self.store.start()
+            await self._restore_rooms()
+
+    async def _restore_rooms(self):
+        """Bring back saved rooms; rooms with active timers are claimed so they keep running"""
+        restored = 0
+        for room in await self.store.load_rooms():
+            if await self.backend.get_room(room["id"]) is not None:
+                continue  # Another worker already restored it (or it never went away)
+            await self.backend.put_room(room)
+            restored += 1
+            if any((info.get("runtime") or {}).get("state") in ("running", "paused") for info in room["timers"]):
+                await self._owner(room["id"])
+        if restored:
+            logger.info(f"Restored {restored} rooms from the database")
+
+    async def stop(self):
+        if self._lease_task is not None:
+            self._lease_task.cancel()
+            try:
+                await self._lease_task
+            except asyncio.CancelledError:
+                pass
+        self.connection_manager.hub = None
+        if self.store is not None:
+            await self.store.close()
+        await self.backend.close()
+
+    @staticmethod
+    def _worker_channel(worker_id: str) -> str:
+        return f"worker:{worker_id}"
+
+    @staticmethod
+    def _room_channel(room_id: str) -> str:
+        return f"room:{room_id}"
+
+    # --- Rooms ---
+
+    async def create_room(self, room: dict):
+        await self.backend.put_room(room)
+        if self.store is not None:
+            self.store.save_room(room)
+        await self._owner(room["id"])
+
+    async def get_room(self, room_id: str) -> Optional[dict]:
+        return await self.backend.get_room(room_id)
+
+    async def get_devices(self, room_id: str) -> List[dict]:
+        devices = await self.backend.get_devices(room_id)
+        return [{key: value for key, value in device.items() if key != "worker_id"} for device in devices]
+
+    # --- Timer operations (run on the room's owner) ---
+
+    async def add_timer(self, room_id: str, timer_data: dict) -> dict:
+        """Create a timer in a room; returns the stored timer info"""
+        return await self._dispatch(room_id, "add_timer", {"timer_data": timer_data})
+
+    async def control_timer(self, room_id: str, timer_id: str, action: str, data: dict) -> dict:
+        """Apply a control action; returns the timer's new state (raises KeyError for an unknown timer)"""
+        return await self._dispatch(room_id, "control_timer", {"timer_id": timer_id, "action": action, "data": data})
+
+    async def room_timers(self, room_id: str) -> List[dict]:
+        """Current state of all timers in a room"""
+        return await self._dispatch(room_id, "room_timers", {})
+
+    def _room_lock(self, room_id: str) -> asyncio.Lock:
+        """Serializes read-modify-write of a room record; only its owner writes it"""
+        if room_id not in self._room_locks:
+            self._room_locks[room_id] = asyncio.Lock()
+        return self._room_locks[room_id]
+
+    async def _local_add_timer(self, room_id: str, timer_data: dict) -> dict:
+        async with self._room_lock(room_id):
+            room = await self.backend.get_room(room_id)
+            timer_info = dict(timer_data, id=str(uuid.uuid4()), position=len(room["timers"]))
+            timer = self._start_timer(room_id, timer_info)
+            room["timers"].append(timer_info)
+            await self.backend.put_room(room)
+        self._save_timer(room_id, timer)
+        return timer_info
+
+    async def _local_control_timer(self, room_id: str, timer_id: str, action: str, data: dict) -> dict:
+        timer = self.timer_engine.get_timer(timer_id)
+        if not timer:
+            raise KeyError(timer_id)
+
+        if action == "start":
+            timer.start()
+        elif action == "stop":
+            timer.stop()
+        elif action == "pause":
+            timer.pause()
+        elif action == "reset":
+            timer.reset()
+        elif action == "add_time":
+            timer.add_time(data.get("seconds", 0))
+
+        # Save the runtime state with the room so another worker can take the timer over
+        async with self._room_lock(room_id):
+            room = await self.backend.get_room(room_id)
+            for timer_info in room["timers"]:
+                if timer_info["id"] == timer_id:
+                    timer_info["runtime"] = timer.get_state()
+            await self.backend.put_room(room)
+        self._save_timer(room_id, timer)
+        return timer.to_dict()
+
+    async def _local_room_timers(self, room_id: str) -> List[dict]:
+        room = await self.backend.get_room(room_id)
+        timers = [self.timer_engine.get_timer(info["id"]) for info in room["timers"]]
+        return [timer.to_dict() for timer in timers if timer]
+
+    def _start_timer(self, room_id: str, timer_info: dict) -> Timer:
+        """Put a room's timer into the local engine, resuming saved runtime state"""
+        config = TimerConfig(
+            id=timer_info["id"],
+            title=timer_info["title"],
+            duration=timer_info["duration"],
+            timer_type=TimerType(timer_info["timer_type"]),
+            wrap_up_yellow=timer_info["wrap_up_yellow"],
+            wrap_up_red=timer_info["wrap_up_red"]
+        )
+        timer = self.timer_engine.add_timer(config)
+        self._room_timers.setdefault(room_id, set()).add(timer.id)
+        self._timer_info[timer.id] = timer_info
+        self.timer_engine.add_callback(timer.id, self._timer_broadcaster(room_id))
+        if timer_info.get("runtime"):
+            timer.restore_state(timer_info["runtime"])
+        return timer
+
+    def _save_timer(self, room_id: str, timer: Timer):
+        """Queue the timer's current state for the next database flush"""
+        if self.store is not None:
+            self.store.save_timer(room_id, self._timer_info[timer.id], timer.get_state())
+
+    def _timer_broadcaster(self, room_id: str):
+        """Engine callback that pushes a timer's new display state to its room"""
+        async def broadcast(timer):
+            self._save_timer(room_id, timer)  # Coalesced: one row write per flush, not per tick
+            # While running, updates only show time passing; finishing is a real transition
+            await self.connection_manager.broadcast_timer_update(room_id, timer.to_dict(),
+                                                                 tick=timer.state == TimerState.RUNNING)
+        return broadcast
+
+    # --- Ownership ---
+
+    async def _owner(self, room_id: str) -> str:
+        """The room's owner, taking the room over if nobody holds it"""
+        owner = await self.backend.claim_room(room_id, self.worker_id, self.LEASE_SECONDS)
+        if owner == self.worker_id and room_id not in self.owned_rooms:
+            room = await self.backend.get_room(room_id)
+            if room_id in self.owned_rooms:
+                return owner  # A concurrent call loaded it while we were reading
+            self.owned_rooms.add(room_id)
+            for timer_info in room["timers"] if room else []:
+                self._start_timer(room_id, timer_info)
+            if room and room["timers"]:
+                logger.info(f"Took over room {room_id} with {len(room['timers'])} timers")
+        return owner
+
+    def _release(self, room_id: str):
+        """Drop a room we lost the lease on; its new owner runs the timers now"""
+        self.owned_rooms.discard(room_id)
+        self._room_locks.pop(room_id, None)
+        for timer_id in self._room_timers.pop(room_id, set()):
+            self.timer_engine.remove_timer(timer_id)
+            self._timer_info.pop(timer_id, None)
+
+    async def _renew_leases(self):
+        while True:
+            await asyncio.sleep(self.LEASE_SECONDS / 3)
+            try:
+                await self.backend.mark_alive(self.worker_id, self.LEASE_SECONDS)
+            except Exception as e:
+                logger.error(f"Error marking worker {self.worker_id} alive: {e}")
+            for room_id in list(self.owned_rooms):
+                try:
+                    if not await self.backend.renew_room(room_id, self.worker_id, self.LEASE_SECONDS):
+                        logger.warning(f"Lost ownership of room {room_id}")
+                        self._release(room_id)
+                except Exception as e:
+                    logger.error(f"Error renewing lease on room {room_id}: {e}")
+            # Our viewers only get ticks while some worker runs the room's timers
+            for room_id in list(self.connection_manager.active_connections):
+                try:
+                    if room_id not in self.owned_rooms:
+                        await self._owner(room_id)
+                except Exception as e:
+                    logger.error(f"Error checking the owner of room {room_id}: {e}")
+            for room_id in list(self.owned_rooms):
+                try:
+                    await self._remove_dead_devices(room_id)
+                except Exception as e:
+                    logger.error(f"Error removing stale devices from room {room_id}: {e}")
+
+    async def _remove_dead_devices(self, room_id: str):
+        """Remove devices left in the backend by workers that stopped without disconnecting them"""
+        alive = {self.worker_id: True}
+        for device in await self.backend.get_devices(room_id):
+            worker_id = device.get("worker_id")
+            if worker_id is None:
+                continue
+            if worker_id not in alive:
+                alive[worker_id] = await self.backend.is_alive(worker_id)
+            if not alive[worker_id]:
+                await self.device_left(room_id, device["id"])
+
+    # --- Forwarded calls ---
+
+    async def _dispatch(self, room_id: str, method: str, args: dict):
+        # Rooms we own stay ours while the lease task renews them
+        owner = self.worker_id if room_id in self.owned_rooms else await self._owner(room_id)
+        if owner == self.worker_id:
+            return await getattr(self, f"_local_{method}")(room_id, **args)
+
+        call_id = str(uuid.uuid4())
+        future = asyncio.get_running_loop().create_future()
+        self._pending_calls[call_id] = future
+        try:
+            await self.backend.publish(self._worker_channel(owner), {
+                "kind": "call",
+                "id": call_id,
+                "reply_to": self.worker_id,
+                "room_id": room_id,
+                "method": method,
+                "args": args
+            })
+            reply = await asyncio.wait_for(future, self.CALL_TIMEOUT)
+        except asyncio.TimeoutError:
+            raise RoomUnavailableError(f"Worker {owner} did not answer for room {room_id}")
+        finally:
+            self._pending_calls.pop(call_id, None)
+
+        if reply.get("error") == "not_found":
+            raise KeyError(args.get("timer_id"))
+        if reply.get("error"):
+            raise RoomUnavailableError(reply["error"])
+        return reply["result"]
+
+    async def _serve_call(self, message: dict):
+        """Run a call forwarded by another worker and publish the reply"""
+        reply = {"kind": "reply", "id": message["id"]}
+        try:
+            if message["room_id"] not in self.owned_rooms:
+                raise RoomUnavailableError("not the owner")
+            method = getattr(self, f"_local_{message['method']}")
+            reply["result"] = await method(message["room_id"], **message["args"])
+        except KeyError:
+            reply["error"] = "not_found"
+        except Exception as e:
+            reply["error"] = str(e)
+        await self.backend.publish(self._worker_channel(message["reply_to"]), reply)
+
+    async def _on_message(self, channel: str, message: dict):
+        if channel.startswith("room:"):
+            await self.connection_manager.deliver_to_room(
+                channel[len("room:"):], message["text"], message.get("exclude"),
+                tuple(message["coalesce_key"]) if message.get("coalesce_key") else None,
+                message.get("push_only", False)
+            )
+        elif message.get("kind") == "call":
+            # Served in its own task so a slow call does not hold up the subscription
+            task = asyncio.create_task(self._serve_call(message))
+            self._handlers.add(task)
+            task.add_done_callback(self._handlers.discard)
+        elif message.get("kind") == "reply":
+            future = self._pending_calls.get(message["id"])
+            if future is not None and not future.done():
+                future.set_result(message)
+
+    # --- ConnectionManager hub ---
+
+    async def relay(self, room_id: str, frame: dict):
+        """Publish an encoded broadcast to every worker with viewers in the room"""
+        await self.backend.publish(self._room_channel(room_id), frame)
+
+    async def room_opened(self, room_id: str):
+        await self.backend.subscribe(self._room_channel(room_id))
+
+    async def room_closed(self, room_id: str):
+        await self.backend.unsubscribe(self._room_channel(room_id))
+
+    async def device_changed(self, room_id: str, device: dict):
+        # Tagged with this worker so the owner can drop it if the worker dies
+        await self.backend.set_device(room_id, dict(device, worker_id=self.worker_id))
+        if self.store is not None:
+            self.store.save_device(room_id, device)
+
+    async def device_left(self, room_id: str, device_id: str):
+        await self.backend.remove_device(room_id, device_id)
+        if self.store is not None:
+            self.store.remove_device(device_id)
+
+    def device_seen(self, room_id: str, device_id: str):
+        """Called for every message a device sends; only the database copy is updated (batched)"""
+        if self.store is not None:
+            self.store.touch_device(device_id)
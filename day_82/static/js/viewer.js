@@ -9,6 +9,14 @@ class Viewer {
         this.isFullscreen = false;
         this.isBlackout = false;
         
+        // Clock sync: the server only sends timer state changes; we estimate the
+        // server clock (NTP-style probes) and render running timers ourselves
+        this.clockOffset = 0; // server clock - local clock, in ms
+        this.syncSamples = [];
+        this.syncTimeouts = [];
+        this.syncInterval = null;
+        this.renderInterval = null;
+        
         this.init();
     }
     
@@ -47,13 +55,14 @@ class Viewer {
     
     connectWebSocket() {
         const protocol = window.location.protocol === 'https:' ? 'wss:' : 'ws:';
-        const wsUrl = `${protocol}//${window.location.host}/ws/${this.roomId}?device_type=viewer`;
+        const wsUrl = `${protocol}//${window.location.host}/ws/${this.roomId}?device_type=viewer&sync=clock`;
         
         this.websocket = new WebSocket(wsUrl);
         
         this.websocket.onopen = () => {
             this.isConnected = true;
             this.updateConnectionStatus('connected');
+            this.startClockSync();
         };
         
         this.websocket.onmessage = (event) => {
@@ -63,6 +72,7 @@ class Viewer {
         
         this.websocket.onclose = () => {
             this.isConnected = false;
+            this.stopClockSync();
             this.updateConnectionStatus('disconnected');
             // Reconnect after 5 seconds
             setTimeout(() => this.connectWebSocket(), 5000);
@@ -88,6 +98,93 @@ class Viewer {
             case 'display_message':
                 this.handleDisplayMessage(message.message);
                 break;
+            case 'time_sync':
+                this.handleTimeSync(message);
+                break;
+        }
+    }
+    
+    startClockSync() {
+        // A quick burst for a first estimate, then a probe every 30 seconds
+        this.syncSamples = [];
+        for (let i = 0; i < 5; i++) {
+            this.syncTimeouts.push(setTimeout(() => this.sendTimeSync(), i * 250));
+        }
+        this.syncInterval = setInterval(() => this.sendTimeSync(), 30000);
+    }
+    
+    stopClockSync() {
+        this.syncTimeouts.forEach(clearTimeout);
+        this.syncTimeouts = [];
+        clearInterval(this.syncInterval);
+        this.syncInterval = null;
+    }
+    
+    sendTimeSync() {
+        if (this.websocket && this.websocket.readyState === WebSocket.OPEN) {
+            this.websocket.send(JSON.stringify({ type: 'time_sync', t0: Date.now() }));
+        }
+    }
+    
+    handleTimeSync(message) {
+        const t3 = Date.now();
+        const { t0, t1, t2 } = message;
+        const roundTrip = (t3 - t0) - (t2 - t1);
+        const offset = ((t1 - t0) + (t2 - t3)) / 2;
+        
+        // Keep the last few samples and trust the one with the shortest round trip
+        this.syncSamples.push({ roundTrip, offset });
+        if (this.syncSamples.length > 8) {
+            this.syncSamples.shift();
+        }
+        const best = this.syncSamples.reduce((a, b) => (b.roundTrip < a.roundTrip ? b : a));
+        this.clockOffset = best.offset;
+        this.updateTimerDisplay();
+    }
+    
+    serverNow() {
+        return (Date.now() + this.clockOffset) / 1000;
+    }
+    
+    localTimerState(timer) {
+        // Project the server snapshot to the current (estimated) server time
+        if (timer.timer_type === 'clock') {
+            const now = new Date(this.serverNow() * 1000);
+            return { current_time: 0, display_time: now.toTimeString().slice(0, 8), warning_level: 'normal' };
+        }
+        
+        let current = timer.current_time;
+        if (timer.sync) {
+            current = timer.sync.value + timer.sync.rate * (this.serverNow() - timer.sync.server_time);
+            current = Math.max(0, current);
+        }
+        
+        let warning = 'normal';
+        if (timer.timer_type === 'countdown') {
+            if (current <= timer.wrap_up_red) warning = 'red';
+            else if (current <= timer.wrap_up_yellow) warning = 'yellow';
+        }
+        return { current_time: current, display_time: this.formatTime(current), warning_level: warning };
+    }
+    
+    formatTime(value) {
+        const total = Math.floor(value);
+        const hours = Math.floor(total / 3600);
+        const minutes = Math.floor((total % 3600) / 60);
+        const seconds = total % 60;
+        const pad = (n) => String(n).padStart(2, '0');
+        return hours > 0 ? `${pad(hours)}:${pad(minutes)}:${pad(seconds)}` : `${pad(minutes)}:${pad(seconds)}`;
+    }
+    
+    updateRenderLoop() {
+        // Only redraw on a timer while something is moving
+        const moving = this.currentTimer && this.currentTimer.sync &&
+            (this.currentTimer.sync.rate !== 0 || this.currentTimer.timer_type === 'clock');
+        if (moving && !this.renderInterval) {
+            this.renderInterval = setInterval(() => this.updateTimerDisplay(), 100);
+        } else if (!moving && this.renderInterval) {
+            clearInterval(this.renderInterval);
+            this.renderInterval = null;
         }
     }
     
@@ -98,6 +195,7 @@ class Viewer {
     handleTimerUpdate(timerData) {
         this.currentTimer = timerData;
         this.updateTimerDisplay();
+        this.updateRenderLoop();
     }
     
     handleTimerControl(message) {
@@ -142,6 +240,7 @@ class Viewer {
         const fullscreenTime = document.getElementById('fullscreenTime');
         
         if (!this.currentTimer) {
+            this.lastFrame = null;
             titleElement.textContent = 'No Active Timer';
             timeElement.textContent = '--:--';
             progressElement.style.width = '0%';
@@ -150,7 +249,14 @@ class Viewer {
             return;
         }
         
-        const timer = this.currentTimer;
+        const timer = { ...this.currentTimer, ...this.localTimerState(this.currentTimer) };
+        
+        // Skip DOM work when nothing visible changed since the last frame
+        const frame = `${timer.id}|${timer.title}|${timer.display_time}|${timer.warning_level}|${this.getProgressWidth(timer).toFixed(1)}`;
+        if (frame === this.lastFrame) {
+            return;
+        }
+        this.lastFrame = frame;
         
         // Update title
         titleElement.textContent = timer.title;
@@ -107,6 +107,319 @@ def test_websocket_manager():
         print(f"❌ WebSocket manager test failed: {e}")
         return False
 
+def test_broadcast_fanout():
+    """Test that a stalled viewer is coalesced, then evicted, without delaying the others"""
+    print("\nTesting broadcast fan-out...")
+    
+    try:
+        from websocket_manager import ConnectionManager
+        
+        class FakeWebSocket:
+            def __init__(self, stalled=False):
+                self.sent = []
+                self.stalled = stalled
+                self.closed_with = None
+            
+            async def accept(self):
+                pass
+            
+            async def send_text(self, text):
+                if self.stalled:
+                    await asyncio.Event().wait()  # Never completes, like a full TCP buffer
+                self.sent.append(text)
+            
+            async def close(self, code=1000):
+                self.closed_with = code
+        
+        async def scenario():
+            manager = ConnectionManager(max_queue=4)
+            fast, slow = FakeWebSocket(), FakeWebSocket(stalled=True)
+            await manager.connect(fast, "room", "viewer", "Fast")
+            await manager.connect(slow, "room", "viewer", "Slow")
+            
+            for second in range(10):
+                await manager.broadcast_timer_update("room", {"id": "t1", "current_time": second})
+                await asyncio.sleep(0)
+            assert slow in manager.connection_info  # Timer frames coalesce, so it is not behind yet
+            
+            for i in range(10):
+                await manager.broadcast_message("room", {"content": f"message {i}"})
+                await asyncio.sleep(0)
+            
+            assert slow not in manager.connection_info
+            assert manager.evicted_count == 1
+            assert slow.closed_with == 1013
+            assert fast.sent[-1].count("message 9") == 1
+            await manager.disconnect(fast)
+        
+        asyncio.run(scenario())
+        
+        print("✅ Broadcast fan-out works")
+        return True
+        
+    except Exception as e:
+        print(f"❌ Broadcast fan-out test failed: {e}")
+        return False
+
+def test_clock_sync_mode():
+    """Test that clock-sync clients get transitions and time_sync replies but no ticks"""
+    print("\nTesting clock-sync mode...")
+    
+    try:
+        import json
+        from timer_engine import TimerEngine, TimerConfig, TimerType, TimerState
+        from websocket_manager import ConnectionManager, WebSocketHandler
+        
+        class FakeWebSocket:
+            def __init__(self):
+                self.sent = []
+            
+            async def accept(self):
+                pass
+            
+            async def send_text(self, text):
+                self.sent.append(json.loads(text))
+        
+        async def scenario():
+            engine = TimerEngine()
+            manager = ConnectionManager()
+            handler = WebSocketHandler(manager, engine)
+            push, clock = FakeWebSocket(), FakeWebSocket()
+            await manager.connect(push, "room", "viewer", "Push")
+            await manager.connect(clock, "room", "viewer", "Clock", sync="clock")
+            
+            timer = engine.add_timer(TimerConfig(id="t1", title="Short", duration=2, timer_type=TimerType.COUNTDOWN))
+            
+            async def broadcast(timer):
+                await manager.broadcast_timer_update("room", timer.to_dict(), tick=timer.state == TimerState.RUNNING)
+            engine.add_callback("t1", broadcast)
+            
+            await engine.start_engine()
+            timer.start()
+            await manager.broadcast_timer_update("room", timer.to_dict())
+            await handler.handle_message(clock, {"type": "time_sync", "t0": 123})
+            await asyncio.sleep(2.2)
+            await engine.stop_engine()
+            
+            push_updates = [m for m in push.sent if m["type"] == "timer_update"]
+            clock_updates = [m for m in clock.sent if m["type"] == "timer_update"]
+            assert len(push_updates) >= 3  # start, every displayed second, finish
+            assert [m["timer"]["state"] for m in clock_updates] == ["running", "finished"]
+            assert clock_updates[0]["timer"]["sync"]["rate"] == -1
+            
+            reply = next(m for m in clock.sent if m["type"] == "time_sync")
+            assert reply["t0"] == 123 and reply["t1"] <= reply["t2"]
+        
+        asyncio.run(scenario())
+        
+        print("✅ Clock-sync mode works")
+        return True
+        
+    except Exception as e:
+        print(f"❌ Clock-sync mode test failed: {e}")
+        return False
+
+def test_room_router_across_workers():
+    """Test two workers sharing a room through the local Redis stand-in"""
+    print("\nTesting room routing across workers...")
+    
+    try:
+        import json
+        from local_redis import LocalRedis
+        from room_backend import RedisBackend
+        from room_router import RoomRouter
+        from timer_engine import TimerEngine
+        from websocket_manager import ConnectionManager
+        
+        class FakeWebSocket:
+            def __init__(self):
+                self.sent = []
+            
+            async def accept(self):
+                pass
+            
+            async def send_text(self, text):
+                self.sent.append(json.loads(text))
+        
+        async def start_worker(port, worker_id):
+            engine, manager = TimerEngine(), ConnectionManager()
+            router = RoomRouter(RedisBackend("127.0.0.1", port), engine, manager, worker_id=worker_id)
+            router.LEASE_SECONDS = 1
+            await engine.start_engine()
+            await router.start()
+            return engine, manager, router
+        
+        async def scenario():
+            server = await asyncio.start_server(LocalRedis().handle, "127.0.0.1", 0)
+            port = server.sockets[0].getsockname()[1]
+            engine_a, manager_a, router_a = await start_worker(port, "worker-a")
+            engine_b, manager_b, router_b = await start_worker(port, "worker-b")
+            
+            # Room created on A; viewer and controller calls arrive on B
+            await router_a.create_room({"id": "room", "title": "Shared", "timers": []})
+            viewer = FakeWebSocket()
+            await manager_a.connect(FakeWebSocket(), "room", "viewer", "Viewer on A")
+            await manager_b.connect(viewer, "room", "viewer", "Viewer")
+            timer_info = await router_b.add_timer("room", {
+                "title": "Talk", "duration": 100, "timer_type": "countdown", "wrap_up_yellow": 60, "wrap_up_red": 30
+            })
+            assert engine_a.get_timer(timer_info["id"]) and not engine_b.get_timer(timer_info["id"])
+            
+            # Concurrent adds through both workers all land in the room record
+            await asyncio.gather(*(router.add_timer("room", {
+                "title": f"Extra {n}", "duration": 60, "timer_type": "countdown", "wrap_up_yellow": 30, "wrap_up_red": 10
+            }) for n, router in enumerate([router_a, router_b] * 3)))
+            room = await router_b.get_room("room")
+            assert sorted(info["position"] for info in room["timers"]) == list(range(7))
+            
+            await router_b.control_timer("room", timer_info["id"], "start", {})
+            await asyncio.sleep(1.2)
+            assert any(m["type"] == "timer_update" for m in viewer.sent)  # Ticks from A's engine
+            
+            # A goes away: once its lease lapses, B takes the room over mid-countdown
+            # because it holds a viewer, and drops the device A left behind
+            await router_a.stop()
+            await engine_a.stop_engine()
+            for _ in range(40):
+                devices = await router_b.get_devices("room")
+                if "room" in router_b.owned_rooms and len(devices) == 1:
+                    break
+                await asyncio.sleep(0.05)
+            assert "room" in router_b.owned_rooms and [d["name"] for d in devices] == ["Viewer"]
+            timer = await router_b.control_timer("room", timer_info["id"], "pause", {})
+            assert timer["state"] == "paused" and 95 < timer["current_time"] < 99
+            
+            await router_b.stop()
+            await engine_b.stop_engine()
+            server.close()
+        
+        asyncio.run(scenario())
+        
+        print("✅ Room routing across workers works")
+        return True
+        
+    except Exception as e:
+        print(f"❌ Room routing test failed: {e}")
+        return False
+
+def test_redis_reconnect():
+    """Test that commands and pub/sub delivery resume after the Redis connections drop"""
+    print("\nTesting Redis reconnect...")
+    
+    try:
+        from local_redis import LocalRedis
+        from room_backend import RedisBackend
+        
+        async def scenario():
+            store = LocalRedis()
+            connections = []
+            
+            async def handle(reader, writer):
+                connections.append(writer)
+                await store.handle(reader, writer)
+            
+            server = await asyncio.start_server(handle, "127.0.0.1", 0)
+            backend = RedisBackend("127.0.0.1", server.sockets[0].getsockname()[1])
+            backend.RECONNECT_DELAY = 0.05
+            received = []
+            
+            async def on_message(channel, message):
+                received.append((channel, message["n"]))
+            
+            async def subscribed(count):
+                for _ in range(50):
+                    if sum(1 for subscribers in store.channels.values() if subscribers) == count:
+                        return
+                    await asyncio.sleep(0.02)
+                raise AssertionError(f"expected {count} subscribed channels")
+            
+            await backend.start(on_message)
+            await backend.subscribe("room:a")
+            await subscribed(1)
+            await backend.put_room({"id": "room", "timers": []})
+            
+            # Server side drops every connection, as a Redis restart would
+            for writer in connections:
+                writer.close()
+            connections.clear()
+            store.channels.clear()
+            await asyncio.sleep(0.01)
+            await backend.subscribe("room:b")  # While the listener is reconnecting
+            await subscribed(2)
+            await backend.publish("room:a", {"n": 1})
+            await backend.publish("room:b", {"n": 2})
+            await asyncio.sleep(0.1)
+            assert received == [("room:a", 1), ("room:b", 2)]
+            assert not backend._listener.done()
+            assert await backend.get_room("room") == {"id": "room", "timers": []}
+            
+            await backend.close()
+            server.close()
+        
+        asyncio.run(scenario())
+        
+        print("✅ Redis connections reconnect")
+        return True
+        
+    except Exception as e:
+        print(f"❌ Redis reconnect test failed: {e}")
+        return False
+
+def test_persistence_restore():
+    """Test that a running timer survives a restart through the write-behind store"""
+    print("\nTesting write-behind persistence...")
+    
+    try:
+        import tempfile
+        from datetime import datetime
+        from persistence import WriteBehindStore
+        from room_backend import InProcessBackend
+        from room_router import RoomRouter
+        from timer_engine import TimerEngine
+        from websocket_manager import ConnectionManager
+        
+        async def start_server(url):
+            engine = TimerEngine()
+            router = RoomRouter(InProcessBackend(), engine, ConnectionManager(), store=WriteBehindStore(url))
+            await engine.start_engine()
+            await router.start()
+            return engine, router
+        
+        async def scenario(url):
+            engine, router = await start_server(url)
+            await router.create_room({"id": "room", "title": "Saved", "password": None,
+                                      "created_at": datetime.now().isoformat(), "timers": []})
+            timer_info = await router.add_timer("room", {
+                "title": "Talk", "duration": 100, "timer_type": "countdown", "wrap_up_yellow": 60, "wrap_up_red": 30
+            })
+            await router.control_timer("room", timer_info["id"], "start", {})
+            await router.device_changed("room", {"id": "device", "name": "Viewer", "type": "viewer",
+                                                 "last_seen": datetime.now().isoformat()})
+            for _ in range(50):
+                router.device_seen("room", "device")  # Coalesced into one pending update
+            assert router.store.pending == 4 and router.store.flushes == 0
+            await router.stop()  # Final flush
+            await engine.stop_engine()
+            
+            await asyncio.sleep(1.1)
+            engine, router = await start_server(url)
+            room = await router.get_room("room")
+            assert room and room["title"] == "Saved" and "room" in router.owned_rooms
+            timer = engine.get_timer(timer_info["id"])
+            assert timer.state.value == "running" and 97 < timer.current_time < 99.5
+            await router.stop()
+            await engine.stop_engine()
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            asyncio.run(scenario(f"sqlite:///{os.path.join(tmp, 'syncstage.db')}"))
+        
+        print("✅ Write-behind persistence works")
+        return True
+        
+    except Exception as e:
+        print(f"❌ Persistence test failed: {e}")
+        return False
+
 def test_app_routes():
     """Test that the FastAPI app has the expected routes"""
     print("\nTesting FastAPI routes...")
@@ -162,6 +475,11 @@ def main():
         test_imports,
         test_timer_engine,
         test_websocket_manager,
+        test_broadcast_fanout,
+        test_clock_sync_mode,
+        test_room_router_across_workers,
+        test_redis_reconnect,
+        test_persistence_restore,
         test_app_routes
     ]
     
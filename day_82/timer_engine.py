@@ -1,11 +1,19 @@
 import asyncio
+import heapq
+import logging
+import math
 import time
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Callable
+from typing import Dict, List, Optional, Callable, Tuple
 from dataclasses import dataclass
 from enum import Enum
 import json
 
+logger = logging.getLogger(__name__)
+
+# Wake slightly after a deadline so int() of the new value has really rolled over
+DEADLINE_SLACK = 0.001
+
 class TimerType(Enum):
     COUNTDOWN = "countdown"
     COUNTUP = "countup"
@@ -32,17 +40,30 @@ class TimerConfig:
     settings: dict = None
 
 class TimerEngine:
+    """
+    Runs timers off a heap of deadlines: each running timer has one entry for the
+    next moment its display changes (second boundary, wrap-up threshold or finish),
+    and the engine sleeps until the earliest one instead of polling every timer.
+    """
+
     def __init__(self):
         self.timers: Dict[str, 'Timer'] = {}
         self.callbacks: Dict[str, List[Callable]] = {}
         self._running = False
         self._task = None
+        # (deadline, sequence, timer_id, timer version); entries whose version no
+        # longer matches the timer are stale and dropped when they reach the top
+        self._deadlines: List[Tuple[float, int, str, int]] = []
+        self._sequence = 0
+        self._wakeup: Optional[asyncio.Event] = None
     
     def add_timer(self, config: TimerConfig) -> 'Timer':
         """Add a new timer to the engine"""
         timer = Timer(config)
+        timer._on_change = self._schedule
         self.timers[config.id] = timer
         self.callbacks[config.id] = []
+        self._schedule(timer)
         return timer
     
     def remove_timer(self, timer_id: str):
@@ -50,6 +71,7 @@ class TimerEngine:
         if timer_id in self.timers:
             timer = self.timers[timer_id]
             timer.stop()
+            timer._on_change = None
             del self.timers[timer_id]
             if timer_id in self.callbacks:
                 del self.callbacks[timer_id]
@@ -79,6 +101,7 @@ class TimerEngine:
             return
         
         self._running = True
+        self._wakeup = asyncio.Event()
         self._task = asyncio.create_task(self._run_engine())
     
     async def stop_engine(self):
@@ -91,24 +114,59 @@ class TimerEngine:
             except asyncio.CancelledError:
                 pass
     
+    def _schedule(self, timer: 'Timer'):
+        """Queue the timer's next display change (called whenever its state changes)"""
+        deadline = timer.next_change_at(time.time())
+        if deadline is None:
+            return
+        self._sequence += 1
+        heapq.heappush(self._deadlines, (deadline, self._sequence, timer.id, timer._version))
+        if self._wakeup is not None and self._deadlines[0][0] == deadline:
+            self._wakeup.set()  # New earliest deadline: re-arm the sleep
+
+    def _pop_due(self, now: float) -> List['Timer']:
+        """Pop every deadline that has passed and return the (live) timers they belong to"""
+        due = []
+        while self._deadlines and self._deadlines[0][0] <= now:
+            _, _, timer_id, version = heapq.heappop(self._deadlines)
+            timer = self.timers.get(timer_id)
+            if timer is not None and timer._version == version:
+                due.append(timer)
+        return due
+
+    async def _notify(self, timer: 'Timer'):
+        """Run a timer's callbacks; a failing callback does not affect the others"""
+        for callback in list(self.callbacks.get(timer.id, ())):
+            try:
+                await callback(timer)
+            except Exception as e:
+                logger.error(f"Error in timer callback: {e}")
+
     async def _run_engine(self):
-        """Main engine loop"""
+        """Main engine loop: sleep until the earliest deadline, then update only the due timers"""
         while self._running:
-            current_time = time.time()
-            
-            for timer in self.timers.values():
-                if timer.state == TimerState.RUNNING:
-                    timer._update(current_time)
-                    
-                    # Notify callbacks
-                    if timer.id in self.callbacks:
-                        for callback in self.callbacks[timer.id]:
-                            try:
-                                await callback(timer)
-                            except Exception as e:
-                                print(f"Error in timer callback: {e}")
-            
-            await asyncio.sleep(0.1)  # 10 FPS update rate
+            now = time.time()
+            due = self._pop_due(now)
+            for timer in due:
+                timer._update(now)
+                self._schedule(timer)
+
+            if due:
+                # Awaited in turn: a task per callback would cost more than the callbacks
+                # themselves at thousands of timers, so callbacks should return quickly
+                for timer in due:
+                    if self.callbacks.get(timer.id):
+                        await self._notify(timer)
+                continue  # Deadlines may have passed while the callbacks ran
+
+            self._wakeup.clear()
+            timeout = self._deadlines[0][0] - time.time() if self._deadlines else None
+            if timeout is not None and timeout <= 0:
+                continue
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
 
 class Timer:
     def __init__(self, config: TimerConfig):
@@ -129,6 +187,16 @@ class Timer:
         self.start_time = None
         self.pause_time = None
         self.total_paused_time = 0
+
+        # Scheduling: bumped on every state change so the engine can drop outdated deadlines
+        self._version = 0
+        self._on_change: Optional[Callable[['Timer'], None]] = None
+
+    def _changed(self):
+        """Tell the engine (if any) that the timer's next display change has moved"""
+        self._version += 1
+        if self._on_change is not None:
+            self._on_change(self)
         
     def start(self):
         """Start the timer"""
@@ -140,12 +208,13 @@ class Timer:
             self.start_time = time.time()
             self.total_paused_time = 0
         elif self.state == TimerState.PAUSED:
-            # Resume from pause
+            # Resume from pause (the paused span no longer counts as elapsed)
             self.total_paused_time += time.time() - self.pause_time
-            self.start_time = time.time() - (self.current_time if self.timer_type == TimerType.COUNTDOWN else (self.duration - self.current_time))
         
         self.state = TimerState.RUNNING
         self.pause_time = None
+        self._update(time.time())
+        self._changed()
     
     def stop(self):
         """Stop the timer"""
@@ -153,12 +222,15 @@ class Timer:
         self.start_time = None
         self.pause_time = None
         self.total_paused_time = 0
+        self._changed()
     
     def pause(self):
         """Pause the timer"""
         if self.state == TimerState.RUNNING:
+            self._update(time.time())
             self.state = TimerState.PAUSED
             self.pause_time = time.time()
+            self._changed()
     
     def reset(self):
         """Reset the timer to initial state"""
@@ -174,6 +246,10 @@ class Timer:
             self.current_time = max(0, self.current_time + seconds)
         else:
             self.current_time = max(0, self.current_time - seconds)
+        if self.start_time is not None:
+            # Running or paused: shift the start so the next update keeps the adjustment
+            self.start_time += seconds
+        self._changed()
     
     def _update(self, current_time: float):
         """Update timer state (called by engine)"""
@@ -193,6 +269,52 @@ class Timer:
             now = datetime.now()
             self.current_time = now.hour * 3600 + now.minute * 60 + now.second
     
+    def get_state(self) -> dict:
+        """Runtime state (wall-clock based) for handing the timer to another process"""
+        return {
+            "state": self.state.value,
+            "current_time": self.current_time,
+            "start_time": self.start_time,
+            "pause_time": self.pause_time,
+            "total_paused_time": self.total_paused_time
+        }
+
+    def restore_state(self, state: dict):
+        """Resume from get_state() output; a running timer carries on from its original start"""
+        self.state = TimerState(state["state"])
+        self.current_time = state["current_time"]
+        self.start_time = state["start_time"]
+        self.pause_time = state["pause_time"]
+        self.total_paused_time = state["total_paused_time"]
+        self._update(time.time())
+        self._changed()
+
+    def next_change_at(self, now: float) -> Optional[float]:
+        """
+        Wall-clock time of the timer's next visible change (display second, warning
+        level or finish), or None if it will not change on its own.
+        """
+        if self.state != TimerState.RUNNING:
+            return None
+
+        if self.timer_type == TimerType.CLOCK:
+            return math.floor(now) + 1 + DEADLINE_SLACK
+
+        elapsed = now - self.start_time - self.total_paused_time
+        if self.timer_type == TimerType.COUNTUP:
+            return now + (math.floor(elapsed) + 1 - elapsed) + DEADLINE_SLACK
+        if self.timer_type != TimerType.COUNTDOWN:
+            return None  # Hidden timers have nothing to show
+
+        remaining = self.duration - elapsed
+        if remaining <= 0:
+            return None  # Already at zero (finished, or held there in overtime)
+        # The display is int(remaining), so it next changes as remaining drops below
+        # the integer at or under it; the wrap-up thresholds and zero are usually
+        # integral too, but may be configured as fractions
+        targets = [math.floor(remaining)] + [t for t in (self.wrap_up_yellow, self.wrap_up_red, 0) if t < remaining]
+        return now + (remaining - max(targets)) + DEADLINE_SLACK
+
     def get_display_time(self) -> str:
         """Get formatted time string for display"""
         if self.timer_type == TimerType.CLOCK:
@@ -221,6 +343,23 @@ class Timer:
         else:
             return "normal"
     
+    def sync_state(self, now: float) -> dict:
+        """
+        Clock-sync snapshot: the timer's value at server time `now` and how fast it
+        moves (-1 counting down, +1 counting up, 0 standing still), so a client with
+        a server clock estimate can render it without further updates.
+        """
+        rate = 0
+        value = self.current_time
+        if self.state == TimerState.RUNNING and self.timer_type in (TimerType.COUNTDOWN, TimerType.COUNTUP):
+            elapsed = now - self.start_time - self.total_paused_time
+            if self.timer_type == TimerType.COUNTDOWN:
+                value = max(0, self.duration - elapsed)
+                rate = -1 if value > 0 else 0
+            else:
+                value, rate = elapsed, 1
+        return {"server_time": now, "value": value, "rate": rate}
+
     def to_dict(self) -> dict:
         """Convert timer to dictionary for JSON serialization"""
         return {
@@ -234,5 +373,6 @@ class Timer:
             "state": self.state.value,
             "wrap_up_yellow": self.wrap_up_yellow,
             "wrap_up_red": self.wrap_up_red,
-            "settings": self.settings
+            "settings": self.settings,
+            "sync": self.sync_state(time.time())
         } 
\ No newline at end of file
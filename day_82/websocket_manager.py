@@ -1,28 +1,118 @@
 import asyncio
 import json
+import time
 import uuid
-from typing import Dict, Set, Optional, Any
+from collections import deque
+from typing import Callable, Deque, Dict, Hashable, Set, Optional, Any, Tuple
 from fastapi import WebSocket, WebSocketDisconnect
 from datetime import datetime
 import logging
 
 logger = logging.getLogger(__name__)
 
+class ClientConnection:
+    """
+    Outgoing side of one WebSocket: a bounded queue of encoded frames drained by
+    its own sender task, so a slow client only ever delays itself.
+
+    Frames enqueued with a coalesce key (e.g. the timer id of a timer_update) replace
+    a still-unsent frame with the same key instead of queueing behind it.
+    """
+
+    def __init__(self, websocket: WebSocket, max_queue: int, max_lag: float,
+                 on_failure: Callable[[WebSocket], None]):
+        self.websocket = websocket
+        self.max_queue = max_queue
+        self.max_lag = max_lag
+        self._on_failure = on_failure
+        # (key, enqueued at) in send order; the frame text lives in _frames so it can be replaced
+        self._queue: Deque[Tuple[Hashable, float]] = deque()
+        self._frames: Dict[Hashable, str] = {}
+        self._ready = asyncio.Event()
+        self._task = asyncio.create_task(self._sender())
+        self.coalesced = 0
+
+    def enqueue(self, text: str, coalesce_key: Optional[Hashable] = None) -> bool:
+        """Queue a frame; returns False if the client is too far behind to keep"""
+        now = time.monotonic()
+        if self._queue and now - self._queue[0][1] > self.max_lag:
+            return False
+        if coalesce_key is not None and coalesce_key in self._frames:
+            self._frames[coalesce_key] = text  # Newer state replaces the unsent one
+            self.coalesced += 1
+            return True
+        if len(self._queue) >= self.max_queue:
+            return False
+
+        key = coalesce_key if coalesce_key is not None else object()
+        self._queue.append((key, now))
+        self._frames[key] = text
+        self._ready.set()
+        return True
+
+    async def _sender(self):
+        """Send queued frames in order until cancelled or the socket fails"""
+        try:
+            while True:
+                if not self._queue:
+                    self._ready.clear()
+                    await self._ready.wait()
+                    continue
+                key, _ = self._queue.popleft()
+                await self.websocket.send_text(self._frames.pop(key))
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Error sending to websocket: {e}")
+            self._on_failure(self.websocket)
+
+    async def close(self):
+        """Stop the sender task (unsent frames are discarded)"""
+        if self._task is asyncio.current_task() or self._task.done():
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+
 class ConnectionManager:
-    def __init__(self):
+    def __init__(self, max_queue: int = 256, max_lag: float = 10.0):
         self.active_connections: Dict[str, Set[WebSocket]] = {}
         self.room_devices: Dict[str, Dict[str, dict]] = {}
         self.connection_info: Dict[WebSocket, dict] = {}
+        # Per-socket send queues: a client with max_queue unsent frames, or whose
+        # oldest unsent frame is max_lag seconds old, is disconnected
+        self.clients: Dict[WebSocket, ClientConnection] = {}
+        self.max_queue = max_queue
+        self.max_lag = max_lag
+        self.evicted_count = 0
+        self._closing: Set[asyncio.Task] = set()
+        # Sockets in "clock" sync mode render timers locally and skip per-second ticks
+        self.clock_sync_connections: Set[WebSocket] = set()
+        # Optional cross-process relay (see room_router.RoomRouter): broadcasts are
+        # published through it and come back via deliver_to_room on every worker
+        self.hub = None
     
-    async def connect(self, websocket: WebSocket, room_id: str, device_type: str = "viewer", device_name: str = None):
-        """Connect a new WebSocket to a room"""
+    async def connect(self, websocket: WebSocket, room_id: str, device_type: str = "viewer", device_name: str = None,
+                      sync: str = "push"):
+        """
+        Connect a new WebSocket to a room.
+
+        sync="push" clients get a timer_update every time a running timer's display
+        changes; sync="clock" clients only get state transitions (with server
+        timestamps) and keep their own estimate of the server clock via time_sync.
+        """
         await websocket.accept()
         
         if room_id not in self.active_connections:
             self.active_connections[room_id] = set()
             self.room_devices[room_id] = {}
+            if self.hub is not None:
+                await self.hub.room_opened(room_id)
         
         self.active_connections[room_id].add(websocket)
+        self.clients[websocket] = ClientConnection(websocket, self.max_queue, self.max_lag, self._connection_failed)
         
         # Generate device info
         device_id = str(uuid.uuid4())
@@ -38,15 +128,24 @@ class ConnectionManager:
         self.connection_info[websocket] = {
             "room_id": room_id,
             "device_id": device_id,
-            "device_type": device_type
+            "device_type": device_type,
+            "sync": sync
         }
+        if sync == "clock":
+            self.clock_sync_connections.add(websocket)
+        devices = list(self.room_devices[room_id].values())
+        if self.hub is not None:
+            await self.hub.device_changed(room_id, device_info)
+            devices = await self.hub.get_devices(room_id)  # Includes devices on other workers
         
         # Send welcome message
-        await websocket.send_text(json.dumps({
+        self.clients[websocket].enqueue(json.dumps({
             "type": "welcome",
             "device_id": device_id,
             "room_id": room_id,
-            "devices": list(self.room_devices[room_id].values())
+            "devices": devices,
+            "sync": sync,
+            "server_time": time.time()
         }))
         
         # Notify other devices
@@ -63,9 +162,14 @@ class ConnectionManager:
         if websocket not in self.connection_info:
             return
         
-        info = self.connection_info[websocket]
+        # Claim the connection first so a concurrent disconnect of the same socket is a no-op
+        info = self.connection_info.pop(websocket)
         room_id = info["room_id"]
         device_id = info["device_id"]
+        self.clock_sync_connections.discard(websocket)
+        client = self.clients.pop(websocket, None)
+        if client is not None:
+            await client.close()
         
         # Remove from active connections
         if room_id in self.active_connections:
@@ -75,6 +179,8 @@ class ConnectionManager:
             if room_id in self.room_devices and device_id in self.room_devices[room_id]:
                 device_info = self.room_devices[room_id][device_id]
                 del self.room_devices[room_id][device_id]
+                if self.hub is not None:
+                    await self.hub.device_left(room_id, device_id)
                 
                 # Notify other devices
                 await self.broadcast_to_room(room_id, {
@@ -83,52 +189,107 @@ class ConnectionManager:
                     "device_name": device_info["name"]
                 })
         
-        # Clean up connection info
-        del self.connection_info[websocket]
-        
         # Clean up empty rooms
         if room_id in self.active_connections and not self.active_connections[room_id]:
             del self.active_connections[room_id]
             if room_id in self.room_devices:
                 del self.room_devices[room_id]
+            if self.hub is not None:
+                await self.hub.room_closed(room_id)
         
         logger.info(f"Device {device_id} disconnected from room {room_id}")
     
     async def send_personal_message(self, message: dict, websocket: WebSocket):
         """Send a message to a specific WebSocket"""
-        try:
-            await websocket.send_text(json.dumps(message))
-        except Exception as e:
-            logger.error(f"Error sending personal message: {e}")
-            await self.disconnect(websocket)
+        client = self.clients.get(websocket)
+        if client is None:
+            return
+        if not client.enqueue(json.dumps(message)):
+            await self._evict(websocket)
     
-    async def broadcast_to_room(self, room_id: str, message: dict, exclude_websocket: WebSocket = None):
-        """Broadcast a message to all connections in a room"""
+    async def broadcast_to_room(self, room_id: str, message: dict, exclude_websocket: WebSocket = None,
+                                coalesce_key: Optional[Hashable] = None, push_only: bool = False):
+        """
+        Broadcast a message to all connections in a room.
+
+        The message is encoded once and queued on every connection; the actual sends
+        happen concurrently in each connection's sender task. Clients that are too far
+        behind to take the frame are disconnected. With push_only, clock-sync clients
+        (which compute the same information locally) are skipped.
+        """
+        exclude_device = self.connection_info.get(exclude_websocket, {}).get("device_id")
+        text = json.dumps(message)
+        if self.hub is not None:
+            # Other workers may hold viewers of this room too
+            await self.hub.relay(room_id, {
+                "text": text,
+                "exclude": exclude_device,
+                "coalesce_key": coalesce_key,
+                "push_only": push_only
+            })
+        else:
+            await self.deliver_to_room(room_id, text, exclude_device, coalesce_key, push_only)
+    
+    async def deliver_to_room(self, room_id: str, text: str, exclude_device: Optional[str] = None,
+                              coalesce_key: Optional[Hashable] = None, push_only: bool = False):
+        """Queue an already encoded frame on this process's connections in a room"""
         if room_id not in self.active_connections:
             return
         
-        disconnected = set()
+        lagging = []
         for websocket in self.active_connections[room_id]:
-            if websocket == exclude_websocket:
+            if exclude_device is not None and self.connection_info.get(websocket, {}).get("device_id") == exclude_device:
                 continue
-            
-            try:
-                await websocket.send_text(json.dumps(message))
-            except Exception as e:
-                logger.error(f"Error broadcasting to room {room_id}: {e}")
-                disconnected.add(websocket)
+            if push_only and websocket in self.clock_sync_connections:
+                continue
+            client = self.clients.get(websocket)
+            if client is not None and not client.enqueue(text, coalesce_key):
+                lagging.append(websocket)
         
-        # Clean up disconnected websockets
-        for websocket in disconnected:
-            await self.disconnect(websocket)
+        for websocket in lagging:
+            await self._evict(websocket)
     
-    async def broadcast_timer_update(self, room_id: str, timer_data: dict):
-        """Broadcast timer updates to all viewers in a room"""
+    async def broadcast_timer_update(self, room_id: str, timer_data: dict, tick: bool = False):
+        """
+        Broadcast timer updates to all viewers in a room.
+
+        tick=True marks an update that only reflects time passing (the engine's
+        per-second updates); clock-sync clients do not need those.
+        """
         message = {
             "type": "timer_update",
             "timer": timer_data
         }
-        await self.broadcast_to_room(room_id, message)
+        # Only the newest state of a timer matters to a client that has not caught up
+        await self.broadcast_to_room(room_id, message, coalesce_key=("timer_update", timer_data.get("id")),
+                                     push_only=tick)
+
+    async def _evict(self, websocket: WebSocket):
+        """Disconnect a client that cannot keep up with its room"""
+        info = self.connection_info.get(websocket)
+        if info is None:
+            return
+        self.evicted_count += 1
+        logger.warning(f"Evicting slow device {info['device_id']} from room {info['room_id']}")
+        await self.disconnect(websocket)
+        self._close_later(websocket, code=1013)  # "Try again later": the client reconnects
+
+    def _connection_failed(self, websocket: WebSocket):
+        """Called by a sender task whose socket failed"""
+        task = asyncio.create_task(self.disconnect(websocket))
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+
+    def _close_later(self, websocket: WebSocket, code: int):
+        """Close a socket without waiting on it (a stalled client may never ack)"""
+        async def close():
+            try:
+                await asyncio.wait_for(websocket.close(code=code), timeout=5)
+            except Exception:
+                pass
+        task = asyncio.create_task(close())
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
     
     async def broadcast_timer_control(self, room_id: str, action: str, timer_id: str, data: dict = None):
         """Broadcast timer control actions to all devices in a room"""
@@ -169,15 +330,22 @@ class ConnectionManager:
             
             if room_id in self.room_devices and device_id in self.room_devices[room_id]:
                 self.room_devices[room_id][device_id]["last_seen"] = datetime.now().isoformat()
+                if self.hub is not None:
+                    self.hub.device_seen(room_id, device_id)
 
 class WebSocketHandler:
-    def __init__(self, connection_manager: ConnectionManager, timer_engine):
+    def __init__(self, connection_manager: ConnectionManager, timer_engine, router=None):
         self.connection_manager = connection_manager
         self.timer_engine = timer_engine
+        # With a RoomRouter, timer actions go to whichever worker owns the room
+        self.router = router
     
-    async def handle_websocket(self, websocket: WebSocket, room_id: str, device_type: str = "viewer", device_name: str = None):
-        """Handle a WebSocket connection"""
-        device_id = await self.connection_manager.connect(websocket, room_id, device_type, device_name)
+    async def handle_websocket(self, websocket: WebSocket, room_id: str, device_type: str = "viewer", device_name: str = None,
+                               sync: str = "push", initial_timers: Optional[list] = None):
+        """Handle a WebSocket connection (initial_timers: current state of the room's timers, sent after welcome)"""
+        device_id = await self.connection_manager.connect(websocket, room_id, device_type, device_name, sync)
+        for timer_data in initial_timers or []:
+            await self.connection_manager.send_personal_message({"type": "timer_update", "timer": timer_data}, websocket)
         
         try:
             while True:
@@ -186,9 +354,10 @@ class WebSocketHandler:
                 
                 # Receive message
                 data = await websocket.receive_text()
+                received_at = time.time()
                 message = json.loads(data)
                 
-                await self.handle_message(websocket, message)
+                await self.handle_message(websocket, message, received_at)
                 
         except WebSocketDisconnect:
             await self.connection_manager.disconnect(websocket)
@@ -196,7 +365,7 @@ class WebSocketHandler:
             logger.error(f"WebSocket error: {e}")
             await self.connection_manager.disconnect(websocket)
     
-    async def handle_message(self, websocket: WebSocket, message: dict):
+    async def handle_message(self, websocket: WebSocket, message: dict, received_at: Optional[float] = None):
         """Handle incoming WebSocket messages"""
         message_type = message.get("type")
         
@@ -206,6 +375,8 @@ class WebSocketHandler:
             await self.handle_display_message(websocket, message)
         elif message_type == "device_update":
             await self.handle_device_update(websocket, message)
+        elif message_type == "time_sync":
+            await self.handle_time_sync(websocket, message, received_at or time.time())
         elif message_type == "ping":
             await self.connection_manager.send_personal_message({"type": "pong"}, websocket)
         else:
@@ -220,16 +391,28 @@ class WebSocketHandler:
         if not timer_id:
             return
         
-        timer = self.timer_engine.get_timer(timer_id)
-        if not timer:
-            return
-        
         # Get room info
         if websocket not in self.connection_manager.connection_info:
             return
         
         room_id = self.connection_manager.connection_info[websocket]["room_id"]
         
+        if self.router is not None:
+            try:
+                timer_data = await self.router.control_timer(room_id, timer_id, action, data)
+            except KeyError:
+                return
+            except Exception as e:
+                logger.error(f"Timer control failed for room {room_id}: {e}")
+                return
+            await self.connection_manager.broadcast_timer_control(room_id, action, timer_id, data)
+            await self.connection_manager.broadcast_timer_update(room_id, timer_data)
+            return
+        
+        timer = self.timer_engine.get_timer(timer_id)
+        if not timer:
+            return
+        
         # Execute timer action
         if action == "start":
             timer.start()
@@ -249,6 +432,19 @@ class WebSocketHandler:
         # Broadcast updated timer state
         await self.connection_manager.broadcast_timer_update(room_id, timer.to_dict())
     
+    async def handle_time_sync(self, websocket: WebSocket, message: dict, received_at: float):
+        """
+        Answer an NTP-style clock probe. The client sent t0 (its clock, ms); we add
+        t1 (received) and t2 (replied) on the server clock, and the client derives
+        offset = ((t1 - t0) + (t2 - t3)) / 2 when the reply arrives at t3.
+        """
+        await self.connection_manager.send_personal_message({
+            "type": "time_sync",
+            "t0": message.get("t0"),
+            "t1": received_at * 1000,
+            "t2": time.time() * 1000
+        }, websocket)
+    
     async def handle_display_message(self, websocket: WebSocket, message: dict):
         """Handle display message requests"""
         message_data = message.get("message", {})
@@ -275,6 +471,8 @@ class WebSocketHandler:
             device_info = self.connection_manager.room_devices[room_id][device_id]
             device_info.update(message.get("device", {}))
             device_info["last_seen"] = datetime.now().isoformat()
+            if self.connection_manager.hub is not None:
+                await self.connection_manager.hub.device_changed(room_id, device_info)
             
             # Broadcast device update
             await self.connection_manager.broadcast_to_room(room_id, {
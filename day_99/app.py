@@ -5,7 +5,7 @@ import plotly.graph_objects as go
 from datetime import datetime, timedelta
 import sqlite3
 import os
-from energy_detector import EnergyDetector
+from energy_detector import EnergyDetector, warm_up_models
 from data_manager import DataManager
 from pattern_analyzer import PatternAnalyzer
 from visualizations import create_energy_chart, create_pattern_insights
@@ -43,6 +43,7 @@ st.markdown("""
 
 def main():
     # Initialize components
+    warm_up_models()
     data_manager = DataManager()
     energy_detector = EnergyDetector()
     pattern_analyzer = PatternAnalyzer()
@@ -101,16 +102,17 @@ def main():
     with col1:
         st.header("📊 Energy Patterns")
         
-        # Get energy data
-        energy_data = data_manager.get_energy_data()
+        # Hourly patterns (kept up to date as records are saved), and the aggregated stats for this render in one query
+        energy_patterns = data_manager.get_energy_patterns()
+        summary_data = data_manager.get_dashboard_summary()
         
-        if not energy_data.empty:
+        if not energy_patterns.empty:
             # Energy trend chart
-            fig = create_energy_chart(energy_data)
+            fig = create_energy_chart(energy_patterns)
             st.plotly_chart(fig, use_container_width=True)
             
             # Pattern insights
-            insights = pattern_analyzer.analyze_patterns(energy_data)
+            insights = pattern_analyzer.analyze_patterns(energy_patterns)
             if insights:
                 st.subheader("🎯 Key Insights")
                 for insight in insights:
@@ -121,9 +123,9 @@ def main():
     with col2:
         st.header("📈 Today's Stats")
         
-        today_data = data_manager.get_today_data()
-        if not today_data.empty:
-            avg_energy = today_data['energy_level'].value_counts().index[0]
+        today_stats = summary_data['today']
+        if today_stats:
+            avg_energy = today_stats['most_common_energy']
             energy_class = f"energy-{str(avg_energy).lower()}"
             
             st.markdown(f"""
@@ -133,8 +135,8 @@ def main():
             </div>
             """, unsafe_allow_html=True)
             
-            st.metric("Records Today", len(today_data))
-            st.metric("Confidence Avg", f"{today_data['confidence'].mean():.1f}%")
+            st.metric("Records Today", today_stats['total_records'])
+            st.metric("Confidence Avg", f"{today_stats['avg_confidence']:.1f}%")
         else:
             st.info("No data for today yet!")
     
@@ -145,7 +147,7 @@ def main():
     st.header("📊 Weekly Energy Insights Report")
     
     # Generate insights
-    weekly_insights = insights_generator.generate_weekly_report(energy_data)
+    weekly_insights = insights_generator.generate_weekly_report(data_manager.get_energy_patterns(7))
     
     col3, col4 = st.columns([2, 1])
     
@@ -193,8 +195,8 @@ def main():
     
     with col5:
         st.header("🎯 Quick Tips")
-        if not energy_data.empty:
-            tips = pattern_analyzer.get_productivity_tips(energy_data)
+        if not energy_patterns.empty:
+            tips = pattern_analyzer.get_productivity_tips(energy_patterns)
             for tip in tips:
                 st.write(f"💡 {tip}")
         else:
@@ -202,10 +204,10 @@ def main():
     
     with col6:
         st.header("📅 Weekly Summary")
-        weekly_data = data_manager.get_weekly_data()
-        if not weekly_data.empty:
-            st.write(f"📊 {len(weekly_data)} energy records this week")
-            st.write(f"🎯 Most common energy: {weekly_data['energy_level'].mode().iloc[0] if not weekly_data.empty else 'N/A'}")
+        week_stats = summary_data['week']
+        if week_stats:
+            st.write(f"📊 {week_stats['total_records']} energy records this week")
+            st.write(f"🎯 Most common energy: {week_stats['most_common_energy']}")
         else:
             st.write("📊 No weekly data yet!")
 
@@ -3,7 +3,7 @@ import pandas as pd
 from auth_system import AuthSystem
 from new_landing_page import show_new_landing_page
 from new_main import show_authenticated_app
-from energy_detector import EnergyDetector
+from energy_detector import EnergyDetector, warm_up_models
 from pattern_analyzer import PatternAnalyzer
 from insights_generator import InsightsGenerator
 
@@ -18,6 +18,9 @@ st.set_page_config(
 def main():
     """Main app with authentication and navigation"""
     
+    # Load the detection models while the landing page is shown
+    warm_up_models()
+    
     # Initialize auth system
     auth = AuthSystem()
     
@@ -5,6 +5,10 @@ import json
 from datetime import datetime
 import os
 import pandas as pd
+from energy_patterns import EnergyBucketStore, EnergyPatterns
+
+# Hourly pattern counts per user, updated by trigger on every insert and delete
+BUCKETS = EnergyBucketStore('energy_data', user_column='user_id', local_time=True)
 
 class AuthSystem:
     def __init__(self):
@@ -41,6 +45,14 @@ class AuthSystem:
             )
         ''')
         
+        # Latest readings per user for the timeline charts
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_energy_data_user_timestamp
+            ON energy_data (user_id, timestamp)
+        ''')
+        
+        BUCKETS.install(conn)
+        
         conn.commit()
         conn.close()
     
@@ -141,6 +153,18 @@ class AuthSystem:
         
         return df
     
+    def get_user_patterns(self, days=None, today=False):
+        """Hour x weekday patterns for current user (all readings, the last N days, or today)"""
+        user = self.get_current_user()
+        if not user:
+            return EnergyPatterns({})
+        
+        conn = sqlite3.connect(self.db_path)
+        patterns = BUCKETS.load(conn, user['id'], days=days, today=today)
+        conn.close()
+        
+        return patterns
+    
     def get_user_stats(self):
         """Get user statistics"""
         user = self.get_current_user()
@@ -0,0 +1,130 @@
+"""
+Benchmark: DataManager write throughput and dashboard load latency.
+
+Compares the previous connection-per-call behaviour (a fresh sqlite3
+connection in every method, rollback journal, no timestamp index) with the
+pooled DataManager (one long-lived WAL connection per thread, timestamp index,
+bulk inserts).
+
+Writes:    records/sec for one-at-a-time save_energy_record and bulk save_energy_records
+Dashboard: time for the aggregate reads one dashboard render makes (today's and
+           this week's stats, 30-day stats, hourly and weekday patterns), on a
+           table of --rows records spread over the last year
+
+Usage:
+    python benchmark_data_manager.py [--rows 1000000] [--writes 2000]
+"""
+
+import argparse
+import os
+import random
+import sqlite3
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from data_manager import DataManager
+
+LEVELS = ['High', 'Medium', 'Low']
+
+class PerCallDataManager(DataManager):
+    """The previous behaviour: a new default connection for every method call, aggregation in pandas"""
+
+    @property
+    def conn(self):
+        return sqlite3.connect(self.db_path)
+
+    def init_database(self):
+        super().init_database()
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute('PRAGMA journal_mode=DELETE')
+            conn.execute('DROP INDEX IF EXISTS idx_energy_records_timestamp_buckets')
+
+    def get_energy_stats(self, days=30):
+        df = self.get_energy_data(days)
+        if df.empty:
+            return {}
+        return {
+            'total_records': len(df),
+            'avg_confidence': df['confidence'].mean(),
+            'energy_distribution': df['energy_level'].value_counts().to_dict(),
+            'most_common_energy': df['energy_level'].mode().iloc[0],
+            'high_energy_percentage': (df['energy_level'] == 'High').mean() * 100,
+            'low_energy_percentage': (df['energy_level'] == 'Low').mean() * 100
+        }
+
+    def get_hourly_patterns(self):
+        df = self.get_energy_data(7)
+        return df.groupby(['hour', 'energy_level']).size().unstack(fill_value=0)
+
+    def get_weekly_patterns(self):
+        df = self.get_energy_data(30)
+        return df.groupby(['day_of_week', 'energy_level']).size().unstack(fill_value=0)
+
+def generate_records(count, days=365):
+    now = datetime.utcnow()
+    for _ in range(count):
+        timestamp = now - timedelta(seconds=random.uniform(0, days * 86400))
+        yield (random.choice(LEVELS), random.uniform(40, 100), 'auto', timestamp.strftime('%Y-%m-%d %H:%M:%S'))
+
+def previous_dashboard_load(data_manager):
+    """Aggregate reads of one render before: each loads its window into pandas"""
+    today = data_manager.get_today_data()
+    today['energy_level'].value_counts()
+    week = data_manager.get_weekly_data()
+    week['energy_level'].mode()
+    data_manager.get_energy_stats()
+    data_manager.get_hourly_patterns()
+    data_manager.get_weekly_patterns()
+
+def dashboard_load(data_manager):
+    """The same figures now: one GROUP BY query"""
+    data_manager.get_dashboard_summary()
+
+def time_writes(data_manager, count):
+    start = time.perf_counter()
+    for level, confidence, source, _ in generate_records(count):
+        data_manager.save_energy_record(level, confidence, source)
+    return count / (time.perf_counter() - start)
+
+def time_dashboard(data_manager, load, repeats=3):
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        load(data_manager)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark DataManager writes and dashboard reads.")
+    parser.add_argument("--rows", type=int, default=1_000_000, help="Rows in the table for the dashboard test")
+    parser.add_argument("--writes", type=int, default=2000, help="Single-record saves to time")
+    args = parser.parse_args()
+
+    random.seed(1)
+    with tempfile.TemporaryDirectory() as tmp:
+        pooled = DataManager(os.path.join(tmp, 'pooled.db'))
+        per_call = PerCallDataManager(os.path.join(tmp, 'per_call.db'))
+
+        print(f"Writes ({args.writes:,} single saves)")
+        print(f"  per-call connection  {time_writes(per_call, args.writes):10,.0f} records/s")
+        print(f"  pooled connection    {time_writes(pooled, args.writes):10,.0f} records/s")
+
+        start = time.perf_counter()
+        pooled.save_energy_records(generate_records(args.rows))
+        elapsed = time.perf_counter() - start
+        print(f"  bulk insert          {args.rows / elapsed:10,.0f} records/s ({args.rows:,} rows in {elapsed:.1f}s)")
+
+        # Same rows for the per-call database
+        pooled.close()
+        with sqlite3.connect(per_call.db_path) as conn:
+            conn.execute('ATTACH DATABASE ? AS pooled', (pooled.db_path,))
+            conn.execute('DELETE FROM energy_records')
+            conn.execute('INSERT INTO energy_records SELECT * FROM pooled.energy_records')
+
+        print(f"\nDashboard load ({args.rows:,} rows over 365 days)")
+        print(f"  per-call, pandas     {time_dashboard(per_call, previous_dashboard_load) * 1000:10,.1f} ms")
+        print(f"  pooled, SQL GROUP BY {time_dashboard(pooled, dashboard_load) * 1000:10,.1f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+"""
+Benchmark: EnergyDetector latency and throughput on CPU.
+
+Preprocess: the previous path decoded the full photo to RGB, copied it to a
+           NumPy BGR array and searched the whole frame for a face; now JPEGs
+           are decoded in draft mode straight to small grayscale and the face
+           is cropped once. Reports latency and peak memory (Linux: each path
+           runs in a child process that resets its peak RSS first)
+Cascades:  the old fallback path built both Haar cascades on every call; the
+           ModelRegistry builds them once
+Model:     the previous path (DeepFace.analyze per image) against the warm
+           registry model, one image at a time and batched with
+           detect_energy_batch (needs deepface installed)
+
+Images come from --images (a folder of .jpg/.png files) or are generated.
+
+Usage:
+    python benchmark_energy_detector.py [--images photos/] [--count 64] [--width 4000 --height 3000]
+"""
+
+import argparse
+import glob
+import io
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+import cv2
+import numpy as np
+
+from PIL import Image
+
+from energy_detector import EnergyDetector, ModelRegistry
+
+def load_images(folder, count, width, height):
+    if folder:
+        paths = sorted(glob.glob(os.path.join(folder, '*.jpg')) + glob.glob(os.path.join(folder, '*.png')))
+        if not paths:
+            raise SystemExit(f"No .jpg or .png files in {folder}")
+        images = [open(path, 'rb').read() for path in paths]
+        return (images * (count // len(images) + 1))[:count]
+
+    rng = np.random.default_rng(0)
+    images = []
+    for _ in range(count):
+        frame = cv2.GaussianBlur(rng.integers(0, 256, (height, width, 3), dtype=np.uint8), (9, 9), 0)
+        images.append(cv2.imencode('.jpg', frame)[1].tobytes())
+    return images
+
+def timed(func, repeats):
+    start = time.perf_counter()
+    for _ in range(repeats):
+        func()
+    return (time.perf_counter() - start) / repeats
+
+def previous_preprocess(image_bytes):
+    """Full-resolution decode, RGB -> BGR -> gray, face search over the whole frame"""
+    image = Image.open(io.BytesIO(image_bytes))
+    opencv_image = cv2.cvtColor(np.array(image), cv2.COLOR_RGB2BGR)
+    gray = cv2.cvtColor(opencv_image, cv2.COLOR_BGR2GRAY)
+    faces = ModelRegistry.get('face_cascade').detectMultiScale(gray, 1.1, 10)
+    if len(faces):
+        x, y, w, h = faces[0]
+        gray = gray[y:y+h, x:x+w]
+    return cv2.resize(gray, (48, 48))
+
+def current_preprocess(detector, image_bytes):
+    return detector._face_input(detector._decode(image_bytes))
+
+def _rss_kb(field):
+    with open('/proc/self/status') as status:
+        for line in status:
+            if line.startswith(field):
+                return int(line.split()[1])
+
+def measure_preprocess(path, image_bytes):
+    """Child process: peak memory and latency of one preprocessing path"""
+    detector = EnergyDetector()
+    run = (lambda: previous_preprocess(image_bytes)) if path == 'previous' else (lambda: current_preprocess(detector, image_bytes))
+    ModelRegistry.get('face_cascade')
+    before = _rss_kb('VmRSS')
+    with open('/proc/self/clear_refs', 'w') as clear_refs:
+        clear_refs.write('5')  # Reset the peak RSS counter
+    start = time.perf_counter()
+    run()
+    first = time.perf_counter() - start
+    peak = _rss_kb('VmHWM') - before
+    latency = min(timed(run, 1) for _ in range(5))
+    print(json.dumps({'peak_mb': peak / 1024, 'first_ms': first * 1000, 'ms': latency * 1000}))
+
+def bench_preprocess(image_path):
+    print("Preprocessing one photo (decode -> face crop)")
+    print(f"  {'path':<34} {'ms':>7} {'peak MB':>8}")
+    for path, label in (('previous', 'full decode, RGB/BGR, full frame'), ('current', 'draft decode, gray, one crop')):
+        output = subprocess.run([sys.executable, __file__, '--measure', path, image_path],
+                                capture_output=True, text=True, check=True).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        print(f"  {label:<34} {result['ms']:7.1f} {result['peak_mb']:8.1f}")
+    print()
+
+def bench_cascades(gray, repeats):
+
+    def rebuilt():
+        face_cascade = cv2.CascadeClassifier(cv2.data.haarcascades + 'haarcascade_frontalface_default.xml')
+        cv2.CascadeClassifier(cv2.data.haarcascades + 'haarcascade_eye.xml')
+        face_cascade.detectMultiScale(gray, 1.3, 5)
+
+    def shared():
+        ModelRegistry.get('face_cascade').detectMultiScale(gray, 1.3, 5)
+
+    shared()  # Load once
+    print("Fallback face detection (per image)")
+    print(f"  cascades rebuilt    {timed(rebuilt, repeats) * 1000:8.1f} ms")
+    print(f"  registry cascades   {timed(shared, repeats) * 1000:8.1f} ms")
+
+def bench_model(detector, images):
+    from deepface import DeepFace
+
+    def previous(image_bytes):
+        image = detector._decode(image_bytes)
+        DeepFace.analyze(image, actions=['emotion'], enforce_detection=False, detector_backend='opencv')
+
+    start = time.perf_counter()
+    ModelRegistry.warm_up()
+    print(f"\nModel load (once per process): {time.perf_counter() - start:.1f}s")
+
+    print(f"\nEmotion detection ({len(images)} images)")
+    print(f"  {'path':<28} {'ms/image':>9} {'images/s':>9}")
+    runs = [
+        ("DeepFace.analyze per image", lambda: [previous(image) for image in images]),
+        ("warm model, one at a time", lambda: [detector.detect_energy(image) for image in images]),
+        ("warm model, batched", lambda: detector.detect_energy_batch(images))
+    ]
+    for label, run in runs:
+        run()  # Warm-up pass
+        elapsed = timed(run, 1)
+        print(f"  {label:<28} {elapsed / len(images) * 1000:9.1f} {len(images) / elapsed:9.1f}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark EnergyDetector on CPU.")
+    parser.add_argument("--images", help="Folder of test photos (default: generated frames)")
+    parser.add_argument("--count", type=int, default=64, help="Images per run")
+    parser.add_argument("--width", type=int, default=4000, help="Generated frame width (default: 12 MP)")
+    parser.add_argument("--height", type=int, default=3000)
+    parser.add_argument("--measure", nargs=2, metavar=("PATH", "IMAGE"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.measure:
+        with open(args.measure[1], 'rb') as image_file:
+            measure_preprocess(args.measure[0], image_file.read())
+        return
+
+    detector = EnergyDetector()
+    images = load_images(args.images, args.count, args.width, args.height)
+
+    with tempfile.NamedTemporaryFile(suffix='.jpg') as image_file:
+        image_file.write(images[0])
+        image_file.flush()
+        bench_preprocess(image_file.name)
+
+    bench_cascades(detector._decode(images[0]), repeats=20)
+
+    try:
+        import deepface  # noqa: F401
+    except ImportError:
+        print("\ndeepface is not installed; skipping the emotion model benchmark")
+        return
+    bench_model(detector, images)
+
+if __name__ == "__main__":
+    main()
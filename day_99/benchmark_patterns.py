@@ -0,0 +1,102 @@
+"""
+Benchmark: pattern analysis cost per dashboard render, and what keeping the
+hourly buckets up to date adds to each save.
+
+Render: what app.py does with the data on every Streamlit rerun
+(analyze_patterns, get_productivity_tips, generate_weekly_report,
+create_energy_chart, create_weekly_summary), fed either
+
+    records  the DataFrame from get_energy_data(), grouped on every render
+    buckets  get_energy_patterns(): the hourly buckets maintained on save
+
+Writes: single save_energy_record calls with and without the bucket triggers.
+
+Usage:
+    python benchmark_patterns.py [--rows 10000 100000 1000000] [--writes 2000]
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from data_manager import BUCKETS, DataManager
+from insights_generator import InsightsGenerator
+from pattern_analyzer import PatternAnalyzer
+from visualizations import create_energy_chart, create_weekly_summary
+
+LEVELS = ['High', 'Medium', 'Low']
+
+class NoBucketsDataManager(DataManager):
+    """Without the bucket table and triggers (saves as before)"""
+
+    def init_database(self):
+        super().init_database()
+        conn = self.conn
+        with conn:
+            conn.execute(f'DROP TRIGGER IF EXISTS {BUCKETS.buckets}_insert')
+            conn.execute(f'DROP TRIGGER IF EXISTS {BUCKETS.buckets}_delete')
+
+def generate_records(count, days=30):
+    now = datetime.utcnow()
+    for _ in range(count):
+        timestamp = now - timedelta(seconds=random.uniform(0, days * 86400))
+        yield (random.choice(LEVELS), random.uniform(40, 100), 'auto', timestamp.strftime('%Y-%m-%d %H:%M:%S'))
+
+def render(month, week):
+    analyzer = PatternAnalyzer()
+    analyzer.analyze_patterns(month)
+    analyzer.get_productivity_tips(month)
+    InsightsGenerator().generate_weekly_report(week)
+    create_energy_chart(month)
+    create_weekly_summary(week)
+
+def records_render(data_manager):
+    energy_data = data_manager.get_energy_data()
+    render(energy_data, energy_data)
+
+def buckets_render(data_manager):
+    render(data_manager.get_energy_patterns(), data_manager.get_energy_patterns(7))
+
+def timed(func, repeats=3):
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+def time_writes(data_manager, count):
+    start = time.perf_counter()
+    for level, confidence, source, _ in generate_records(count):
+        data_manager.save_energy_record(level, confidence, source)
+    return (time.perf_counter() - start) / count
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark pattern analysis per render and bucket upkeep per save.")
+    parser.add_argument("--rows", type=int, nargs='+', default=[10_000, 100_000, 1_000_000], help="Records in the last 30 days")
+    parser.add_argument("--writes", type=int, default=2000, help="Single-record saves to time")
+    args = parser.parse_args()
+
+    random.seed(1)
+    with tempfile.TemporaryDirectory() as tmp:
+        print(f"Writes ({args.writes:,} single saves)")
+        plain = NoBucketsDataManager(os.path.join(tmp, 'plain.db'))
+        bucketed = DataManager(os.path.join(tmp, 'bucketed.db'))
+        print(f"  without buckets   {time_writes(plain, args.writes) * 1e6:9.1f} µs/save")
+        print(f"  with buckets      {time_writes(bucketed, args.writes) * 1e6:9.1f} µs/save")
+
+        print("\nDashboard render (pattern analysis and charts)")
+        print(f"  {'rows':>10} {'records ms':>11} {'buckets ms':>11}")
+        for rows in args.rows:
+            data_manager = DataManager(os.path.join(tmp, f'render_{rows}.db'))
+            data_manager.save_energy_records(generate_records(rows))
+            records = timed(lambda: records_render(data_manager))
+            buckets = timed(lambda: buckets_render(data_manager))
+            print(f"  {rows:>10,} {records * 1000:11.1f} {buckets * 1000:11.1f}")
+            data_manager.close()
+
+if __name__ == "__main__":
+    main()
@@ -1,16 +1,106 @@
 import sqlite3
+import threading
 import pandas as pd
 from datetime import datetime, timedelta
 import os
+from energy_patterns import EnergyBucketStore, WEEKDAY_NAMES
+
+class ConnectionPool:
+    """
+    Long-lived SQLite connections, one per database file per thread.
+    
+    Streamlit reruns the script (and builds a new DataManager) on every
+    interaction, so connections live here rather than on the DataManager.
+    sqlite3 connections may not be shared between threads, hence per thread.
+    """
+    
+    _local = threading.local()
+    
+    @classmethod
+    def get(cls, db_path):
+        connections = getattr(cls._local, 'connections', None)
+        if connections is None:
+            connections = cls._local.connections = {}
+        
+        conn = connections.get(db_path)
+        if conn is None:
+            # Keep plenty of prepared statements around; every query here is parameterized
+            conn = sqlite3.connect(db_path, cached_statements=256)
+            # WAL lets the dashboard read while a check-in is being written
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            conn.execute('PRAGMA temp_store=MEMORY')
+            connections[db_path] = conn
+        return conn
+    
+    @classmethod
+    def close(cls, db_path):
+        connections = getattr(cls._local, 'connections', {})
+        conn = connections.pop(db_path, None)
+        if conn is not None:
+            conn.close()
+
+def _days_ago(days):
+    """Modifier for SQLite's datetime('now', ?)"""
+    return f'-{int(days)} days'
+
+# hour and weekday are derived from the timestamp once, here, so GROUP BY can use them directly
+INSERT_RECORD = '''
+    INSERT INTO energy_records (energy_level, confidence, source, timestamp, hour, weekday)
+    SELECT ?, ?, ?, ts, CAST(strftime('%H', ts) AS INTEGER), CAST(strftime('%w', ts) AS INTEGER)
+    FROM (SELECT COALESCE(?, CURRENT_TIMESTAMP) AS ts)
+'''
+
+# Hourly pattern counts, updated by trigger on every insert and delete
+BUCKETS = EnergyBucketStore('energy_records')
+
+def _summarize(counts, confidence_sums):
+    """Stats in the get_energy_stats format from per-level counts and confidence sums"""
+    total = sum(counts.values())
+    if not total:
+        return {}
+    
+    return {
+        'total_records': total,
+        'avg_confidence': sum(confidence_sums.values()) / total,
+        'energy_distribution': dict(sorted(counts.items(), key=lambda item: -item[1])),
+        # Ties go to the alphabetically first level, like pandas' mode()
+        'most_common_energy': min(counts, key=lambda level: (-counts[level], level)),
+        'high_energy_percentage': counts.get('High', 0) / total * 100,
+        'low_energy_percentage': counts.get('Low', 0) / total * 100
+    }
+
+def _pattern_frame(counts, index_name, labels=None):
+    """Pattern table (rows = bucket, columns = energy level) from {(bucket, level): count}"""
+    if not counts:
+        return pd.DataFrame()
+    
+    series = pd.Series(counts)
+    series.index.names = [index_name, 'energy_level']
+    patterns = series.unstack(fill_value=0)
+    if labels:
+        patterns.index = [labels[i] for i in patterns.index]
+        patterns.index.name = index_name
+        patterns = patterns.sort_index()
+    patterns.columns.name = 'energy_level'
+    return patterns
 
 class DataManager:
     def __init__(self, db_path="energy_lens.db"):
         self.db_path = db_path
         self.init_database()
     
+    @property
+    def conn(self):
+        return ConnectionPool.get(self.db_path)
+    
+    def close(self):
+        """Close this thread's connection (it is reopened on next use)"""
+        ConnectionPool.close(self.db_path)
+    
     def init_database(self):
         """Initialize the database with required tables"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self.conn
         cursor = conn.cursor()
         
         # Create energy_records table
@@ -38,35 +128,57 @@ class DataManager:
             )
         ''')
         
+        # Databases from before hour/weekday were stored: add and backfill them
+        columns = {row[1] for row in cursor.execute('PRAGMA table_info(energy_records)')}
+        if 'hour' not in columns:
+            cursor.execute('ALTER TABLE energy_records ADD COLUMN hour INTEGER')
+            cursor.execute('ALTER TABLE energy_records ADD COLUMN weekday INTEGER')
+            cursor.execute('''
+                UPDATE energy_records
+                SET hour = CAST(strftime('%H', timestamp) AS INTEGER),
+                    weekday = CAST(strftime('%w', timestamp) AS INTEGER)
+            ''')
+        
+        # Every read filters or sorts on timestamp; the extra columns let the
+        # pattern aggregations run from the index without touching the table
+        cursor.execute('DROP INDEX IF EXISTS idx_energy_records_timestamp')
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_energy_records_timestamp_buckets
+            ON energy_records (timestamp, hour, weekday, energy_level, confidence)
+        ''')
+        
+        BUCKETS.install(conn)
+        
         conn.commit()
-        conn.close()
     
     def save_energy_record(self, energy_level, confidence, source="auto"):
         """Save an energy record to the database"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            INSERT INTO energy_records (energy_level, confidence, source)
-            VALUES (?, ?, ?)
-        ''', (energy_level, confidence, source))
+        conn = self.conn
+        with conn:
+            conn.execute(INSERT_RECORD, (energy_level, confidence, source, None))
+    
+    def save_energy_records(self, records):
+        """
+        Save many energy records in one transaction.
         
-        conn.commit()
-        conn.close()
+        records: iterable of (energy_level, confidence, source, timestamp) tuples;
+        a timestamp of None means now.
+        """
+        conn = self.conn
+        with conn:
+            cursor = conn.executemany(INSERT_RECORD, records)
+        return cursor.rowcount
     
     def get_energy_data(self, days=30):
         """Get energy data for the last N days"""
-        conn = sqlite3.connect(self.db_path)
-        
         query = '''
             SELECT energy_level, confidence, timestamp, source
             FROM energy_records
-            WHERE timestamp >= datetime('now', '-{} days')
+            WHERE timestamp >= datetime('now', ?)
             ORDER BY timestamp DESC
-        '''.format(days)
+        '''
         
-        df = pd.read_sql_query(query, conn)
-        conn.close()
+        df = pd.read_sql_query(query, self.conn, params=(_days_ago(days),))
         
         if not df.empty:
             df['timestamp'] = pd.to_datetime(df['timestamp'])
@@ -78,17 +190,15 @@ class DataManager:
     
     def get_today_data(self):
         """Get energy data for today"""
-        conn = sqlite3.connect(self.db_path)
-        
+        # A range on the raw column (not date(timestamp)) so the index is used
         query = '''
             SELECT energy_level, confidence, timestamp, source
             FROM energy_records
-            WHERE date(timestamp) = date('now')
+            WHERE timestamp >= date('now') AND timestamp < date('now', '+1 day')
             ORDER BY timestamp DESC
         '''
         
-        df = pd.read_sql_query(query, conn)
-        conn.close()
+        df = pd.read_sql_query(query, self.conn)
         
         if not df.empty:
             df['timestamp'] = pd.to_datetime(df['timestamp'])
@@ -97,8 +207,6 @@ class DataManager:
     
     def get_weekly_data(self):
         """Get energy data for the current week"""
-        conn = sqlite3.connect(self.db_path)
-        
         query = '''
             SELECT energy_level, confidence, timestamp, source
             FROM energy_records
@@ -106,8 +214,7 @@ class DataManager:
             ORDER BY timestamp DESC
         '''
         
-        df = pd.read_sql_query(query, conn)
-        conn.close()
+        df = pd.read_sql_query(query, self.conn)
         
         if not df.empty:
             df['timestamp'] = pd.to_datetime(df['timestamp'])
@@ -116,59 +223,76 @@ class DataManager:
         
         return df
     
-    def get_energy_stats(self, days=30):
-        """Get statistical summary of energy data"""
-        df = self.get_energy_data(days)
+    def _aggregate(self, days=30):
+        """
+        One GROUP BY over the window: record counts and confidence sums per
+        (hour, weekday, energy level), split into today / last 7 days / older.
+        At most a few hundred rows, whatever the number of records.
+        """
+        query = '''
+            SELECT hour, weekday, energy_level,
+                   timestamp >= date('now') AS today,
+                   timestamp >= datetime('now', '-7 days') AS this_week,
+                   COUNT(*), SUM(confidence)
+            FROM energy_records
+            WHERE timestamp >= datetime('now', ?)
+            GROUP BY hour, weekday, energy_level, today, this_week
+        '''
+        return self.conn.execute(query, (_days_ago(days),)).fetchall()
+    
+    def get_dashboard_summary(self, days=30):
+        """
+        Everything the dashboard shows about the data, from a single query:
+        stats for today, the last 7 days and the last N days, plus hourly
+        (last 7 days) and weekday (last N days) patterns.
+        """
+        periods = {'today': ({}, {}), 'week': ({}, {}), 'all': ({}, {})}
+        hourly, weekly = {}, {}
         
-        if df.empty:
-            return {}
-        
-        stats = {
-            'total_records': len(df),
-            'avg_confidence': df['confidence'].mean(),
-            'energy_distribution': df['energy_level'].value_counts().to_dict(),
-            'most_common_energy': df['energy_level'].mode().iloc[0] if not df.empty else None,
-            'high_energy_percentage': (df['energy_level'] == 'High').mean() * 100,
-            'low_energy_percentage': (df['energy_level'] == 'Low').mean() * 100
-        }
+        for hour, weekday, level, today, this_week, count, confidence_sum in self._aggregate(days):
+            for period, included in (('today', today), ('week', this_week), ('all', True)):
+                if included:
+                    counts, confidence_sums = periods[period]
+                    counts[level] = counts.get(level, 0) + count
+                    confidence_sums[level] = confidence_sums.get(level, 0) + confidence_sum
+            if this_week:
+                hourly[(hour, level)] = hourly.get((hour, level), 0) + count
+            weekly[(weekday, level)] = weekly.get((weekday, level), 0) + count
         
-        return stats
+        return {
+            'today': _summarize(*periods['today']),
+            'week': _summarize(*periods['week']),
+            'stats': _summarize(*periods['all']),
+            'hourly_patterns': _pattern_frame(hourly, 'hour'),
+            'weekly_patterns': _pattern_frame(weekly, 'day_of_week', WEEKDAY_NAMES)
+        }
+    
+    def get_energy_stats(self, days=30):
+        """Get statistical summary of energy data"""
+        return self.get_dashboard_summary(days)['stats']
     
     def get_hourly_patterns(self):
         """Get energy patterns by hour of day"""
-        df = self.get_energy_data(7)  # Last 7 days
-        
-        if df.empty:
-            return pd.DataFrame()
-        
-        hourly_patterns = df.groupby(['hour', 'energy_level']).size().unstack(fill_value=0)
-        return hourly_patterns
+        return self.get_dashboard_summary(7)['hourly_patterns']  # Last 7 days
     
     def get_weekly_patterns(self):
         """Get energy patterns by day of week"""
-        df = self.get_energy_data(30)  # Last 30 days
-        
-        if df.empty:
-            return pd.DataFrame()
-        
-        weekly_patterns = df.groupby(['day_of_week', 'energy_level']).size().unstack(fill_value=0)
-        return weekly_patterns
+        return self.get_dashboard_summary(30)['weekly_patterns']  # Last 30 days
+    
+    def get_energy_patterns(self, days=30):
+        """Hour x weekday patterns of the last N days for PatternAnalyzer, InsightsGenerator and the charts"""
+        return BUCKETS.load(self.conn, days=days)
     
     def delete_old_records(self, days=90):
         """Delete records older than specified days"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            DELETE FROM energy_records
-            WHERE timestamp < datetime('now', '-{} days')
-        '''.format(days))
-        
-        deleted_count = cursor.rowcount
-        conn.commit()
-        conn.close()
+        conn = self.conn
+        with conn:
+            cursor = conn.execute('''
+                DELETE FROM energy_records
+                WHERE timestamp < datetime('now', ?)
+            ''', (_days_ago(days),))
         
-        return deleted_count
+        return cursor.rowcount
     
     def export_data(self, format='csv'):
         """Export energy data"""
@@ -1,11 +1,90 @@
 import cv2
 import numpy as np
-from deepface import DeepFace
-from PIL import Image
+from PIL import Image, ImageOps
 import io
+import threading
 import streamlit as st
 import os
 
+# Output order of DeepFace's emotion model
+EMOTION_LABELS = ['angry', 'disgust', 'fear', 'happy', 'sad', 'surprise', 'neutral']
+
+# Input size of the emotion model (grayscale)
+EMOTION_INPUT_SIZE = (48, 48)
+
+# Largest number of faces sent to the model in one call
+MAX_BATCH_SIZE = 64
+
+# Photos are decoded no larger than this (longest side) before face detection;
+# a face still spans far more than the model's 48 pixels at this size
+DETECTION_MAX_SIDE = 640
+
+def _load_emotion_model():
+    # Importing DeepFace pulls in TensorFlow, so only do it when a model is needed
+    from deepface import DeepFace
+    try:
+        client = DeepFace.build_model(model_name='Emotion', task='facial_attribute')
+    except TypeError:
+        client = DeepFace.build_model('Emotion')  # Older deepface: no task argument
+    # Newer deepface wraps the Keras model in a client object
+    return getattr(client, 'model', client)
+
+def _load_cascade(filename):
+    haarcascades_path = getattr(cv2, 'data', None)
+    if not haarcascades_path:
+        raise RuntimeError("OpenCV was installed without its Haar cascade files")
+    cascade = cv2.CascadeClassifier(haarcascades_path.haarcascades + filename)
+    if cascade.empty():
+        raise RuntimeError(f"Could not load {filename}")
+    return cascade
+
+class ModelRegistry:
+    """
+    Models loaded once per process and shared by every EnergyDetector.
+    
+    Streamlit creates a new EnergyDetector on every rerun, so models kept on
+    the detector would be rebuilt for each photo.
+    """
+    
+    _models = {}
+    _lock = threading.Lock()
+    _loaders = {
+        'emotion': _load_emotion_model,
+        'face_cascade': lambda: _load_cascade('haarcascade_frontalface_default.xml'),
+        'eye_cascade': lambda: _load_cascade('haarcascade_eye.xml')
+    }
+    
+    @classmethod
+    def get(cls, name):
+        model = cls._models.get(name)
+        if model is None:
+            with cls._lock:
+                # Another thread may have loaded it while we waited
+                model = cls._models.get(name)
+                if model is None:
+                    model = cls._models[name] = cls._loaders[name]()
+        return model
+    
+    @classmethod
+    def warm_up(cls):
+        """
+        Load every model now (e.g. at app start) instead of on the first photo.
+        Returns {name: error} for models that failed; get() tries those again.
+        """
+        failures = {}
+        for name in cls._loaders:
+            try:
+                cls.get(name)
+            except Exception as e:
+                failures[name] = e
+        return failures
+
+@st.cache_resource(show_spinner="Loading energy detection models...")
+def warm_up_models():
+    """ModelRegistry.warm_up() once per server process, not on each session's first photo"""
+    # Failures are returned, not raised: st.cache_resource would retry a raise on every rerun
+    return {name: str(error) for name, error in ModelRegistry.warm_up().items()}
+
 class EnergyDetector:
     def __init__(self):
         self.energy_mapping = {
@@ -33,74 +112,134 @@ class EnergyDetector:
         Returns: (energy_level, confidence)
         """
         try:
-            # Convert image input to format DeepFace can process
-            if hasattr(image_input, 'read'):
-                # Streamlit uploaded file
-                image_bytes = image_input.read()
-                image_input.seek(0)  # Reset file pointer
-            else:
-                # Camera input
-                image_bytes = image_input.getvalue()
+            gray_image = self._decode(image_input)
             
-            # Convert to PIL Image
-            image = Image.open(io.BytesIO(image_bytes))
-            
-            # Convert to OpenCV format
-            opencv_image = cv2.cvtColor(np.array(image), cv2.COLOR_RGB2BGR)
-            
-            # Try DeepFace emotion detection
+            # Emotion detection with the shared, already loaded model
             try:
-                result = DeepFace.analyze(
-                    opencv_image, 
-                    actions=['emotion'],
-                    enforce_detection=False,
-                    detector_backend='opencv'
-                )
-                
-                if isinstance(result, list):
-                    result = result[0]
-                
-                # Get dominant emotion
-                emotions = result['emotion']
-                dominant_emotion = max(emotions, key=emotions.get)
-                confidence = emotions[dominant_emotion]
-                
-                # Map emotion to energy level
-                energy_level = self.energy_mapping.get(dominant_emotion, 'Medium')
-                
-                # Adjust confidence based on emotion strength
-                if confidence > 70:
-                    confidence = min(confidence, 95)  # Cap at 95% for realism
-                else:
-                    confidence = max(confidence, 30)  # Minimum 30% confidence
-                
-                return energy_level, confidence
+                emotions = self._predict_emotions([self._face_input(gray_image)])[0]
+                return self._energy_from_emotions(emotions)
                 
             except Exception as e:
                 st.warning(f"⚠️ Face analysis failed: {str(e)}\n\nWe'll try a simpler method. Make sure your face is clearly visible and well-lit.")
-                return self._fallback_analysis(opencv_image)
+                return self._fallback_analysis(gray_image)
                 
         except Exception as e:
             st.error(f"❌ Image processing error: {str(e)}\n\nPossible reasons: camera not working, file corrupted, or unsupported image format. Try retaking the photo or uploading a different image.")
             return "Medium", 50.0
     
+    def detect_energy_batch(self, image_inputs):
+        """
+        Detect energy levels for many images with one pass through the model
+        Returns: list of (energy_level, confidence), in input order
+        """
+        results = [None] * len(image_inputs)
+        images, faces = {}, {}
+        
+        for i, image_input in enumerate(image_inputs):
+            try:
+                images[i] = self._decode(image_input)
+                faces[i] = self._face_input(images[i])
+            except Exception:
+                results[i] = ("Medium", 50.0)
+        
+        if results.count(None) < len(results):
+            st.warning(f"⚠️ {len(results) - results.count(None)} of {len(results)} images could not be read.")
+        
+        if faces:
+            try:
+                for i, emotions in zip(faces, self._predict_emotions(list(faces.values()))):
+                    results[i] = self._energy_from_emotions(emotions)
+            except Exception as e:
+                st.warning(f"⚠️ Face analysis failed: {str(e)}\n\nUsing a simpler method for these images.")
+                for i in faces:
+                    results[i] = self._fallback_analysis(images[i])
+        
+        return results
+    
+    def analyze_emotions(self, image_input):
+        """
+        Emotion percentages for the face in an image (raises if it cannot be analysed)
+        Returns: dict of emotion -> percentage
+        """
+        return self._predict_emotions([self._face_input(self._decode(image_input))])[0]
+    
+    def _decode(self, image_input):
+        """
+        Uploaded file, camera input or raw bytes -> grayscale array at most
+        DETECTION_MAX_SIDE pixels on its longest side.
+        
+        Both models work on grayscale, so colour is never materialised. JPEGs
+        are decoded straight at reduced size (draft mode scales in the DCT by
+        1/2 to 1/8), so a 12-MP photo never exists at full resolution in memory.
+        """
+        if isinstance(image_input, bytes):
+            image_bytes = image_input
+        elif hasattr(image_input, 'read'):
+            # Streamlit uploaded file
+            image_bytes = image_input.read()
+            image_input.seek(0)  # Reset file pointer
+        else:
+            # Camera input
+            image_bytes = image_input.getvalue()
+        
+        image = Image.open(io.BytesIO(image_bytes))
+        image.draft('L', (DETECTION_MAX_SIDE, DETECTION_MAX_SIDE))  # No-op for non-JPEG
+        image = image.convert('L')
+        image.thumbnail((DETECTION_MAX_SIDE, DETECTION_MAX_SIDE))
+        # Phone photos are often stored sideways with an EXIF rotation
+        image = ImageOps.exif_transpose(image)
+        return np.asarray(image)
+    
+    def _face_input(self, gray):
+        """
+        Emotion model input for a decoded image: the largest face, cropped once,
+        or the whole frame if none is found (as DeepFace does with enforce_detection=False)
+        """
+        faces = ModelRegistry.get('face_cascade').detectMultiScale(gray, 1.1, 10)
+        if len(faces):
+            x, y, w, h = max(faces, key=lambda face: face[2] * face[3])
+            gray = gray[y:y+h, x:x+w]
+        return cv2.resize(gray, EMOTION_INPUT_SIZE).astype(np.float32) / 255.0
+    
+    def _predict_emotions(self, faces):
+        """Emotion percentages for each face, in batches through the model"""
+        model = ModelRegistry.get('emotion')
+        batch = np.stack(faces)[..., np.newaxis]
+        predictions = np.concatenate([
+            np.asarray(model.predict_on_batch(batch[start:start + MAX_BATCH_SIZE]))
+            for start in range(0, len(batch), MAX_BATCH_SIZE)
+        ])
+        percentages = predictions * 100 / predictions.sum(axis=1, keepdims=True)
+        return [dict(zip(EMOTION_LABELS, row.tolist())) for row in percentages]
+    
+    def _energy_from_emotions(self, emotions):
+        # Get dominant emotion
+        dominant_emotion = max(emotions, key=emotions.get)
+        confidence = emotions[dominant_emotion]
+        
+        # Map emotion to energy level
+        energy_level = self.energy_mapping.get(dominant_emotion, 'Medium')
+        
+        # Adjust confidence based on emotion strength
+        if confidence > 70:
+            confidence = min(confidence, 95)  # Cap at 95% for realism
+        else:
+            confidence = max(confidence, 30)  # Minimum 30% confidence
+        
+        return energy_level, confidence
+    
     def _fallback_analysis(self, image):
         """
         Fallback analysis using basic OpenCV features
         """
         try:
-            # Convert to grayscale
-            gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+            # Convert to grayscale (decoded images already are)
+            gray = image if image.ndim == 2 else cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
             
-            # Load face cascade
+            # Face cascades (loaded once per process)
             try:
-                haarcascades_path = getattr(cv2, 'data', None)
-                if haarcascades_path:
-                    face_cascade = cv2.CascadeClassifier(haarcascades_path.haarcascades + 'haarcascade_frontalface_default.xml')
-                    eye_cascade = cv2.CascadeClassifier(haarcascades_path.haarcascades + 'haarcascade_eye.xml')
-                else:
-                    st.warning("Could not load face detection models. Please check your OpenCV installation.")
-                    return "Medium", 40.0
+                face_cascade = ModelRegistry.get('face_cascade')
+                eye_cascade = ModelRegistry.get('eye_cascade')
             except Exception:
                 st.warning("Face detection model loading failed. Please check your OpenCV installation.")
                 return "Medium", 40.0
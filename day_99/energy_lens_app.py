@@ -10,11 +10,6 @@ import os
 from energy_detector import EnergyDetector
 from pattern_analyzer import PatternAnalyzer
 from insights_generator import InsightsGenerator
-import cv2
-from deepface import DeepFace
-from PIL import Image
-import numpy as np
-import io
 from visualizations import create_energy_chart, create_pattern_insights, create_weekly_summary, create_productivity_chart
 import time
 
@@ -130,12 +125,8 @@ def get_all_energy_data():
 
 def analyze_image(image_bytes):
     try:
-        image = Image.open(io.BytesIO(image_bytes))
-        opencv_image = cv2.cvtColor(np.array(image), cv2.COLOR_RGB2BGR)
-        result = DeepFace.analyze(opencv_image, actions=['emotion'], enforce_detection=False)
-        if isinstance(result, list):
-            result = result[0]
-        emotions = result['emotion']
+        # Downscaled decode, one face crop and the shared warm model (see EnergyDetector)
+        emotions = EnergyDetector().analyze_emotions(image_bytes)
         dominant_emotion = max(emotions, key=emotions.get)
         confidence = emotions[dominant_emotion]
         # Map emotion to energy level
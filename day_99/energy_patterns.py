@@ -0,0 +1,254 @@
+import pandas as pd
+
+# SQLite's strftime('%w') numbering (0 = Sunday)
+WEEKDAY_NAMES = ['Sunday', 'Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday']
+
+LEVEL_SCORES = {'High': 3, 'Medium': 2, 'Low': 1}
+
+# Readings kept one by one for the timeline charts and the trend; everything else comes from the counts
+RECENT_READINGS = 500
+
+CELL_KEYS = ('hour', 'day_of_week')
+
+class EnergyPatterns:
+    """
+    Energy readings summarized as counts and confidence sums per
+    (hour, day of week, energy level), at most 24 x 7 x 3 cells, plus the
+    latest RECENT_READINGS readings and the first few of the window.
+
+    This is what PatternAnalyzer, InsightsGenerator and the chart builders
+    work from, so their cost does not grow with the number of readings.
+    """
+
+    def __init__(self, cells, recent=None, earliest=()):
+        self.cells = cells  # {(hour, day_of_week, energy_level): (readings, confidence_sum)}
+        self.recent = recent if recent is not None else pd.DataFrame(columns=['timestamp', 'energy_level'])
+        self.earliest = list(earliest)
+        self.total = sum(count for count, _ in cells.values())
+
+    @classmethod
+    def from_frame(cls, energy_data):
+        """Summarize a DataFrame of readings (for callers without an EnergyBucketStore)"""
+        if energy_data.empty:
+            return cls({})
+
+        timestamps = pd.to_datetime(energy_data['timestamp'], errors='coerce') if 'timestamp' in energy_data.columns else None
+        hours = energy_data['hour'] if 'hour' in energy_data.columns else timestamps.dt.hour
+        days = energy_data['day_of_week'] if 'day_of_week' in energy_data.columns else timestamps.dt.day_name()
+        grouped = energy_data.groupby([hours.rename('hour'), days.rename('day_of_week'), energy_data['energy_level']])['confidence'].agg(['size', 'sum'])
+        cells = {
+            (int(hour), day, level): (int(count), float(confidence_sum))
+            for (hour, day, level), count, confidence_sum in zip(grouped.index, grouped['size'], grouped['sum'])
+        }
+
+        if timestamps is None:
+            return cls(cells)
+        readings = pd.DataFrame({'timestamp': timestamps, 'energy_level': energy_data['energy_level']}).sort_values('timestamp')
+        return cls(cells, readings.tail(RECENT_READINGS).reset_index(drop=True), readings['energy_level'].head(3))
+
+    @property
+    def empty(self):
+        return self.total == 0
+
+    def __len__(self):
+        return self.total
+
+    @property
+    def avg_confidence(self):
+        return sum(confidence_sum for _, confidence_sum in self.cells.values()) / self.total
+
+    def level_counts(self):
+        """Readings per energy level, most common first (like value_counts())"""
+        counts = {}
+        for (_, _, level), (count, _) in self.cells.items():
+            counts[level] = counts.get(level, 0) + count
+        return pd.Series(counts, dtype='int64').sort_values(ascending=False, kind='stable')
+
+    def level_percentage(self, level):
+        return self.level_counts().get(level, 0) / self.total * 100 if self.total else 0
+
+    def most_common_level(self):
+        """Ties go to the alphabetically first level, like pandas' mode()"""
+        counts = self.level_counts()
+        return min(counts.index, key=lambda level: (-counts[level], level))
+
+    def counts_by(self, *keys):
+        """
+        Readings per energy level grouped by 'hour' and/or 'day_of_week', the
+        same table as groupby([*keys, 'energy_level']).size().unstack(fill_value=0)
+        """
+        positions = [CELL_KEYS.index(key) for key in keys]
+        counts = {}
+        for cell, (count, _) in self.cells.items():
+            key = tuple(cell[position] for position in positions) + (cell[2],)
+            counts[key] = counts.get(key, 0) + count
+        if not counts:
+            return pd.DataFrame()
+
+        series = pd.Series(counts)
+        series.index.names = list(keys) + ['energy_level']
+        return series.unstack(fill_value=0).sort_index()
+
+    def high_percentage_by(self, key):
+        """Share of High readings (%) per hour or per day of week"""
+        counts = self.counts_by(key)
+        high = counts['High'] if 'High' in counts.columns else 0
+        return high / counts.sum(axis=1) * 100
+
+    def scores_by_day_and_hour(self):
+        """Mean energy score (High=3, Medium=2, Low=1) per day of week and hour"""
+        sums, counts = {}, {}
+        for (hour, day, level), (count, _) in self.cells.items():
+            if level in LEVEL_SCORES:
+                sums[(day, hour)] = sums.get((day, hour), 0) + LEVEL_SCORES[level] * count
+                counts[(day, hour)] = counts.get((day, hour), 0) + count
+        if not counts:
+            return pd.DataFrame()
+
+        means = pd.Series({key: sums[key] / counts[key] for key in counts})
+        means.index.names = ['day_of_week', 'hour']
+        return means.unstack(fill_value=0).sort_index()
+
+    def trend(self):
+        """'improving', 'declining' or 'stable': the last three readings against the first three"""
+        if self.total < 3:
+            return "stable"
+
+        recent_avg = self.recent['energy_level'].tail(3).map(LEVEL_SCORES).mean()
+        earlier_avg = pd.Series(self.earliest).map(LEVEL_SCORES).mean()
+
+        if recent_avg > earlier_avg + 0.5:
+            return "improving"
+        elif recent_avg < earlier_avg - 0.5:
+            return "declining"
+        return "stable"
+
+def to_patterns(energy_data):
+    """EnergyPatterns for either a DataFrame of readings or already summarized patterns"""
+    if isinstance(energy_data, EnergyPatterns):
+        return energy_data
+    return EnergyPatterns.from_frame(energy_data)
+
+class EnergyBucketStore:
+    """
+    Per-user reading counts and confidence sums for each hour readings were
+    taken in, stored next to a readings table and kept in step with it by
+    SQLite triggers: every insert (save_energy_record, bulk saves) and delete
+    updates its bucket in the same transaction.
+
+    load() reads one indexed range of buckets (at most 72 rows per day of the
+    window) and folds it into the 168 hour x weekday cells of EnergyPatterns.
+    """
+
+    def __init__(self, table, user_column=None, local_time=False):
+        """
+        table: readings table with energy_level, confidence and timestamp columns
+        user_column: its user id column, or None for a single-user table
+        local_time: timestamps are local time rather than UTC (CURRENT_TIMESTAMP)
+        """
+        self.table = table
+        self.buckets = f'{table}_buckets'
+        self.user_column = user_column
+        self.clock = ['localtime'] if local_time else []
+
+    def _user(self, row):
+        return f'{row}.{self.user_column}' if self.user_column else '0'
+
+    def install(self, conn):
+        """Create the bucket table and its triggers, filling it from existing readings the first time"""
+        created = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (self.buckets,)
+        ).fetchone()
+
+        conn.execute(f'''
+            CREATE TABLE IF NOT EXISTS {self.buckets} (
+                user_id INTEGER NOT NULL,
+                bucket TEXT NOT NULL,
+                hour INTEGER NOT NULL,
+                weekday INTEGER NOT NULL,
+                energy_level TEXT NOT NULL,
+                readings INTEGER NOT NULL,
+                confidence_sum REAL NOT NULL,
+                PRIMARY KEY (user_id, bucket, energy_level)
+            ) WITHOUT ROWID
+        ''')
+
+        conn.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS {self.buckets}_insert AFTER INSERT ON {self.table}
+            BEGIN
+                INSERT INTO {self.buckets} (user_id, bucket, hour, weekday, energy_level, readings, confidence_sum)
+                SELECT {self._user('NEW')}, strftime('%Y-%m-%d %H:00:00', NEW.timestamp),
+                       CAST(strftime('%H', NEW.timestamp) AS INTEGER), CAST(strftime('%w', NEW.timestamp) AS INTEGER),
+                       NEW.energy_level, 1, NEW.confidence
+                WHERE NEW.timestamp IS NOT NULL
+                ON CONFLICT (user_id, bucket, energy_level) DO UPDATE
+                SET readings = readings + 1, confidence_sum = confidence_sum + excluded.confidence_sum;
+            END
+        ''')
+
+        conn.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS {self.buckets}_delete AFTER DELETE ON {self.table}
+            BEGIN
+                UPDATE {self.buckets}
+                SET readings = readings - 1, confidence_sum = confidence_sum - OLD.confidence
+                WHERE user_id = {self._user('OLD')} AND bucket = strftime('%Y-%m-%d %H:00:00', OLD.timestamp)
+                  AND energy_level = OLD.energy_level;
+                DELETE FROM {self.buckets}
+                WHERE user_id = {self._user('OLD')} AND bucket = strftime('%Y-%m-%d %H:00:00', OLD.timestamp)
+                  AND energy_level = OLD.energy_level AND readings <= 0;
+            END
+        ''')
+
+        if not created:
+            # Readings saved before the buckets existed
+            conn.execute(f'''
+                INSERT INTO {self.buckets} (user_id, bucket, hour, weekday, energy_level, readings, confidence_sum)
+                SELECT {self.user_column or 0}, strftime('%Y-%m-%d %H:00:00', timestamp),
+                       CAST(strftime('%H', timestamp) AS INTEGER), CAST(strftime('%w', timestamp) AS INTEGER),
+                       energy_level, COUNT(*), SUM(confidence)
+                FROM {self.table}
+                WHERE timestamp IS NOT NULL
+                GROUP BY 1, 2, 5
+            ''')
+
+    def load(self, conn, user_id=None, days=None, today=False):
+        """
+        EnergyPatterns of one user for the last `days` days (all readings
+        when None), or since midnight when today is set. Windows start on the hour.
+        """
+        modifiers = self.clock + ([f'-{int(days)} days'] if days is not None else []) + (['start of day'] if today else [])
+        since = ''
+        if modifiers:
+            placeholders = ', ?' * len(modifiers)
+            since = conn.execute(f"SELECT strftime('%Y-%m-%d %H:00:00', 'now'{placeholders})", modifiers).fetchone()[0]
+
+        rows = conn.execute(f'''
+            SELECT hour, weekday, energy_level, SUM(readings), SUM(confidence_sum)
+            FROM {self.buckets}
+            WHERE user_id = ? AND bucket >= ?
+            GROUP BY hour, weekday, energy_level
+        ''', (user_id or 0, since)).fetchall()
+        cells = {
+            (hour, WEEKDAY_NAMES[weekday], level): (count, confidence_sum)
+            for hour, weekday, level, count, confidence_sum in rows if count > 0
+        }
+        if not cells:
+            return EnergyPatterns({})
+
+        user_filter = f'{self.user_column} = ? AND ' if self.user_column else ''
+        params = (user_id, since) if self.user_column else (since,)
+        query = f'''
+            SELECT timestamp, energy_level
+            FROM {self.table}
+            WHERE {user_filter}timestamp >= ?
+            ORDER BY timestamp {{}}
+            LIMIT ?
+        '''
+        recent = pd.DataFrame(
+            conn.execute(query.format('DESC'), params + (RECENT_READINGS,)).fetchall()[::-1],
+            columns=['timestamp', 'energy_level']
+        )
+        recent['timestamp'] = pd.to_datetime(recent['timestamp'], errors='coerce')
+        earliest = [level for _, level in conn.execute(query.format('ASC'), params + (3,))]
+
+        return EnergyPatterns(cells, recent, earliest)
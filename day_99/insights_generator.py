@@ -2,6 +2,7 @@ import pandas as pd
 import plotly.graph_objects as go
 from datetime import datetime, timedelta
 import random
+from energy_patterns import EnergyPatterns, to_patterns
 
 class InsightsGenerator:
     def __init__(self):
@@ -31,17 +32,23 @@ class InsightsGenerator:
     def generate_weekly_report(self, energy_data, user_name="You"):
         """
         Generate a comprehensive weekly energy insights report
-        """
-        if energy_data.empty:
-            return self._generate_empty_report(user_name)
         
-        # Filter for last 7 days
-        # Ensure 'timestamp' is timezone-naive for comparison
-        ts = energy_data['timestamp']
-        if hasattr(ts.dt, 'tz') and ts.dt.tz is not None:
-            ts = ts.dt.tz_localize(None)
-        week_ago = datetime.now()
-        weekly_data = energy_data[ts >= week_ago - timedelta(days=7)]
+        energy_data: EnergyPatterns of the last 7 days, or a DataFrame of
+        readings (filtered to the last 7 days here)
+        """
+        if isinstance(energy_data, EnergyPatterns):
+            weekly_data = energy_data
+        else:
+            if energy_data.empty:
+                return self._generate_empty_report(user_name)
+            
+            # Filter for last 7 days
+            # Ensure 'timestamp' is timezone-naive for comparison
+            ts = energy_data['timestamp']
+            if hasattr(ts.dt, 'tz') and ts.dt.tz is not None:
+                ts = ts.dt.tz_localize(None)
+            week_ago = datetime.now()
+            weekly_data = to_patterns(energy_data[ts >= week_ago - timedelta(days=7)])
         
         if weekly_data.empty:
             return self._generate_empty_report(user_name)
@@ -62,74 +69,73 @@ class InsightsGenerator:
     def _generate_summary(self, data, user_name):
         """Generate weekly summary statistics"""
         total_records = len(data)
-        high_energy_pct = (data['energy_level'] == 'High').mean() * 100
-        avg_confidence = data['confidence'].mean()
+        high_energy_pct = data.level_percentage('High')
+        avg_confidence = data.avg_confidence
         
         return {
             'total_readings': total_records,
             'high_energy_percentage': high_energy_pct,
             'avg_confidence': avg_confidence,
-            'most_productive_day': data['day_of_week'].mode().iloc[0] if 'day_of_week' in data.columns else 'Unknown',
+            # The day with the most readings (ties: alphabetically first, like mode())
+            'most_productive_day': data.counts_by('day_of_week').sum(axis=1).idxmax(),
             'energy_trend': self._calculate_trend(data)
         }
     
     def _find_peak_performance(self, data):
         """Find peak performance times"""
-        if 'hour' in data.columns and 'day_of_week' in data.columns:
-            # Group by hour and day, find highest energy periods
-            hourly_data = data.groupby(['hour', 'day_of_week', 'energy_level']).size().unstack(fill_value=0)
+        # Readings by hour and day, find highest energy periods
+        hourly_data = data.counts_by('hour', 'day_of_week')
+        
+        if 'High' in hourly_data.columns:
+            peak_times = hourly_data['High'].nlargest(3)
+            insights = []
             
-            if 'High' in hourly_data.columns:
-                peak_times = hourly_data['High'].nlargest(3)
-                insights = []
-                
-                for (hour, day), count in peak_times.items():
-                    if count > 0:
-                        energy_pct = (count / hourly_data.loc[(hour, day)].sum()) * 100
-                        # Format time more accurately
-                        if hour < 12:
-                            time_str = f"{hour}:00 AM"
-                        elif hour == 12:
-                            time_str = "12:00 PM"
-                        else:
-                            time_str = f"{hour-12}:00 PM"
-                        day_name = day
-                        
-                        insight = random.choice(self.insight_templates['peak_performance']).format(
-                            day=day_name, time=time_str, energy_pct=int(energy_pct)
-                        )
-                        insights.append(insight)
-                
-                return insights[:2]  # Return top 2 insights
+            for (hour, day), count in peak_times.items():
+                if count > 0:
+                    energy_pct = (count / hourly_data.loc[(hour, day)].sum()) * 100
+                    # Format time more accurately
+                    if hour < 12:
+                        time_str = f"{hour}:00 AM"
+                    elif hour == 12:
+                        time_str = "12:00 PM"
+                    else:
+                        time_str = f"{hour-12}:00 PM"
+                    day_name = day
+                    
+                    insight = random.choice(self.insight_templates['peak_performance']).format(
+                        day=day_name, time=time_str, energy_pct=int(energy_pct)
+                    )
+                    insights.append(insight)
+            
+            return insights[:2]  # Return top 2 insights
         
         return ["Your peak performance patterns are emerging - keep tracking to discover more!"]
     
     def _find_energy_dips(self, data):
         """Find energy dip times"""
-        if 'hour' in data.columns and 'day_of_week' in data.columns:
-            hourly_data = data.groupby(['hour', 'day_of_week', 'energy_level']).size().unstack(fill_value=0)
+        hourly_data = data.counts_by('hour', 'day_of_week')
+        
+        if 'Low' in hourly_data.columns:
+            dip_times = hourly_data['Low'].nlargest(3)
+            insights = []
+            
+            for (hour, day), count in dip_times.items():
+                if count > 0:
+                    # Format time more accurately
+                    if hour < 12:
+                        time_str = f"{hour}:00 AM"
+                    elif hour == 12:
+                        time_str = "12:00 PM"
+                    else:
+                        time_str = f"{hour-12}:00 PM"
+                    day_name = day
+                    
+                    insight = random.choice(self.insight_templates['energy_dip']).format(
+                        day=day_name, time=time_str
+                    )
+                    insights.append(insight)
             
-            if 'Low' in hourly_data.columns:
-                dip_times = hourly_data['Low'].nlargest(3)
-                insights = []
-                
-                for (hour, day), count in dip_times.items():
-                    if count > 0:
-                        # Format time more accurately
-                        if hour < 12:
-                            time_str = f"{hour}:00 AM"
-                        elif hour == 12:
-                            time_str = "12:00 PM"
-                        else:
-                            time_str = f"{hour-12}:00 PM"
-                        day_name = day
-                        
-                        insight = random.choice(self.insight_templates['energy_dip']).format(
-                            day=day_name, time=time_str
-                        )
-                        insights.append(insight)
-                
-                return insights[:2]
+            return insights[:2]
         
         return ["Energy dips are normal - use them for lighter tasks and breaks"]
     
@@ -138,61 +144,53 @@ class InsightsGenerator:
         discoveries = []
         
         # Day of week patterns
-        if 'day_of_week' in data.columns:
-            day_energy = data.groupby('day_of_week')['energy_level'].apply(
-                lambda x: (x == 'High').mean() * 100
-            )
-            
-            best_day = day_energy.idxmax()
-            worst_day = day_energy.idxmin()
-            
-            if day_energy[best_day] > 50:
-                discoveries.append(f"You're {int(day_energy[best_day])}% more energetic on {best_day}s")
-            
-            if day_energy[worst_day] < 30:
-                discoveries.append(f"Energy challenges on {worst_day}s - plan accordingly")
+        day_energy = data.high_percentage_by('day_of_week')
+        
+        best_day = day_energy.idxmax()
+        worst_day = day_energy.idxmin()
+        
+        if day_energy[best_day] > 50:
+            discoveries.append(f"You're {int(day_energy[best_day])}% more energetic on {best_day}s")
+        
+        if day_energy[worst_day] < 30:
+            discoveries.append(f"Energy challenges on {worst_day}s - plan accordingly")
         
         # Time patterns
-        if 'hour' in data.columns:
-            hour_energy = data.groupby('hour')['energy_level'].apply(
-                lambda x: (x == 'High').mean() * 100
-            )
-            
-            peak_hour = hour_energy.idxmax()
-            if hour_energy[peak_hour] > 60:
-                # Format time more accurately
-                if peak_hour < 12:
-                    time_str = f"{peak_hour}:00 AM"
-                elif peak_hour == 12:
-                    time_str = "12:00 PM"
-                else:
-                    time_str = f"{peak_hour-12}:00 PM"
-                discoveries.append(f"Peak energy at {time_str} - your power hour!")
+        hour_energy = data.high_percentage_by('hour')
+        
+        peak_hour = hour_energy.idxmax()
+        if hour_energy[peak_hour] > 60:
+            # Format time more accurately
+            if peak_hour < 12:
+                time_str = f"{peak_hour}:00 AM"
+            elif peak_hour == 12:
+                time_str = "12:00 PM"
+            else:
+                time_str = f"{peak_hour-12}:00 PM"
+            discoveries.append(f"Peak energy at {time_str} - your power hour!")
         
         return discoveries[:3]
     
     def _generate_productivity_tips(self, data):
         """Generate actionable productivity tips (enhanced)"""
         tips = []
-        high_energy_pct = (data['energy_level'] == 'High').mean() * 100
+        high_energy_pct = data.level_percentage('High')
         # Personalized by best day
-        if 'day_of_week' in data.columns:
-            day_energy = data.groupby('day_of_week')['energy_level'].apply(lambda x: (x == 'High').mean() * 100)
-            best_day = day_energy.idxmax()
-            if day_energy[best_day] > 50:
-                tips.append(f"You are most productive on {best_day}s. Schedule your hardest tasks then!")
+        day_energy = data.high_percentage_by('day_of_week')
+        best_day = day_energy.idxmax()
+        if day_energy[best_day] > 50:
+            tips.append(f"You are most productive on {best_day}s. Schedule your hardest tasks then!")
         # Personalized by best hour
-        if 'hour' in data.columns:
-            hour_energy = data.groupby('hour')['energy_level'].apply(lambda x: (x == 'High').mean() * 100)
-            peak_hour = hour_energy.idxmax()
-            if hour_energy[peak_hour] > 60:
-                if peak_hour < 12:
-                    time_str = f"{peak_hour}:00 AM"
-                elif peak_hour == 12:
-                    time_str = "12:00 PM"
-                else:
-                    time_str = f"{peak_hour-12}:00 PM"
-                tips.append(f"Your power hour is {time_str}. Block this time for deep work!")
+        hour_energy = data.high_percentage_by('hour')
+        peak_hour = hour_energy.idxmax()
+        if hour_energy[peak_hour] > 60:
+            if peak_hour < 12:
+                time_str = f"{peak_hour}:00 AM"
+            elif peak_hour == 12:
+                time_str = "12:00 PM"
+            else:
+                time_str = f"{peak_hour-12}:00 PM"
+            tips.append(f"Your power hour is {time_str}. Block this time for deep work!")
         # Trend-based advice
         trend = self._calculate_trend(data)
         if trend == "improving":
@@ -210,16 +208,15 @@ class InsightsGenerator:
             tips.append("Your balanced energy is perfect for varied tasks")
             tips.append("Mix high-focus and routine tasks throughout your day")
         # Add time-specific tips
-        if 'hour' in data.columns:
-            hourly_tips = self._get_hourly_tips(data)
-            tips.extend(hourly_tips)
+        hourly_tips = self._get_hourly_tips(data)
+        tips.extend(hourly_tips)
         return tips[:6]
     
     def _get_hourly_tips(self, data):
         """Get tips based on hourly patterns"""
         tips = []
         
-        hourly_data = data.groupby(['hour', 'energy_level']).size().unstack(fill_value=0)
+        hourly_data = data.counts_by('hour')
         
         if 'High' in hourly_data.columns:
             peak_hours = hourly_data['High'].nlargest(2)
@@ -254,21 +251,20 @@ class InsightsGenerator:
         goals = []
         
         # Based on current patterns, suggest optimizations
-        if 'hour' in data.columns and 'day_of_week' in data.columns:
-            hourly_data = data.groupby(['hour', 'day_of_week', 'energy_level']).size().unstack(fill_value=0)
-            
-            if 'High' in hourly_data.columns:
-                peak_time = hourly_data['High'].idxmax()
-                if isinstance(peak_time, tuple):
-                    hour, day = peak_time
-                    # Format time more accurately
-                    if hour < 12:
-                        time_str = f"{hour}:00 AM"
-                    elif hour == 12:
-                        time_str = "12:00 PM"
-                    else:
-                        time_str = f"{hour-12}:00 PM"
-                    goals.append(f"Test scheduling important tasks at {time_str} on {day}s")
+        hourly_data = data.counts_by('hour', 'day_of_week')
+        
+        if 'High' in hourly_data.columns:
+            peak_time = hourly_data['High'].idxmax()
+            if isinstance(peak_time, tuple):
+                hour, day = peak_time
+                # Format time more accurately
+                if hour < 12:
+                    time_str = f"{hour}:00 AM"
+                elif hour == 12:
+                    time_str = "12:00 PM"
+                else:
+                    time_str = f"{hour-12}:00 PM"
+                goals.append(f"Test scheduling important tasks at {time_str} on {day}s")
         
         goals.append("Track your energy before and after meetings")
         goals.append("Experiment with different work environments")
@@ -278,7 +274,7 @@ class InsightsGenerator:
     
     def _generate_shareable_quote(self, data):
         """Generate a shareable quote for LinkedIn"""
-        high_energy_pct = (data['energy_level'] == 'High').mean() * 100
+        high_energy_pct = data.level_percentage('High')
         
         quotes = [
             f"After tracking my energy for a week, I discovered I'm {int(high_energy_pct)}% more productive during my peak hours. Energy optimization is real! ⚡",
@@ -291,23 +287,8 @@ class InsightsGenerator:
     
     def _calculate_trend(self, data):
         """Calculate energy trend over the week"""
-        if len(data) < 3:
-            return "stable"
-        
-        # Sort by timestamp and calculate trend
-        sorted_data = data.sort_values('timestamp')
-        energy_scores = sorted_data['energy_level'].map({'High': 3, 'Medium': 2, 'Low': 1})
-        
-        if len(energy_scores) >= 3:
-            recent_avg = energy_scores.tail(3).mean()
-            earlier_avg = energy_scores.head(3).mean()
-            
-            if recent_avg > earlier_avg + 0.5:
-                return "improving"
-            elif recent_avg < earlier_avg - 0.5:
-                return "declining"
-        
-        return "stable"
+        # Last three readings against the first three
+        return data.trend()
     
     def _generate_empty_report(self, user_name):
         """Generate report for users with no data"""
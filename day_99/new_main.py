@@ -5,7 +5,7 @@ import plotly.graph_objects as go
 from datetime import datetime, timedelta
 import sqlite3
 import os
-from energy_detector import EnergyDetector
+from energy_detector import EnergyDetector, warm_up_models
 from auth_system import AuthSystem
 from pattern_analyzer import PatternAnalyzer
 from visualizations import create_energy_chart, create_pattern_insights
@@ -50,6 +50,7 @@ st.markdown("""
 
 def main():
     # Initialize components
+    warm_up_models()
     auth = AuthSystem()
     energy_detector = EnergyDetector()
     pattern_analyzer = PatternAnalyzer()
@@ -164,16 +165,16 @@ def show_authenticated_app(auth, user, energy_detector, pattern_analyzer, insigh
     with col1:
         st.header("📊 Your Energy Patterns")
         
-        # Get user's energy data
-        energy_data = auth.get_user_energy_data()
+        # Get user's energy patterns (kept up to date as readings are saved)
+        energy_patterns = auth.get_user_patterns()
         
-        if not energy_data.empty:
+        if not energy_patterns.empty:
             # Energy trend chart
-            fig = create_energy_chart(energy_data)
+            fig = create_energy_chart(energy_patterns)
             st.plotly_chart(fig, use_container_width=True)
             
             # Pattern insights
-            insights = pattern_analyzer.analyze_patterns(energy_data)
+            insights = pattern_analyzer.analyze_patterns(energy_patterns)
             if insights:
                 st.subheader("🎯 Key Insights")
                 for insight in insights:
@@ -184,16 +185,11 @@ def show_authenticated_app(auth, user, energy_detector, pattern_analyzer, insigh
     with col2:
         st.header("📈 Today's Stats")
         
-        # Get today's data for current user
-        if not energy_data.empty and 'timestamp' in energy_data.columns:
-            # Ensure timestamp is datetime
-            energy_data['timestamp'] = pd.to_datetime(energy_data['timestamp'], errors='coerce')
-            today_data = energy_data[energy_data['timestamp'].dt.date == datetime.now().date()]
-        else:
-            today_data = pd.DataFrame()
+        # Get today's patterns for current user
+        today_data = auth.get_user_patterns(today=True)
         
         if not today_data.empty:
-            avg_energy = today_data['energy_level'].mode().iloc[0] if not today_data.empty else 'Medium'
+            avg_energy = today_data.most_common_level()
             energy_class = f"energy-{str(avg_energy).lower()}"
             
             st.markdown(f"""
@@ -204,7 +200,7 @@ def show_authenticated_app(auth, user, energy_detector, pattern_analyzer, insigh
             """, unsafe_allow_html=True)
             
             st.metric("Records Today", len(today_data))
-            st.metric("Confidence Avg", f"{today_data['confidence'].mean():.1f}%")
+            st.metric("Confidence Avg", f"{today_data.avg_confidence:.1f}%")
         else:
             st.info("No data for today yet!")
     
@@ -215,7 +211,7 @@ def show_authenticated_app(auth, user, energy_detector, pattern_analyzer, insigh
     st.header("📊 Weekly Energy Insights Report")
     
     # Generate insights for current user
-    weekly_insights = insights_generator.generate_weekly_report(energy_data)
+    weekly_insights = insights_generator.generate_weekly_report(auth.get_user_patterns(days=7))
     
     col3, col4 = st.columns([2, 1])
     
@@ -1,6 +1,7 @@
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
+from energy_patterns import to_patterns
 
 class PatternAnalyzer:
     def __init__(self):
@@ -14,31 +15,31 @@ class PatternAnalyzer:
     def analyze_patterns(self, energy_data):
         """
         Analyze energy data and return actionable insights
+        
+        energy_data: EnergyPatterns, or a DataFrame of readings
         """
-        if energy_data.empty:
+        patterns = to_patterns(energy_data)
+        if patterns.empty:
             return []
         
         insights = []
         
         # Basic statistics
-        total_records = len(energy_data)
-        avg_confidence = energy_data['confidence'].mean()
+        total_records = len(patterns)
+        avg_confidence = patterns.avg_confidence
         
         # Energy distribution
-        energy_dist = energy_data['energy_level'].value_counts(normalize=True)
-        high_energy_pct = energy_dist.get('High', 0) * 100
-        low_energy_pct = energy_dist.get('Low', 0) * 100
-        medium_energy_pct = energy_dist.get('Medium', 0) * 100
+        high_energy_pct = patterns.level_percentage('High')
+        low_energy_pct = patterns.level_percentage('Low')
+        medium_energy_pct = patterns.level_percentage('Medium')
         
         # Time-based patterns
-        if 'hour' in energy_data.columns:
-            hourly_insights = self._analyze_hourly_patterns(energy_data)
-            insights.extend(hourly_insights)
+        hourly_insights = self._analyze_hourly_patterns(patterns)
+        insights.extend(hourly_insights)
         
         # Day-of-week patterns
-        if 'day_of_week' in energy_data.columns:
-            weekly_insights = self._analyze_weekly_patterns(energy_data)
-            insights.extend(weekly_insights)
+        weekly_insights = self._analyze_weekly_patterns(patterns)
+        insights.extend(weekly_insights)
         
         # Overall energy insights
         if high_energy_pct > 50:
@@ -55,18 +56,18 @@ class PatternAnalyzer:
             insights.append("🎯 Great detection accuracy - your patterns are clear!")
         
         # Trend analysis
-        trend_insight = self._analyze_trends(energy_data)
+        trend_insight = self._analyze_trends(patterns)
         if trend_insight:
             insights.append(trend_insight)
         
         return insights
     
-    def _analyze_hourly_patterns(self, energy_data):
+    def _analyze_hourly_patterns(self, patterns):
         """Analyze energy patterns by hour of day"""
         insights = []
         
-        # Group by hour and energy level
-        hourly_data = energy_data.groupby(['hour', 'energy_level']).size().unstack(fill_value=0)
+        # Readings by hour and energy level
+        hourly_data = patterns.counts_by('hour')
         
         if hourly_data.empty:
             return insights
@@ -87,12 +88,12 @@ class PatternAnalyzer:
         
         return insights
     
-    def _analyze_weekly_patterns(self, energy_data):
+    def _analyze_weekly_patterns(self, patterns):
         """Analyze energy patterns by day of week"""
         insights = []
         
-        # Group by day and energy level
-        weekly_data = energy_data.groupby(['day_of_week', 'energy_level']).size().unstack(fill_value=0)
+        # Readings by day and energy level
+        weekly_data = patterns.counts_by('day_of_week')
         
         if weekly_data.empty:
             return insights
@@ -112,26 +113,15 @@ class PatternAnalyzer:
         
         return insights
     
-    def _analyze_trends(self, energy_data):
+    def _analyze_trends(self, patterns):
         """Analyze energy trends over time"""
-        if len(energy_data) < 3:
-            return None
-        
-        # Sort by timestamp
-        sorted_data = energy_data.sort_values('timestamp')
-        
-        # Calculate energy scores (High=3, Medium=2, Low=1)
-        energy_scores = sorted_data['energy_level'].map({'High': 3, 'Medium': 2, 'Low': 1})
+        # Last three readings against the first three (High=3, Medium=2, Low=1)
+        trend = patterns.trend()
         
-        # Simple trend analysis
-        if len(energy_scores) >= 3:
-            recent_avg = energy_scores.tail(3).mean()
-            earlier_avg = energy_scores.head(3).mean()
-            
-            if recent_avg > earlier_avg + 0.5:
-                return "📈 Your energy is trending upward - great momentum!"
-            elif recent_avg < earlier_avg - 0.5:
-                return "📉 Your energy is declining - consider rest or routine changes"
+        if trend == "improving":
+            return "📈 Your energy is trending upward - great momentum!"
+        elif trend == "declining":
+            return "📉 Your energy is declining - consider rest or routine changes"
         
         return None
     
@@ -140,14 +130,14 @@ class PatternAnalyzer:
         Get personalized productivity tips based on energy patterns
         """
         tips = []
+        patterns = to_patterns(energy_data)
         
-        if energy_data.empty:
+        if patterns.empty:
             return ["💡 Start tracking your energy to get personalized tips!"]
         
         # Energy distribution tips
-        energy_dist = energy_data['energy_level'].value_counts(normalize=True)
-        high_energy_pct = energy_dist.get('High', 0) * 100
-        low_energy_pct = energy_dist.get('Low', 0) * 100
+        high_energy_pct = patterns.level_percentage('High')
+        low_energy_pct = patterns.level_percentage('Low')
         
         if high_energy_pct > 50:
             tips.append("🚀 You're naturally high-energy - leverage this for creative projects!")
@@ -160,23 +150,22 @@ class PatternAnalyzer:
             tips.append("📅 Mix high-focus and routine tasks throughout your day")
         
         # Time-based tips
-        if 'hour' in energy_data.columns:
-            hourly_tips = self._get_hourly_tips(energy_data)
-            tips.extend(hourly_tips)
+        hourly_tips = self._get_hourly_tips(patterns)
+        tips.extend(hourly_tips)
         
         # Confidence tips
-        avg_confidence = energy_data['confidence'].mean()
+        avg_confidence = patterns.avg_confidence
         if avg_confidence < 60:
             tips.append("📸 Try different lighting for better energy detection")
             tips.append("✏️ Use manual entries when detection is unclear")
         
         return tips[:5]  # Limit to top 5 tips
     
-    def _get_hourly_tips(self, energy_data):
+    def _get_hourly_tips(self, patterns):
         """Get tips based on hourly patterns"""
         tips = []
         
-        hourly_data = energy_data.groupby(['hour', 'energy_level']).size().unstack(fill_value=0)
+        hourly_data = patterns.counts_by('hour')
         
         if hourly_data.empty:
             return tips
@@ -202,18 +191,17 @@ class PatternAnalyzer:
         Get specific optimization suggestions for productivity
         """
         suggestions = []
+        patterns = to_patterns(energy_data)
         
-        if energy_data.empty:
+        if patterns.empty:
             return ["📊 Start tracking to get optimization suggestions"]
         
         # Analyze patterns for specific suggestions
-        if 'hour' in energy_data.columns:
-            hourly_suggestions = self._get_hourly_suggestions(energy_data)
-            suggestions.extend(hourly_suggestions)
+        hourly_suggestions = self._get_hourly_suggestions(patterns)
+        suggestions.extend(hourly_suggestions)
         
         # Overall suggestions
-        energy_dist = energy_data['energy_level'].value_counts(normalize=True)
-        high_energy_pct = energy_dist.get('High', 0) * 100
+        high_energy_pct = patterns.level_percentage('High')
         
         if high_energy_pct > 60:
             suggestions.append("🎯 You're naturally high-energy - consider longer focused work sessions")
@@ -222,11 +210,11 @@ class PatternAnalyzer:
         
         return suggestions
     
-    def _get_hourly_suggestions(self, energy_data):
+    def _get_hourly_suggestions(self, patterns):
         """Get specific hourly optimization suggestions"""
         suggestions = []
         
-        hourly_data = energy_data.groupby(['hour', 'energy_level']).size().unstack(fill_value=0)
+        hourly_data = patterns.counts_by('hour')
         
         if hourly_data.empty:
             return suggestions
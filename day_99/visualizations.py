@@ -4,12 +4,17 @@ from plotly.subplots import make_subplots
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
+from energy_patterns import EnergyPatterns, LEVEL_SCORES, to_patterns
 
 def create_energy_chart(energy_data):
     """
     Create a comprehensive energy visualization chart
+    
+    energy_data: EnergyPatterns, or a DataFrame of readings. The timeline
+    shows the latest readings (RECENT_READINGS), the other panels all of them.
     """
-    if energy_data.empty:
+    patterns = to_patterns(energy_data)
+    if patterns.empty:
         # Return empty chart
         fig = go.Figure()
         fig.add_annotation(
@@ -27,10 +32,10 @@ def create_energy_chart(energy_data):
         return fig
     
     # Prepare data
-    energy_data = energy_data.sort_values('timestamp')
+    recent_data = patterns.recent
     
     # Create energy score mapping
-    energy_scores = energy_data['energy_level'].map({'High': 3, 'Medium': 2, 'Low': 1})
+    energy_scores = recent_data['energy_level'].map(LEVEL_SCORES)
     
     # Create the main chart
     fig = make_subplots(
@@ -43,7 +48,7 @@ def create_energy_chart(energy_data):
     # 1. Energy Timeline
     fig.add_trace(
         go.Scatter(
-            x=energy_data['timestamp'],
+            x=recent_data['timestamp'],
             y=energy_scores,
             mode='lines+markers',
             name='Energy Level',
@@ -54,7 +59,7 @@ def create_energy_chart(energy_data):
     )
     
     # 2. Energy Distribution
-    energy_dist = energy_data['energy_level'].value_counts()
+    energy_dist = patterns.level_counts()
     colors = {'High': '#2ecc71', 'Medium': '#f39c12', 'Low': '#e74c3c'}
     
     fig.add_trace(
@@ -68,42 +73,40 @@ def create_energy_chart(energy_data):
     )
     
     # 3. Hourly Patterns
-    if 'hour' in energy_data.columns:
-        hourly_data = energy_data.groupby(['hour', 'energy_level']).size().unstack(fill_value=0)
-        
-        for energy_level in ['High', 'Medium', 'Low']:
-            if energy_level in hourly_data.columns:
-                fig.add_trace(
-                    go.Scatter(
-                        x=hourly_data.index,
-                        y=hourly_data[energy_level],
-                        mode='lines+markers',
-                        name=f'{energy_level} Energy',
-                        line=dict(color=colors.get(energy_level, '#95a5a6')),
-                        marker=dict(size=6)
-                    ),
-                    row=2, col=1
-                )
+    hourly_data = patterns.counts_by('hour')
+    
+    for energy_level in ['High', 'Medium', 'Low']:
+        if energy_level in hourly_data.columns:
+            fig.add_trace(
+                go.Scatter(
+                    x=hourly_data.index,
+                    y=hourly_data[energy_level],
+                    mode='lines+markers',
+                    name=f'{energy_level} Energy',
+                    line=dict(color=colors.get(energy_level, '#95a5a6')),
+                    marker=dict(size=6)
+                ),
+                row=2, col=1
+            )
     
     # 4. Daily Patterns
-    if 'day_of_week' in energy_data.columns:
-        daily_data = energy_data.groupby(['day_of_week', 'energy_level']).size().unstack(fill_value=0)
-        
-        # Reorder days
-        day_order = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-        daily_data = daily_data.reindex([day for day in day_order if day in daily_data.index])
-        
-        for energy_level in ['High', 'Medium', 'Low']:
-            if energy_level in daily_data.columns:
-                fig.add_trace(
-                    go.Bar(
-                        x=daily_data.index,
-                        y=daily_data[energy_level],
-                        name=f'{energy_level} Energy',
-                        marker_color=colors.get(energy_level, '#95a5a6')
-                    ),
-                    row=2, col=2
-                )
+    daily_data = patterns.counts_by('day_of_week')
+    
+    # Reorder days
+    day_order = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+    daily_data = daily_data.reindex([day for day in day_order if day in daily_data.index])
+    
+    for energy_level in ['High', 'Medium', 'Low']:
+        if energy_level in daily_data.columns:
+            fig.add_trace(
+                go.Bar(
+                    x=daily_data.index,
+                    y=daily_data[energy_level],
+                    name=f'{energy_level} Energy',
+                    marker_color=colors.get(energy_level, '#95a5a6')
+                ),
+                row=2, col=2
+            )
     
     # Update layout
     fig.update_layout(
@@ -129,13 +132,13 @@ def create_pattern_insights(energy_data):
     """
     Create insights visualization
     """
-    if energy_data.empty:
+    patterns = to_patterns(energy_data)
+    if patterns.empty:
         return None
     
     # Calculate insights
-    total_records = len(energy_data)
-    avg_confidence = energy_data['confidence'].mean()
-    energy_dist = energy_data['energy_level'].value_counts(normalize=True)
+    total_records = len(patterns)
+    avg_confidence = patterns.avg_confidence
     
     # Create insights figure
     fig = go.Figure()
@@ -173,66 +176,60 @@ def create_pattern_insights(energy_data):
 def create_weekly_summary(energy_data):
     """
     Create a weekly summary visualization
-    """
-    if energy_data.empty:
-        return None
     
-    # Filter for last 7 days
-    # Ensure 'timestamp' is timezone-naive for comparison
-    ts = energy_data['timestamp']
-    if hasattr(ts.dt, 'tz') and ts.dt.tz is not None:
-        ts = ts.dt.tz_localize(None)
-    week_ago = datetime.now()
-    weekly_data = energy_data[ts >= week_ago - timedelta(days=7)]
+    energy_data: EnergyPatterns of the last 7 days, or a DataFrame of
+    readings (filtered to the last 7 days here)
+    """
+    if isinstance(energy_data, EnergyPatterns):
+        weekly_data = energy_data
+    else:
+        if energy_data.empty:
+            return None
+        
+        # Filter for last 7 days
+        # Ensure 'timestamp' is timezone-naive for comparison
+        ts = energy_data['timestamp']
+        if hasattr(ts.dt, 'tz') and ts.dt.tz is not None:
+            ts = ts.dt.tz_localize(None)
+        week_ago = datetime.now()
+        weekly_data = to_patterns(energy_data[ts >= week_ago - timedelta(days=7)])
     
     if weekly_data.empty:
         return None
     
-    # Create weekly heatmap
-    if 'hour' in weekly_data.columns and 'day_of_week' in weekly_data.columns:
-        # Create pivot table for heatmap
-        energy_scores = weekly_data['energy_level'].map({'High': 3, 'Medium': 2, 'Low': 1})
-        weekly_data['energy_score'] = energy_scores
-        
-        pivot_data = weekly_data.pivot_table(
-            values='energy_score',
-            index='day_of_week',
-            columns='hour',
-            aggfunc='mean',
-            fill_value=0
-        )
-        
-        # Reorder days
-        day_order = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-        pivot_data = pivot_data.reindex([day for day in day_order if day in pivot_data.index])
-        
-        fig = px.imshow(
-            pivot_data,
-            title="📅 Weekly Energy Heatmap",
-            color_continuous_scale='RdYlGn',
-            aspect="auto"
-        )
-        
-        fig.update_layout(
-            xaxis_title="Hour of Day",
-            yaxis_title="Day of Week",
-            height=400
-        )
-        
-        return fig
+    # Create weekly heatmap: mean energy score per day and hour
+    pivot_data = weekly_data.scores_by_day_and_hour()
+    
+    # Reorder days
+    day_order = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+    pivot_data = pivot_data.reindex([day for day in day_order if day in pivot_data.index])
     
-    return None
+    fig = px.imshow(
+        pivot_data,
+        title="📅 Weekly Energy Heatmap",
+        color_continuous_scale='RdYlGn',
+        aspect="auto"
+    )
+    
+    fig.update_layout(
+        xaxis_title="Hour of Day",
+        yaxis_title="Day of Week",
+        height=400
+    )
+    
+    return fig
 
 def create_productivity_chart(energy_data):
     """
     Create productivity-focused visualization
     """
-    if energy_data.empty:
+    patterns = to_patterns(energy_data)
+    if patterns.empty:
         return None
     
     # Calculate productivity metrics
-    high_energy_pct = (energy_data['energy_level'] == 'High').mean() * 100
-    low_energy_pct = (energy_data['energy_level'] == 'Low').mean() * 100
+    high_energy_pct = patterns.level_percentage('High')
+    low_energy_pct = patterns.level_percentage('Low')
     
     # Create productivity gauge
     fig = go.Figure()
@@ -268,16 +265,17 @@ def create_productivity_chart(energy_data):
 
 def create_energy_trend(energy_data):
     """
-    Create energy trend analysis
+    Create energy trend analysis (over the latest RECENT_READINGS readings)
     """
-    if energy_data.empty or len(energy_data) < 3:
+    patterns = to_patterns(energy_data)
+    if patterns.empty or len(patterns) < 3:
         return None
     
-    # Sort by timestamp
-    sorted_data = energy_data.sort_values('timestamp')
+    # Readings in timestamp order
+    sorted_data = patterns.recent
     
     # Calculate moving average
-    energy_scores = sorted_data['energy_level'].map({'High': 3, 'Medium': 2, 'Low': 1})
+    energy_scores = sorted_data['energy_level'].map(LEVEL_SCORES)
     moving_avg = energy_scores.rolling(window=3, min_periods=1).mean()
     
     fig = go.Figure()